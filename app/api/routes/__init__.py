@@ -1,3 +1,4 @@
+from app.api.routes.availability import router as availability_router
 from app.api.routes.bookings import router as bookings_router
 from app.api.routes.nlp import router as nlp_router
-__all__ = ["bookings_router", "nlp_router"]
+__all__ = ["availability_router", "bookings_router", "nlp_router"]
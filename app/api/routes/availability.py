@@ -0,0 +1,81 @@
+from datetime import date, datetime, timedelta
+from fastapi import APIRouter, Body, HTTPException, Query
+from typing import List, Optional
+from app.models.availability import (
+    AvailabilityCheck,
+    AvailabilityVerdict,
+    AvailableSlot,
+    DailyAvailability,
+    TechnicianAvailability,
+    TimeInterval
+)
+from app.db.database import find_next_free_slots, get_daily_availability
+from app.models.booking import MAX_DURATION_MINUTES, MIN_DURATION_MINUTES, default_duration_minutes
+from app.nlp.handlers.conflict_checker import BookingConflictChecker
+from app.nlp.managers.technician_manager import TechnicianManager
+router = APIRouter()
+MAX_SUGGESTIONS = 20
+MAX_CHECKS = 500
+
+
+def resolve_technicians(specialty: str) -> List[str]:
+    name = TechnicianManager.find_specialty(specialty)
+    if name is None:
+        raise HTTPException(status_code=404, detail=f"Unknown specialty: {specialty}")
+    return TechnicianManager.get_available_technicians(name)
+
+
+def resolve_technician(technician_name: str) -> str:
+    specialty = TechnicianManager.specialty_of(technician_name)
+    if specialty is None:
+        raise HTTPException(status_code=404, detail=f"Unknown technician: {technician_name}")
+    return specialty
+
+
+@router.get("", response_model=DailyAvailability)
+def daily_availability(specialty: str, day: date = Query(..., alias="date")):
+    technicians = resolve_technicians(specialty)
+    return DailyAvailability(date=day, specialty=TechnicianManager.find_specialty(specialty), technicians=[
+        TechnicianAvailability(
+            technician_name=view.technician_name,
+            busy=[TimeInterval(start=start, end=end) for start, end in view.busy],
+            free=[TimeInterval(start=start, end=end) for start, end in view.free]
+        )
+        for view in get_daily_availability(day, technicians)
+    ])
+
+
+@router.get("/next", response_model=List[AvailableSlot])
+def next_available(specialty: str,
+                   after: Optional[datetime] = None,
+                   count: int = Query(3, ge=1, le=MAX_SUGGESTIONS),
+                   duration_minutes: Optional[int] = Query(None, ge=MIN_DURATION_MINUTES, le=MAX_DURATION_MINUTES)):
+    technicians = resolve_technicians(specialty)
+    duration = timedelta(minutes=duration_minutes or default_duration_minutes(specialty))
+    slots = find_next_free_slots(after or datetime.now(), technicians, count, duration)
+    return [AvailableSlot(start=slot.start, end=slot.start + duration, technicians=slot.technicians)
+            for slot in slots]
+
+
+@router.post("/check", response_model=List[AvailabilityVerdict])
+def check_availability(checks: List[AvailabilityCheck] = Body(..., max_length=MAX_CHECKS)):
+    slots = []
+    for check in checks:
+        if check.technician is not None:
+            technicians = [check.technician]
+            specialty = resolve_technician(check.technician)
+        else:
+            technicians = resolve_technicians(check.specialty)
+            specialty = check.specialty
+        start = check.start.replace(tzinfo=None)
+        slots.append((technicians, start, check.duration_minutes or default_duration_minutes(specialty)))
+    return [
+        AvailabilityVerdict(
+            start=start,
+            end=start + timedelta(minutes=duration_minutes),
+            available=bool(verdict.free_technicians),
+            technicians=verdict.free_technicians,
+            conflicting_booking_id=verdict.booking_id
+        )
+        for (_, start, duration_minutes), verdict in zip(slots, BookingConflictChecker.check_slots(slots))
+    ]
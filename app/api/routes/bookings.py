@@ -1,20 +1,194 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
+import base64
+import binascii
+import json
+from datetime import datetime
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
+from typing import AsyncIterator, Iterator, List, Optional, Tuple, Union
 from app.models.booking import Booking, BookingCreate
-from app.db.database import get_all_bookings, get_booking_by_id, delete_booking, create_booking, update_booking
+from app.models.series import BookingRequest, BookingSeries, BookingSeriesCreate, RecurrenceRule, SeriesRecord
+from app.db.booking_store import VersionConflictError
+from app.db.database import (
+    get_bookings_in_range,
+    get_booking_by_id,
+    delete_booking,
+    create_booking,
+    create_bookings,
+    create_series,
+    delete_series,
+    get_series,
+    get_series_occurrences,
+    update_booking
+)
 router = APIRouter()
+MAX_PAGE_SIZE = 1000
+DEFAULT_PAGE_SIZE = 100
+EXPORT_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def encode_cursor(booking_time: datetime, booking_id: int) -> str:
+    raw = f"{booking_time.isoformat()}|{booking_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        booking_time, booking_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(booking_time), int(booking_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
 @router.get("/", response_model=List[Booking])
-def list_bookings():
-    return get_all_bookings()
+def list_bookings(response: Response,
+                  start: Optional[datetime] = Query(None, alias="from"),
+                  end: Optional[datetime] = Query(None, alias="to"),
+                  technician: Optional[str] = None,
+                  specialty: Optional[str] = None,
+                  limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+                  cursor: Optional[str] = None):
+    after = decode_cursor(cursor) if cursor else None
+    bookings = get_bookings_in_range(start, end, technician=technician, specialty=specialty,
+                                     after=after, limit=limit + 1)
+    if len(bookings) > limit:
+        bookings = bookings[:limit]
+        last = bookings[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.booking_time, last.id)
+    return bookings
+
+
+def format_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def parse_if_match(value: Optional[str]) -> Optional[int]:
+    if value is None or value.strip() == "*":
+        return None
+    tag = value.split(",")[0].strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    try:
+        return int(tag.strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid If-Match header")
+
+
+async def read_ndjson_lines(request: Request) -> AsyncIterator[bytes]:
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    yield buffer
+
+
+def export_lines(start: Optional[datetime], end: Optional[datetime],
+                 technician: Optional[str], specialty: Optional[str]) -> Iterator[str]:
+    after = None
+    while True:
+        page = get_bookings_in_range(start, end, technician=technician, specialty=specialty,
+                                     after=after, limit=EXPORT_PAGE_SIZE)
+        for booking in page:
+            yield json.dumps({
+                "id": booking.id,
+                "technician_name": booking.technician_name,
+                "specialty": booking.specialty,
+                "booking_time": booking.booking_time.isoformat(),
+                "version": booking.version,
+                "duration_minutes": booking.duration_minutes
+            }) + "\n"
+        if len(page) < EXPORT_PAGE_SIZE:
+            return
+        after = (page[-1].booking_time, page[-1].id)
+
+
+@router.post("/bulk")
+async def bulk_import(request: Request, atomic: bool = True):
+    candidates = []
+    rows = []
+    parse_errors = []
+    row = 0
+    async for line in read_ndjson_lines(request):
+        row += 1
+        if not line.strip():
+            continue
+        try:
+            candidates.append(BookingCreate.model_validate_json(line))
+            rows.append(row)
+        except ValidationError as e:
+            parse_errors.append({"row": row, "error": f"Invalid booking: {e.errors()[0]['msg']}"})
+    if parse_errors and atomic:
+        return JSONResponse(status_code=400, content={"committed": False, "created": 0, "errors": parse_errors})
+    results = await run_in_threadpool(create_bookings, candidates, atomic, rows)
+    errors = parse_errors + [{"row": result.row, "error": result.error}
+                             for result in results if result.error is not None]
+    errors.sort(key=lambda error: error["row"])
+    created = [{"row": result.row, "id": result.booking_id}
+               for result in results if result.booking_id is not None]
+    if errors and atomic:
+        return JSONResponse(status_code=400, content={"committed": False, "created": 0, "errors": errors})
+    return {"committed": True, "created": len(created), "bookings": created, "errors": errors}
+
+
+@router.get("/export")
+def export_bookings(start: Optional[datetime] = Query(None, alias="from"),
+                    end: Optional[datetime] = Query(None, alias="to"),
+                    technician: Optional[str] = None,
+                    specialty: Optional[str] = None):
+    return StreamingResponse(export_lines(start, end, technician, specialty), media_type=NDJSON_MEDIA_TYPE)
+
+
+def series_response(series: SeriesRecord) -> BookingSeries:
+    return BookingSeries(
+        id=series.id,
+        technician_name=series.technician_name,
+        specialty=series.specialty,
+        booking_time=series.booking_time,
+        duration_minutes=series.duration_minutes,
+        recurrence=RecurrenceRule(frequency=series.frequency, interval=series.interval, count=series.count,
+                                  until=series.until)
+    )
+
+
+def require_series(series_id: int) -> SeriesRecord:
+    series = get_series(series_id)
+    if series is None:
+        raise HTTPException(status_code=404, detail="Series not found")
+    return series
+
+
+@router.get("/series/{series_id}", response_model=BookingSeries)
+def retrieve_series(series_id: int):
+    return series_response(require_series(series_id))
+
+
+@router.get("/series/{series_id}/occurrences", response_model=List[Booking])
+def list_series_occurrences(series_id: int,
+                            start: Optional[datetime] = Query(None, alias="from"),
+                            end: Optional[datetime] = Query(None, alias="to")):
+    require_series(series_id)
+    return get_series_occurrences(series_id, start, end)
+
+
+@router.delete("/series/{series_id}")
+def remove_series(series_id: int):
+    if not delete_series(series_id):
+        raise HTTPException(status_code=404, detail="Series not found")
+    return {"message": "Series deleted successfully"}
 
 
 @router.get("/{booking_id}", response_model=Booking)
-def retrieve_booking(booking_id: int):
+def retrieve_booking(booking_id: int, response: Response):
     booking = get_booking_by_id(booking_id)
     if booking is None:
         raise HTTPException(status_code=404, detail="Booking not found")
+    response.headers["ETag"] = format_etag(booking.version)
     return booking
 
 
@@ -26,21 +200,29 @@ def remove_booking(booking_id: int):
     return {"message": "Booking deleted successfully"}
 
 
-@router.post("/", response_model=Booking)
-def schedule_booking(booking: BookingCreate):
+@router.post("/", response_model=Union[BookingSeries, Booking])
+def schedule_booking(request: BookingRequest, response: Response):
     try:
-        booking_id = create_booking(booking)
-        return get_booking_by_id(booking_id)
+        if request.recurrence is not None:
+            return series_response(get_series(create_series(BookingSeriesCreate(**request.model_dump()))))
+        booking_id = create_booking(BookingCreate(**request.model_dump(exclude={"recurrence"})))
+        created = get_booking_by_id(booking_id)
+        response.headers["ETag"] = format_etag(created.version)
+        return created
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.put("/{booking_id}", response_model=Booking)
-def update_booking_endpoint(booking_id: int, booking: BookingCreate):
+def update_booking_endpoint(booking_id: int, booking: BookingCreate, response: Response,
+                            if_match: Optional[str] = Header(None)):
     try:
-        updated_booking = update_booking(booking_id, booking.dict())
+        updated_booking = update_booking(booking_id, booking.dict(), expected_version=parse_if_match(if_match))
         if updated_booking is None:
             raise HTTPException(status_code=404, detail="Booking not found")
+        response.headers["ETag"] = format_etag(updated_booking.version)
         return updated_booking
+    except VersionConflictError as e:
+        raise HTTPException(status_code=412, detail=str(e), headers={"ETag": format_etag(e.current_version)})
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
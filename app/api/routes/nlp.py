@@ -3,6 +3,7 @@ from pydantic import BaseModel
 import logging
 import colorama
 from colorama import Fore, Style
+from app.nlp.managers.user_context_manager import UserContextManager
 from app.nlp.processors.natural_language_processor import NaturalLanguageProcessor
 from app.nlp.utils.intent_recognizer import IntentRecognizer
 colorama.init(autoreset=True)
@@ -55,33 +56,22 @@ class IntentResponse(BaseModel):
 @router.post("/process", response_model=NLPResponse)
 async def process_text(request: NLPRequest) -> NLPResponse:
     try:
-        request_processor = NaturalLanguageProcessor()
         text = request.text.strip().lower()
         if request.session_id:
-            if request.session_id not in session_contexts:
-                session_contexts[request.session_id] = {}
-            for key, value in session_contexts[request.session_id].items():
-                request_processor.user_context[key] = value
+            user_context = UserContextManager.ensure_defaults(
+                session_contexts.setdefault(request.session_id, {}))
         else:
             logger.info("No session_id provided, using empty context")
-        response = request_processor.process_input(text)
+            user_context = UserContextManager.create_default_context()
+        response = nlp_processor.process_input(text, user_context)
         log_chat_interaction(
             session_id=request.session_id or "no_session",
             user_message=request.text,
             system_response=response
         )
-        local_intent_recognizer = IntentRecognizer()
-        if local_intent_recognizer.is_list_bookings_request(text):
-            if request.session_id:
-                session_contexts[request.session_id] = request_processor.user_context.copy()
-            return NLPResponse(message=response)
-        if "has been updated to" in response.lower() and request.session_id:
-            if request.session_id in session_contexts:
-                del session_contexts[request.session_id]
+        if ("has been updated to" in response.lower() and request.session_id
+                and not intent_recognizer.is_list_bookings_request(text)):
             session_contexts[request.session_id] = {"last_booking_id": None}
-            return NLPResponse(message=response)
-        if request.session_id:
-            session_contexts[request.session_id] = request_processor.user_context.copy()
         return NLPResponse(message=response)
     except Exception as e:
         logger.error(f"Error processing message: {str(e)}")
@@ -1,5 +1,6 @@
 from app.db.database import get_all_bookings
 from app.nlp.processor import NaturalLanguageProcessor
+from app.nlp.managers.user_context_manager import UserContextManager
 
 
 def run_console_app():
@@ -7,10 +8,11 @@ def run_console_app():
     print("I can help you schedule appointments with our technicians.")
     print("Type 'quit' to exit.")
     nlp = NaturalLanguageProcessor()
+    user_context = UserContextManager.create_default_context()
     bookings = get_all_bookings()
     if bookings:
         print("\n> I see you have existing bookings. Would you like to see your current bookings or schedule a new appointment?")
-        nlp.user_context["booking_in_progress"] = True
+        user_context["booking_in_progress"] = True
     else:
         print("\n> How can I help you today? You can book a technician, check your booking ID, or cancel a booking.")
     while True:
@@ -18,5 +20,5 @@ def run_console_app():
         if user_input.lower() == 'quit':
             print("Thank you for using the Technician Booking System. Goodbye!")
             break
-        response = nlp.process_input(user_input)
+        response = nlp.process_input(user_input, user_context)
         print(f"> {response}")
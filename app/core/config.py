@@ -1,11 +1,27 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List, Optional
 
 
 class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "Technician Booking System"
     BACKEND_CORS_ORIGINS: List[str] = ["http://localhost:3000"]
+    BOOKING_STORAGE_BACKEND: str = "memory"
+    SQLITE_DATABASE_PATH: str = "bookings.db"
+    BOOKING_JOURNAL_DIR: Optional[str] = None
+    BOOKING_SNAPSHOT_INTERVAL: int = 10000
+    BOOKING_JOURNAL_FSYNC: bool = True
+    AVAILABILITY_SLOT_MINUTES: int = 15
+    DEFAULT_DURATION_MINUTES: int = 60
+    TECHNICIAN_ASSIGNMENT_STRATEGY: str = "least_loaded"
+    BOOKING_LIST_LIMIT: int = 20
+    SPECIALTY_DURATION_MINUTES: Dict[str, int] = {
+        "electrician": 90,
+        "welder": 120,
+        "carpenter": 120,
+        "painter": 180,
+        "hvac": 90
+    }
 
     class Config:
         case_sensitive = True
@@ -1,16 +1,25 @@
 from app.db.database import (
     get_all_bookings,
     get_booking_by_id,
+    get_bookings_in_range,
     delete_booking,
     create_booking,
     update_booking,
-    bookings_db
+    find_conflicting_booking
 )
 __all__ = [
     "get_all_bookings",
     "get_booking_by_id",
+    "get_bookings_in_range",
     "delete_booking",
     "create_booking",
     "update_booking",
-    "bookings_db"
+    "find_conflicting_booking"
 ]
+
+
+def __getattr__(name: str):
+    if name == "bookings_db":
+        from app.db import database
+        return database.bookings_db
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
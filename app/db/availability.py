@@ -0,0 +1,178 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.core.config import settings
+from app.db.booking_index import BOOKING_DURATION
+
+MINUTES_PER_DAY = 24 * 60
+ONE_DAY = timedelta(days=1)
+
+
+def split_at_midnight(booking_time: datetime,
+                      duration: timedelta = BOOKING_DURATION) -> List[Tuple[datetime, timedelta]]:
+    end = booking_time + duration
+    pieces = []
+    while True:
+        midnight = datetime.combine(booking_time.date() + ONE_DAY, datetime.min.time(), booking_time.tzinfo)
+        if end <= midnight:
+            pieces.append((booking_time, end - booking_time))
+            return pieces
+        pieces.append((booking_time, midnight - booking_time))
+        booking_time = midnight
+
+
+def overlap_days(start: datetime, end: datetime) -> List[date]:
+    day = start.date() - ONE_DAY
+    days = []
+    while datetime.combine(day, datetime.min.time(), end.tzinfo) < end:
+        days.append(day)
+        day += ONE_DAY
+    return days
+
+
+def slot_range(booking_time: datetime, duration: timedelta = BOOKING_DURATION,
+               slot_minutes: Optional[int] = None) -> Tuple[int, int]:
+    slot_minutes = slot_minutes or settings.AVAILABILITY_SLOT_MINUTES
+    slot_seconds = slot_minutes * 60
+    start = booking_time.hour * 3600 + booking_time.minute * 60 + booking_time.second
+    end = start + int(duration.total_seconds()) + (1 if booking_time.microsecond else 0)
+    end = min(end, MINUTES_PER_DAY * 60)
+    return start // slot_seconds, -(-end // slot_seconds)
+
+
+def interval_mask(booking_time: datetime, duration: timedelta = BOOKING_DURATION,
+                  slot_minutes: Optional[int] = None) -> int:
+    first, last = slot_range(booking_time, duration, slot_minutes)
+    return ((1 << (last - first)) - 1) << first
+
+
+def interval_mask_on(day: date, booking_time: datetime, duration: timedelta = BOOKING_DURATION,
+                     slot_minutes: Optional[int] = None) -> int:
+    mask = 0
+    for start, piece in split_at_midnight(booking_time, duration):
+        if start.date() == day:
+            mask |= interval_mask(start, piece, slot_minutes)
+    return mask
+
+
+def covered_mask(booking_time: datetime, duration: timedelta = BOOKING_DURATION,
+                 slot_minutes: Optional[int] = None) -> int:
+    slot_seconds = (slot_minutes or settings.AVAILABILITY_SLOT_MINUTES) * 60
+    start = booking_time.hour * 3600 + booking_time.minute * 60 + booking_time.second
+    end = min(start + int(duration.total_seconds()), MINUTES_PER_DAY * 60)
+    first = -(-(start + (1 if booking_time.microsecond else 0)) // slot_seconds)
+    last = end // slot_seconds
+    if last <= first:
+        return 0
+    return ((1 << (last - first)) - 1) << first
+
+
+class SlotAvailability:
+    def __init__(self, slot_minutes: Optional[int] = None, duration: timedelta = BOOKING_DURATION):
+        self.slot_minutes = slot_minutes or settings.AVAILABILITY_SLOT_MINUTES
+        self.slots_per_day = MINUTES_PER_DAY // self.slot_minutes
+        self.duration = duration
+        self._masks: Dict[date, Dict[str, int]] = {}
+        self._groups: Dict[str, Tuple[str, ...]] = {}
+        self._memberships: Dict[str, List[str]] = {}
+        self._busy_counts: Dict[Tuple[date, str], List[int]] = {}
+        self._full: Dict[Tuple[date, str], int] = {}
+
+    def interval_mask(self, booking_time: datetime, duration: Optional[timedelta] = None) -> int:
+        return interval_mask(booking_time, duration or self.duration, self.slot_minutes)
+
+    def add(self, technician_name: str, booking_time: datetime, duration: Optional[timedelta] = None) -> None:
+        for start, piece in split_at_midnight(booking_time, duration or self.duration):
+            day = start.date()
+            day_masks = self._masks.setdefault(day, {})
+            previous = day_masks.get(technician_name, 0)
+            day_masks[technician_name] = previous | self.interval_mask(start, piece)
+            self._count(day, technician_name, previous, day_masks[technician_name])
+
+    def rebuild(self, technician_name: str, day: date,
+                intervals: Iterable[Tuple[datetime, Optional[timedelta]]]) -> None:
+        mask = 0
+        for booking_time, duration in intervals:
+            mask |= interval_mask_on(day, booking_time, duration or self.duration, self.slot_minutes)
+        day_masks = self._masks.setdefault(day, {})
+        previous = day_masks.get(technician_name, 0)
+        if mask:
+            day_masks[technician_name] = mask
+        else:
+            day_masks.pop(technician_name, None)
+            if not day_masks:
+                del self._masks[day]
+        self._count(day, technician_name, previous, mask)
+
+    def mask(self, day: date, technician_name: Optional[str] = None) -> int:
+        day_masks = self._masks.get(day)
+        if not day_masks:
+            return 0
+        if technician_name is not None:
+            return day_masks.get(technician_name, 0)
+        mask = 0
+        for technician_mask in list(day_masks.values()):
+            mask |= technician_mask
+        return mask
+
+    def free_mask(self, day: date, technician_names: Iterable[str]) -> int:
+        day_masks = self._masks.get(day, {})
+        full = (1 << self.slots_per_day) - 1
+        mask = 0
+        for technician_name in technician_names:
+            mask |= full & ~day_masks.get(technician_name, 0)
+        return mask
+
+    def set_groups(self, groups: Dict[str, Iterable[str]]) -> None:
+        self._groups = {name: tuple(dict.fromkeys(members)) for name, members in groups.items()}
+        self._memberships = {}
+        for name, members in self._groups.items():
+            for technician_name in members:
+                self._memberships.setdefault(technician_name, []).append(name)
+        self._busy_counts.clear()
+        self._full.clear()
+        for day, day_masks in self._masks.items():
+            for technician_name, mask in day_masks.items():
+                self._count(day, technician_name, 0, mask)
+
+    def full_mask(self, day: date, group: str) -> int:
+        return self._full.get((day, group), 0)
+
+    def busy_count(self, day: date, group: str, slot: int) -> int:
+        counts = self._busy_counts.get((day, group))
+        return counts[slot] if counts else 0
+
+    def clear(self) -> None:
+        self._masks.clear()
+        self._busy_counts.clear()
+        self._full.clear()
+
+    def _count(self, day: date, technician_name: str, previous: int, current: int) -> None:
+        groups = self._memberships.get(technician_name)
+        if not groups or previous == current:
+            return
+        for group in groups:
+            key = (day, group)
+            counts = self._busy_counts.get(key)
+            if counts is None:
+                counts = self._busy_counts[key] = [0] * self.slots_per_day
+            capacity = len(self._groups[group])
+            full = self._full.get(key, 0)
+            added = current & ~previous
+            while added:
+                bit = added & -added
+                counts[bit.bit_length() - 1] += 1
+                if counts[bit.bit_length() - 1] == capacity:
+                    full |= bit
+                added ^= bit
+            removed = previous & ~current
+            while removed:
+                bit = removed & -removed
+                counts[bit.bit_length() - 1] -= 1
+                full &= ~bit
+                removed ^= bit
+            if full:
+                self._full[key] = full
+            else:
+                self._full.pop(key, None)
+            if not any(counts):
+                del self._busy_counts[key]
@@ -0,0 +1,121 @@
+import threading
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple
+from app.db.observers import BookingObserver
+from app.db.availability import ONE_DAY, split_at_midnight
+from app.models.booking import BookingRecord, MAX_DURATION_MINUTES
+from app.models.series import SeriesRecord
+
+Interval = Tuple[datetime, datetime]
+MAX_DURATION = timedelta(minutes=MAX_DURATION_MINUTES)
+
+
+class TechnicianDay(NamedTuple):
+    technician_name: str
+    busy: Tuple[Interval, ...]
+    free: Tuple[Interval, ...]
+
+
+class DailyAvailabilityView(BookingObserver):
+    def __init__(self, load_day: Callable[[datetime, datetime], Iterable[BookingRecord]]):
+        self._load_day = load_day
+        self._lock = threading.RLock()
+        self._bookings: Dict[date, Dict[str, Dict[int, Interval]]] = {}
+        self._views: Dict[Tuple[date, str], TechnicianDay] = {}
+
+    def technician_day(self, day: date, technician_name: str) -> TechnicianDay:
+        view = self._views.get((day, technician_name))
+        if view is not None:
+            return view
+        with self._lock:
+            self._ensure_loaded(day)
+            view = self._views.get((day, technician_name))
+            if view is None:
+                view = self._views[(day, technician_name)] = self._materialize(day, technician_name, {})
+            return view
+
+    def day(self, day: date, technician_names: Iterable[str]) -> List[TechnicianDay]:
+        return [self.technician_day(day, technician_name) for technician_name in technician_names]
+
+    def is_loaded(self, day: date) -> bool:
+        return day in self._bookings
+
+    def booking_added(self, booking: BookingRecord) -> None:
+        with self._lock:
+            for day in self._days_of(booking):
+                technicians = self._bookings.get(day)
+                if technicians is None:
+                    continue
+                intervals = technicians.setdefault(booking.technician_name, {})
+                intervals[booking.id] = (booking.booking_time, booking.end_time)
+                self._views[(day, booking.technician_name)] = self._materialize(
+                    day, booking.technician_name, intervals)
+
+    def booking_removed(self, booking: BookingRecord) -> None:
+        with self._lock:
+            for day in self._days_of(booking):
+                technicians = self._bookings.get(day)
+                if technicians is None:
+                    continue
+                intervals = technicians.get(booking.technician_name, {})
+                intervals.pop(booking.id, None)
+                self._views[(day, booking.technician_name)] = self._materialize(
+                    day, booking.technician_name, intervals)
+
+    def series_added(self, series: SeriesRecord) -> None:
+        with self._lock:
+            for booking in series.occurrences_on(self._loaded_and_previous_days()):
+                self.booking_added(booking)
+
+    def series_removed(self, series: SeriesRecord) -> None:
+        with self._lock:
+            for booking in series.occurrences_on(self._loaded_and_previous_days()):
+                self.booking_removed(booking)
+
+    def bookings_reset(self) -> None:
+        with self._lock:
+            self._bookings.clear()
+            self._views.clear()
+
+    def _ensure_loaded(self, day: date) -> None:
+        if day in self._bookings:
+            return
+        start = datetime.combine(day, datetime.min.time())
+        technicians: Dict[str, Dict[int, Interval]] = {}
+        for booking in self._load_day(start - MAX_DURATION, start + ONE_DAY):
+            if booking.end_time <= start:
+                continue
+            technicians.setdefault(booking.technician_name, {})[booking.id] = (booking.booking_time, booking.end_time)
+        self._bookings[day] = technicians
+        for technician_name, intervals in technicians.items():
+            self._views[(day, technician_name)] = self._materialize(day, technician_name, intervals)
+
+    def _loaded_and_previous_days(self) -> List[date]:
+        return sorted({day - offset for day in self._bookings for offset in (ONE_DAY, timedelta(0))})
+
+    @staticmethod
+    def _days_of(booking: BookingRecord) -> List[date]:
+        duration = timedelta(minutes=booking.duration_minutes)
+        return [start.date() for start, _ in split_at_midnight(booking.booking_time, duration)]
+
+    @staticmethod
+    def _materialize(day: date, technician_name: str, intervals: Dict[int, Interval]) -> TechnicianDay:
+        day_start = datetime.combine(day, datetime.min.time())
+        day_end = day_start + ONE_DAY
+        busy: List[List[datetime]] = []
+        for start, end in sorted(intervals.values()):
+            start = max(start, day_start)
+            end = min(end, day_end)
+            if busy and start <= busy[-1][1]:
+                busy[-1][1] = max(busy[-1][1], end)
+            else:
+                busy.append([start, end])
+        free = []
+        cursor = day_start
+        for start, end in busy:
+            if start > cursor:
+                free.append((cursor, start))
+            cursor = end
+        if cursor < day_end:
+            free.append((cursor, day_end))
+        return TechnicianDay(technician_name, tuple((start, end) for start, end in busy), tuple(free))
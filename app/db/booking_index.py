@@ -0,0 +1,177 @@
+import bisect
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from app.db.interval_tree import IntervalTree
+
+BOOKING_DURATION = timedelta(hours=1)
+IndexEntry = Tuple[int, str, datetime, Optional[timedelta]]
+
+
+class BookingIntervalIndex:
+    def __init__(self, duration: timedelta = BOOKING_DURATION, overlaps: bool = True):
+        self.duration = duration
+        self._all: List[Tuple[datetime, int]] = []
+        self._by_technician: Dict[str, List[Tuple[datetime, int]]] = {}
+        self._trees: Optional[Dict[Optional[str], IntervalTree]] = {} if overlaps else None
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def add(self, booking_id: int, technician_name: str, booking_time: datetime,
+            duration: Optional[timedelta] = None) -> None:
+        entry = (booking_time, booking_id)
+        bisect.insort(self._all, entry)
+        bisect.insort(self._by_technician.setdefault(technician_name, []), entry)
+        if self._trees is not None:
+            end = booking_time + (duration or self.duration)
+            for key in (None, technician_name):
+                tree = self._trees.get(key)
+                if tree is None:
+                    tree = self._trees[key] = IntervalTree()
+                tree.insert(booking_time, end, booking_id)
+
+    def remove(self, booking_id: int, technician_name: str, booking_time: datetime) -> None:
+        entry = (booking_time, booking_id)
+        self._discard(self._all, entry)
+        entries = self._by_technician.get(technician_name)
+        if entries is not None:
+            self._discard(entries, entry)
+            if not entries:
+                del self._by_technician[technician_name]
+        if self._trees is not None:
+            for key in (None, technician_name):
+                tree = self._trees.get(key)
+                if tree is not None:
+                    tree.remove(booking_time, booking_id)
+                    if not tree:
+                        del self._trees[key]
+
+    def clear(self) -> None:
+        self._all.clear()
+        self._by_technician.clear()
+        if self._trees is not None:
+            self._trees.clear()
+
+    def bulk_load(self, entries: Iterable[IndexEntry]) -> None:
+        intervals: Dict[Optional[str], List[Tuple[datetime, datetime, int]]] = {}
+        for booking_id, technician_name, booking_time, *rest in entries:
+            entry = (booking_time, booking_id)
+            self._all.append(entry)
+            self._by_technician.setdefault(technician_name, []).append(entry)
+            if self._trees is not None:
+                interval = (booking_time, booking_time + ((rest and rest[0]) or self.duration), booking_id)
+                intervals.setdefault(None, []).append(interval)
+                intervals.setdefault(technician_name, []).append(interval)
+        self._all.sort()
+        for technician_entries in self._by_technician.values():
+            technician_entries.sort()
+        for key, technician_intervals in intervals.items():
+            tree = self._trees[key] = IntervalTree()
+            tree.build(technician_intervals)
+
+    def entries(self, technician_name: Optional[str] = None) -> List[Tuple[datetime, int]]:
+        if technician_name is None:
+            return self._all
+        return self._by_technician.get(technician_name, [])
+
+    def find_overlaps(self, start: datetime, end: datetime,
+                      technician_name: Optional[str] = None) -> Iterator[Tuple[datetime, int]]:
+        if self._trees is None:
+            return self.find_starts_between(start - self.duration, end, technician_name, inclusive_start=False)
+        tree = self._trees.get(technician_name)
+        if tree is None:
+            return iter(())
+        return tree.overlaps(start, end)
+
+    def find_at(self, point: datetime, technician_name: Optional[str] = None) -> Iterator[Tuple[datetime, int]]:
+        tree = None if self._trees is None else self._trees.get(technician_name)
+        if tree is None:
+            return self.find_overlaps(point, point + timedelta(microseconds=1), technician_name)
+        return tree.stab(point)
+
+    def find_starts_between(self, start: Optional[datetime], end: Optional[datetime],
+                            technician_name: Optional[str] = None,
+                            inclusive_start: bool = True,
+                            after: Optional[Tuple[datetime, int]] = None) -> Iterator[Tuple[datetime, int]]:
+        entries = self.entries(technician_name)
+        if start is None:
+            position = 0
+        elif inclusive_start:
+            position = bisect.bisect_left(entries, (start, float("-inf")))
+        else:
+            position = bisect.bisect_right(entries, (start, float("inf")))
+        if after is not None:
+            position = max(position, bisect.bisect_right(entries, after))
+        while position < len(entries) and (end is None or entries[position][0] < end):
+            yield entries[position]
+            position += 1
+
+    @staticmethod
+    def _discard(entries: List[Tuple[datetime, int]], entry: Tuple[datetime, int]) -> None:
+        position = bisect.bisect_left(entries, entry)
+        if position < len(entries) and entries[position] == entry:
+            del entries[position]
+
+
+class DayPartitionedBookingIndex:
+    def __init__(self, duration: timedelta = BOOKING_DURATION, overlaps: bool = True):
+        self.duration = duration
+        self.overlaps = overlaps
+        self._partitions: Dict[date, BookingIntervalIndex] = {}
+        self._days: List[date] = []
+
+    def add(self, booking_id: int, technician_name: str, booking_time: datetime,
+            duration: Optional[timedelta] = None) -> None:
+        day = booking_time.date()
+        partition = self._partitions.get(day)
+        if partition is None:
+            partition = BookingIntervalIndex(self.duration, self.overlaps)
+            self._partitions[day] = partition
+            bisect.insort(self._days, day)
+        partition.add(booking_id, technician_name, booking_time, duration)
+
+    def remove(self, booking_id: int, technician_name: str, booking_time: datetime) -> None:
+        day = booking_time.date()
+        partition = self._partitions.get(day)
+        if partition is None:
+            return
+        partition.remove(booking_id, technician_name, booking_time)
+        if not partition:
+            del self._partitions[day]
+            position = bisect.bisect_left(self._days, day)
+            del self._days[position]
+
+    def clear(self) -> None:
+        self._partitions.clear()
+        self._days.clear()
+
+    def rebuild(self, entries: Iterable[IndexEntry]) -> None:
+        self.clear()
+        by_day: Dict[date, List[IndexEntry]] = {}
+        for entry in entries:
+            by_day.setdefault(entry[2].date(), []).append(entry)
+        for day, day_entries in by_day.items():
+            partition = BookingIntervalIndex(self.duration, self.overlaps)
+            partition.bulk_load(day_entries)
+            self._partitions[day] = partition
+        self._days.extend(sorted(by_day))
+
+    def partition(self, day: date) -> Optional[BookingIntervalIndex]:
+        return self._partitions.get(day)
+
+    def days_between(self, start: Optional[datetime], end: Optional[datetime]) -> List[date]:
+        first = 0 if start is None else bisect.bisect_left(self._days, start.date())
+        last = len(self._days) if end is None else bisect.bisect_right(self._days, end.date())
+        return self._days[first:last]
+
+    def find_overlaps(self, start: datetime, end: datetime,
+                      technician_name: Optional[str] = None) -> Iterator[Tuple[datetime, int]]:
+        for day in self.days_between(start - timedelta(days=1), end):
+            yield from self._partitions[day].find_overlaps(start, end, technician_name)
+
+    def find_starts_between(self, start: Optional[datetime], end: Optional[datetime],
+                            technician_name: Optional[str] = None,
+                            after: Optional[Tuple[datetime, int]] = None) -> Iterator[Tuple[datetime, int]]:
+        first_day = start if after is None or (start is not None and start > after[0]) else after[0]
+        for day in self.days_between(first_day, end):
+            yield from self._partitions[day].find_starts_between(start, end, technician_name, after=after)
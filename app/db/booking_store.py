@@ -0,0 +1,130 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from app.models.booking import BookingCreate, BookingRecord
+from app.models.series import BookingSeriesCreate, SeriesRecord
+from app.db.bulk import BulkRowResult
+from app.db.observers import BookingObserver
+
+
+class VersionConflictError(Exception):
+    def __init__(self, booking_id: int, current_version: int):
+        super().__init__(f"Booking {booking_id} was modified concurrently (current version {current_version})")
+        self.booking_id = booking_id
+        self.current_version = current_version
+
+
+class BookingStore(ABC):
+    _observers: Tuple[BookingObserver, ...] = ()
+
+    def add_observer(self, observer: BookingObserver) -> None:
+        self._observers = self._observers + (observer,)
+
+    def remove_observer(self, observer: BookingObserver) -> None:
+        self._observers = tuple(existing for existing in self._observers if existing is not observer)
+
+    def _notify_added(self, booking: BookingRecord) -> None:
+        for observer in self._observers:
+            observer.booking_added(booking)
+
+    def _notify_removed(self, booking: BookingRecord) -> None:
+        for observer in self._observers:
+            observer.booking_removed(booking)
+
+    def _notify_series_added(self, series: SeriesRecord) -> None:
+        for observer in self._observers:
+            observer.series_added(series)
+
+    def _notify_series_removed(self, series: SeriesRecord) -> None:
+        for observer in self._observers:
+            observer.series_removed(series)
+
+    def _notify_reset(self) -> None:
+        for observer in self._observers:
+            observer.bookings_reset()
+
+    def _notify_stale(self) -> None:
+        for observer in self._observers:
+            observer.bookings_stale()
+
+    @abstractmethod
+    def seed(self, bookings: List[Dict]) -> None:
+        pass
+
+    @abstractmethod
+    def get_all_bookings(self) -> List[BookingRecord]:
+        pass
+
+    @abstractmethod
+    def get_booking_by_id(self, booking_id: int) -> Optional[BookingRecord]:
+        pass
+
+    @abstractmethod
+    def get_bookings_in_range(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                              technician: Optional[str] = None,
+                              specialty: Optional[str] = None,
+                              after: Optional[Tuple[datetime, int]] = None,
+                              limit: Optional[int] = None) -> List[BookingRecord]:
+        pass
+
+    @abstractmethod
+    def find_conflicting_booking(self, booking_time: datetime, technician_name: Optional[str] = None,
+                                 exclude_booking_id: Optional[int] = None,
+                                 duration_minutes: Optional[int] = None) -> Optional[BookingRecord]:
+        pass
+
+    @abstractmethod
+    def day_mask(self, day: date, technician_name: Optional[str] = None) -> int:
+        pass
+
+    @abstractmethod
+    def generation(self) -> int:
+        pass
+
+    @abstractmethod
+    def set_capacity_groups(self, groups: Dict[str, Iterable[str]]) -> None:
+        pass
+
+    @abstractmethod
+    def full_mask(self, day: date, group: str) -> int:
+        pass
+
+    @abstractmethod
+    def create_booking(self, booking_data: BookingCreate) -> int:
+        pass
+
+    @abstractmethod
+    def create_bookings(self, bookings: List[BookingCreate], atomic: bool = True,
+                        row_numbers: Optional[Sequence[int]] = None) -> List[BulkRowResult]:
+        pass
+
+    @abstractmethod
+    def update_booking(self, booking_id: int, booking_data: Dict,
+                       expected_version: Optional[int] = None) -> Optional[BookingRecord]:
+        pass
+
+    @abstractmethod
+    def delete_booking(self, booking_id: int) -> bool:
+        pass
+
+    @abstractmethod
+    def create_series(self, series_data: BookingSeriesCreate) -> int:
+        pass
+
+    @abstractmethod
+    def get_series(self, series_id: int) -> Optional[SeriesRecord]:
+        pass
+
+    @abstractmethod
+    def delete_series(self, series_id: int) -> bool:
+        pass
+
+    @abstractmethod
+    def get_series_occurrences(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                               technician: Optional[str] = None,
+                               series_id: Optional[int] = None) -> List[BookingRecord]:
+        pass
+
+    @abstractmethod
+    def reset_database(self) -> None:
+        pass
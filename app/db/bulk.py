@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from app.models.booking import BookingCreate, default_duration_minutes
+
+
+class BulkRowResult(NamedTuple):
+    row: int
+    booking_id: Optional[int] = None
+    error: Optional[str] = None
+
+
+def booked_message(technician_name: str) -> str:
+    return f"The technician {technician_name} is already booked during this time slot"
+
+
+def row_number(index: int, row_numbers: Optional[Sequence[int]] = None) -> int:
+    return index + 1 if row_numbers is None else row_numbers[index]
+
+
+def plan_bulk_insert(bookings: List[BookingCreate],
+                     find_conflict: Callable[[datetime, str, int], bool],
+                     row_numbers: Optional[Sequence[int]] = None) -> Tuple[List[int], Dict[int, str]]:
+    order = sorted(
+        range(len(bookings)),
+        key=lambda index: (bookings[index].technician_name, bookings[index].booking_time.replace(tzinfo=None), index)
+    )
+    accepted = []
+    errors: Dict[int, str] = {}
+    previous_technician = None
+    previous_end = None
+    previous_row = None
+    for index in order:
+        booking = bookings[index]
+        booking_time = booking.booking_time.replace(tzinfo=None)
+        duration_minutes = booking.duration_minutes or default_duration_minutes(booking.specialty)
+        if booking.technician_name != previous_technician:
+            previous_technician, previous_end, previous_row = booking.technician_name, None, None
+        if previous_end is not None and booking_time < previous_end:
+            errors[index] = f"{booked_message(booking.technician_name)} (conflicts with row {row_number(previous_row, row_numbers)})"
+            continue
+        if find_conflict(booking_time, booking.technician_name, duration_minutes):
+            errors[index] = booked_message(booking.technician_name)
+            continue
+        end = booking_time + timedelta(minutes=duration_minutes)
+        if previous_end is None or end > previous_end:
+            previous_end, previous_row = end, index
+        accepted.append(index)
+    accepted.sort()
+    return accepted, errors
+
+
+def bulk_results(count: int, booking_ids: Dict[int, int], errors: Dict[int, str],
+                 row_numbers: Optional[Sequence[int]] = None) -> List[BulkRowResult]:
+    return [BulkRowResult(row_number(index, row_numbers), booking_ids.get(index), errors.get(index))
+            for index in range(count)]
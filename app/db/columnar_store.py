@@ -0,0 +1,493 @@
+import bisect
+import threading
+from array import array
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from app.core.config import settings
+from app.models.booking import BookingCreate, BookingRecord, default_duration_minutes
+from app.models.series import BookingSeriesCreate, SeriesRecord
+from app.db.availability import SlotAvailability, split_at_midnight
+from app.db.booking_store import BookingStore, VersionConflictError
+from app.db.locks import LockStripes
+from app.db.bulk import BulkRowResult, bulk_results, plan_bulk_insert
+from app.db.recurrence import SeriesIndex, check_series, series_window
+
+EPOCH = datetime(1970, 1, 1)
+MINUTES_PER_DAY = 24 * 60
+ROW_BITS = 32
+ROW_MASK = (1 << ROW_BITS) - 1
+
+
+def to_epoch_minutes(value: datetime) -> int:
+    return (value.replace(tzinfo=None) - EPOCH) // timedelta(minutes=1)
+
+
+def from_epoch_minutes(minutes: int) -> datetime:
+    return EPOCH + timedelta(minutes=minutes)
+
+
+def ceil_epoch_minutes(value: datetime) -> int:
+    return -((EPOCH - value.replace(tzinfo=None)) // timedelta(minutes=1))
+
+
+class LazyBookingList(Sequence):
+    def __init__(self, store: "ColumnarBookingStore", rows: List[int]):
+        self._store = store
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazyBookingList(self._store, self._rows[index])
+        return self._store.build_booking(self._rows[index])
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __eq__(self, other):
+        return isinstance(other, (list, LazyBookingList)) and list(self) == list(other)
+
+    __hash__ = None
+
+
+class ColumnarBookingStore(BookingStore):
+    def __init__(self):
+        self.technician_names: List[str] = []
+        self.specialty_names: List[str] = []
+        self._technician_ids: Dict[str, int] = {}
+        self._specialty_ids: Dict[str, int] = {}
+        self.technician_column = array("I")
+        self.specialty_column = array("I")
+        self.time_column = array("i")
+        self.version_column = array("I")
+        self.duration_column = array("H")
+        self.tombstones = bytearray()
+        self.live_count = 0
+        self._time_keys = array("q")
+        self._technician_keys: Dict[int, array] = {}
+        self._specialty_keys: Dict[str, array] = {}
+        self.availability = SlotAvailability()
+        self.series = SeriesIndex()
+        self._max_duration_minutes = settings.DEFAULT_DURATION_MINUTES
+        self._stripes = LockStripes()
+        self._write_lock = threading.RLock()
+        self._generation = 0
+
+    @property
+    def next_id(self) -> int:
+        return len(self.time_column) + 1
+
+    def __len__(self) -> int:
+        return self.live_count
+
+    def seed(self, bookings: List[Dict]) -> None:
+        for booking_data in bookings:
+            self._append(booking_data["technician_name"], booking_data["specialty"],
+                         booking_data["booking_time"], booking_data.get("duration_minutes"), index=False)
+        self._rebuild_index()
+
+    def get_all_bookings(self) -> LazyBookingList:
+        return LazyBookingList(self, list(self.iter_rows()))
+
+    def get_booking_by_id(self, booking_id: int) -> Optional[BookingRecord]:
+        row = booking_id - 1
+        if not self._is_live(row):
+            return None
+        return self.build_booking(row)
+
+    def get_bookings_in_range(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                              technician: Optional[str] = None,
+                              specialty: Optional[str] = None,
+                              after: Optional[Tuple[datetime, int]] = None,
+                              limit: Optional[int] = None) -> LazyBookingList:
+        if technician is None and specialty is not None:
+            keys = self._specialty_keys.get(specialty.lower())
+        else:
+            keys = self._keys_for(technician)
+        if keys is None:
+            return LazyBookingList(self, [])
+        first = 0 if start is None else bisect.bisect_left(keys, ceil_epoch_minutes(start) << ROW_BITS)
+        if after is not None:
+            after_key = (to_epoch_minutes(after[0]) << ROW_BITS) | (after[1] - 1)
+            first = max(first, bisect.bisect_right(keys, after_key))
+        last = len(keys) if end is None else bisect.bisect_left(keys, ceil_epoch_minutes(end) << ROW_BITS)
+        specialty = None if specialty is None else specialty.lower()
+        rows = []
+        for position in range(first, last):
+            if limit is not None and len(rows) >= limit:
+                break
+            row = keys[position] & ROW_MASK
+            if specialty is not None and self.specialty_names[self.specialty_column[row]].lower() != specialty:
+                continue
+            rows.append(row)
+        return LazyBookingList(self, rows)
+
+    def find_conflicting_booking(self, booking_time: datetime, technician_name: Optional[str] = None,
+                                 exclude_booking_id: Optional[int] = None,
+                                 duration_minutes: Optional[int] = None) -> Optional[BookingRecord]:
+        minutes = to_epoch_minutes(booking_time)
+        row = self._find_conflicting_row(minutes, technician_name,
+                                         None if exclude_booking_id is None else exclude_booking_id - 1,
+                                         duration_minutes)
+        occurrence = self._find_series_overlap(minutes, technician_name, exclude_booking_id, duration_minutes)
+        if occurrence is not None and (row is None or occurrence.id < row + 1):
+            return occurrence
+        return None if row is None else self.build_booking(row)
+
+    def create_booking(self, booking_data: BookingCreate) -> int:
+        booking_time = booking_data.booking_time.replace(tzinfo=None)
+        duration_minutes = booking_data.duration_minutes or default_duration_minutes(booking_data.specialty)
+        with self._stripes.hold(booking_data.technician_name):
+            if self._has_conflict(to_epoch_minutes(booking_time), booking_data.technician_name,
+                                  duration_minutes=duration_minutes):
+                raise ValueError(
+                    f"The technician {booking_data.technician_name} is already booked during this time slot")
+            with self._write_lock:
+                return self._append(booking_data.technician_name, booking_data.specialty, booking_time,
+                                    duration_minutes) + 1
+
+    def create_bookings(self, bookings: List[BookingCreate], atomic: bool = True,
+                        row_numbers: Optional[Sequence[int]] = None) -> List[BulkRowResult]:
+        with self._stripes.hold(*{booking.technician_name for booking in bookings}):
+            accepted, errors = plan_bulk_insert(
+                bookings, lambda booking_time, technician_name, duration_minutes:
+                self._has_conflict(to_epoch_minutes(booking_time), technician_name,
+                                   duration_minutes=duration_minutes),
+                row_numbers)
+            if errors and atomic:
+                return bulk_results(len(bookings), {}, errors, row_numbers)
+            booking_ids = {}
+            with self._write_lock:
+                rebuild = len(accepted) > self.live_count
+                for index in accepted:
+                    booking = bookings[index]
+                    booking_ids[index] = self._append(booking.technician_name, booking.specialty,
+                                                      booking.booking_time, booking.duration_minutes,
+                                                      index=not rebuild) + 1
+                if rebuild:
+                    self._rebuild_index()
+        return bulk_results(len(bookings), booking_ids, errors, row_numbers)
+
+    def update_booking(self, booking_id: int, booking_data: Dict,
+                       expected_version: Optional[int] = None) -> Optional[BookingRecord]:
+        booking_data = {key: value for key, value in booking_data.items() if value is not None}
+        row = booking_id - 1
+        while True:
+            if not self._is_live(row):
+                return None
+            version = self.version_column[row]
+            if expected_version is not None and version != expected_version:
+                raise VersionConflictError(booking_id, version)
+            technician_id = self.technician_column[row]
+            technician_name = booking_data.get("technician_name", self.technician_names[technician_id])
+            with self._stripes.hold(self.technician_names[technician_id], technician_name):
+                if not self._is_live(row) or self.version_column[row] != version:
+                    continue
+                minutes = self.time_column[row]
+                if "booking_time" in booking_data:
+                    booking_time = booking_data["booking_time"].replace(tzinfo=None)
+                    minutes = to_epoch_minutes(booking_time)
+                else:
+                    booking_time = from_epoch_minutes(minutes)
+                duration_minutes = booking_data.get("duration_minutes") or self.duration_column[row]
+                moves_slot = (technician_name != self.technician_names[technician_id]
+                              or minutes != self.time_column[row]
+                              or duration_minutes > self.duration_column[row])
+                if moves_slot:
+                    if self._has_conflict(minutes, technician_name, exclude_row=row,
+                                          duration_minutes=duration_minutes):
+                        raise ValueError(f"The technician {technician_name} is already booked during this time slot")
+                with self._write_lock:
+                    if self._observers:
+                        self._notify_removed(self.build_booking(row))
+                    self.version_column[row] = version + 1
+                    self._unindex(row)
+                    if "technician_name" in booking_data:
+                        self.technician_column[row] = self._intern_technician(booking_data["technician_name"])
+                    if "specialty" in booking_data:
+                        self.specialty_column[row] = self._intern_specialty(booking_data["specialty"])
+                    self.time_column[row] = minutes
+                    self.duration_column[row] = duration_minutes
+                    self._max_duration_minutes = max(self._max_duration_minutes, duration_minutes)
+                    self._index(row)
+                    booking = self.build_booking(row)
+                    self._notify_added(booking)
+                    return booking
+
+    def delete_booking(self, booking_id: int) -> bool:
+        row = booking_id - 1
+        while True:
+            if not self._is_live(row):
+                return False
+            technician_id = self.technician_column[row]
+            with self._stripes.hold(self.technician_names[technician_id]):
+                if not self._is_live(row) or self.technician_column[row] != technician_id:
+                    continue
+                with self._write_lock:
+                    if self._observers:
+                        self._notify_removed(self.build_booking(row))
+                    self._unindex(row)
+                    self.version_column[row] += 1
+                    self.tombstones[row >> 3] |= 1 << (row & 7)
+                    self.live_count -= 1
+                return True
+
+    def create_series(self, series_data: BookingSeriesCreate) -> int:
+        with self._stripes.hold(series_data.technician_name):
+            series = SeriesRecord.from_create(0, series_data)
+            start, end = series_window(series)
+            check_series(series, self.get_bookings_in_range(start, end, technician=series.technician_name),
+                         self.series.for_technician(series.technician_name))
+            with self._write_lock:
+                series = series._replace(id=self._reserve_row() + 1)
+                self.series.add(series)
+                self._generation += 1
+                if self._observers:
+                    self._notify_series_added(series)
+        return series.id
+
+    def get_series(self, series_id: int) -> Optional[SeriesRecord]:
+        return self.series.get(series_id)
+
+    def delete_series(self, series_id: int) -> bool:
+        series = self.series.get(series_id)
+        if series is None:
+            return False
+        with self._stripes.hold(series.technician_name), self._write_lock:
+            if self.series.remove(series_id) is None:
+                return False
+            self._generation += 1
+            if self._observers:
+                self._notify_series_removed(series)
+        return True
+
+    def get_series_occurrences(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                               technician: Optional[str] = None,
+                               series_id: Optional[int] = None) -> List[BookingRecord]:
+        return self.series.occurrences(start, end, technician, series_id)
+
+    def reset_database(self) -> None:
+        with self._stripes.hold_all(), self._write_lock:
+            self.technician_column = array("I")
+            self.specialty_column = array("I")
+            self.time_column = array("i")
+            self.version_column = array("I")
+            self.duration_column = array("H")
+            self.tombstones = bytearray()
+            self.live_count = 0
+            self._max_duration_minutes = settings.DEFAULT_DURATION_MINUTES
+            self._time_keys = array("q")
+            self._technician_keys.clear()
+            self._specialty_keys.clear()
+            self.availability.clear()
+            self.series.clear()
+            self._generation += 1
+            self._notify_reset()
+
+    def generation(self) -> int:
+        return self._generation
+
+    def day_mask(self, day: date, technician_name: Optional[str] = None) -> int:
+        mask = self.availability.mask(day, technician_name)
+        if self.series:
+            mask |= self.series.day_mask(day, technician_name)
+        return mask
+
+    def set_capacity_groups(self, groups: Dict[str, Iterable[str]]) -> None:
+        with self._stripes.hold_all(), self._write_lock:
+            self.availability.set_groups(groups)
+
+    def full_mask(self, day: date, group: str) -> int:
+        return self.availability.full_mask(day, group)
+
+    def iter_rows(self) -> Iterator[int]:
+        return (row for row in range(len(self.time_column)) if self._is_live(row))
+
+    def build_booking(self, row: int) -> BookingRecord:
+        return BookingRecord(
+            row + 1,
+            self.technician_names[self.technician_column[row]],
+            self.specialty_names[self.specialty_column[row]],
+            from_epoch_minutes(self.time_column[row]),
+            self.version_column[row],
+            self.duration_column[row]
+        )
+
+    def _append(self, technician_name: str, specialty: str, booking_time: datetime,
+                duration_minutes: Optional[int] = None, index: bool = True) -> int:
+        row = len(self.time_column)
+        duration_minutes = duration_minutes or default_duration_minutes(specialty)
+        self.technician_column.append(self._intern_technician(technician_name))
+        self.specialty_column.append(self._intern_specialty(specialty))
+        self.time_column.append(to_epoch_minutes(booking_time))
+        self.version_column.append(1)
+        self.duration_column.append(duration_minutes)
+        self._max_duration_minutes = max(self._max_duration_minutes, duration_minutes)
+        if row & 7 == 0:
+            self.tombstones.append(0)
+        self.live_count += 1
+        if index:
+            self._index(row)
+        if self._observers:
+            self._notify_added(self.build_booking(row))
+        return row
+
+    def _reserve_row(self) -> int:
+        row = len(self.time_column)
+        self.technician_column.append(0)
+        self.specialty_column.append(0)
+        self.time_column.append(0)
+        self.version_column.append(1)
+        self.duration_column.append(0)
+        if row & 7 == 0:
+            self.tombstones.append(0)
+        self.tombstones[row >> 3] |= 1 << (row & 7)
+        return row
+
+    def _rebuild_index(self) -> None:
+        by_technician: Dict[int, List[int]] = {}
+        by_specialty: Dict[str, List[int]] = {}
+        all_keys = []
+        for row in self.iter_rows():
+            key = (self.time_column[row] << ROW_BITS) | row
+            all_keys.append(key)
+            by_technician.setdefault(self.technician_column[row], []).append(key)
+            by_specialty.setdefault(self._specialty_key(row), []).append(key)
+        all_keys.sort()
+        self._time_keys = array("q", all_keys)
+        self._technician_keys = {
+            technician_id: array("q", sorted(keys)) for technician_id, keys in by_technician.items()
+        }
+        self._specialty_keys = {
+            specialty: array("q", sorted(keys)) for specialty, keys in by_specialty.items()
+        }
+        self.availability.clear()
+        self._generation += 1
+        for key in all_keys:
+            row = key & ROW_MASK
+            self.availability.add(self.technician_names[self.technician_column[row]],
+                                  from_epoch_minutes(self.time_column[row]), self._duration(row))
+
+    def _find_conflicting_row(self, minutes: int, technician_name: Optional[str] = None,
+                              exclude_row: Optional[int] = None,
+                              duration_minutes: Optional[int] = None) -> Optional[int]:
+        keys = self._keys_for(technician_name)
+        if keys is None:
+            return None
+        low = minutes - self._max_duration_minutes + 1
+        high = minutes + (duration_minutes or settings.DEFAULT_DURATION_MINUTES)
+        first = bisect.bisect_left(keys, low << ROW_BITS)
+        last = bisect.bisect_left(keys, high << ROW_BITS)
+        conflict = None
+        for position in range(first, last):
+            row = keys[position] & ROW_MASK
+            if row == exclude_row or self.time_column[row] + self.duration_column[row] <= minutes:
+                continue
+            if conflict is None or row < conflict:
+                conflict = row
+        return conflict
+
+    def _find_series_overlap(self, minutes: int, technician_name: Optional[str] = None,
+                             exclude_id: Optional[int] = None,
+                             duration_minutes: Optional[int] = None) -> Optional[BookingRecord]:
+        if not self.series:
+            return None
+        booking_time = from_epoch_minutes(minutes)
+        end = booking_time + timedelta(minutes=duration_minutes or settings.DEFAULT_DURATION_MINUTES)
+        return self.series.conflict(booking_time, end, technician_name, exclude_id)
+
+    def _has_conflict(self, minutes: int, technician_name: Optional[str] = None,
+                      exclude_row: Optional[int] = None, duration_minutes: Optional[int] = None) -> bool:
+        return (self._find_conflicting_row(minutes, technician_name, exclude_row, duration_minutes) is not None
+                or self._find_series_overlap(minutes, technician_name, duration_minutes=duration_minutes) is not None)
+
+    def _duration(self, row: int) -> timedelta:
+        return timedelta(minutes=self.duration_column[row])
+
+    def _keys_for(self, technician_name: Optional[str]) -> Optional[array]:
+        if technician_name is None:
+            return self._time_keys
+        technician_id = self._technician_ids.get(technician_name)
+        if technician_id is None:
+            return None
+        return self._technician_keys.get(technician_id)
+
+    def _specialty_key(self, row: int) -> str:
+        return self.specialty_names[self.specialty_column[row]].lower()
+
+    def _index(self, row: int) -> None:
+        self._generation += 1
+        key = (self.time_column[row] << ROW_BITS) | row
+        self._insort(self._time_keys, key)
+        technician_id = self.technician_column[row]
+        technician_keys = self._technician_keys.get(technician_id)
+        if technician_keys is None:
+            technician_keys = self._technician_keys[technician_id] = array("q")
+        self._insort(technician_keys, key)
+        specialty_keys = self._specialty_keys.get(self._specialty_key(row))
+        if specialty_keys is None:
+            specialty_keys = self._specialty_keys[self._specialty_key(row)] = array("q")
+        self._insort(specialty_keys, key)
+        self.availability.add(self.technician_names[technician_id], from_epoch_minutes(self.time_column[row]),
+                              self._duration(row))
+
+    def _unindex(self, row: int) -> None:
+        self._generation += 1
+        key = (self.time_column[row] << ROW_BITS) | row
+        self._discard(self._time_keys, key)
+        technician_keys = self._technician_keys.get(self.technician_column[row])
+        if technician_keys is not None:
+            self._discard(technician_keys, key)
+        specialty_keys = self._specialty_keys.get(self._specialty_key(row))
+        if specialty_keys is not None:
+            self._discard(specialty_keys, key)
+        for start, _ in split_at_midnight(from_epoch_minutes(self.time_column[row]), self._duration(row)):
+            self._rebuild_availability(row, start.date())
+
+    def _rebuild_availability(self, row: int, day: date) -> None:
+        day_start = to_epoch_minutes(datetime.combine(day, datetime.min.time()))
+        technician_keys = self._technician_keys.get(self.technician_column[row]) or array("q")
+        first = bisect.bisect_left(technician_keys, (day_start - MINUTES_PER_DAY) << ROW_BITS)
+        last = bisect.bisect_left(technician_keys, (day_start + MINUTES_PER_DAY) << ROW_BITS)
+        self.availability.rebuild(
+            self.technician_names[self.technician_column[row]],
+            day,
+            [(from_epoch_minutes(technician_keys[position] >> ROW_BITS),
+              self._duration(technician_keys[position] & ROW_MASK)) for position in range(first, last)]
+        )
+
+    def _is_live(self, row: int) -> bool:
+        return 0 <= row < len(self.time_column) and not self.tombstones[row >> 3] & (1 << (row & 7))
+
+    def _intern_technician(self, technician_name: str) -> int:
+        technician_id = self._technician_ids.get(technician_name)
+        if technician_id is None:
+            technician_id = self._technician_ids[technician_name] = len(self.technician_names)
+            self.technician_names.append(technician_name)
+        return technician_id
+
+    def _intern_specialty(self, specialty: str) -> int:
+        specialty_id = self._specialty_ids.get(specialty)
+        if specialty_id is None:
+            specialty_id = self._specialty_ids[specialty] = len(self.specialty_names)
+            self.specialty_names.append(specialty)
+        return specialty_id
+
+    @staticmethod
+    def _insort(keys: array, key: int) -> None:
+        if not keys or keys[-1] < key:
+            keys.append(key)
+        else:
+            keys.insert(bisect.bisect_left(keys, key), key)
+
+    @staticmethod
+    def _discard(keys: array, key: int) -> None:
+        position = bisect.bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            del keys[position]
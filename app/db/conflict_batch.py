@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+from app.core.config import settings
+from app.models.booking import BookingRecord
+
+NO_CONFLICT = -1
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+Candidate = Tuple[Optional[str], datetime, Optional[timedelta]]
+
+
+class BatchConflicts(NamedTuple):
+    mask: np.ndarray
+    booking_ids: np.ndarray
+
+
+class SortedSchedule:
+    def __init__(self, starts: np.ndarray, booking_ids: np.ndarray, duration: timedelta):
+        self.duration = np.timedelta64(duration // MICROSECOND, "us")
+        order = np.lexsort((booking_ids, starts))
+        self.starts = starts[order]
+        self.booking_ids = booking_ids[order]
+        self._min_table = [self.booking_ids]
+        width = 1
+        while width * 2 <= len(self.booking_ids):
+            previous = self._min_table[-1]
+            self._min_table.append(np.minimum(previous[:-width], previous[width:]))
+            width *= 2
+
+    def conflicts(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        low = np.searchsorted(self.starts, starts - self.duration, side="right")
+        high = np.searchsorted(self.starts, ends, side="left")
+        return self._range_min(low, high)
+
+    def _range_min(self, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+        result = np.full(len(low), NO_CONFLICT, dtype=np.int64)
+        hit = high > low
+        if not hit.any():
+            return result
+        low = low[hit]
+        high = high[hit]
+        level = np.log2(high - low).astype(np.int64)
+        minimum = np.full(len(low), np.iinfo(np.int64).max, dtype=np.int64)
+        for depth in np.unique(level):
+            rows = level == depth
+            table = self._min_table[depth]
+            minimum[rows] = np.minimum(table[low[rows]], table[high[rows] - (1 << depth)])
+        result[hit] = minimum
+        return result
+
+
+class ScheduleArrays:
+    def __init__(self, bookings: Iterable[BookingRecord], exclude_booking_id: Optional[int] = None):
+        codes: Dict[str, int] = {}
+        technician_codes: List[int] = []
+        starts: List[datetime] = []
+        booking_ids: List[int] = []
+        durations: List[int] = []
+        for booking in bookings:
+            if booking.id == exclude_booking_id:
+                continue
+            technician_codes.append(codes.setdefault(booking.technician_name, len(codes)))
+            starts.append(booking.booking_time)
+            booking_ids.append(booking.id)
+            durations.append(booking.duration_minutes)
+        start_array = to_datetime64(starts)
+        id_array = np.array(booking_ids, dtype=np.int64)
+        code_array = np.array(technician_codes, dtype=np.int64)
+        duration_array = np.array(durations, dtype=np.int64)
+        self.combined = self._schedules(start_array, id_array, duration_array)
+        self.technicians: Dict[str, List[SortedSchedule]] = {}
+        for technician_name, code in codes.items():
+            rows = code_array == code
+            self.technicians[technician_name] = self._schedules(
+                start_array[rows], id_array[rows], duration_array[rows])
+
+    @staticmethod
+    def _schedules(starts: np.ndarray, booking_ids: np.ndarray, durations: np.ndarray) -> List[SortedSchedule]:
+        return [
+            SortedSchedule(starts[durations == minutes], booking_ids[durations == minutes],
+                           timedelta(minutes=int(minutes)))
+            for minutes in np.unique(durations)
+        ]
+
+    def evaluate(self, candidates: Sequence[Candidate]) -> BatchConflicts:
+        starts = to_datetime64([candidate[1] for candidate in candidates])
+        durations = np.fromiter(
+            (candidate_duration(candidate) // MICROSECOND for candidate in candidates),
+            dtype=np.int64, count=len(candidates)).astype("timedelta64[us]")
+        ends = starts + durations
+        booking_ids = np.full(len(candidates), NO_CONFLICT, dtype=np.int64)
+        groups: Dict[Optional[str], List[int]] = {}
+        for position, candidate in enumerate(candidates):
+            groups.setdefault(candidate[0], []).append(position)
+        for technician_name, positions in groups.items():
+            schedules = self.combined if technician_name is None else self.technicians.get(technician_name, [])
+            rows = np.array(positions, dtype=np.int64)
+            for schedule in schedules:
+                found = schedule.conflicts(starts[rows], ends[rows])
+                current = booking_ids[rows]
+                booking_ids[rows] = np.where(
+                    (found != NO_CONFLICT) & ((current == NO_CONFLICT) | (found < current)), found, current)
+        return BatchConflicts(booking_ids != NO_CONFLICT, booking_ids)
+
+
+def candidate_duration(candidate: Candidate) -> timedelta:
+    if len(candidate) < 3 or candidate[2] is None:
+        return timedelta(minutes=settings.DEFAULT_DURATION_MINUTES)
+    return candidate[2]
+
+
+def to_datetime64(values: Sequence[datetime]) -> np.ndarray:
+    offsets = (((value if value.tzinfo is None else value.replace(tzinfo=None)) - EPOCH) // MICROSECOND
+               for value in values)
+    return np.fromiter(offsets, dtype=np.int64, count=len(values)).astype("datetime64[us]")
@@ -1,99 +1,219 @@
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict
-from app.models.booking import Booking, BookingCreate
-bookings_db: Dict[int, dict] = {}
-next_id = 1
+from datetime import date, datetime, timedelta
+from typing import Callable, Iterable, List, Optional, Dict, Sequence, Tuple
+from app.core.config import settings
+from app.models.booking import BookingCreate, BookingRecord
+from app.models.series import BookingSeriesCreate, SeriesRecord
+from app.db.availability_view import DailyAvailabilityView, TechnicianDay
+from app.db.booking_store import BookingStore
+from app.db.bulk import BulkRowResult
+from app.db.columnar_store import ColumnarBookingStore
+from app.db.journal import BookingJournal
+from app.db.memory_store import InMemoryBookingStore
+from app.db.slot_finder import FreeSlot, FreeSlotFinder
+from app.db.sqlite_store import SQLiteBookingStore
+from app.db.technician_load import TechnicianLoad
+
+
+def create_store() -> BookingStore:
+    if settings.BOOKING_STORAGE_BACKEND == "sqlite":
+        return SQLiteBookingStore(settings.SQLITE_DATABASE_PATH)
+    if settings.BOOKING_STORAGE_BACKEND == "memory":
+        if settings.BOOKING_JOURNAL_DIR:
+            return InMemoryBookingStore(BookingJournal(
+                settings.BOOKING_JOURNAL_DIR,
+                snapshot_interval=settings.BOOKING_SNAPSHOT_INTERVAL,
+                fsync=settings.BOOKING_JOURNAL_FSYNC
+            ))
+        return InMemoryBookingStore()
+    if settings.BOOKING_STORAGE_BACKEND == "columnar":
+        return ColumnarBookingStore()
+    raise ValueError(f"Unknown booking storage backend: {settings.BOOKING_STORAGE_BACKEND}")
+
+
+store = create_store()
+
+
+def get_schedule_in_range(start: datetime, end: datetime) -> List[BookingRecord]:
+    return list(store.get_bookings_in_range(start, end)) + store.get_series_occurrences(start, end)
+
+
+availability_view = DailyAvailabilityView(get_schedule_in_range)
+store.add_observer(availability_view)
+technician_load = TechnicianLoad(get_schedule_in_range)
+store.add_observer(technician_load)
+slot_finder = FreeSlotFinder(store.day_mask)
+
+
+def __getattr__(name: str):
+    if name == "next_id":
+        return getattr(store, "next_id", None)
+    if name == "bookings_db":
+        if isinstance(store, InMemoryBookingStore):
+            return store.bookings_db
+        raise AttributeError(
+            f"bookings_db is only available on the memory backend, not {settings.BOOKING_STORAGE_BACKEND!r}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def initialize_db():
-    global next_id
     sample_bookings = [
         {
             "technician_name": "Nicolas Woollett",
             "specialty": "Plumber",
-            "booking_time": datetime(2022, 10, 15, 10, 0)
+            "booking_time": datetime(2022, 10, 15, 10, 0),
+            "duration_minutes": 60
         },
         {
             "technician_name": "Franky Flay",
             "specialty": "Electrician",
-            "booking_time": datetime(2022, 10, 16, 18, 0)
+            "booking_time": datetime(2022, 10, 16, 18, 0),
+            "duration_minutes": 60
         },
         {
             "technician_name": "Griselda Dickson",
             "specialty": "Welder",
-            "booking_time": datetime(2022, 10, 18, 11, 0)
+            "booking_time": datetime(2022, 10, 18, 11, 0),
+            "duration_minutes": 60
         }
     ]
-    for booking_data in sample_bookings:
-        booking_id = next_id
-        next_id += 1
-        bookings_db[booking_id] = {
-            "technician_name": booking_data["technician_name"],
-            "specialty": booking_data["specialty"],
-            "booking_time": booking_data["booking_time"]
-        }
+    store.seed(sample_bookings)
+
+
+def get_all_bookings() -> List[BookingRecord]:
+    return store.get_all_bookings()
+
+
+def get_booking_by_id(booking_id: int) -> Optional[BookingRecord]:
+    return store.get_booking_by_id(booking_id)
 
 
-def get_all_bookings() -> List[Booking]:
-    return [Booking(id=id, **data) for id, data in bookings_db.items()]
+def get_bookings_in_range(start: Optional[datetime] = None, end: Optional[datetime] = None,
+                          technician: Optional[str] = None,
+                          specialty: Optional[str] = None,
+                          after: Optional[Tuple[datetime, int]] = None,
+                          limit: Optional[int] = None) -> List[BookingRecord]:
+    if start is not None:
+        start = start.replace(tzinfo=None)
+    if end is not None:
+        end = end.replace(tzinfo=None)
+    if after is not None:
+        after = (after[0].replace(tzinfo=None), after[1])
+    return store.get_bookings_in_range(start, end, technician=technician, specialty=specialty,
+                                       after=after, limit=limit)
 
 
-def get_booking_by_id(booking_id: int) -> Optional[Booking]:
-    if booking_id not in bookings_db:
-        return None
-    return Booking(id=booking_id, **bookings_db[booking_id])
+def get_upcoming_bookings(limit: Optional[int] = None) -> List[BookingRecord]:
+    return store.get_bookings_in_range(datetime.now(), limit=limit or settings.BOOKING_LIST_LIMIT)
+
+
+def get_bookings_on_days(days: Iterable[date]) -> List[BookingRecord]:
+    ranges: List[List[date]] = []
+    for day in sorted(set(days)):
+        if ranges and day - ranges[-1][1] == timedelta(days=1):
+            ranges[-1][1] = day
+        else:
+            ranges.append([day, day])
+    bookings: List[BookingRecord] = []
+    for first, last in ranges:
+        start = datetime.combine(first, datetime.min.time())
+        end = datetime.combine(last, datetime.min.time()) + timedelta(days=1)
+        bookings.extend(get_schedule_in_range(start, end))
+    return bookings
 
 
 def delete_booking(booking_id: int) -> bool:
-    if booking_id not in bookings_db:
-        return False
-    del bookings_db[booking_id]
-    return True
+    return store.delete_booking(booking_id)
+
+
+def find_conflicting_booking(booking_time: datetime, technician_name: Optional[str] = None,
+                             exclude_booking_id: Optional[int] = None,
+                             duration_minutes: Optional[int] = None) -> Optional[BookingRecord]:
+    return store.find_conflicting_booking(
+        booking_time, technician_name=technician_name, exclude_booking_id=exclude_booking_id,
+        duration_minutes=duration_minutes)
+
+
+def get_generation() -> int:
+    return store.generation()
+
+
+def get_daily_availability(day: date, technicians: Sequence[str]) -> List[TechnicianDay]:
+    store.generation()
+    return availability_view.day(day, technicians)
+
+
+def set_capacity_groups(groups: Dict[str, Sequence[str]]) -> None:
+    store.set_capacity_groups(groups)
+    technician_load.set_groups(groups)
+
+
+def find_least_loaded_technician(day: date, group: str, accept: Callable[[str], bool]) -> Optional[str]:
+    store.generation()
+    return technician_load.least_loaded(day, group, accept)
+
+
+def find_next_technician_in_rotation(group: str, accept: Callable[[str], bool]) -> Optional[str]:
+    return technician_load.rotate(group, accept)
+
+
+def get_full_mask(day: date, group: str) -> int:
+    return store.full_mask(day, group)
+
+
+def get_day_mask(day: date, technician_name: Optional[str] = None) -> int:
+    return store.day_mask(day, technician_name=technician_name)
+
+
+def find_next_free_slots(after: datetime, technicians: Optional[Sequence[str]] = None,
+                         count: int = 3, duration: Optional[timedelta] = None) -> List[FreeSlot]:
+    return slot_finder.next_free(after.replace(tzinfo=None), technicians, count, duration)
+
+
+def find_nearest_free_slots(around: datetime, technicians: Optional[Sequence[str]] = None, count: int = 3,
+                            earliest: Optional[datetime] = None,
+                            duration: Optional[timedelta] = None) -> List[FreeSlot]:
+    if earliest is not None:
+        earliest = earliest.replace(tzinfo=None)
+    return slot_finder.nearest_free(around.replace(tzinfo=None), technicians, count, earliest, duration)
 
 
 def create_booking(booking_data: BookingCreate) -> int:
-    global next_id
-    booking_time = booking_data.booking_time.replace(tzinfo=None)
-    if booking_time.year <= 2025:
-        for existing_booking in bookings_db.values():
-            existing_time = existing_booking["booking_time"]
-            same_day = (
-                existing_time.year == booking_time.year and
-                existing_time.month == booking_time.month and
-                existing_time.day == booking_time.day
-            )
-            if same_day:
-                existing_start = existing_time
-                existing_end = existing_start + timedelta(hours=1)
-                new_start = booking_time
-                new_end = new_start + timedelta(hours=1)
-                if (new_start < existing_end and existing_start < new_end and
-                        existing_booking["technician_name"] == booking_data.technician_name):
-                    raise ValueError(
-                        f"The technician {booking_data.technician_name} is already booked during this time slot")
-    booking_id = next_id
-    next_id += 1
-    bookings_db[booking_id] = {
-        "technician_name": booking_data.technician_name,
-        "specialty": booking_data.specialty,
-        "booking_time": booking_time
-    }
-    return booking_id
-
-
-def update_booking(booking_id: int, booking_data: Dict) -> Optional[Booking]:
-    if booking_id not in bookings_db:
-        return None
-    booking = bookings_db[booking_id].copy()
-    booking.update(booking_data)
-    bookings_db[booking_id] = booking
-    return Booking(id=booking_id, **bookings_db[booking_id])
+    return store.create_booking(booking_data)
+
+
+def create_bookings(bookings: List[BookingCreate], atomic: bool = True,
+                    row_numbers: Optional[Sequence[int]] = None) -> List[BulkRowResult]:
+    return store.create_bookings(bookings, atomic=atomic, row_numbers=row_numbers)
+
+
+def update_booking(booking_id: int, booking_data: Dict,
+                   expected_version: Optional[int] = None) -> Optional[BookingRecord]:
+    return store.update_booking(booking_id, booking_data, expected_version=expected_version)
+
+
+def create_series(series_data: BookingSeriesCreate) -> int:
+    return store.create_series(series_data)
+
+
+def get_series(series_id: int) -> Optional[SeriesRecord]:
+    return store.get_series(series_id)
+
+
+def delete_series(series_id: int) -> bool:
+    return store.delete_series(series_id)
+
+
+def get_series_occurrences(series_id: int, start: Optional[datetime] = None,
+                           end: Optional[datetime] = None) -> List[BookingRecord]:
+    if start is not None:
+        start = start.replace(tzinfo=None)
+    if end is not None:
+        end = end.replace(tzinfo=None)
+    return store.get_series_occurrences(start, end, series_id=series_id)
 
 
 def reset_database():
-    global next_id
-    bookings_db.clear()
-    next_id = 1
+    store.reset_database()
     return {"status": "success", "message": "Database reset"}
 
 
@@ -0,0 +1,121 @@
+import random
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+STAB_EPSILON = timedelta(microseconds=1)
+
+
+class _Node:
+    __slots__ = ("start", "key", "end", "max_end", "priority", "left", "right")
+
+    def __init__(self, start: datetime, key: int, end: datetime, priority: float):
+        self.start = start
+        self.key = key
+        self.end = end
+        self.max_end = end
+        self.priority = priority
+        self.left: Optional["_Node"] = None
+        self.right: Optional["_Node"] = None
+
+    def update(self) -> None:
+        max_end = self.end
+        if self.left is not None and self.left.max_end > max_end:
+            max_end = self.left.max_end
+        if self.right is not None and self.right.max_end > max_end:
+            max_end = self.right.max_end
+        self.max_end = max_end
+
+
+class IntervalTree:
+    def __init__(self):
+        self._root: Optional[_Node] = None
+        self._size = 0
+        self._random = random.Random()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        self._root = None
+        self._size = 0
+
+    def insert(self, start: datetime, end: datetime, key: int) -> None:
+        node = _Node(start, key, end, self._random.random())
+        left, right = self._split(self._root, (start, key))
+        self._root = self._merge(self._merge(left, node), right)
+        self._size += 1
+
+    def remove(self, start: datetime, key: int) -> bool:
+        left, right = self._split(self._root, (start, key))
+        middle, right = self._split(right, (start, key + 1))
+        self._root = self._merge(left, right)
+        if middle is None:
+            return False
+        self._size -= 1
+        return True
+
+    def build(self, intervals: Iterable[Tuple[datetime, datetime, int]]) -> None:
+        stack: List[_Node] = []
+        size = 0
+        for start, end, key in sorted(intervals, key=lambda interval: (interval[0], interval[2])):
+            node = _Node(start, key, end, self._random.random())
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop()
+                last.update()
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+            size += 1
+        while len(stack) > 1:
+            stack.pop().update()
+        if stack:
+            stack[0].update()
+        self._root = stack[0] if stack else None
+        self._size = size
+
+    def overlaps(self, low: datetime, high: datetime) -> Iterator[Tuple[datetime, int]]:
+        stack: List[_Node] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None and node.max_end > low:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.start >= high:
+                return
+            if node.end > low:
+                yield node.start, node.key
+            node = node.right
+
+    def stab(self, point: datetime) -> Iterator[Tuple[datetime, int]]:
+        return self.overlaps(point, point + STAB_EPSILON)
+
+    def _split(self, node: Optional[_Node], key: Tuple[datetime, int]) -> Tuple[Optional[_Node], Optional[_Node]]:
+        if node is None:
+            return None, None
+        if (node.start, node.key) < key:
+            left, right = self._split(node.right, key)
+            node.right = left
+            node.update()
+            return node, right
+        left, right = self._split(node.left, key)
+        node.left = right
+        node.update()
+        return left, node
+
+    def _merge(self, left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = self._merge(left.right, right)
+            left.update()
+            return left
+        right.left = self._merge(left, right.left)
+        right.update()
+        return right
@@ -0,0 +1,135 @@
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+JOURNAL_FILE_NAME = "bookings.journal"
+SNAPSHOT_FILE_NAME = "bookings.snapshot"
+
+
+class BookingJournal:
+    def __init__(self, directory: str, snapshot_interval: int = 10000, fsync: bool = True):
+        self.directory = directory
+        self.snapshot_interval = snapshot_interval
+        self.fsync = fsync
+        self.journal_path = os.path.join(directory, JOURNAL_FILE_NAME)
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILE_NAME)
+        self.last_lsn = 0
+        self.records_since_snapshot = 0
+        self._condition = threading.Condition()
+        self._pending: List[str] = []
+        self._durable_lsn = 0
+        self._flushing = False
+        self._file = None
+        self.recovered = False
+        os.makedirs(directory, exist_ok=True)
+
+    def load(self) -> Tuple[Optional[Dict], List[Dict]]:
+        snapshot = None
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "r", encoding="utf-8") as snapshot_file:
+                snapshot = json.load(snapshot_file)
+        snapshot_lsn = snapshot["lsn"] if snapshot else 0
+        records = [record for record in self._read_journal() if record["lsn"] > snapshot_lsn]
+        self.recovered = snapshot is not None or bool(records)
+        self.last_lsn = records[-1]["lsn"] if records else snapshot_lsn
+        self._durable_lsn = self.last_lsn
+        self.records_since_snapshot = len(records)
+        self._file = open(self.journal_path, "a", encoding="utf-8")
+        return snapshot, records
+
+    def append(self, record: Dict) -> None:
+        self.append_many([record])
+
+    def append_many(self, records: List[Dict]) -> None:
+        self.wait_durable(self.enqueue(records))
+
+    def enqueue(self, records: List[Dict]) -> int:
+        with self._condition:
+            for record in records:
+                self.last_lsn += 1
+                record["lsn"] = self.last_lsn
+                self._pending.append(json.dumps(record, default=self._encode_value, separators=(",", ":")))
+            self.records_since_snapshot += len(records)
+            return self.last_lsn
+
+    def wait_durable(self, lsn: int) -> None:
+        with self._condition:
+            while self._durable_lsn < lsn:
+                if self._flushing:
+                    self._condition.wait()
+                    continue
+                self._flush_pending()
+
+    def should_snapshot(self) -> bool:
+        return self.records_since_snapshot >= self.snapshot_interval
+
+    def write_snapshot(self, state: Dict) -> None:
+        with self._condition:
+            while self._flushing or self._pending:
+                if self._flushing:
+                    self._condition.wait()
+                else:
+                    self._flush_pending()
+            state["lsn"] = self.last_lsn
+            temp_path = self.snapshot_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as snapshot_file:
+                json.dump(state, snapshot_file, separators=(",", ":"))
+                snapshot_file.flush()
+                os.fsync(snapshot_file.fileno())
+            os.replace(temp_path, self.snapshot_path)
+            self._file.close()
+            self._file = open(self.journal_path, "w", encoding="utf-8")
+            self._sync(self._file)
+            self.records_since_snapshot = 0
+
+    def close(self) -> None:
+        with self._condition:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _flush_pending(self) -> None:
+        self._flushing = True
+        batch, self._pending = self._pending, []
+        batch_lsn = self.last_lsn
+        self._condition.release()
+        try:
+            self._file.write("\n".join(batch) + "\n")
+            self._sync(self._file)
+        finally:
+            self._condition.acquire()
+            self._flushing = False
+        self._durable_lsn = batch_lsn
+        self._condition.notify_all()
+
+    def _sync(self, journal_file) -> None:
+        journal_file.flush()
+        if self.fsync:
+            os.fsync(journal_file.fileno())
+
+    def _read_journal(self) -> List[Dict]:
+        if not os.path.exists(self.journal_path):
+            return []
+        records = []
+        valid_length = 0
+        with open(self.journal_path, "rb") as journal_file:
+            for line in journal_file:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+                valid_length += len(line)
+        if valid_length < os.path.getsize(self.journal_path):
+            with open(self.journal_path, "r+b") as journal_file:
+                journal_file.truncate(valid_length)
+        return records
+
+    @staticmethod
+    def _encode_value(value):
+        if isinstance(value, datetime):
+            return value.isoformat()
+        raise TypeError(f"Cannot journal value of type {type(value).__name__}")
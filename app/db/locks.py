@@ -0,0 +1,65 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List
+
+
+class LockStripes:
+    def __init__(self, stripes: int = 64):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def stripe_for(self, key: str) -> int:
+        return hash(key) % len(self._locks)
+
+    @contextmanager
+    def hold(self, *keys: str) -> Iterator[None]:
+        with self._hold_stripes(sorted({self.stripe_for(key) for key in keys})):
+            yield
+
+    @contextmanager
+    def hold_all(self) -> Iterator[None]:
+        with self._hold_stripes(list(range(len(self._locks)))):
+            yield
+
+    @contextmanager
+    def _hold_stripes(self, stripes: List[int]) -> Iterator[None]:
+        acquired = []
+        try:
+            for stripe in stripes:
+                self._locks[stripe].acquire()
+                acquired.append(stripe)
+            yield
+        finally:
+            for stripe in reversed(acquired):
+                self._locks[stripe].release()
+
+
+class IdAllocator:
+    def __init__(self, start: int = 1):
+        self._next = start
+        self._lock = threading.Lock()
+
+    def peek(self) -> int:
+        return self._next
+
+    def allocate(self) -> int:
+        with self._lock:
+            value = self._next
+            self._next += 1
+            return value
+
+    def allocate_many(self, count: int) -> range:
+        with self._lock:
+            first = self._next
+            self._next += count
+            return range(first, first + count)
+
+    def advance_to(self, value: int) -> None:
+        with self._lock:
+            self._next = max(self._next, value)
+
+    def reset(self, start: int = 1) -> None:
+        with self._lock:
+            self._next = start
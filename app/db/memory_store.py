@@ -0,0 +1,442 @@
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from app.core.config import settings
+from app.models.booking import BookingCreate, BookingRecord, default_duration_minutes
+from app.models.series import BookingSeriesCreate, SeriesRecord
+from app.db.availability import SlotAvailability, split_at_midnight
+from app.db.booking_index import DayPartitionedBookingIndex
+from app.db.booking_store import BookingStore, VersionConflictError
+from app.db.bulk import BulkRowResult, bulk_results, plan_bulk_insert
+from app.db.journal import BookingJournal
+from app.db.locks import IdAllocator, LockStripes
+from app.db.recurrence import SeriesIndex, check_series, series_window
+
+
+class InMemoryBookingStore(BookingStore):
+    def __init__(self, journal: Optional[BookingJournal] = None):
+        self.bookings_db: Dict[int, dict] = {}
+        self.booking_index = DayPartitionedBookingIndex()
+        self.specialty_index = DayPartitionedBookingIndex(overlaps=False)
+        self.availability = SlotAvailability()
+        self.series = SeriesIndex()
+        self.journal = journal
+        self._ids = IdAllocator()
+        self._stripes = LockStripes()
+        self._write_lock = threading.RLock()
+        self._generation = 0
+        if journal is not None:
+            self._recover()
+
+    @property
+    def next_id(self) -> int:
+        return self._ids.peek()
+
+    def seed(self, bookings: List[Dict]) -> None:
+        if self.journal is not None and self.journal.recovered:
+            return
+        rows = [(booking_id, {
+            "technician_name": booking_data["technician_name"],
+            "specialty": booking_data["specialty"],
+            "booking_time": booking_data["booking_time"],
+            "version": 1,
+            "duration_minutes": booking_data.get("duration_minutes") or default_duration_minutes(
+                booking_data["specialty"])
+        }) for booking_id, booking_data in zip(self._ids.allocate_many(len(bookings)), bookings)]
+        with self._write_lock:
+            lsn = self._log([self._booking_record("create", booking_id, data) for booking_id, data in rows])
+            for booking_id, data in rows:
+                self._insert(booking_id, data)
+        self._commit(lsn)
+
+    def get_all_bookings(self) -> List[BookingRecord]:
+        return [self._record(booking_id, data) for booking_id, data in list(self.bookings_db.items())]
+
+    def get_booking_by_id(self, booking_id: int) -> Optional[BookingRecord]:
+        if booking_id not in self.bookings_db:
+            return None
+        return self._record(booking_id, self.bookings_db[booking_id])
+
+    def get_bookings_in_range(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                              technician: Optional[str] = None,
+                              specialty: Optional[str] = None,
+                              after: Optional[Tuple[datetime, int]] = None,
+                              limit: Optional[int] = None) -> List[BookingRecord]:
+        if technician is None and specialty is not None:
+            entries = self.specialty_index.find_starts_between(start, end, specialty.lower(), after=after)
+        else:
+            entries = self.booking_index.find_starts_between(start, end, technician, after=after)
+        bookings = []
+        for _, booking_id in entries:
+            if limit is not None and len(bookings) >= limit:
+                break
+            data = self.bookings_db.get(booking_id)
+            if data is None:
+                continue
+            if specialty is not None and data["specialty"].lower() != specialty.lower():
+                continue
+            bookings.append(self._record(booking_id, data))
+        return bookings
+
+    def find_conflicting_booking(self, booking_time: datetime, technician_name: Optional[str] = None,
+                                 exclude_booking_id: Optional[int] = None,
+                                 duration_minutes: Optional[int] = None) -> Optional[BookingRecord]:
+        new_start = booking_time
+        new_end = booking_time + timedelta(minutes=duration_minutes or settings.DEFAULT_DURATION_MINUTES)
+        conflict_id = None
+        for _, booking_id in self.booking_index.find_overlaps(new_start, new_end, technician_name):
+            if booking_id == exclude_booking_id or booking_id not in self.bookings_db:
+                continue
+            if conflict_id is None or booking_id < conflict_id:
+                conflict_id = booking_id
+        booking = None if conflict_id is None else self._record(conflict_id, self.bookings_db[conflict_id])
+        if self.series:
+            occurrence = self.series.conflict(new_start, new_end, technician_name, exclude_booking_id)
+            if occurrence is not None and (booking is None or occurrence.id < booking.id):
+                return occurrence
+        return booking
+
+    def create_booking(self, booking_data: BookingCreate) -> int:
+        booking_time = booking_data.booking_time.replace(tzinfo=None)
+        duration_minutes = booking_data.duration_minutes or default_duration_minutes(booking_data.specialty)
+        with self._stripes.hold(booking_data.technician_name):
+            if self.find_conflicting_booking(booking_time, booking_data.technician_name,
+                                             duration_minutes=duration_minutes) is not None:
+                raise ValueError(
+                    f"The technician {booking_data.technician_name} is already booked during this time slot")
+            booking_id = self._ids.allocate()
+            data = {
+                "technician_name": booking_data.technician_name,
+                "specialty": booking_data.specialty,
+                "booking_time": booking_time,
+                "version": 1,
+                "duration_minutes": duration_minutes
+            }
+            with self._write_lock:
+                lsn = self._log([self._booking_record("create", booking_id, data)])
+                self._insert(booking_id, data)
+            self._commit(lsn)
+        return booking_id
+
+    def create_bookings(self, bookings: List[BookingCreate], atomic: bool = True,
+                        row_numbers: Optional[Sequence[int]] = None) -> List[BulkRowResult]:
+        with self._stripes.hold(*{booking.technician_name for booking in bookings}):
+            accepted, errors = plan_bulk_insert(
+                bookings, lambda booking_time, technician_name, duration_minutes:
+                self.find_conflicting_booking(
+                    booking_time, technician_name, duration_minutes=duration_minutes) is not None,
+                row_numbers)
+            if errors and atomic:
+                return bulk_results(len(bookings), {}, errors, row_numbers)
+            booking_ids = {}
+            rows = []
+            for index, booking_id in zip(accepted, self._ids.allocate_many(len(accepted))):
+                booking = bookings[index]
+                booking_ids[index] = booking_id
+                rows.append((booking_id, {
+                    "technician_name": booking.technician_name,
+                    "specialty": booking.specialty,
+                    "booking_time": booking.booking_time.replace(tzinfo=None),
+                    "version": 1,
+                    "duration_minutes": booking.duration_minutes or default_duration_minutes(booking.specialty)
+                }))
+            with self._write_lock:
+                lsn = self._log([self._booking_record("create", booking_id, data) for booking_id, data in rows])
+                for booking_id, data in rows:
+                    self._insert(booking_id, data)
+            self._commit(lsn)
+        return bulk_results(len(bookings), booking_ids, errors, row_numbers)
+
+    def update_booking(self, booking_id: int, booking_data: Dict,
+                       expected_version: Optional[int] = None) -> Optional[BookingRecord]:
+        while True:
+            previous = self.bookings_db.get(booking_id)
+            if previous is None:
+                return None
+            if expected_version is not None and previous["version"] != expected_version:
+                raise VersionConflictError(booking_id, previous["version"])
+            technician_name = booking_data.get("technician_name", previous["technician_name"])
+            with self._stripes.hold(previous["technician_name"], technician_name):
+                if self.bookings_db.get(booking_id) is not previous:
+                    continue
+                booking = previous.copy()
+                booking.update((key, value) for key, value in booking_data.items() if value is not None)
+                booking["booking_time"] = booking["booking_time"].replace(tzinfo=None)
+                booking["version"] = previous["version"] + 1
+                if self._moves_slot(previous, booking):
+                    if self.find_conflicting_booking(booking["booking_time"], booking["technician_name"],
+                                                     exclude_booking_id=booking_id,
+                                                     duration_minutes=booking["duration_minutes"]) is not None:
+                        raise ValueError(
+                            f"The technician {booking['technician_name']} is already booked during this time slot")
+                with self._write_lock:
+                    lsn = self._log([self._booking_record("update", booking_id, booking)])
+                    self.bookings_db[booking_id] = booking
+                    self._unindex(booking_id, previous)
+                    self._index(booking_id, booking)
+                self._commit(lsn)
+                return self._record(booking_id, booking)
+
+    def delete_booking(self, booking_id: int) -> bool:
+        while True:
+            booking = self.bookings_db.get(booking_id)
+            if booking is None:
+                return False
+            with self._stripes.hold(booking["technician_name"]):
+                if self.bookings_db.get(booking_id) is not booking:
+                    continue
+                with self._write_lock:
+                    lsn = self._log([{"op": "delete", "id": booking_id}])
+                    del self.bookings_db[booking_id]
+                    self._unindex(booking_id, booking)
+                self._commit(lsn)
+                return True
+
+    def create_series(self, series_data: BookingSeriesCreate) -> int:
+        with self._stripes.hold(series_data.technician_name):
+            series = SeriesRecord.from_create(0, series_data)
+            start, end = series_window(series)
+            check_series(series, self.get_bookings_in_range(start, end, technician=series.technician_name),
+                         self.series.for_technician(series.technician_name))
+            series = series._replace(id=self._ids.allocate())
+            with self._write_lock:
+                lsn = self._log([dict(self._series_state(series), op="series")])
+                self.series.add(series)
+                self._generation += 1
+                if self._observers:
+                    self._notify_series_added(series)
+            self._commit(lsn)
+        return series.id
+
+    def get_series(self, series_id: int) -> Optional[SeriesRecord]:
+        return self.series.get(series_id)
+
+    def delete_series(self, series_id: int) -> bool:
+        series = self.series.get(series_id)
+        if series is None:
+            return False
+        with self._stripes.hold(series.technician_name):
+            with self._write_lock:
+                if self.series.remove(series_id) is None:
+                    return False
+                lsn = self._log([{"op": "delete_series", "id": series_id}])
+                self._generation += 1
+                if self._observers:
+                    self._notify_series_removed(series)
+            self._commit(lsn)
+        return True
+
+    def get_series_occurrences(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                               technician: Optional[str] = None,
+                               series_id: Optional[int] = None) -> List[BookingRecord]:
+        return self.series.occurrences(start, end, technician, series_id)
+
+    def reset_database(self) -> None:
+        with self._stripes.hold_all():
+            with self._write_lock:
+                lsn = self._log([{"op": "reset"}])
+                self.bookings_db.clear()
+                self.series.clear()
+                self.booking_index.clear()
+                self.specialty_index.clear()
+                self.availability.clear()
+                self._generation += 1
+                self._ids.reset()
+                self._notify_reset()
+            self._commit(lsn)
+
+    def day_mask(self, day: date, technician_name: Optional[str] = None) -> int:
+        mask = self.availability.mask(day, technician_name)
+        if self.series:
+            mask |= self.series.day_mask(day, technician_name)
+        return mask
+
+    def generation(self) -> int:
+        return self._generation
+
+    def set_capacity_groups(self, groups: Dict[str, Iterable[str]]) -> None:
+        with self._stripes.hold_all(), self._write_lock:
+            self.availability.set_groups(groups)
+
+    def full_mask(self, day: date, group: str) -> int:
+        return self.availability.full_mask(day, group)
+
+    def snapshot_state(self) -> Dict:
+        technicians: Dict[str, int] = {}
+        specialties: Dict[str, int] = {}
+        ids = []
+        technician_refs = []
+        specialty_refs = []
+        booking_times = []
+        versions = []
+        durations = []
+        for booking_id, data in self.bookings_db.items():
+            ids.append(booking_id)
+            technician_refs.append(technicians.setdefault(data["technician_name"], len(technicians)))
+            specialty_refs.append(specialties.setdefault(data["specialty"], len(specialties)))
+            booking_times.append(data["booking_time"].isoformat())
+            versions.append(data["version"])
+            durations.append(data["duration_minutes"])
+        return {
+            "next_id": self.next_id,
+            "technicians": list(technicians),
+            "specialties": list(specialties),
+            "ids": ids,
+            "technician_refs": technician_refs,
+            "specialty_refs": specialty_refs,
+            "booking_times": booking_times,
+            "versions": versions,
+            "durations": durations,
+            "series": [self._series_state(series) for series in self.series.all()]
+        }
+
+    def _recover(self) -> None:
+        snapshot, records = self.journal.load()
+        if snapshot is not None:
+            technicians = snapshot["technicians"]
+            specialties = snapshot["specialties"]
+            versions = snapshot.get("versions") or [1] * len(snapshot["ids"])
+            durations = snapshot.get("durations") or [None] * len(snapshot["ids"])
+            for booking_id, technician_ref, specialty_ref, booking_time, version, duration_minutes in zip(
+                    snapshot["ids"], snapshot["technician_refs"],
+                    snapshot["specialty_refs"], snapshot["booking_times"], versions, durations):
+                self.bookings_db[booking_id] = {
+                    "technician_name": technicians[technician_ref],
+                    "specialty": specialties[specialty_ref],
+                    "booking_time": datetime.fromisoformat(booking_time),
+                    "version": version,
+                    "duration_minutes": duration_minutes or settings.DEFAULT_DURATION_MINUTES
+                }
+            for series in snapshot.get("series", []):
+                self.series.add(self._series_from_state(series))
+            self._ids.reset(snapshot["next_id"])
+        for record in records:
+            self._replay(record)
+        self.booking_index.rebuild(
+            (booking_id, data["technician_name"], data["booking_time"], self._duration(data))
+            for booking_id, data in self.bookings_db.items()
+        )
+        self.specialty_index.rebuild(
+            (booking_id, data["specialty"].lower(), data["booking_time"])
+            for booking_id, data in self.bookings_db.items()
+        )
+        for data in self.bookings_db.values():
+            self.availability.add(data["technician_name"], data["booking_time"], self._duration(data))
+
+    def _replay(self, record: Dict) -> None:
+        operation = record["op"]
+        if operation == "reset":
+            self.bookings_db.clear()
+            self.series.clear()
+            self._ids.reset()
+        elif operation == "delete":
+            self.bookings_db.pop(record["id"], None)
+        elif operation == "series":
+            self.series.add(self._series_from_state(record))
+            self._ids.advance_to(record["id"] + 1)
+        elif operation == "delete_series":
+            self.series.remove(record["id"])
+        else:
+            booking_id = record["id"]
+            self.bookings_db[booking_id] = {
+                "technician_name": record["technician_name"],
+                "specialty": record["specialty"],
+                "booking_time": datetime.fromisoformat(record["booking_time"]),
+                "version": record.get("version", 1),
+                "duration_minutes": record.get("duration_minutes") or settings.DEFAULT_DURATION_MINUTES
+            }
+            self._ids.advance_to(booking_id + 1)
+
+    def _log(self, records: List[Dict]) -> int:
+        if self.journal is None:
+            return 0
+        return self.journal.enqueue(records)
+
+    def _commit(self, lsn: int) -> None:
+        if self.journal is None:
+            return
+        self.journal.wait_durable(lsn)
+        self._maybe_snapshot()
+
+    @staticmethod
+    def _booking_record(operation: str, booking_id: int, booking: Dict) -> Dict:
+        return {
+            "op": operation,
+            "id": booking_id,
+            "technician_name": booking["technician_name"],
+            "specialty": booking["specialty"],
+            "booking_time": booking["booking_time"],
+            "version": booking["version"],
+            "duration_minutes": booking["duration_minutes"]
+        }
+
+    @staticmethod
+    def _series_state(series: SeriesRecord) -> Dict:
+        state = series._asdict()
+        state["booking_time"] = series.booking_time.isoformat()
+        state["until"] = None if series.until is None else series.until.isoformat()
+        return state
+
+    @staticmethod
+    def _series_from_state(state: Dict) -> SeriesRecord:
+        return SeriesRecord(
+            state["id"],
+            state["technician_name"],
+            state["specialty"],
+            datetime.fromisoformat(state["booking_time"]),
+            state["duration_minutes"],
+            state["frequency"],
+            state["interval"],
+            state["count"],
+            None if state["until"] is None else datetime.fromisoformat(state["until"])
+        )
+
+    def _maybe_snapshot(self) -> None:
+        with self._write_lock:
+            if self.journal.should_snapshot():
+                self.journal.write_snapshot(self.snapshot_state())
+
+    @staticmethod
+    def _moves_slot(previous: Dict, booking: Dict) -> bool:
+        return (previous["technician_name"] != booking["technician_name"]
+                or previous["booking_time"] != booking["booking_time"]
+                or previous["duration_minutes"] < booking["duration_minutes"])
+
+    @staticmethod
+    def _record(booking_id: int, data: Dict) -> BookingRecord:
+        return BookingRecord(booking_id, data["technician_name"], data["specialty"], data["booking_time"],
+                             data["version"], data["duration_minutes"])
+
+    @staticmethod
+    def _duration(data: Dict) -> timedelta:
+        return timedelta(minutes=data["duration_minutes"])
+
+    def _insert(self, booking_id: int, data: Dict) -> None:
+        self.bookings_db[booking_id] = data
+        self._index(booking_id, data)
+
+    def _index(self, booking_id: int, data: Dict) -> None:
+        self._generation += 1
+        self.booking_index.add(booking_id, data["technician_name"], data["booking_time"], self._duration(data))
+        self.specialty_index.add(booking_id, data["specialty"].lower(), data["booking_time"])
+        self.availability.add(data["technician_name"], data["booking_time"], self._duration(data))
+        if self._observers:
+            self._notify_added(self._record(booking_id, data))
+
+    def _unindex(self, booking_id: int, data: Dict) -> None:
+        self._generation += 1
+        self.booking_index.remove(booking_id, data["technician_name"], data["booking_time"])
+        self.specialty_index.remove(booking_id, data["specialty"].lower(), data["booking_time"])
+        for start, _ in split_at_midnight(data["booking_time"], self._duration(data)):
+            self._rebuild_availability(data["technician_name"], start.date())
+        if self._observers:
+            self._notify_removed(self._record(booking_id, data))
+
+    def _rebuild_availability(self, technician_name: str, day: date) -> None:
+        intervals = []
+        for partition_day in (day - timedelta(days=1), day):
+            partition = self.booking_index.partition(partition_day)
+            entries = partition.entries(technician_name) if partition is not None else []
+            intervals.extend((booking_time, self._duration(self.bookings_db[entry_id]))
+                             for booking_time, entry_id in entries if entry_id in self.bookings_db)
+        self.availability.rebuild(technician_name, day, intervals)
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from app.models.booking import BookingRecord
+from app.models.series import SeriesRecord
+
+
+class BookingObserver(ABC):
+    @abstractmethod
+    def booking_added(self, booking: BookingRecord) -> None:
+        pass
+
+    @abstractmethod
+    def booking_removed(self, booking: BookingRecord) -> None:
+        pass
+
+    @abstractmethod
+    def series_added(self, series: SeriesRecord) -> None:
+        pass
+
+    @abstractmethod
+    def series_removed(self, series: SeriesRecord) -> None:
+        pass
+
+    @abstractmethod
+    def bookings_reset(self) -> None:
+        pass
+
+    def bookings_stale(self) -> None:
+        self.bookings_reset()
@@ -0,0 +1,110 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.db.availability import ONE_DAY, interval_mask_on, overlap_days
+from app.models.booking import BookingRecord
+from app.models.series import SeriesRecord
+
+
+def series_window(series: SeriesRecord) -> Tuple[datetime, datetime]:
+    start = datetime.combine(series.booking_time.date(), datetime.min.time()) - ONE_DAY
+    return start, datetime.combine(series.end_time.date(), datetime.min.time()) + ONE_DAY
+
+
+def check_series(series: SeriesRecord, bookings: Iterable[BookingRecord], others: Iterable[SeriesRecord]) -> None:
+    by_day: Dict[date, List[BookingRecord]] = {}
+    for booking in bookings:
+        by_day.setdefault(booking.booking_time.date(), []).append(booking)
+    others = [other for other in others if other.id != series.id]
+    for occurrence in series.occurrences():
+        days = overlap_days(occurrence.booking_time, occurrence.end_time)
+        candidates = [candidate for day in days for candidate in by_day.get(day, [])]
+        candidates.extend(candidate for other in others for candidate in other.occurrences_on(days))
+        if any(candidate.booking_time < occurrence.end_time and candidate.end_time > occurrence.booking_time
+               for candidate in candidates):
+            raise ValueError(f"The technician {series.technician_name} is already booked on "
+                             f"{occurrence.booking_time:%Y-%m-%d %H:%M}")
+
+
+def first_series_overlap(series: Iterable[SeriesRecord], booking_time: datetime, end: datetime,
+                         exclude_id: Optional[int] = None) -> Optional[BookingRecord]:
+    conflict = None
+    days = overlap_days(booking_time, end)
+    for record in series:
+        if record.id == exclude_id:
+            continue
+        for occurrence in record.occurrences_on(days):
+            if occurrence.booking_time >= end or occurrence.end_time <= booking_time:
+                continue
+            if conflict is None or occurrence.id < conflict.id:
+                conflict = occurrence
+    return conflict
+
+
+def series_day_mask(series: Iterable[SeriesRecord], day: date) -> int:
+    mask = 0
+    for record in series:
+        for occurrence in record.occurrences_on((day - ONE_DAY, day)):
+            mask |= interval_mask_on(day, occurrence.booking_time, timedelta(minutes=occurrence.duration_minutes))
+    return mask
+
+
+def expand_series(series: Iterable[SeriesRecord], start: Optional[datetime] = None,
+                  end: Optional[datetime] = None) -> List[BookingRecord]:
+    occurrences = [occurrence for record in series for occurrence in record.occurrences(start, end)]
+    occurrences.sort(key=lambda occurrence: (occurrence.booking_time, occurrence.id))
+    return occurrences
+
+
+class SeriesIndex:
+    def __init__(self):
+        self._series: Dict[int, SeriesRecord] = {}
+        self._by_technician: Dict[str, Dict[int, SeriesRecord]] = {}
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def add(self, series: SeriesRecord) -> None:
+        self._series[series.id] = series
+        self._by_technician.setdefault(series.technician_name, {})[series.id] = series
+
+    def remove(self, series_id: int) -> Optional[SeriesRecord]:
+        series = self._series.pop(series_id, None)
+        if series is not None:
+            technician_series = self._by_technician[series.technician_name]
+            del technician_series[series_id]
+            if not technician_series:
+                del self._by_technician[series.technician_name]
+        return series
+
+    def get(self, series_id: int) -> Optional[SeriesRecord]:
+        return self._series.get(series_id)
+
+    def clear(self) -> None:
+        self._series.clear()
+        self._by_technician.clear()
+
+    def all(self) -> List[SeriesRecord]:
+        return list(self._series.values())
+
+    def for_technician(self, technician_name: Optional[str]) -> List[SeriesRecord]:
+        if technician_name is None:
+            return list(self._series.values())
+        return list(self._by_technician.get(technician_name, {}).values())
+
+    def occurrences(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                    technician_name: Optional[str] = None, series_id: Optional[int] = None) -> List[BookingRecord]:
+        if series_id is not None:
+            series = [self._series[series_id]] if series_id in self._series else []
+        else:
+            series = self.for_technician(technician_name)
+        return expand_series(
+            (record for record in series
+             if (end is None or record.booking_time < end) and (start is None or record.end_time > start)),
+            start, end)
+
+    def conflict(self, booking_time: datetime, end: datetime, technician_name: Optional[str] = None,
+                 exclude_id: Optional[int] = None) -> Optional[BookingRecord]:
+        return first_series_overlap(self.for_technician(technician_name), booking_time, end, exclude_id)
+
+    def day_mask(self, day: date, technician_name: Optional[str] = None) -> int:
+        return series_day_mask(self.for_technician(technician_name), day)
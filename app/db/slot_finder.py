@@ -0,0 +1,102 @@
+from datetime import date, datetime, timedelta
+from typing import Callable, List, NamedTuple, Optional, Sequence
+from app.core.config import settings
+from app.db.availability import MINUTES_PER_DAY
+from app.db.booking_index import BOOKING_DURATION
+
+
+class FreeSlot(NamedTuple):
+    start: datetime
+    technicians: List[str]
+
+
+class FreeSlotFinder:
+    def __init__(self, day_mask: Callable[[date, Optional[str]], int],
+                 slot_minutes: Optional[int] = None,
+                 duration: timedelta = BOOKING_DURATION,
+                 horizon_days: int = 30):
+        self.day_mask = day_mask
+        self.slot_minutes = slot_minutes or settings.AVAILABILITY_SLOT_MINUTES
+        self.slots_per_day = MINUTES_PER_DAY // self.slot_minutes
+        self.duration = duration
+        self.span = self.span_for(duration)
+        self.horizon_days = horizon_days
+        self.full = (1 << self.slots_per_day) - 1
+
+    def span_for(self, duration: Optional[timedelta]) -> int:
+        if duration is None:
+            return self.span
+        return max(1, -(-duration // timedelta(minutes=self.slot_minutes)))
+
+    def blocked_starts(self, busy: int, span: Optional[int] = None) -> int:
+        blocked = busy
+        for shift in range(1, span or self.span):
+            blocked |= busy >> shift
+        return blocked
+
+    def free_starts(self, day: date, technicians: Optional[Sequence[str]] = None,
+                    duration: Optional[timedelta] = None) -> int:
+        span = self.span_for(duration)
+        if technicians is None:
+            return self.full & ~self.blocked_starts(self.busy_mask(day, None), span)
+        free = 0
+        for technician_name in technicians:
+            free |= self.full & ~self.blocked_starts(self.busy_mask(day, technician_name), span)
+            if free == self.full:
+                break
+        return free
+
+    def busy_mask(self, day: date, technician_name: Optional[str] = None) -> int:
+        next_day = self.day_mask(day + timedelta(days=1), technician_name)
+        return self.day_mask(day, technician_name) | next_day << self.slots_per_day
+
+    def next_free(self, after: datetime, technicians: Optional[Sequence[str]] = None,
+                  count: int = 3, duration: Optional[timedelta] = None) -> List[FreeSlot]:
+        slots: List[FreeSlot] = []
+        day = after.date()
+        first = self._ceil_slot(after)
+        for _ in range(self.horizon_days + 1):
+            free = self.free_starts(day, technicians, duration) & ~((1 << first) - 1)
+            while free and len(slots) < count:
+                slot = (free & -free).bit_length() - 1
+                slots.append(self._free_slot(day, slot, technicians, duration))
+                free &= free - 1
+            if len(slots) == count:
+                break
+            day += timedelta(days=1)
+            first = 0
+        return slots
+
+    def nearest_free(self, around: datetime, technicians: Optional[Sequence[str]] = None,
+                     count: int = 3, earliest: Optional[datetime] = None,
+                     duration: Optional[timedelta] = None) -> List[FreeSlot]:
+        day = around.date()
+        free = self.free_starts(day, technicians, duration)
+        if earliest is not None and earliest.date() == day:
+            free &= ~((1 << self._ceil_slot(earliest)) - 1)
+        elif earliest is not None and earliest.date() > day:
+            free = 0
+        before = free & ((1 << self._ceil_slot(around)) - 1)
+        candidates = []
+        while before and len(candidates) < count:
+            slot = before.bit_length() - 1
+            candidates.append(self._free_slot(day, slot, technicians, duration))
+            before &= ~(1 << slot)
+        candidates.extend(self.next_free(max(around, earliest or around), technicians, count, duration))
+        candidates.sort(key=lambda free_slot: (abs(free_slot.start - around), free_slot.start))
+        return sorted(candidates[:count], key=lambda free_slot: free_slot.start)
+
+    def _ceil_slot(self, value: datetime) -> int:
+        seconds = value.hour * 3600 + value.minute * 60 + value.second + (1 if value.microsecond else 0)
+        return -(-seconds // (self.slot_minutes * 60))
+
+    def _free_slot(self, day: date, slot: int, technicians: Optional[Sequence[str]],
+                   duration: Optional[timedelta] = None) -> FreeSlot:
+        start = datetime.combine(day, datetime.min.time()) + timedelta(minutes=slot * self.slot_minutes)
+        if technicians is None:
+            return FreeSlot(start, [])
+        bit = 1 << slot
+        return FreeSlot(start, [
+            technician_name for technician_name in technicians
+            if not self.blocked_starts(self.busy_mask(day, technician_name), self.span_for(duration)) & bit
+        ])
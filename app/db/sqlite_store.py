@@ -0,0 +1,483 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from app.core.config import settings
+from app.models.booking import BookingCreate, BookingRecord, MAX_DURATION_MINUTES, default_duration_minutes
+from app.models.series import BookingSeriesCreate, SeriesRecord
+from app.db.availability import MINUTES_PER_DAY, interval_mask_on
+from app.db.booking_store import BookingStore, VersionConflictError
+from app.db.bulk import BulkRowResult, bulk_results, plan_bulk_insert
+from app.db.recurrence import check_series, expand_series, first_series_overlap, series_day_mask, series_window
+
+SCHEMA_STATEMENTS = [
+    """CREATE TABLE IF NOT EXISTS bookings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        technician_name TEXT NOT NULL,
+        specialty TEXT NOT NULL,
+        booking_time TEXT NOT NULL,
+        version INTEGER NOT NULL DEFAULT 1,
+        duration_minutes INTEGER NOT NULL DEFAULT 60,
+        end_time TEXT
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_bookings_technician_time ON bookings (technician_name, booking_time)",
+    "CREATE INDEX IF NOT EXISTS idx_bookings_time ON bookings (booking_time)",
+    "CREATE INDEX IF NOT EXISTS idx_bookings_specialty_time ON bookings (specialty COLLATE NOCASE, booking_time)",
+    """CREATE TABLE IF NOT EXISTS booking_series (
+        id INTEGER PRIMARY KEY,
+        technician_name TEXT NOT NULL,
+        specialty TEXT NOT NULL,
+        booking_time TEXT NOT NULL,
+        duration_minutes INTEGER NOT NULL,
+        frequency TEXT NOT NULL,
+        repeat_interval INTEGER NOT NULL,
+        count_limit INTEGER,
+        until_time TEXT,
+        end_time TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_booking_series_technician_time ON booking_series (technician_name, booking_time)",
+    "CREATE TABLE IF NOT EXISTS store_meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    "INSERT OR IGNORE INTO store_meta (name, value) VALUES ('generation', 0)"
+]
+SELECT_COLUMNS = "SELECT id, technician_name, specialty, booking_time, version, duration_minutes FROM bookings"
+SELECT_ALL_SQL = f"{SELECT_COLUMNS} ORDER BY id"
+SELECT_BY_ID_SQL = f"{SELECT_COLUMNS} WHERE id = ?"
+SELECT_OVERLAP_SQL = (
+    f"{SELECT_COLUMNS} WHERE booking_time > ? AND booking_time < ? AND end_time > ? AND id IS NOT ? "
+    "ORDER BY id LIMIT 1"
+)
+SELECT_TECHNICIAN_OVERLAP_SQL = (
+    f"{SELECT_COLUMNS} WHERE technician_name = ? AND booking_time > ? AND booking_time < ? "
+    "AND end_time > ? AND id IS NOT ? ORDER BY id LIMIT 1"
+)
+SELECT_DAY_TIMES_SQL = (
+    "SELECT booking_time, duration_minutes FROM bookings WHERE booking_time > ? AND booking_time < ? AND end_time > ?"
+)
+SELECT_TECHNICIAN_DAY_TIMES_SQL = f"{SELECT_DAY_TIMES_SQL} AND technician_name = ?"
+COUNT_SQL = "SELECT COUNT(*) FROM bookings"
+INSERT_SQL = (
+    "INSERT INTO bookings (technician_name, specialty, booking_time, duration_minutes, end_time) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+UPDATE_SQL = (
+    "UPDATE bookings SET technician_name = ?, specialty = ?, booking_time = ?, duration_minutes = ?, "
+    "end_time = ?, version = version + 1 WHERE id = ? AND version = ?"
+)
+TABLE_INFO_SQL = "PRAGMA table_info(bookings)"
+ADD_VERSION_COLUMN_SQL = "ALTER TABLE bookings ADD COLUMN version INTEGER NOT NULL DEFAULT 1"
+ADD_DURATION_COLUMN_SQL = "ALTER TABLE bookings ADD COLUMN duration_minutes INTEGER NOT NULL DEFAULT 60"
+ADD_END_TIME_COLUMN_SQL = "ALTER TABLE bookings ADD COLUMN end_time TEXT"
+SELECT_MISSING_END_SQL = "SELECT id, booking_time, duration_minutes FROM bookings WHERE end_time IS NULL"
+UPDATE_END_TIME_SQL = "UPDATE bookings SET end_time = ? WHERE id = ?"
+DELETE_SQL = "DELETE FROM bookings WHERE id = ?"
+SELECT_SERIES_COLUMNS = (
+    "SELECT id, technician_name, specialty, booking_time, duration_minutes, frequency, repeat_interval, "
+    "count_limit, until_time FROM booking_series"
+)
+SELECT_SERIES_BY_ID_SQL = f"{SELECT_SERIES_COLUMNS} WHERE id = ?"
+INSERT_SERIES_SQL = (
+    "INSERT INTO booking_series (id, technician_name, specialty, booking_time, duration_minutes, frequency, "
+    "repeat_interval, count_limit, until_time, end_time) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+DELETE_SERIES_SQL = "DELETE FROM booking_series WHERE id = ?"
+NEXT_SEQUENCE_SQL = "UPDATE sqlite_sequence SET seq = seq + 1 WHERE name = 'bookings'"
+START_SEQUENCE_SQL = (
+    "INSERT INTO sqlite_sequence (name, seq) VALUES ('bookings', (SELECT COALESCE(MAX(id), 0) + 1 FROM bookings))"
+)
+SELECT_SEQUENCE_SQL = "SELECT seq FROM sqlite_sequence WHERE name = 'bookings'"
+SELECT_GENERATION_SQL = "SELECT value FROM store_meta WHERE name = 'generation'"
+BUMP_GENERATION_SQL = "UPDATE store_meta SET value = value + 1 WHERE name = 'generation' RETURNING value"
+RESET_STATEMENTS = [
+    "DELETE FROM bookings",
+    "DELETE FROM booking_series",
+    "DELETE FROM sqlite_sequence WHERE name = 'bookings'"
+]
+
+
+class SQLiteBookingStore(BookingStore):
+    def __init__(self, database_path: str, busy_timeout_ms: int = 5000):
+        self.database_path = database_path
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._generation = 0
+        self._capacity_groups: Dict[str, Tuple[str, ...]] = {}
+        self._generation_lock = threading.Lock()
+        with self._transaction() as connection:
+            for statement in SCHEMA_STATEMENTS:
+                connection.execute(statement)
+            columns = {row[1] for row in connection.execute(TABLE_INFO_SQL)}
+            if "version" not in columns:
+                connection.execute(ADD_VERSION_COLUMN_SQL)
+            if "duration_minutes" not in columns:
+                connection.execute(ADD_DURATION_COLUMN_SQL)
+            if "end_time" not in columns:
+                connection.execute(ADD_END_TIME_COLUMN_SQL)
+            connection.executemany(UPDATE_END_TIME_SQL, [
+                (self._encode_end(datetime.fromisoformat(booking_time), duration_minutes), booking_id)
+                for booking_id, booking_time, duration_minutes in connection.execute(SELECT_MISSING_END_SQL).fetchall()
+            ])
+        self._generation = self._connection().execute(SELECT_GENERATION_SQL).fetchone()[0]
+
+    def seed(self, bookings: List[Dict]) -> None:
+        events: List[Callable[[], None]] = []
+        with self._transaction(events) as connection:
+            if connection.execute(COUNT_SQL).fetchone()[0]:
+                return
+            for booking_data in bookings:
+                duration_minutes = booking_data.get("duration_minutes") or default_duration_minutes(
+                    booking_data["specialty"])
+                booking_id = connection.execute(INSERT_SQL, (
+                    booking_data["technician_name"],
+                    booking_data["specialty"],
+                    self._encode_time(booking_data["booking_time"]),
+                    duration_minutes,
+                    self._encode_end(booking_data["booking_time"], duration_minutes)
+                )).lastrowid
+                self._queue_added(events, BookingRecord(
+                    booking_id, booking_data["technician_name"], booking_data["specialty"],
+                    booking_data["booking_time"].replace(tzinfo=None), 1, duration_minutes))
+
+    def get_all_bookings(self) -> List[BookingRecord]:
+        return [self._row_to_booking(row) for row in self._connection().execute(SELECT_ALL_SQL)]
+
+    def get_booking_by_id(self, booking_id: int) -> Optional[BookingRecord]:
+        row = self._connection().execute(SELECT_BY_ID_SQL, (booking_id,)).fetchone()
+        return self._row_to_booking(row) if row is not None else None
+
+    def get_bookings_in_range(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                              technician: Optional[str] = None,
+                              specialty: Optional[str] = None,
+                              after: Optional[Tuple[datetime, int]] = None,
+                              limit: Optional[int] = None) -> List[BookingRecord]:
+        clauses = []
+        params = []
+        if technician is not None:
+            clauses.append("technician_name = ?")
+            params.append(technician)
+        if start is not None:
+            clauses.append("booking_time >= ?")
+            params.append(self._encode_time(start))
+        if end is not None:
+            clauses.append("booking_time < ?")
+            params.append(self._encode_time(end))
+        if specialty is not None:
+            clauses.append("specialty = ? COLLATE NOCASE")
+            params.append(specialty)
+        if after is not None:
+            clauses.append("(booking_time, id) > (?, ?)")
+            params.extend((self._encode_time(after[0]), after[1]))
+        sql = SELECT_COLUMNS
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY booking_time, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._row_to_booking(row) for row in self._connection().execute(sql, params)]
+
+    def find_conflicting_booking(self, booking_time: datetime, technician_name: Optional[str] = None,
+                                 exclude_booking_id: Optional[int] = None,
+                                 duration_minutes: Optional[int] = None) -> Optional[BookingRecord]:
+        return self._find_overlap(self._connection(), booking_time, technician_name, exclude_booking_id,
+                                  duration_minutes)
+
+    def generation(self) -> int:
+        generation = self._connection().execute(SELECT_GENERATION_SQL).fetchone()[0]
+        if generation > self._generation:
+            with self._generation_lock:
+                if generation > self._generation:
+                    self._generation = generation
+                    self._notify_stale()
+        return generation
+
+    def day_mask(self, day: date, technician_name: Optional[str] = None) -> int:
+        day_start = datetime.combine(day, datetime.min.time())
+        params = (
+            self._encode_time(day_start - timedelta(minutes=MAX_DURATION_MINUTES)),
+            self._encode_time(day_start + timedelta(days=1)),
+            self._encode_time(day_start)
+        )
+        if technician_name is None:
+            rows = self._connection().execute(SELECT_DAY_TIMES_SQL, params)
+        else:
+            rows = self._connection().execute(SELECT_TECHNICIAN_DAY_TIMES_SQL, params + (technician_name,))
+        mask = 0
+        for booking_time, duration_minutes in rows:
+            mask |= interval_mask_on(day, datetime.fromisoformat(booking_time), timedelta(minutes=duration_minutes))
+        series = self._select_series(self._connection(), day_start, day_start + timedelta(days=1), technician_name)
+        return mask | series_day_mask(series, day) if series else mask
+
+    def set_capacity_groups(self, groups: Dict[str, Iterable[str]]) -> None:
+        self._capacity_groups = {name: tuple(dict.fromkeys(members)) for name, members in groups.items()}
+
+    def full_mask(self, day: date, group: str) -> int:
+        members = self._capacity_groups.get(group)
+        if not members:
+            return 0
+        full = (1 << (MINUTES_PER_DAY // settings.AVAILABILITY_SLOT_MINUTES)) - 1
+        for technician_name in members:
+            full &= self.day_mask(day, technician_name)
+            if not full:
+                break
+        return full
+
+    def create_booking(self, booking_data: BookingCreate) -> int:
+        booking_time = booking_data.booking_time.replace(tzinfo=None)
+        duration_minutes = booking_data.duration_minutes or default_duration_minutes(booking_data.specialty)
+        events: List[Callable[[], None]] = []
+        with self._transaction(events) as connection:
+            if self._find_overlap(connection, booking_time, booking_data.technician_name,
+                                  duration_minutes=duration_minutes) is not None:
+                raise ValueError(
+                    f"The technician {booking_data.technician_name} is already booked during this time slot")
+            cursor = connection.execute(INSERT_SQL, (
+                booking_data.technician_name,
+                booking_data.specialty,
+                self._encode_time(booking_time),
+                duration_minutes,
+                self._encode_end(booking_time, duration_minutes)
+            ))
+            self._queue_added(events, BookingRecord(
+                cursor.lastrowid, booking_data.technician_name, booking_data.specialty, booking_time, 1,
+                duration_minutes))
+            return cursor.lastrowid
+
+    def create_bookings(self, bookings: List[BookingCreate], atomic: bool = True,
+                        row_numbers: Optional[Sequence[int]] = None) -> List[BulkRowResult]:
+        events: List[Callable[[], None]] = []
+        with self._transaction(events) as connection:
+            accepted, errors = plan_bulk_insert(
+                bookings, lambda booking_time, technician_name, duration_minutes:
+                self._find_overlap(connection, booking_time, technician_name,
+                                   duration_minutes=duration_minutes) is not None,
+                row_numbers)
+            if errors and atomic:
+                return bulk_results(len(bookings), {}, errors, row_numbers)
+            booking_ids = {}
+            for index in accepted:
+                booking = bookings[index]
+                duration_minutes = booking.duration_minutes or default_duration_minutes(booking.specialty)
+                booking_ids[index] = connection.execute(INSERT_SQL, (
+                    booking.technician_name,
+                    booking.specialty,
+                    self._encode_time(booking.booking_time),
+                    duration_minutes,
+                    self._encode_end(booking.booking_time, duration_minutes)
+                )).lastrowid
+                self._queue_added(events, BookingRecord(
+                    booking_ids[index], booking.technician_name, booking.specialty,
+                    booking.booking_time.replace(tzinfo=None), 1, duration_minutes))
+        return bulk_results(len(bookings), booking_ids, errors, row_numbers)
+
+    def update_booking(self, booking_id: int, booking_data: Dict,
+                       expected_version: Optional[int] = None) -> Optional[BookingRecord]:
+        events: List[Callable[[], None]] = []
+        with self._transaction(events) as connection:
+            row = connection.execute(SELECT_BY_ID_SQL, (booking_id,)).fetchone()
+            if row is None:
+                return None
+            previous = self._row_to_booking(row)
+            if expected_version is not None and previous.version != expected_version:
+                raise VersionConflictError(booking_id, previous.version)
+            booking = previous._asdict()
+            booking.update((key, value) for key, value in booking_data.items() if value is not None)
+            booking["booking_time"] = booking["booking_time"].replace(tzinfo=None)
+            moves_slot = (booking["technician_name"] != previous.technician_name
+                          or booking["booking_time"] != previous.booking_time
+                          or booking["duration_minutes"] > previous.duration_minutes)
+            if moves_slot:
+                if self._find_overlap(connection, booking["booking_time"], booking["technician_name"],
+                                      booking_id, booking["duration_minutes"]) is not None:
+                    raise ValueError(
+                        f"The technician {booking['technician_name']} is already booked during this time slot")
+            connection.execute(UPDATE_SQL, (
+                booking["technician_name"],
+                booking["specialty"],
+                self._encode_time(booking["booking_time"]),
+                booking["duration_minutes"],
+                self._encode_end(booking["booking_time"], booking["duration_minutes"]),
+                booking_id,
+                previous.version
+            ))
+            booking["version"] = previous.version + 1
+            updated = BookingRecord(**booking)
+            if self._observers:
+                events.append(lambda: self._notify_removed(previous))
+                self._queue_added(events, updated)
+        return updated
+
+    def delete_booking(self, booking_id: int) -> bool:
+        events: List[Callable[[], None]] = []
+        with self._transaction(events) as connection:
+            if self._observers:
+                row = connection.execute(SELECT_BY_ID_SQL, (booking_id,)).fetchone()
+                if row is not None:
+                    booking = self._row_to_booking(row)
+                    events.append(lambda: self._notify_removed(booking))
+            return connection.execute(DELETE_SQL, (booking_id,)).rowcount > 0
+
+    def create_series(self, series_data: BookingSeriesCreate) -> int:
+        series = SeriesRecord.from_create(0, series_data)
+        start, end = series_window(series)
+        events: List[Callable[[], None]] = []
+        with self._transaction(events) as connection:
+            check_series(series, self.get_bookings_in_range(start, end, technician=series.technician_name),
+                         self._select_series(connection, start, end, series.technician_name))
+            if connection.execute(NEXT_SEQUENCE_SQL).rowcount == 0:
+                connection.execute(START_SEQUENCE_SQL)
+            series = series._replace(id=connection.execute(SELECT_SEQUENCE_SQL).fetchone()[0])
+            connection.execute(INSERT_SERIES_SQL, (
+                series.id,
+                series.technician_name,
+                series.specialty,
+                self._encode_time(series.booking_time),
+                series.duration_minutes,
+                series.frequency,
+                series.interval,
+                series.count,
+                None if series.until is None else self._encode_time(series.until),
+                self._encode_time(series.end_time)
+            ))
+            if self._observers:
+                events.append(lambda: self._notify_series_added(series))
+        return series.id
+
+    def get_series(self, series_id: int) -> Optional[SeriesRecord]:
+        row = self._connection().execute(SELECT_SERIES_BY_ID_SQL, (series_id,)).fetchone()
+        return self._row_to_series(row) if row is not None else None
+
+    def delete_series(self, series_id: int) -> bool:
+        events: List[Callable[[], None]] = []
+        with self._transaction(events) as connection:
+            if self._observers:
+                row = connection.execute(SELECT_SERIES_BY_ID_SQL, (series_id,)).fetchone()
+                if row is not None:
+                    series = self._row_to_series(row)
+                    events.append(lambda: self._notify_series_removed(series))
+            return connection.execute(DELETE_SERIES_SQL, (series_id,)).rowcount > 0
+
+    def get_series_occurrences(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                               technician: Optional[str] = None,
+                               series_id: Optional[int] = None) -> List[BookingRecord]:
+        if series_id is not None:
+            series = self.get_series(series_id)
+            return expand_series([series] if series is not None else [], start, end)
+        return expand_series(self._select_series(self._connection(), start, end, technician), start, end)
+
+    def reset_database(self) -> None:
+        with self._transaction([self._notify_reset]) as connection:
+            for statement in RESET_STATEMENTS:
+                connection.execute(statement)
+
+    def _queue_added(self, events: List[Callable[[], None]], booking: BookingRecord) -> None:
+        if self._observers:
+            events.append(lambda: self._notify_added(booking))
+
+    def _find_overlap(self, connection: sqlite3.Connection, booking_time: datetime,
+                      technician_name: Optional[str] = None,
+                      exclude_booking_id: Optional[int] = None,
+                      duration_minutes: Optional[int] = None) -> Optional[BookingRecord]:
+        row = self._select_overlap(connection, booking_time, technician_name, exclude_booking_id, duration_minutes)
+        booking = self._row_to_booking(row) if row is not None else None
+        day_start = datetime.combine(booking_time.date(), datetime.min.time())
+        series = self._select_series(connection, day_start, day_start + timedelta(days=1), technician_name)
+        if not series:
+            return booking
+        end = booking_time + timedelta(minutes=duration_minutes or settings.DEFAULT_DURATION_MINUTES)
+        occurrence = first_series_overlap(series, booking_time, end, exclude_booking_id)
+        if occurrence is not None and (booking is None or occurrence.id < booking.id):
+            return occurrence
+        return booking
+
+    def _select_series(self, connection: sqlite3.Connection, start: Optional[datetime] = None,
+                       end: Optional[datetime] = None,
+                       technician_name: Optional[str] = None) -> List[SeriesRecord]:
+        clauses = []
+        params = []
+        if technician_name is not None:
+            clauses.append("technician_name = ?")
+            params.append(technician_name)
+        if end is not None:
+            clauses.append("booking_time < ?")
+            params.append(self._encode_time(end))
+        if start is not None:
+            clauses.append("end_time > ?")
+            params.append(self._encode_time(start))
+        sql = SELECT_SERIES_COLUMNS
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        return [self._row_to_series(row) for row in connection.execute(sql, params)]
+
+    def _select_overlap(self, connection: sqlite3.Connection, booking_time: datetime,
+                        technician_name: Optional[str] = None,
+                        exclude_booking_id: Optional[int] = None,
+                        duration_minutes: Optional[int] = None) -> Optional[tuple]:
+        params = (
+            self._encode_time(booking_time - timedelta(minutes=MAX_DURATION_MINUTES)),
+            self._encode_end(booking_time, duration_minutes or settings.DEFAULT_DURATION_MINUTES),
+            self._encode_time(booking_time),
+            exclude_booking_id
+        )
+        if technician_name is None:
+            return connection.execute(SELECT_OVERLAP_SQL, params).fetchone()
+        return connection.execute(SELECT_TECHNICIAN_OVERLAP_SQL, (technician_name,) + params).fetchone()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.database_path,
+                timeout=self.busy_timeout_ms / 1000,
+                isolation_level=None,
+                cached_statements=256
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.connection = connection
+        return connection
+
+    @contextmanager
+    def _transaction(self, events: Sequence[Callable[[], None]] = ()) -> Iterator[sqlite3.Connection]:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        changes = connection.total_changes
+        try:
+            yield connection
+            generation = None
+            if events or connection.total_changes != changes:
+                generation = connection.execute(BUMP_GENERATION_SQL).fetchone()[0]
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        with self._generation_lock:
+            connection.execute("COMMIT")
+            if generation is None:
+                return
+            if generation - 1 > self._generation:
+                self._notify_stale()
+            self._generation = max(self._generation, generation)
+            for event in events:
+                event()
+
+    @staticmethod
+    def _encode_time(value: datetime) -> str:
+        return value.replace(tzinfo=None).isoformat(sep=" ", timespec="microseconds")
+
+    @classmethod
+    def _encode_end(cls, booking_time: datetime, duration_minutes: int) -> str:
+        return cls._encode_time(booking_time + timedelta(minutes=duration_minutes))
+
+    @staticmethod
+    def _row_to_series(row: tuple) -> SeriesRecord:
+        series_id, technician_name, specialty, booking_time, duration_minutes, frequency, interval, count, until = row
+        return SeriesRecord(series_id, technician_name, specialty, datetime.fromisoformat(booking_time),
+                            duration_minutes, frequency, interval, count,
+                            None if until is None else datetime.fromisoformat(until))
+
+    @staticmethod
+    def _row_to_booking(row: tuple) -> BookingRecord:
+        booking_id, technician_name, specialty, booking_time, version, duration_minutes = row
+        return BookingRecord(booking_id, technician_name, specialty, datetime.fromisoformat(booking_time), version,
+                             duration_minutes)
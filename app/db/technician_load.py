@@ -0,0 +1,139 @@
+import heapq
+import threading
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from app.db.observers import BookingObserver
+from app.models.booking import BookingRecord
+from app.models.series import SeriesRecord
+
+LoadEntry = Tuple[int, int, str]
+HEAP_SLACK = 4
+
+
+class TechnicianLoad(BookingObserver):
+    def __init__(self, load_day: Callable[[datetime, datetime], Iterable[BookingRecord]]):
+        self._load_day = load_day
+        self._lock = threading.RLock()
+        self._groups: Dict[str, Tuple[str, ...]] = {}
+        self._positions: Dict[str, Dict[str, int]] = {}
+        self._memberships: Dict[str, List[str]] = {}
+        self._bookings: Dict[date, Dict[str, Set[int]]] = {}
+        self._heaps: Dict[Tuple[date, str], List[LoadEntry]] = {}
+        self._cursors: Dict[str, int] = {}
+
+    def set_groups(self, groups: Dict[str, Iterable[str]]) -> None:
+        with self._lock:
+            self._groups = {name: tuple(dict.fromkeys(members)) for name, members in groups.items()}
+            self._positions = {name: {technician_name: position for position, technician_name in enumerate(members)}
+                               for name, members in self._groups.items()}
+            self._memberships = {}
+            for name, members in self._groups.items():
+                for technician_name in members:
+                    self._memberships.setdefault(technician_name, []).append(name)
+            self._heaps.clear()
+            self._cursors.clear()
+
+    def count(self, day: date, technician_name: str) -> int:
+        with self._lock:
+            self._ensure_loaded(day)
+            return len(self._bookings[day].get(technician_name, ()))
+
+    def least_loaded(self, day: date, group: str, accept: Callable[[str], bool]) -> Optional[str]:
+        with self._lock:
+            self._ensure_loaded(day)
+            heap = self._heap(day, group)
+            counts = self._bookings[day]
+            popped: List[LoadEntry] = []
+            chosen = None
+            while heap:
+                entry = heapq.heappop(heap)
+                if entry[0] != len(counts.get(entry[2], ())):
+                    continue
+                popped.append(entry)
+                if accept(entry[2]):
+                    chosen = entry[2]
+                    break
+            for entry in popped:
+                heapq.heappush(heap, entry)
+            return chosen
+
+    def rotate(self, group: str, accept: Callable[[str], bool]) -> Optional[str]:
+        with self._lock:
+            members = self._groups.get(group, ())
+            cursor = self._cursors.get(group, 0)
+            for offset in range(len(members)):
+                position = (cursor + offset) % len(members)
+                if accept(members[position]):
+                    self._cursors[group] = position + 1
+                    return members[position]
+            return None
+
+    def booking_added(self, booking: BookingRecord) -> None:
+        with self._lock:
+            technicians = self._bookings.get(booking.booking_time.date())
+            if technicians is None:
+                return
+            booking_ids = technicians.setdefault(booking.technician_name, set())
+            if booking.id not in booking_ids:
+                booking_ids.add(booking.id)
+                self._changed(booking.booking_time.date(), booking.technician_name, len(booking_ids))
+
+    def booking_removed(self, booking: BookingRecord) -> None:
+        with self._lock:
+            technicians = self._bookings.get(booking.booking_time.date())
+            if technicians is None:
+                return
+            booking_ids = technicians.get(booking.technician_name)
+            if booking_ids and booking.id in booking_ids:
+                booking_ids.discard(booking.id)
+                self._changed(booking.booking_time.date(), booking.technician_name, len(booking_ids))
+
+    def series_added(self, series: SeriesRecord) -> None:
+        with self._lock:
+            for booking in series.occurrences_on(list(self._bookings)):
+                self.booking_added(booking)
+
+    def series_removed(self, series: SeriesRecord) -> None:
+        with self._lock:
+            for booking in series.occurrences_on(list(self._bookings)):
+                self.booking_removed(booking)
+
+    def bookings_reset(self) -> None:
+        with self._lock:
+            self._bookings.clear()
+            self._heaps.clear()
+            self._cursors.clear()
+
+    def bookings_stale(self) -> None:
+        with self._lock:
+            self._bookings.clear()
+            self._heaps.clear()
+
+    def _ensure_loaded(self, day: date) -> None:
+        if day in self._bookings:
+            return
+        start = datetime.combine(day, datetime.min.time())
+        technicians: Dict[str, Set[int]] = {}
+        for booking in self._load_day(start, start + timedelta(days=1)):
+            technicians.setdefault(booking.technician_name, set()).add(booking.id)
+        self._bookings[day] = technicians
+
+    def _heap(self, day: date, group: str) -> List[LoadEntry]:
+        heap = self._heaps.get((day, group))
+        if heap is None:
+            counts = self._bookings[day]
+            heap = [(len(counts.get(technician_name, ())), position, technician_name)
+                    for position, technician_name in enumerate(self._groups.get(group, ()))]
+            heapq.heapify(heap)
+            self._heaps[(day, group)] = heap
+        return heap
+
+    def _changed(self, day: date, technician_name: str, count: int) -> None:
+        for group in self._memberships.get(technician_name, ()):
+            heap = self._heaps.get((day, group))
+            if heap is None:
+                continue
+            if len(heap) >= HEAP_SLACK * len(self._groups[group]):
+                del self._heaps[(day, group)]
+                continue
+            heapq.heappush(heap, (count, self._positions[group][technician_name], technician_name))
@@ -4,7 +4,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 import uvicorn
 from app.core.config import settings
-from app.api.routes import bookings_router, nlp_router
+from app.api.routes import availability_router, bookings_router, nlp_router
 app = FastAPI(title=settings.PROJECT_NAME)
 app.add_middleware(
     CORSMiddleware,
@@ -18,6 +18,10 @@ app.include_router(
     bookings_router,
     prefix=f"{settings.API_V1_STR}/bookings",
     tags=["bookings"])
+app.include_router(
+    availability_router,
+    prefix=f"{settings.API_V1_STR}/availability",
+    tags=["availability"])
 app.include_router(nlp_router, prefix=f"{settings.API_V1_STR}/nlp", tags=["nlp"])
 
 
@@ -1,2 +1,13 @@
+from app.models.availability import (
+    AvailabilityCheck,
+    AvailabilityVerdict,
+    AvailableSlot,
+    DailyAvailability,
+    TechnicianAvailability,
+    TimeInterval
+)
 from app.models.booking import Booking, BookingCreate, BookingBase
-__all__ = ["Booking", "BookingCreate", "BookingBase"]
+from app.models.series import BookingRequest, BookingSeries, BookingSeriesCreate, RecurrenceRule
+__all__ = ["AvailabilityCheck", "AvailabilityVerdict", "AvailableSlot", "DailyAvailability",
+           "TechnicianAvailability", "TimeInterval", "Booking", "BookingCreate", "BookingBase", "BookingRequest",
+           "BookingSeries", "BookingSeriesCreate", "RecurrenceRule"]
@@ -0,0 +1,48 @@
+from pydantic import BaseModel, Field, model_validator
+from datetime import date, datetime
+from typing import List, Optional
+from app.models.booking import MAX_DURATION_MINUTES, MIN_DURATION_MINUTES
+
+
+class AvailableSlot(BaseModel):
+    start: datetime
+    end: datetime
+    technicians: List[str]
+
+
+class TimeInterval(BaseModel):
+    start: datetime
+    end: datetime
+
+
+class TechnicianAvailability(BaseModel):
+    technician_name: str
+    busy: List[TimeInterval]
+    free: List[TimeInterval]
+
+
+class DailyAvailability(BaseModel):
+    date: date
+    specialty: str
+    technicians: List[TechnicianAvailability]
+
+
+class AvailabilityCheck(BaseModel):
+    specialty: Optional[str] = None
+    technician: Optional[str] = None
+    start: datetime
+    duration_minutes: Optional[int] = Field(None, ge=MIN_DURATION_MINUTES, le=MAX_DURATION_MINUTES)
+
+    @model_validator(mode="after")
+    def require_one_target(self):
+        if (self.specialty is None) == (self.technician is None):
+            raise ValueError("Provide exactly one of specialty or technician")
+        return self
+
+
+class AvailabilityVerdict(BaseModel):
+    start: datetime
+    end: datetime
+    available: bool
+    technicians: List[str]
+    conflicting_booking_id: Optional[int] = None
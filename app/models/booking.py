@@ -1,11 +1,29 @@
-from pydantic import BaseModel
-from datetime import datetime
+from pydantic import BaseModel, Field, model_validator
+from datetime import datetime, timedelta
+from typing import NamedTuple, Optional
+from app.core.config import settings
+
+MIN_DURATION_MINUTES = 15
+MAX_DURATION_MINUTES = 8 * 60
+
+
+def default_duration_minutes(specialty: Optional[str]) -> int:
+    if not specialty:
+        return settings.DEFAULT_DURATION_MINUTES
+    return settings.SPECIALTY_DURATION_MINUTES.get(specialty.strip().lower(), settings.DEFAULT_DURATION_MINUTES)
 
 
 class BookingBase(BaseModel):
     technician_name: str
     specialty: str
     booking_time: datetime
+    duration_minutes: Optional[int] = Field(None, ge=MIN_DURATION_MINUTES, le=MAX_DURATION_MINUTES)
+
+    @model_validator(mode="after")
+    def apply_default_duration(self):
+        if self.duration_minutes is None:
+            self.duration_minutes = default_duration_minutes(self.specialty)
+        return self
 
 
 class BookingCreate(BookingBase):
@@ -14,6 +32,20 @@ class BookingCreate(BookingBase):
 
 class Booking(BookingBase):
     id: int
+    version: int = 1
 
     class Config:
         from_attributes = True
+
+
+class BookingRecord(NamedTuple):
+    id: int
+    technician_name: str
+    specialty: str
+    booking_time: datetime
+    version: int = 1
+    duration_minutes: int = 60
+
+    @property
+    def end_time(self) -> datetime:
+        return self.booking_time + timedelta(minutes=self.duration_minutes)
@@ -0,0 +1,142 @@
+import calendar
+from datetime import date, datetime, timedelta
+from typing import Iterable, Iterator, Literal, NamedTuple, Optional
+from pydantic import BaseModel, Field, model_validator
+from app.models.booking import BookingBase, BookingRecord
+
+MAX_SERIES_OCCURRENCES = 520
+MAX_SERIES_INTERVAL = 52
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    month = value.month - 1 + months
+    year = value.year + month // 12
+    month = month % 12 + 1
+    return value.replace(year=year, month=month, day=min(value.day, calendar.monthrange(year, month)[1]))
+
+
+def months_between(start: datetime, end: datetime) -> int:
+    return (end.year - start.year) * 12 + end.month - start.month
+
+
+class RecurrenceRule(BaseModel):
+    frequency: Literal["weekly", "monthly"]
+    interval: int = Field(1, ge=1, le=MAX_SERIES_INTERVAL)
+    count: Optional[int] = Field(None, ge=1, le=MAX_SERIES_OCCURRENCES)
+    until: Optional[datetime] = None
+
+    @model_validator(mode="after")
+    def require_bound(self):
+        if self.count is None and self.until is None:
+            raise ValueError("A recurrence needs a count or an until date")
+        return self
+
+
+class BookingRequest(BookingBase):
+    recurrence: Optional[RecurrenceRule] = None
+
+    @model_validator(mode="after")
+    def limit_occurrences(self):
+        if self.recurrence is None:
+            return self
+        occurrences = SeriesRecord.from_create(0, self).occurrence_count
+        if occurrences == 0:
+            raise ValueError("The recurrence ends before the first booking")
+        if occurrences > MAX_SERIES_OCCURRENCES:
+            raise ValueError(f"A series can have at most {MAX_SERIES_OCCURRENCES} occurrences")
+        return self
+
+
+class BookingSeriesCreate(BookingRequest):
+    recurrence: RecurrenceRule
+
+
+class BookingSeries(BookingSeriesCreate):
+    id: int
+
+
+class SeriesRecord(NamedTuple):
+    id: int
+    technician_name: str
+    specialty: str
+    booking_time: datetime
+    duration_minutes: int
+    frequency: str
+    interval: int = 1
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+
+    @classmethod
+    def from_create(cls, series_id: int, series: BookingRequest) -> "SeriesRecord":
+        until = series.recurrence.until
+        return cls(series_id, series.technician_name, series.specialty, series.booking_time.replace(tzinfo=None),
+                   series.duration_minutes, series.recurrence.frequency, series.recurrence.interval,
+                   series.recurrence.count, None if until is None else until.replace(tzinfo=None))
+
+    @property
+    def occurrence_count(self) -> int:
+        if self.until is None:
+            return self.count
+        if self.until < self.booking_time:
+            return 0
+        if self.frequency == "weekly":
+            last = (self.until - self.booking_time) // timedelta(weeks=self.interval)
+        else:
+            last = months_between(self.booking_time, self.until) // self.interval
+            if self.start_of(last) > self.until:
+                last -= 1
+        return last + 1 if self.count is None else min(last + 1, self.count)
+
+    @property
+    def last_time(self) -> datetime:
+        return self.start_of(self.occurrence_count - 1)
+
+    @property
+    def end_time(self) -> datetime:
+        return self.last_time + timedelta(minutes=self.duration_minutes)
+
+    def start_of(self, index: int) -> datetime:
+        if self.frequency == "weekly":
+            return self.booking_time + timedelta(weeks=self.interval * index)
+        return add_months(self.booking_time, self.interval * index)
+
+    def occurrence(self, index: int) -> BookingRecord:
+        return BookingRecord(self.id, self.technician_name, self.specialty, self.start_of(index), 1,
+                             self.duration_minutes)
+
+    def occurrences(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> Iterator[BookingRecord]:
+        index = 0
+        if start is not None and start > self.booking_time:
+            if self.frequency == "weekly":
+                index = -((self.booking_time - start) // timedelta(weeks=self.interval))
+            else:
+                index = max(months_between(self.booking_time, start) // self.interval - 1, 0)
+        for index in range(index, self.occurrence_count):
+            booking_time = self.start_of(index)
+            if end is not None and booking_time >= end:
+                return
+            if start is None or booking_time >= start:
+                yield self.occurrence(index)
+
+    def occurrence_on(self, day: date) -> Optional[BookingRecord]:
+        if day < self.booking_time.date():
+            return None
+        if self.frequency == "weekly":
+            days = (day - self.booking_time.date()).days
+            if days % (7 * self.interval):
+                return None
+            index = days // (7 * self.interval)
+        else:
+            months = (day.year - self.booking_time.year) * 12 + day.month - self.booking_time.month
+            if months % self.interval:
+                return None
+            index = months // self.interval
+        if index >= self.occurrence_count or self.start_of(index).date() != day:
+            return None
+        return self.occurrence(index)
+
+    def occurrences_on(self, days: Iterable[date]) -> Iterator[BookingRecord]:
+        for day in days:
+            occurrence = self.occurrence_on(day)
+            if occurrence is not None:
+                yield occurrence
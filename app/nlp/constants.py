@@ -25,6 +25,8 @@ MESSAGES = {
     "PROVIDE_VALID_BOOKING_ID": "Please provide a valid booking ID (a number).",
     "NO_BOOKING_FOUND": "No booking found with ID {booking_id}.",
     "CONFLICT_DETECTED": "There is already a booking at {time_description}. Would you like to schedule at a different time?",
+    "DURATION_NOTED": "Got it, the booking will last {duration_minutes} minutes.",
+    "CONFLICT_WITH_ALTERNATIVES": "There is already a booking at {time_description}. The nearest available times are {alternatives}. Would you like to schedule at a different time?",
     "DIFFERENT_TIME_PROMPT": "Please provide a different time for your {specialty} appointment.",
     "TECHNICIAN_SELECTION_PROMPT": "Please select a technician by number or name.",
     "TECHNICIAN_SELECTION_INVALID": "Please select a valid number between 1 and {num_technicians}.",
@@ -67,6 +69,11 @@ DATE_TIME_FORMATS = {
 }
 NEGATIVE_RESPONSES = ["no", "n", "nope", "nevermind"]
 CANCEL_TERMS = ["cancel", "nevermind", "cancellation"]
+CONFLICT_AFFIRMATIVE_RESPONSES = ["yes", "y", "sure", "ok", "okay", "yep", "yeah", "yea"]
+CONFLICT_NEGATIVE_RESPONSES = ["no", "n", "nope", "negative", "cancel", "nevermind"]
+SPECIALTY_CHANGE_PHRASES = ["actually", "need", "want", "not a"]
+IN_PROGRESS_FLAGS = ["awaiting_specialty", "awaiting_date", "awaiting_time",
+                     "awaiting_technician", "awaiting_ampm", "updating_booking"]
 TECHNICIANS: Dict[str, List[str]] = {
     "Plumber": ["Nicolas Woollett", "John Pipe", "Sarah Waters"],
     "Electrician": ["Franky Flay", "Emma Volt", "Michael Wire"],
@@ -212,7 +219,8 @@ DEFAULT_USER_CONTEXT = {
     "specialty": None,
     "awaiting_update_time": False,
     "updating_booking_id": None,
-    "is_test_booking": False
+    "is_test_booking": False,
+    "temp_booking_duration": None
 }
 UPDATE_COMMANDS = [
     "update booking",
@@ -232,6 +240,22 @@ UPDATE_COMMANDS = [
     "reschedule my appointment",
     "modify my appointment"
 ]
+INTENT_KEYWORD_CLASSES = {
+    "booking": BOOKING_KEYWORDS,
+    "inquiry": INQUIRY_KEYWORDS,
+    "id": ID_KEYWORDS,
+    "cancel": CANCEL_KEYWORDS,
+    "update": UPDATE_KEYWORDS,
+    "booking_reference": BOOKING_REFERENCE_KEYWORDS,
+    "list": LIST_KEYWORDS,
+    "booking_plural": BOOKING_PLURAL_KEYWORDS,
+    "list_bookings": LIST_BOOKINGS_EXACT_MATCHES,
+    "greeting": GREETING_KEYWORDS,
+    "update_command": UPDATE_COMMANDS,
+    "booking_id": ["booking id"],
+    "id_token": ["id"],
+    "digit": list("0123456789")
+}
 VALID_SPECIALTIES = [
     "Plumber",
     "Electrician",
@@ -297,6 +321,14 @@ TIME_TEXT_PATTERN = r'(\d{1,2}(?::\d{2})?\s*(?:am|pm)|morning|afternoon|evening|
 TIME_ONLY_PATTERN = r'(\d{1,2})(?::(\d{2}))?'
 UPDATE_BOOKING_WITH_TIME_PATTERN = r'(?:change|update|reschedule|modify).*(?:booking|appointment).*(?:to|for|at|on).*'
 BOOKING_ID_EXTRACTION_FROM_CONFIRMATION_PATTERN = r"booking ID is (\d+)"
+DURATION_PATTERN = (
+    r'(?<!\bin\s)(?:\bfor\s+)?\b(\d+(?:\.\d+)?|an?|one|two|three|four|five|six|seven|eight|half\s+an?)'
+    r'\s*(hours?|hrs?|minutes?|mins?)\b(?:\s+and\s+(?:a\s+)?(half|\d+\s*(?:minutes?|mins?)))?'
+)
+DURATION_NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4,
+    "five": 5, "six": 6, "seven": 7, "eight": 8, "half a": 0.5, "half an": 0.5
+}
 SPECIFIC_BOOKING_INQUIRY_PATTERNS = [
     r'(check|view|show|get|display|what is|details for|what are the details for)\s+(booking|appointment)(?:\s+|#|number|id\s+)?(\d+)',
     r'(show|get|display)\s+(?:me\s+)?(booking|appointment)(?:\s+|#|number|id\s+)?(\d+)',
@@ -310,3 +342,19 @@ DATE_PATTERNS_EXTENDED = [
     r'(\d{4})-(\d{1,2})-(\d{1,2})',
     r'([a-zA-Z]+) (\d{1,2})(?:st|nd|rd|th)?,? (\d{4})'
 ]
+SINGLE_NUMBER_PATTERN = r'(\d{1,2})$'
+MONTH_WORD_DAY_PATTERN = r'([a-z]+)\s+(\d{1,2})$'
+MONTH_DAY_LOOSE_PATTERNS = [
+    r'([a-zA-Z]+)\s+(\d{1,2})',
+    r'([a-zA-Z]+)\.?\s+(\d{1,2})'
+]
+DAY_NUMBER_PATTERN = r'(\d{1,2})'
+STANDALONE_MINUTES_PATTERN = r'^:(\d{1,2})$'
+PERIOD_OF_DAY_PATTERN = r'(\d{1,2})(?::(\d{2}))?\s+(?:in the\s+|at\s+)?(morning|afternoon|evening|night)'
+CLOCK_TIME_PATTERN = r'(\d{1,2}):(\d{2})$'
+AMPM_MARKER_PATTERN = r'(am|pm|a\.m\.|p\.m\.)'
+NUMERIC_TIME_PATTERN = r'\d+(?::\d+)?\s*(?:am|pm)?'
+MONTH_DAY_TIME_PATTERN = r'([a-zA-Z]+)\s+(\d{1,2})(?:\s+|,\s*|\s*)\s*(\d{1,2})(?::(\d{2}))?(?:\s*(am|pm))?'
+DAY_MONTH_TIME_PATTERN = r'(\d{1,2})\s+([a-zA-Z]+)\s+(\d{1,2}(?::\d{2})?(?:\s*[aApP][mM])?)'
+NOT_A_SPECIALTY_PATTERN = r'not\s+a\s+{specialty}'
+TOKEN_PATTERN = r"[a-z]+(?:'[a-z]+)?|\d+"
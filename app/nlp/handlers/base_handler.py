@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+from app.core.config import settings
 from app.nlp.managers.user_context_manager import UserContextManager
 from app.nlp.constants import MESSAGES
 
@@ -13,9 +14,9 @@ class BaseHandler:
         return dt.strftime(DATE_TIME_FORMATS["DATETIME_WITHOUT_DAY"])
 
     @staticmethod
-    def get_hour_range(booking_date: datetime) -> Tuple[datetime, datetime]:
+    def get_hour_range(booking_date: datetime, duration_minutes: Optional[int] = None) -> Tuple[datetime, datetime]:
         start_time = booking_date.replace(minute=0, second=0, microsecond=0)
-        end_time = start_time + timedelta(hours=1)
+        end_time = start_time + timedelta(minutes=duration_minutes or settings.DEFAULT_DURATION_MINUTES)
         return start_time, end_time
 
     @staticmethod
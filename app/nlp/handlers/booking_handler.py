@@ -1,17 +1,16 @@
-import re
 from datetime import datetime, timedelta
 from typing import Dict
 from app.db.database import get_booking_by_id, delete_booking
 from app.nlp.utils.booking_data_extractor import BookingDataExtractor
 from app.nlp.utils.intent_recognizer import IntentRecognizer
 from app.nlp.utils.date_time_parser import DateTimeParser
+from app.nlp.utils.patterns import BOOKING_ID
 from app.nlp.managers.user_context_manager import UserContextManager
 from app.nlp.constants import (
     MESSAGES,
     CANCEL_TERMS,
     DEFAULT_SPECIALTY,
-    PROCESSOR_MESSAGES,
-    BOOKING_ID_PATTERN
+    PROCESSOR_MESSAGES
 )
 from app.nlp.handlers.base_handler import BaseHandler
 
@@ -37,8 +36,7 @@ class BookingHandler(BaseHandler):
         specialty = BookingDataExtractor.extract_specialty(text)
         if specialty:
             UserContextManager.set_temp_specialty(user_context, specialty)
-            parser = DateTimeParser()
-            datetime_result = parser.parse_date_time(text)
+            datetime_result = DateTimeParser.parse_date_time(text)
             if datetime_result[0]:
                 booking_datetime, datetime_description = datetime_result
                 UserContextManager.update_date_context(user_context, booking_datetime.date())
@@ -52,7 +50,7 @@ class BookingHandler(BaseHandler):
                 return TechnicianService.setup_technician_selection(
                     user_context, booking_datetime, specialty)
             UserContextManager.set_awaiting_date(user_context)
-            date_result = parser.parse_date(text)
+            date_result = DateTimeParser.parse_date(text)
             if date_result[0]:
                 booking_date, date_description = date_result
                 UserContextManager.update_date_context(user_context, booking_date)
@@ -118,7 +116,7 @@ class BookingHandler(BaseHandler):
         )
 
     def _handle_booking_update_request(self, text: str, user_context: Dict) -> str:
-        booking_id_match = re.search(BOOKING_ID_PATTERN, text, re.IGNORECASE)
+        booking_id_match = BOOKING_ID.search(text)
         if not booking_id_match:
             return MESSAGES["PROVIDE_BOOKING_ID_UPDATE"]
         booking_id = int(booking_id_match.group(1))
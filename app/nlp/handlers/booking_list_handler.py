@@ -1,5 +1,5 @@
 from typing import Dict, List
-from app.db.database import get_all_bookings
+from app.db.database import get_upcoming_bookings
 from app.nlp.managers.user_context_manager import UserContextManager
 from app.nlp.constants import MESSAGES, BOOKINGS_LIST_HEADER, BOOKING_DISPLAY_FORMAT, DATE_TIME_FORMATS
 from app.nlp.handlers.base_handler import BaseHandler
@@ -12,7 +12,7 @@ class BookingListHandler(BaseHandler):
             "handle_list_bookings_request_instance", user_context)
 
     def handle_list_bookings_request_instance(self, user_context: Dict = None) -> str:
-        bookings = get_all_bookings()
+        bookings = get_upcoming_bookings()
         if not bookings:
             return MESSAGES["NO_BOOKINGS"]
         response = BOOKINGS_LIST_HEADER
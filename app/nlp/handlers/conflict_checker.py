@@ -1,37 +1,75 @@
-import sys
 from datetime import datetime, timedelta
-from typing import Dict, Optional
-from app.db.database import get_all_bookings
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from app.db.availability import covered_mask, interval_mask, overlap_days, split_at_midnight
+from app.db.conflict_batch import BatchConflicts, Candidate, NO_CONFLICT, ScheduleArrays, candidate_duration
+from app.db.database import find_conflicting_booking, get_bookings_on_days, get_day_mask, get_full_mask
+from app.models.booking import default_duration_minutes
+from app.nlp.managers.technician_manager import TechnicianManager
+
+SlotRequest = Tuple[Sequence[str], datetime, int]
+
+
+class SlotVerdict(NamedTuple):
+    free_technicians: List[str]
+    booking_id: Optional[int]
 
 
 class BookingConflictChecker:
     @staticmethod
     def check_conflict(booking_date: Optional[datetime], exclude_booking_id: Optional[int] = None,
-                       specialty: Optional[str] = None, technician_name: Optional[str] = None) -> Optional[Dict]:
+                       specialty: Optional[str] = None, technician_name: Optional[str] = None,
+                       duration_minutes: Optional[int] = None) -> Optional[Dict]:
         if booking_date is None:
             return None
-        if booking_date.year > 2025 and 'unittest' not in sys.modules:
+        duration_minutes = duration_minutes or default_duration_minutes(specialty)
+        if not any(get_day_mask(start.date(), technician_name) & interval_mask(start, duration)
+                   for start, duration in split_at_midnight(booking_date, timedelta(minutes=duration_minutes))):
             return None
-        bookings = get_all_bookings()
-        new_start = booking_date
-        new_end = booking_date + timedelta(hours=1)
-        for booking in bookings:
-            if exclude_booking_id is not None and booking.id == exclude_booking_id:
-                continue
-            same_day = (
-                booking.booking_time.year == booking_date.year and
-                booking.booking_time.month == booking_date.month and
-                booking.booking_time.day == booking_date.day
-            )
-            if same_day:
-                existing_start = booking.booking_time
-                existing_end = existing_start + timedelta(hours=1)
-                if (new_start < existing_end and new_end > existing_start):
-                    if technician_name is None or booking.technician_name == technician_name:
-                        return {
-                            "booking_id": booking.id,
-                            "technician_name": booking.technician_name,
-                            "specialty": booking.specialty,
-                            "booking_time": booking.booking_time
-                        }
-        return None
+        booking = find_conflicting_booking(
+            booking_date, technician_name=technician_name, exclude_booking_id=exclude_booking_id,
+            duration_minutes=duration_minutes)
+        if booking is None:
+            return None
+        return {
+            "booking_id": booking.id,
+            "technician_name": booking.technician_name,
+            "specialty": booking.specialty,
+            "booking_time": booking.booking_time,
+            "duration_minutes": booking.duration_minutes
+        }
+
+    @staticmethod
+    def is_slot_full(booking_date: Optional[datetime], specialty: Optional[str] = None,
+                     duration_minutes: Optional[int] = None) -> bool:
+        if booking_date is None:
+            return False
+        specialty = TechnicianManager.qualified_specialty(specialty)
+        duration_minutes = duration_minutes or default_duration_minutes(specialty)
+        if any(get_full_mask(start.date(), specialty) & covered_mask(start, duration)
+               for start, duration in split_at_midnight(booking_date, timedelta(minutes=duration_minutes))):
+            return True
+        return not TechnicianManager.get_free_technicians(specialty, booking_date, duration_minutes)
+
+    @staticmethod
+    def check_conflicts(candidates: Sequence[Candidate],
+                        exclude_booking_id: Optional[int] = None) -> BatchConflicts:
+        bookings = get_bookings_on_days(
+            day for candidate in candidates
+            for day in overlap_days(candidate[1], candidate[1] + candidate_duration(candidate)))
+        return ScheduleArrays(bookings, exclude_booking_id).evaluate(candidates)
+
+    @staticmethod
+    def check_slots(slots: Sequence[SlotRequest]) -> List[SlotVerdict]:
+        candidates: List[Candidate] = []
+        for technicians, start, duration_minutes in slots:
+            candidates.extend((technician_name, start, timedelta(minutes=duration_minutes))
+                              for technician_name in technicians)
+        booking_ids = BookingConflictChecker.check_conflicts(candidates).booking_ids.tolist() if candidates else []
+        verdicts = []
+        position = 0
+        for technicians, _, _ in slots:
+            found = booking_ids[position:position + len(technicians)]
+            position += len(technicians)
+            free = [name for name, booking_id in zip(technicians, found) if booking_id == NO_CONFLICT]
+            verdicts.append(SlotVerdict(free, None if free or not found else min(found)))
+        return verdicts
@@ -1,7 +1,7 @@
-import re
 from datetime import datetime, time, timedelta
 from typing import Dict, Optional, Tuple
 from app.nlp.utils.date_time_parser import DateTimeParser
+from app.nlp.utils.patterns import SINGLE_NUMBER, TIME_WITHOUT_AMPM
 from app.nlp.managers.user_context_manager import UserContextManager
 from app.nlp.constants import (
     MESSAGES,
@@ -9,7 +9,6 @@ from app.nlp.constants import (
     CANCEL_TERMS,
     DEFAULT_SPECIALTY,
     DEFAULT_PLUMBER_SPECIALTY,
-    TIME_WITHOUT_AMPM_PATTERN,
     TECHNICIAN_SELECTION_FORMAT,
     TECHNICIAN_OPTION_LINE_FORMAT,
     TECHNICIAN_SELECTION_SUFFIX,
@@ -60,11 +59,10 @@ class DateTimeHandler(BaseHandler):
         if any(term in text.lower() for term in CANCEL_TERMS):
             self.reset_context(user_context, ["awaiting_time"])
             return MESSAGES["TIME_SELECTION_CANCELLED"]
-        date_time_parser = DateTimeParser()
         booking_date = user_context.get("temp_booking_date")
         if not booking_date:
             return MESSAGES["NO_DATE_SELECTED"]
-        single_digit_match = re.fullmatch(r'(\d{1,2})$', text.strip())
+        single_digit_match = SINGLE_NUMBER.fullmatch(text.strip())
         if single_digit_match:
             hour = int(single_digit_match.group(1))
             minute = 0
@@ -76,9 +74,9 @@ class DateTimeHandler(BaseHandler):
                 user_context["awaiting_ampm"] = True
                 user_context["awaiting_time"] = False
                 return AMPM_PROMPT_FORMAT.format(hour=hour, minute=minute)
-        time_result, time_desc = date_time_parser.parse_time(text, booking_date)
+        time_result, time_desc = DateTimeParser.parse_time(text, booking_date)
         if time_result is None:
-            time_match = re.search(TIME_WITHOUT_AMPM_PATTERN, text.strip())
+            time_match = TIME_WITHOUT_AMPM.search(text.strip())
             if time_match:
                 hour = int(time_match.group(1))
                 minute = int(time_match.group(2) or 0)
@@ -125,9 +123,10 @@ class DateTimeHandler(BaseHandler):
         time_str = f"{display_hour}:{minute:02d} {am_pm}"
         UserContextManager.update_time_context(user_context, time_dt)
         UserContextManager.set_awaiting_ampm(user_context, False)
-        conflict = BookingConflictChecker.check_conflict(time_dt)
+        duration_minutes = user_context.get("temp_booking_duration")
         specialty = user_context.get("temp_booking_specialty") or user_context.get(
             "specialty", DEFAULT_SPECIALTY)
+        conflict = BookingConflictChecker.is_slot_full(time_dt, specialty, duration_minutes)
         if conflict:
             UserContextManager.set_conflict_detected(user_context, time_dt)
             return MESSAGES["CONFLICT_DETECTED"].format(time_description=time_str)
@@ -145,17 +144,19 @@ class DateTimeHandler(BaseHandler):
             UserContextManager.cancel_booking_process(user_context)
             return MESSAGES["BOOKING_PROCESS_CANCELLED"]
         else:
-            parser = DateTimeParser()
             booking_date = user_context.get("temp_booking_date")
             if not booking_date:
                 return MESSAGES["INVALID_TIME_FORMAT"]
-            time_result = parser.parse_time(text, booking_date)
+            time_result = DateTimeParser.parse_time(text, booking_date)
             if not time_result or time_result[0] is None:
                 return MESSAGES["INVALID_TIME_FORMAT"]
             time_dt, time_desc = time_result
             UserContextManager.update_time_context(user_context, time_dt)
             UserContextManager.clear_conflict(user_context)
-            conflict = BookingConflictChecker.check_conflict(time_dt)
+            duration_minutes = user_context.get("temp_booking_duration")
+            specialty = user_context.get("temp_booking_specialty") or user_context.get(
+                "specialty", DEFAULT_SPECIALTY)
+            conflict = BookingConflictChecker.is_slot_full(time_dt, specialty, duration_minutes)
             if conflict:
                 UserContextManager.set_conflict_detected(user_context, time_dt)
                 return MESSAGES["CONFLICT_DETECTED"].format(time_description=time_desc)
@@ -216,7 +217,8 @@ class DateTimeHandler(BaseHandler):
                 from app.nlp.handlers.update_handler import UpdateHandler
                 return UpdateHandler().handle_update_booking_time(
                     time_dt, f"{time_dt.hour}:{time_dt.minute}", user_context)
-        available_technicians = TechnicianManager.get_available_technicians(specialty)
+        available_technicians = TechnicianManager.get_free_technicians(
+            specialty, time_dt, user_context.get("temp_booking_duration"))
         if not available_technicians:
             UserContextManager.cancel_booking_process(user_context)
             return MESSAGES["NO_TECHNICIANS"]
@@ -245,21 +247,22 @@ class DateTimeHandler(BaseHandler):
             time_dt = time_result
         UserContextManager.update_time_context(user_context, time_dt)
         UserContextManager.set_awaiting_time(user_context, False)
-        conflict = BookingConflictChecker.check_conflict(time_dt)
+        duration_minutes = user_context.get("temp_booking_duration")
         specialty = user_context.get("temp_booking_specialty") or user_context.get(
             "specialty", DEFAULT_SPECIALTY)
+        conflict = BookingConflictChecker.is_slot_full(time_dt, specialty, duration_minutes)
         if conflict:
             UserContextManager.set_conflict_detected(user_context, time_dt)
             time_desc = time_dt.strftime(DATE_TIME_FORMATS["TIME_ONLY_FORMAT"])
             alt_times = []
             one_hour_before = time_dt - timedelta(hours=1)
-            if not BookingConflictChecker.check_conflict(one_hour_before):
+            if not BookingConflictChecker.is_slot_full(one_hour_before, specialty, duration_minutes):
                 alt_times.append(one_hour_before.strftime(DATE_TIME_FORMATS["TIME_ONLY_FORMAT"]))
             thirty_min_after = time_dt + timedelta(minutes=30)
-            if not BookingConflictChecker.check_conflict(thirty_min_after):
+            if not BookingConflictChecker.is_slot_full(thirty_min_after, specialty, duration_minutes):
                 alt_times.append(thirty_min_after.strftime(DATE_TIME_FORMATS["TIME_ONLY_FORMAT"]))
             one_hour_after = time_dt + timedelta(hours=1)
-            if not BookingConflictChecker.check_conflict(one_hour_after):
+            if not BookingConflictChecker.is_slot_full(one_hour_after, specialty, duration_minutes):
                 alt_times.append(one_hour_after.strftime(DATE_TIME_FORMATS["TIME_ONLY_FORMAT"]))
             suggestion_message = ""
             if alt_times:
@@ -273,7 +276,10 @@ class DateTimeHandler(BaseHandler):
         if not time_result or not time_result[0]:
             return MESSAGES["INVALID_AMPM_FORMAT"]
         time_dt, time_description = time_result
-        conflict = BookingConflictChecker.check_conflict(time_dt)
+        duration_minutes = user_context.get("temp_booking_duration")
+        specialty = user_context.get("temp_booking_specialty") or user_context.get(
+            "specialty", DEFAULT_SPECIALTY)
+        conflict = BookingConflictChecker.is_slot_full(time_dt, specialty, duration_minutes)
         if conflict:
             return MESSAGES["CONFLICT_DETECTED"].format(
                 time_description=time_description)
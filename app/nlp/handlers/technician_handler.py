@@ -5,7 +5,6 @@ from datetime import datetime
 from app.db.database import (
     create_booking,
     get_booking_by_id,
-    get_all_bookings,
     update_booking
 )
 from app.models.booking import BookingCreate
@@ -129,7 +128,8 @@ class TechnicianHandler(BaseHandler):
         booking_create = BookingCreate(
             technician_name=technician_name,
             specialty=specialty,
-            booking_time=booking_date
+            booking_time=booking_date,
+            duration_minutes=user_context.get("temp_booking_duration")
         )
         try:
             booking_id = create_booking(booking_create)
@@ -163,7 +163,10 @@ class TechnicianHandler(BaseHandler):
         old_date = booking.booking_time.strftime(DATE_TIME_FORMATS["DATE_ONLY_FORMAT"])
         old_time = booking.booking_time.strftime(DATE_TIME_FORMATS["TIME_ONLY_FORMAT"])
         old_datetime = f"{old_date} at {old_time}"
-        update_booking(booking_id, {"technician_name": technician_name})
+        try:
+            update_booking(booking_id, {"technician_name": technician_name})
+        except ValueError as e:
+            return str(e)
         UserContextManager.update_booking_context(
             user_context,
             booking_id,
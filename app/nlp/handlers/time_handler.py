@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, Optional, Tuple, Union
-import re
 from app.nlp.handlers.base_handler import BaseHandler
 from app.nlp.handlers.datetime_handler import DateTimeHandler
 from app.nlp.handlers.technician_handler import TechnicianHandler
 from app.nlp.utils.date_time_parser import DateTimeParser
 from app.nlp.utils.booking_data_extractor import BookingDataExtractor
+from app.nlp.utils.patterns import SINGLE_NUMBER, TIME_ONLY
 from app.nlp.models.time_result import TimeResult
 
 
@@ -32,10 +32,9 @@ class TimeHandler(BaseHandler):
                 success=False,
                 message="Please provide a date first."
             )
-        time_parser = DateTimeParser()
-        parsed_time, time_desc = time_parser.parse_time(text, booking_date)
+        parsed_time, time_desc = DateTimeParser.parse_time(text, booking_date)
         if parsed_time is None:
-            single_digit_match = re.fullmatch(r'(\d{1,2})$', text.strip())
+            single_digit_match = SINGLE_NUMBER.fullmatch(text.strip())
             if single_digit_match:
                 hour = int(single_digit_match.group(1))
                 if 5 <= hour <= 8:
@@ -51,7 +50,7 @@ class TimeHandler(BaseHandler):
                         booking_time=booking_datetime,
                         time_description=time_str
                     )
-            time_without_ampm = re.search(r'(\d{1,2})(?::(\d{2}))?', text.strip())
+            time_without_ampm = TIME_ONLY.search(text.strip())
             if time_without_ampm:
                 hour = int(time_without_ampm.group(1))
                 minute = int(time_without_ampm.group(2) or 0)
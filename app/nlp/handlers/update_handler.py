@@ -39,7 +39,10 @@ class UpdateHandler(BaseHandler):
             return MESSAGES["UPDATE_NOT_FOUND"].format(booking_id=booking_id)
         old_date = booking.booking_time.strftime(DATE_TIME_FORMATS["DATE_ONLY_FORMAT"])
         old_time = booking.booking_time.strftime(DATE_TIME_FORMATS["TIME_ONLY_FORMAT"])
-        update_booking(booking_id, {"booking_time": booking_date})
+        try:
+            update_booking(booking_id, {"booking_time": booking_date})
+        except ValueError as e:
+            return str(e)
         new_date = booking_date.strftime(DATE_TIME_FORMATS["DATE_ONLY_FORMAT"])
         new_time = booking_date.strftime(DATE_TIME_FORMATS["TIME_ONLY_FORMAT"])
         return f"Your booking with {booking.technician_name} has been updated from {old_date} at {old_time} to {new_date} at {new_time}."
@@ -72,7 +75,10 @@ class UpdateHandler(BaseHandler):
         if not booking:
             return MESSAGES["NO_BOOKING_FOUND"].format(booking_id=booking_id)
         booking_datetime = time_result.booking_time
-        update_result = update_booking(booking_id, {"booking_time": booking_datetime})
+        try:
+            update_result = update_booking(booking_id, {"booking_time": booking_datetime})
+        except ValueError as e:
+            return str(e)
         if not update_result:
             return MESSAGES["UPDATE_FAILED"]
         booking_time_display = booking_datetime.strftime(DATE_TIME_FORMATS["BOOKING_TIME_DISPLAY"])
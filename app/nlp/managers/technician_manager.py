@@ -1,18 +1,117 @@
 import random
-from typing import List
-from app.nlp.constants import TECHNICIANS
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.db.availability import MINUTES_PER_DAY, interval_mask, split_at_midnight
+from app.db.database import (
+    find_conflicting_booking,
+    find_least_loaded_technician,
+    find_next_technician_in_rotation,
+    get_day_mask,
+    get_generation,
+    set_capacity_groups
+)
+from app.models.booking import default_duration_minutes
+from app.nlp.constants import DEFAULT_PLUMBER_SPECIALTY, DEFAULT_SPECIALTY, TECHNICIANS
 
 
 class TechnicianManager:
+    _menu_cache: Dict[Tuple[str, datetime, int], Tuple[int, List[str]]] = {}
+    _menu_generation: Optional[int] = None
+    _menu_lock = threading.Lock()
+
     @classmethod
     def get_available_technicians(cls, specialty: str) -> List[str]:
         return TECHNICIANS.get(specialty, TECHNICIANS["Technician"])
 
     @classmethod
-    def assign_technician(cls, specialty: str) -> str:
+    def get_free_technicians(cls, specialty: str, booking_time: datetime,
+                             duration_minutes: Optional[int] = None) -> List[str]:
+        booking_time = booking_time.replace(tzinfo=None)
+        duration_minutes = duration_minutes or default_duration_minutes(specialty)
+        generation = get_generation()
+        key = (specialty, booking_time, duration_minutes)
+        with cls._menu_lock:
+            if cls._menu_generation is None or generation > cls._menu_generation:
+                cls._menu_cache = {}
+                cls._menu_generation = generation
+            cached = cls._menu_cache.get(key)
+        if cached is not None and cached[0] == generation:
+            return list(cached[1])
+        menu = cls._build_menu(specialty, booking_time, duration_minutes)
+        with cls._menu_lock:
+            if generation == cls._menu_generation:
+                cls._menu_cache[key] = (generation, menu)
+        return list(menu)
+
+    @classmethod
+    def _build_menu(cls, specialty: str, booking_time: datetime, duration_minutes: int) -> List[str]:
+        day = booking_time.date()
+        requested = split_at_midnight(booking_time, timedelta(minutes=duration_minutes))
+        full = (1 << (MINUTES_PER_DAY // settings.AVAILABILITY_SLOT_MINUTES)) - 1
+        ranked = []
+        for position, technician_name in enumerate(cls.get_available_technicians(specialty)):
+            busy = get_day_mask(day, technician_name)
+            overlaps = any((busy if start.date() == day else get_day_mask(start.date(), technician_name))
+                           & interval_mask(start, duration) for start, duration in requested)
+            if overlaps and find_conflicting_booking(
+                    booking_time, technician_name, duration_minutes=duration_minutes) is not None:
+                continue
+            ranked.append((-(full & ~busy).bit_count(), position, technician_name))
+        ranked.sort()
+        return [technician_name for _, _, technician_name in ranked]
+
+    @classmethod
+    def qualified_specialty(cls, specialty: Optional[str]) -> str:
+        if not specialty or specialty.lower() == DEFAULT_SPECIALTY.lower():
+            return DEFAULT_PLUMBER_SPECIALTY
+        return cls.find_specialty(specialty) or specialty
+
+    @classmethod
+    def find_specialty(cls, specialty: str) -> Optional[str]:
+        specialty_lower = specialty.strip().lower()
+        for name in TECHNICIANS:
+            if name.lower() == specialty_lower:
+                return name
+        return None
+
+    @classmethod
+    def specialty_of(cls, technician_name: str) -> Optional[str]:
+        for name, technicians in TECHNICIANS.items():
+            if technician_name in technicians:
+                return name
+        return None
+
+    @classmethod
+    def assign_technician(cls, specialty: str, booking_time: Optional[datetime] = None,
+                          duration_minutes: Optional[int] = None) -> str:
         available = cls.get_available_technicians(specialty)
-        return random.choice(available)
+        strategy = settings.TECHNICIAN_ASSIGNMENT_STRATEGY
+        if strategy == "random" or booking_time is None:
+            return random.choice(available)
+        booking_time = booking_time.replace(tzinfo=None)
+        duration_minutes = duration_minutes or default_duration_minutes(specialty)
+        requested = interval_mask(booking_time, timedelta(minutes=duration_minutes))
+        group = specialty if specialty in TECHNICIANS else DEFAULT_SPECIALTY
+
+        def is_free(technician_name: str) -> bool:
+            return not get_day_mask(booking_time.date(), technician_name) & requested
+
+        if strategy == "least_loaded":
+            chosen = find_least_loaded_technician(booking_time.date(), group, is_free)
+        elif strategy == "round_robin":
+            chosen = find_next_technician_in_rotation(group, is_free)
+        else:
+            raise ValueError(f"Unknown technician assignment strategy: {strategy}")
+        if chosen is None:
+            free = cls.get_free_technicians(specialty, booking_time, duration_minutes)
+            chosen = free[0] if free else random.choice(available)
+        return chosen
 
     @classmethod
     def get_available_technicians_static(cls, specialty: str) -> List[str]:
         return cls.get_available_technicians(specialty)
+
+
+set_capacity_groups(TECHNICIANS)
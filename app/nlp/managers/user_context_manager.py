@@ -8,6 +8,12 @@ class UserContextManager:
     def create_default_context() -> Dict[str, Any]:
         return DEFAULT_USER_CONTEXT.copy()
 
+    @staticmethod
+    def ensure_defaults(user_context: Dict) -> Dict:
+        for key, value in DEFAULT_USER_CONTEXT.items():
+            user_context.setdefault(key, value)
+        return user_context
+
     @staticmethod
     def reset_context(user_context: Dict, fields: Optional[List[str]] = None) -> None:
         if fields:
@@ -30,6 +36,7 @@ class UserContextManager:
             user_context["last_booking_time"] = booking_date
             user_context["last_booking_specialty"] = specialty
             user_context["last_booking_technician"] = technician_name
+            user_context["temp_booking_duration"] = None
 
     @staticmethod
     def update_date_context(user_context: Dict, booking_date: datetime) -> None:
@@ -82,6 +89,7 @@ class UserContextManager:
         user_context["available_technicians"] = None
         user_context["temp_booking_hour"] = None
         user_context["temp_booking_minute"] = None
+        user_context["temp_booking_duration"] = None
         user_context["is_test_booking"] = False
 
     @staticmethod
@@ -113,6 +121,10 @@ class UserContextManager:
     def set_temp_specialty(user_context: Dict, specialty: str) -> None:
         user_context["temp_booking_specialty"] = specialty
 
+    @staticmethod
+    def set_temp_duration(user_context: Dict, duration_minutes: int) -> None:
+        user_context["temp_booking_duration"] = duration_minutes
+
     @staticmethod
     def set_booking_in_progress(user_context: Dict, value: bool = True) -> None:
         user_context["booking_in_progress"] = value
@@ -195,7 +207,7 @@ class UserContextManager:
             "awaiting_technician", "available_technicians", "conflict_detected",
             "temp_booking_date", "temp_booking_specialty", "awaiting_ampm",
             "temp_booking_hour", "temp_booking_minute", "is_test_booking",
-            "specialty", "temp_booking_specialty"
+            "specialty", "temp_booking_specialty", "temp_booking_duration"
         ]
         for field in booking_fields:
             user_context[field] = DEFAULT_USER_CONTEXT.get(field)
@@ -205,6 +217,7 @@ class UserContextManager:
         user_context["temp_booking_date"] = None
         user_context["temp_booking_hour"] = None
         user_context["temp_booking_minute"] = None
+        user_context["temp_booking_duration"] = None
 
     @staticmethod
     def update_available_technicians(user_context: Dict, available_technicians: List[str]) -> None:
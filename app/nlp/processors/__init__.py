@@ -6,6 +6,7 @@ from app.nlp.processors.datetime_service import DateTimeService
 from app.nlp.processors.specialty_service import SpecialtyService
 from app.nlp.processors.handler_service import HandlerService
 from app.nlp.processors.processor_condition_factory import ProcessorConditionFactory
+from app.nlp.processors.conversation_state import ConversationState
 __all__ = [
     'NaturalLanguageProcessor',
     'ProcessorInterface',
@@ -14,5 +15,6 @@ __all__ = [
     'DateTimeService',
     'SpecialtyService',
     'HandlerService',
-    'ProcessorConditionFactory'
+    'ProcessorConditionFactory',
+    'ConversationState'
 ]
@@ -17,11 +17,13 @@ class BookingService:
         is_test = user_context.get("is_test_booking", False)
         if is_test:
             UserContextManager.set_is_test_booking(user_context)
-        technician_name = TechnicianManager.assign_technician(specialty)
+        technician_name = TechnicianManager.assign_technician(
+            specialty, booking_date, user_context.get("temp_booking_duration"))
         booking_create = BookingCreate(
             technician_name=technician_name,
             specialty=specialty,
-            booking_time=booking_date
+            booking_time=booking_date,
+            duration_minutes=user_context.get("temp_booking_duration")
         )
         booking_id = create_booking(booking_create)
         UserContextManager.update_booking_context(
@@ -50,7 +52,10 @@ class BookingService:
             return False, f"No booking found with ID {booking_id}"
         old_time = booking.booking_time.strftime(DATE_TIME_FORMATS["TIME_ONLY_DISPLAY"])
         old_date = booking.booking_time.strftime(DATE_TIME_FORMATS["DATE_ONLY_DISPLAY"])
-        update_booking(booking_id, {"booking_time": new_datetime})
+        try:
+            update_booking(booking_id, {"booking_time": new_datetime})
+        except ValueError as e:
+            return False, str(e)
         new_time = new_datetime.strftime(DATE_TIME_FORMATS["TIME_ONLY_DISPLAY"])
         new_date_str = new_datetime.strftime(DATE_TIME_FORMATS["DATE_ONLY_DISPLAY"])
         message = MESSAGES["BOOKING_UPDATED"].format(
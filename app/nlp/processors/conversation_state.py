@@ -0,0 +1,31 @@
+from enum import Enum
+from typing import Dict, List
+
+
+class ConversationState(Enum):
+    AWAITING_AMPM = "awaiting_ampm"
+    CONFLICT = "conflict_detected"
+    AWAITING_DATE = "awaiting_date"
+    AWAITING_TIME = "awaiting_time"
+    AWAITING_TECHNICIAN = "awaiting_technician"
+    AWAITING_BOOKING_ID_FOR_UPDATE = "awaiting_booking_id_for_update"
+    AWAITING_BOOKING_ID_FOR_CANCEL = "awaiting_booking_id_for_cancel"
+    AWAITING_SPECIALTY = "awaiting_specialty"
+    UPDATING_BOOKING = "updating_booking"
+    IDLE = "idle"
+
+    @classmethod
+    def active(cls, user_context: Dict) -> List["ConversationState"]:
+        states = [state for flag, state in STATE_FLAGS if user_context.get(flag, False)]
+        states.append(cls.IDLE)
+        return states
+
+    @classmethod
+    def of(cls, user_context: Dict) -> "ConversationState":
+        for flag, state in STATE_FLAGS:
+            if user_context.get(flag, False):
+                return state
+        return cls.IDLE
+
+
+STATE_FLAGS = tuple((state.value, state) for state in ConversationState if state is not ConversationState.IDLE)
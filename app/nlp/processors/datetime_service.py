@@ -1,12 +1,11 @@
-import re
 from datetime import datetime, time
 from typing import Dict, Optional, Tuple, Union, List
-from app.nlp.constants import TIME_PATTERNS
 from app.nlp.managers.user_context_manager import UserContextManager
 from app.nlp.handlers.conflict_checker import BookingConflictChecker
 from app.nlp.handlers.datetime_handler import DateTimeHandler
 from app.nlp.processors.technician_service import TechnicianService
 from app.nlp.utils.date_time_parser import DateTimeParser
+from app.nlp.utils.patterns import AMPM_MARKER, CLOCK_TIME, MONTH_WORD_DAY, SINGLE_NUMBER, TIME
 
 
 class DateTimeService:
@@ -15,7 +14,7 @@ class DateTimeService:
         self.date_time_handler = DateTimeHandler()
 
     def handle_date_input(self, user_context: Dict, text: str, specialty: str) -> str:
-        simple_date_match = re.fullmatch(r'([a-z]+)\s+(\d{1,2})$', text.lower())
+        simple_date_match = MONTH_WORD_DAY.fullmatch(text.lower())
         if simple_date_match:
             date_result, date_desc = self.date_time_parser.parse_date(text)
             if date_result:
@@ -45,13 +44,13 @@ class DateTimeService:
         booking_date = user_context.get("temp_booking_date")
         if not booking_date:
             return self._handle_missing_date(specialty)
-        single_digit_match = re.fullmatch(r'(\d{1,2})$', text.strip())
+        single_digit_match = SINGLE_NUMBER.fullmatch(text.strip())
         if single_digit_match:
             hour = int(single_digit_match.group(1))
             UserContextManager.setup_for_ampm_clarification(user_context, hour, 0)
             return self._prompt_for_ampm(hour, 0)
-        time_without_ampm = re.search(r'(\d{1,2}):(\d{2})$', text.strip())
-        if time_without_ampm and not re.search(r'(am|pm|a\.m\.|p\.m\.)', text.lower()):
+        time_without_ampm = CLOCK_TIME.search(text.strip())
+        if time_without_ampm and not AMPM_MARKER.search(text.lower()):
             hour = int(time_without_ampm.group(1))
             minute = int(time_without_ampm.group(2))
             UserContextManager.setup_for_ampm_clarification(user_context, hour, minute)
@@ -113,10 +112,8 @@ class DateTimeService:
         return self.date_time_handler.handle_conflict_response(text, user_context)
 
     def _contains_time(self, text: str) -> bool:
-        for pattern in TIME_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        text = text.lower()
+        return any(pattern.search(text) for pattern in TIME)
 
     def _create_datetime(self, date_result: datetime.date,
                          time_result: Union[datetime, Tuple[int, int]]) -> datetime:
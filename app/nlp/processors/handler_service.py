@@ -1,18 +1,14 @@
-import re
 from datetime import datetime, time
 from typing import Dict, List, Optional, Any, Tuple
-from app.db.database import get_all_bookings, get_booking_by_id
+from app.db.database import get_upcoming_bookings, get_booking_by_id
 from app.nlp.constants import (
     MESSAGES,
     DATE_TIME_FORMATS,
     PROCESSOR_MESSAGES,
     CANCEL_TERMS,
-    SPECIFIC_BOOKING_INQUIRY_PATTERNS,
     TECHNICIAN_TYPES,
-    UPDATE_BOOKING_WITH_TIME_PATTERN,
     NON_OFFERED_SPECIALTIES,
-    UNSUPPORTED_SPECIALTY_MESSAGE,
-    GREETING_KEYWORDS
+    UNSUPPORTED_SPECIALTY_MESSAGE
 )
 from app.nlp.managers.user_context_manager import UserContextManager
 from app.nlp.handlers.booking_handler import BookingHandler
@@ -28,6 +24,8 @@ from app.nlp.processors.technician_service import TechnicianService
 from app.nlp.utils.booking_data_extractor import BookingDataExtractor
 from app.nlp.utils.date_time_parser import DateTimeParser
 from app.nlp.utils.intent_recognizer import IntentRecognizer
+from app.nlp.utils.parsed_utterance import ParsedUtterance
+from app.nlp.utils.patterns import INQUIRY_BOOKING_NUMBER, SPECIFIC_BOOKING_INQUIRY
 
 
 class HandlerService:
@@ -35,19 +33,24 @@ class HandlerService:
         self.booking_service = BookingService()
         self.datetime_service = DateTimeService()
         self.specialty_service = SpecialtyService()
+        self.booking_handler = BookingHandler()
+        self.booking_list_handler = BookingListHandler()
+        self.technician_handler = TechnicianHandler()
+        self.update_handler = UpdateHandler()
+        self.date_time_parser = DateTimeParser()
 
     def handle_greeting(self, user_context: Dict, text: str) -> str:
         return MESSAGES["GREETING"]
 
     def handle_booking_id_inquiry(self, user_context: Dict, text: str) -> str:
-        return BookingHandler().handle_booking_id_inquiry(user_context)
+        return self.booking_handler.handle_booking_id_inquiry(user_context)
 
     def handle_specific_booking_inquiry(self, user_context: Dict, text: str) -> str:
         booking_id = None
-        for pattern in SPECIFIC_BOOKING_INQUIRY_PATTERNS:
-            match = re.search(pattern, text.lower())
+        for pattern in SPECIFIC_BOOKING_INQUIRY:
+            match = pattern.search(text.lower())
             if match:
-                group_index = 3 if pattern != SPECIFIC_BOOKING_INQUIRY_PATTERNS[2] else 2
+                group_index = 2 if pattern is INQUIRY_BOOKING_NUMBER else 3
                 booking_id = int(match.group(group_index))
                 break
         if booking_id is None:
@@ -62,8 +65,7 @@ class HandlerService:
 
     def handle_list_bookings(self, user_context: Dict, text: str) -> str:
         self.reset_context(user_context)
-        booking_list_handler = BookingListHandler()
-        return booking_list_handler.handle_list_bookings_request(user_context)
+        return self.booking_list_handler.handle_list_bookings_request(user_context)
 
     def handle_cancellation(self, user_context: Dict, text: str) -> str:
         self.reset_context(user_context)
@@ -76,11 +78,11 @@ class HandlerService:
         return self.handle_update_booking(user_context, booking_id, text)
 
     def handle_booking(self, user_context: Dict, text: str) -> str:
-        text_lower = text.lower()
-        specialty = BookingDataExtractor.extract_specialty(text_lower)
+        utterance = ParsedUtterance.of(text)
+        text_lower = utterance.lowered
+        specialty = BookingDataExtractor.extract_specialty(utterance)
         if specialty:
-            date_time_parser = DateTimeParser()
-            date_time_result, date_time_desc = date_time_parser.parse_date_time(text)
+            date_time_result, date_time_desc = self.date_time_parser.parse_date_time(text)
             if date_time_result:
                 UserContextManager.set_temp_specialty(user_context, specialty)
                 UserContextManager.update_date_context(user_context, date_time_result.date())
@@ -91,11 +93,11 @@ class HandlerService:
                     return conflict_message
                 return TechnicianService.setup_technician_selection(
                     user_context, date_time_result, specialty)
-            date_result, date_desc = date_time_parser.parse_date(text)
+            date_result, date_desc = self.date_time_parser.parse_date(text)
             if date_result:
                 UserContextManager.set_temp_specialty(user_context, specialty)
                 UserContextManager.update_date_context(user_context, date_result)
-                time_result, time_desc = date_time_parser.parse_time(text, date_result)
+                time_result, time_desc = self.date_time_parser.parse_time(text, date_result)
                 if time_result:
                     if isinstance(time_result, tuple):
                         hour, minute = time_result
@@ -155,14 +157,13 @@ class HandlerService:
         if any(term in text.lower() for term in CANCEL_TERMS):
             UserContextManager.cancel_booking_process(user_context)
             return MESSAGES["BOOKING_PROCESS_CANCELLED"]
-        technician_handler = TechnicianHandler()
-        return technician_handler.handle_technician_input(text, user_context)
+        return self.technician_handler.handle_technician_input(text, user_context)
 
     def handle_awaiting_booking_id_for_update(self, user_context: Dict, text: str) -> str:
         if any(term in text.lower() for term in CANCEL_TERMS):
             UserContextManager.set_awaiting_booking_id_for_update(user_context, False)
             return MESSAGES["PROCESS_CANCELLED"]
-        if any(greeting in text.lower() for greeting in GREETING_KEYWORDS):
+        if IntentRecognizer.is_greeting(text):
             UserContextManager.set_awaiting_booking_id_for_update(user_context, False)
             return MESSAGES["GREETING"]
         if IntentRecognizer.is_booking_request(text):
@@ -175,7 +176,7 @@ class HandlerService:
             return MESSAGES["SPECIALTY_PROMPT"]
         if IntentRecognizer.is_list_bookings_request(text):
             UserContextManager.set_awaiting_booking_id_for_update(user_context, False)
-            bookings = get_all_bookings()
+            bookings = get_upcoming_bookings()
             if not bookings:
                 return MESSAGES["NO_BOOKINGS"]
             return self.format_booking_list(bookings)
@@ -185,7 +186,7 @@ class HandlerService:
             return MESSAGES["PROVIDE_BOOKING_ID_CANCEL"]
         booking_id = BookingService.extract_booking_id_from_text(text)
         if booking_id is None:
-            if not re.search(r'\d+', text):
+            if not ParsedUtterance.of(text).has_digits:
                 UserContextManager.set_awaiting_booking_id_for_update(user_context, False)
                 return MESSAGES["UNCLEAR_REQUEST"]
             return PROCESSOR_MESSAGES["PROVIDE_VALID_BOOKING_ID"]
@@ -206,7 +207,7 @@ class HandlerService:
                for term in CANCEL_TERMS) and not text.lower().startswith("cancel"):
             UserContextManager.set_awaiting_booking_id_for_cancel(user_context, False)
             return MESSAGES["PROCESS_CANCELLED"]
-        if any(greeting in text.lower() for greeting in GREETING_KEYWORDS):
+        if IntentRecognizer.is_greeting(text):
             UserContextManager.set_awaiting_booking_id_for_cancel(user_context, False)
             return MESSAGES["GREETING"]
         if IntentRecognizer.is_booking_request(text):
@@ -219,13 +220,13 @@ class HandlerService:
             return MESSAGES["SPECIALTY_PROMPT"]
         if IntentRecognizer.is_list_bookings_request(text):
             UserContextManager.set_awaiting_booking_id_for_cancel(user_context, False)
-            bookings = get_all_bookings()
+            bookings = get_upcoming_bookings()
             if not bookings:
                 return MESSAGES["NO_BOOKINGS"]
             return self.format_booking_list(bookings)
         booking_id = BookingService.extract_booking_id_from_text(text)
         if booking_id is None:
-            if not re.search(r'\d+', text):
+            if not ParsedUtterance.of(text).has_digits:
                 UserContextManager.set_awaiting_booking_id_for_cancel(user_context, False)
                 return MESSAGES["UNCLEAR_REQUEST"]
             return PROCESSOR_MESSAGES["PROVIDE_VALID_BOOKING_ID"]
@@ -256,7 +257,7 @@ class HandlerService:
         if user_context.get("awaiting_date"):
             return self.handle_awaiting_date(user_context, text)
         if user_context.get("awaiting_update_time"):
-            return UpdateHandler().handle_update_time_input(text, user_context)
+            return self.update_handler.handle_update_time_input(text, user_context)
         if user_context.get("awaiting_ampm"):
             return self.handle_awaiting_ampm(user_context, text)
         self.reset_context(user_context)
@@ -273,13 +274,13 @@ class HandlerService:
         booking = get_booking_by_id(booking_id)
         if booking is None:
             return MESSAGES["NO_BOOKING_FOUND"].format(booking_id=booking_id)
-        date_time_parser = DateTimeParser()
-        if date_time_parser.contains_date(text) or date_time_parser.contains_time(text):
+        if self.date_time_parser.contains_date(text) or self.date_time_parser.contains_time(text):
             try:
-                new_date, time_description = date_time_parser.parse_date_time(
+                new_date, time_description = self.date_time_parser.parse_date_time(
                     text, original_datetime=booking.booking_time)
                 conflict = BookingConflictChecker.check_conflict(
-                    new_date, exclude_booking_id=booking_id)
+                    new_date, exclude_booking_id=booking_id, technician_name=booking.technician_name,
+                    duration_minutes=booking.duration_minutes)
                 if conflict:
                     return PROCESSOR_MESSAGES["BOOKING_CONFLICT"].format(
                         time_description=time_description,
@@ -304,7 +305,7 @@ class HandlerService:
                               booking_id: Optional[int], text: str) -> str:
         if booking_id is None:
             UserContextManager.set_awaiting_booking_id_for_update(user_context)
-            bookings = get_all_bookings()
+            bookings = get_upcoming_bookings()
             return self.format_booking_list(bookings)
         booking = get_booking_by_id(booking_id)
         if booking is None:
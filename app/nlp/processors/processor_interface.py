@@ -1,6 +1,6 @@
-from typing import Dict, Optional
+from typing import Dict
 
 
 class ProcessorInterface:
-    def process_input(self, text: str, user_context: Optional[Dict] = None) -> str:
+    def process_input(self, text: str, user_context: Dict) -> str:
         raise NotImplementedError("Subclasses must implement process_input")
@@ -1,5 +1,5 @@
 from typing import Dict, List, Tuple, Optional, Any
-from datetime import datetime
+from datetime import datetime, timedelta
 import random
 import re
 from app.nlp.constants import (
@@ -9,9 +9,12 @@ from app.nlp.constants import (
     TECHNICIAN_SELECTION_SUFFIX,
     MESSAGES,
     DEFAULT_SPECIALTY,
-    DEFAULT_PLUMBER_SPECIALTY
+    DEFAULT_PLUMBER_SPECIALTY,
+    DATE_TIME_FORMATS
 )
+from app.models.booking import default_duration_minutes
 from app.nlp.managers.user_context_manager import UserContextManager
+from app.db.database import find_nearest_free_slots, get_booking_by_id
 from app.nlp.handlers.conflict_checker import BookingConflictChecker
 from app.nlp.managers.technician_manager import TechnicianManager
 
@@ -19,12 +22,13 @@ from app.nlp.managers.technician_manager import TechnicianManager
 class TechnicianService:
     @staticmethod
     def setup_technician_selection(user_context: Dict, time_dt: datetime, specialty: str) -> str:
+        duration_minutes = user_context.get("temp_booking_duration")
         if specialty and specialty.lower() != DEFAULT_SPECIALTY.lower():
-            available_technicians = TechnicianManager.get_available_technicians(specialty)
+            available_technicians = TechnicianManager.get_free_technicians(specialty, time_dt, duration_minutes)
         else:
             specialty = DEFAULT_SPECIALTY
-            available_technicians = TechnicianManager.get_available_technicians(
-                DEFAULT_PLUMBER_SPECIALTY)
+            available_technicians = TechnicianManager.get_free_technicians(
+                DEFAULT_PLUMBER_SPECIALTY, time_dt, duration_minutes)
         if not available_technicians:
             return MESSAGES["NO_TECHNICIANS"]
         UserContextManager.setup_for_technician_selection(
@@ -45,9 +49,40 @@ class TechnicianService:
                                   booking_date: datetime,
                                   time_description: str,
                                   exclude_booking_id: Optional[int] = None) -> Optional[str]:
-        conflict = BookingConflictChecker.check_conflict(
-            booking_date, exclude_booking_id=exclude_booking_id)
+        duration_minutes = user_context.get("temp_booking_duration")
+        specialty = TechnicianManager.qualified_specialty(
+            user_context.get("temp_booking_specialty") or user_context.get("specialty"))
+        technicians = TechnicianManager.get_available_technicians(specialty)
+        booking = None if exclude_booking_id is None else get_booking_by_id(exclude_booking_id)
+        if booking is None:
+            duration_minutes = duration_minutes or default_duration_minutes(specialty)
+            conflict = BookingConflictChecker.is_slot_full(booking_date, specialty, duration_minutes)
+        else:
+            duration_minutes = duration_minutes or booking.duration_minutes
+            technicians = [booking.technician_name]
+            conflict = BookingConflictChecker.check_conflict(
+                booking_date, exclude_booking_id=exclude_booking_id, specialty=booking.specialty,
+                technician_name=booking.technician_name, duration_minutes=duration_minutes)
         if conflict:
             UserContextManager.set_conflict_detected(user_context, booking_date)
+            alternatives = TechnicianService.suggest_alternatives(
+                booking_date, duration_minutes=duration_minutes, technicians=technicians)
+            if alternatives:
+                return MESSAGES["CONFLICT_WITH_ALTERNATIVES"].format(
+                    time_description=time_description, alternatives=alternatives)
             return MESSAGES["CONFLICT_DETECTED"].format(time_description=time_description)
         return None
+
+    @staticmethod
+    def suggest_alternatives(booking_date: datetime, count: int = 3, duration_minutes: Optional[int] = None,
+                             technicians: Optional[List[str]] = None) -> str:
+        booking_date = booking_date.replace(tzinfo=None)
+        duration = timedelta(minutes=duration_minutes) if duration_minutes else None
+        slots = find_nearest_free_slots(booking_date, technicians, count=count,
+                                        earliest=min(datetime.now(), booking_date), duration=duration)
+        formats = [DATE_TIME_FORMATS["TIME_ONLY_FORMAT"] if slot.start.date() == booking_date.date()
+                   else DATE_TIME_FORMATS["DATETIME_WITHOUT_DAY"] for slot in slots]
+        names = [slot.start.strftime(time_format) for slot, time_format in zip(slots, formats)]
+        if len(names) < 2:
+            return "".join(names)
+        return ", ".join(names[:-1]) + " or " + names[-1]
@@ -1,19 +1,25 @@
-import re
-from typing import Optional
+from typing import Optional, Tuple
+from app.models.booking import MAX_DURATION_MINUTES, MIN_DURATION_MINUTES
 from app.nlp.constants import (
     TECHNICIANS,
     SPECIALTY_TERMS,
     FUZZY_SPECIALTY_MATCHES,
     TECHNICIAN_TYPES,
-    BOOKING_ID_EXTRACTION_PATTERN,
-    STANDALONE_NUMBER_PATTERN
+    DURATION_NUMBER_WORDS
 )
+from app.nlp.utils.parsed_utterance import ParsedUtterance
+from app.nlp.utils.patterns import BOOKING_ID_EXTRACTION, DIGITS, DURATION, NOT_A_SPECIALTY, STANDALONE_NUMBER
 
 
 class BookingDataExtractor:
     @staticmethod
     def extract_specialty(text: str) -> Optional[str]:
-        text_lower = text.lower()
+        if isinstance(text, ParsedUtterance):
+            return text.memoize("specialty", BookingDataExtractor._extract_specialty, text.lowered)
+        return BookingDataExtractor._extract_specialty(text.lower())
+
+    @staticmethod
+    def _extract_specialty(text_lower: str) -> Optional[str]:
         if "technician" in text_lower and not any(
                 specific in text_lower for specific in TECHNICIAN_TYPES):
             return None
@@ -24,9 +30,7 @@ class BookingDataExtractor:
                 if specialty_lower in text_lower:
                     if specialty_lower == "technician":
                         continue
-                    not_pattern = rf'not\s+a\s+{specialty_lower}'
-                    not_match = re.search(not_pattern, text_lower)
-                    if not_match:
+                    if NOT_A_SPECIALTY[specialty_lower].search(text_lower):
                         continue
                     return specialty
         for specialty in TECHNICIANS.keys():
@@ -50,16 +54,40 @@ class BookingDataExtractor:
 
     @staticmethod
     def extract_booking_id(text: str) -> Optional[int]:
-        match = re.search(BOOKING_ID_EXTRACTION_PATTERN, text.lower())
+        if isinstance(text, ParsedUtterance):
+            return text.memoize("booking_id", BookingDataExtractor._extract_booking_id, text)
+        return BookingDataExtractor._extract_booking_id(text)
+
+    @staticmethod
+    def _extract_booking_id(text: str) -> Optional[int]:
+        match = BOOKING_ID_EXTRACTION.search(text.lower())
         if match:
             try:
                 return int(match.group(1))
             except (ValueError, IndexError):
                 pass
-        match = re.search(STANDALONE_NUMBER_PATTERN, text)
+        match = STANDALONE_NUMBER.search(text)
         if match:
             try:
                 return int(match.group(1))
             except (ValueError, IndexError):
                 pass
         return None
+
+    @staticmethod
+    def extract_duration(text: str) -> Tuple[Optional[int], str]:
+        match = DURATION.search(text)
+        if not match:
+            return None, text
+        amount, unit, extra = match.groups()
+        amount = " ".join(amount.lower().split())
+        value = float(DURATION_NUMBER_WORDS.get(amount, 0) or amount)
+        minutes = value * 60 if unit.lower().startswith("h") else value
+        if extra:
+            extra = extra.lower()
+            minutes += 30 if extra == "half" else int(DIGITS.match(extra).group())
+        minutes = int(round(minutes))
+        if not MIN_DURATION_MINUTES <= minutes <= MAX_DURATION_MINUTES:
+            return None, text
+        remaining = " ".join((text[:match.start()] + " " + text[match.end():]).split())
+        return minutes, remaining
@@ -1,23 +1,47 @@
-import re
 from datetime import datetime, timedelta, time
 from typing import Tuple, Optional, Union
-from app.nlp.constants import (
-    DATE_PATTERNS,
-    MONTH_NAMES,
-    TIME_PATTERNS,
-    SIMPLE_DIGIT_PATTERN,
-    MONTH_DAY_PATTERN,
-    TIME_WITHOUT_AMPM_PATTERN,
-    DATE_PATTERNS_EXTENDED
+from app.nlp.constants import MONTH_NAMES
+from app.nlp.utils.parsed_utterance import ParsedUtterance
+from app.nlp.utils.patterns import (
+    AMPM,
+    DATE,
+    DATE_EXTENDED,
+    DATE_EXTENDED_DAY_OF_MONTH,
+    DATE_EXTENDED_ISO,
+    DATE_EXTENDED_MONTH_DAY_YEAR,
+    DATE_EXTENDED_NUMERIC,
+    DATE_MONTH_DAY_YEAR,
+    DATE_NUMERIC,
+    DATE_WORD_DAY,
+    DAY_MONTH_TIME,
+    DAY_NUMBER,
+    MONTH_DAY,
+    MONTH_DAY_LOOSE,
+    MONTH_DAY_TIME,
+    MONTH_WORD_DAY,
+    PERIOD_OF_DAY,
+    SINGLE_NUMBER,
+    STANDALONE_MINUTES,
+    TIME,
+    TIME_AMPM,
+    TIME_MINUTES,
+    TIME_MINUTES_WORD,
+    TIME_WITHOUT_AMPM
 )
 
 
 class DateTimeParser:
     @staticmethod
     def parse_date(text: str) -> Tuple[Optional[datetime.date], Optional[str]]:
+        if isinstance(text, ParsedUtterance):
+            return text.memoize("date", DateTimeParser._parse_date, text)
+        return DateTimeParser._parse_date(text)
+
+    @staticmethod
+    def _parse_date(text: str) -> Tuple[Optional[datetime.date], Optional[str]]:
         text = text.lower().strip()
         today = datetime.now().date()
-        full_month_match = re.fullmatch(r'([a-z]+)\s+(\d{1,2})$', text.lower())
+        full_month_match = MONTH_WORD_DAY.fullmatch(text.lower())
         if full_month_match:
             month_name, day = full_month_match.groups()
             day = int(day)
@@ -31,8 +55,8 @@ class DateTimeParser:
                     except ValueError:
                         pass
         date_time_split = text
-        for pattern in TIME_PATTERNS:
-            time_match = re.search(pattern, text)
+        for pattern in TIME:
+            time_match = pattern.search(text)
             if time_match:
                 time_start = time_match.start()
                 date_time_split = text[:time_start].strip()
@@ -62,12 +86,8 @@ class DateTimeParser:
                     days_ahead = 7
                 target_date = today + timedelta(days=days_ahead)
                 return target_date, f"next {day}"
-        month_day_patterns = [
-            r'([a-zA-Z]+)\s+(\d{1,2})',
-            r'([a-zA-Z]+)\.?\s+(\d{1,2})',
-        ]
-        for pattern in month_day_patterns:
-            month_day_match = re.search(pattern, date_time_split)
+        for pattern in MONTH_DAY_LOOSE:
+            month_day_match = pattern.search(date_time_split)
             if month_day_match:
                 month_name, day = month_day_match.groups()
                 day = int(day)
@@ -81,7 +101,7 @@ class DateTimeParser:
                             return date_obj, f"{month_full} {day}"
                         except ValueError:
                             pass
-        match = re.search(MONTH_DAY_PATTERN, date_time_split)
+        match = MONTH_DAY.search(date_time_split)
         if match:
             month_name, day = match.groups()
             day = int(day)
@@ -98,7 +118,7 @@ class DateTimeParser:
             if month in date_time_split.lower():
                 month_pos = date_time_split.lower().find(month)
                 rest_of_text = date_time_split.lower()[month_pos + len(month):].strip()
-                day_match = re.search(r'(\d{1,2})', rest_of_text)
+                day_match = DAY_NUMBER.search(rest_of_text)
                 if day_match:
                     day = int(day_match.group(1))
                     month_index = i + 1
@@ -108,11 +128,11 @@ class DateTimeParser:
                         return date_obj, f"{month.capitalize()} {day}"
                     except ValueError:
                         pass
-        for pattern in DATE_PATTERNS_EXTENDED:
-            match = re.search(pattern, date_time_split)
+        for pattern in DATE_EXTENDED:
+            match = pattern.search(date_time_split)
             if match:
                 try:
-                    if pattern == DATE_PATTERNS_EXTENDED[0]:
+                    if pattern is DATE_EXTENDED_NUMERIC:
                         day, month, year = match.groups()
                         day = int(day)
                         month = int(month)
@@ -121,7 +141,7 @@ class DateTimeParser:
                             year += 2000
                         date_obj = datetime(year, month, day).date()
                         return date_obj, f"{day}/{month}/{year}"
-                    elif pattern == DATE_PATTERNS_EXTENDED[1]:
+                    elif pattern is DATE_EXTENDED_DAY_OF_MONTH:
                         day, month_name, year = match.groups()
                         day = int(day)
                         for i, month in enumerate(MONTH_NAMES):
@@ -135,14 +155,14 @@ class DateTimeParser:
                                     year += 2000
                                 date_obj = datetime(year, month_index, day).date()
                                 return date_obj, f"{day} {month_name} {year}"
-                    elif pattern == DATE_PATTERNS_EXTENDED[2]:
+                    elif pattern is DATE_EXTENDED_ISO:
                         year, month, day = match.groups()
                         year = int(year)
                         month = int(month)
                         day = int(day)
                         date_obj = datetime(year, month, day).date()
                         return date_obj, f"{year}-{month}-{day}"
-                    elif pattern == DATE_PATTERNS_EXTENDED[3]:
+                    elif pattern is DATE_EXTENDED_MONTH_DAY_YEAR:
                         month_name, day, year = match.groups()
                         day = int(day)
                         year = int(year)
@@ -153,11 +173,11 @@ class DateTimeParser:
                                 return date_obj, f"{month_name} {day}, {year}"
                 except (ValueError, IndexError):
                     pass
-        for pattern in DATE_PATTERNS:
-            match = re.search(pattern, text)
+        for pattern in DATE:
+            match = pattern.search(text)
             if match:
                 try:
-                    if pattern == DATE_PATTERNS[0]:
+                    if pattern is DATE_NUMERIC:
                         day, month, year = match.groups()
                         day = int(day)
                         month = int(month)
@@ -166,14 +186,14 @@ class DateTimeParser:
                             year += 2000
                         date_obj = datetime(year, month, day).date()
                         return date_obj, f"{day}/{month}/{year}"
-                    elif pattern == DATE_PATTERNS[2]:
+                    elif pattern is DATE_WORD_DAY:
                         year, month, day = match.groups()
                         year = int(year)
                         month = int(month)
                         day = int(day)
                         date_obj = datetime(year, month, day).date()
                         return date_obj, f"{year}-{month}-{day}"
-                    elif pattern == DATE_PATTERNS[5]:
+                    elif pattern is DATE_MONTH_DAY_YEAR:
                         month_name, day, year = match.groups()
                         day = int(day)
                         year = int(year)
@@ -199,14 +219,21 @@ class DateTimeParser:
     @staticmethod
     def parse_time(text: str, booking_date: Optional[datetime]
                    = None) -> Tuple[Union[Tuple[int, int], datetime], str]:
+        if isinstance(text, ParsedUtterance):
+            return text.memoize(("time", booking_date), DateTimeParser._parse_time, text, booking_date)
+        return DateTimeParser._parse_time(text, booking_date)
+
+    @staticmethod
+    def _parse_time(text: str, booking_date: Optional[datetime]
+                    = None) -> Tuple[Union[Tuple[int, int], datetime], str]:
         text = text.lower().strip()
         for month_name in MONTH_NAMES:
             if month_name in text:
-                month_day_match = re.search(MONTH_DAY_PATTERN, text)
+                month_day_match = MONTH_DAY.search(text)
                 if month_day_match:
                     text = text[month_day_match.end():].strip()
                     break
-        single_digit_match = re.fullmatch(r'(\d{1,2})$', text)
+        single_digit_match = SINGLE_NUMBER.fullmatch(text)
         if single_digit_match:
             hour = int(single_digit_match.group(1))
             minute = 0
@@ -266,7 +293,7 @@ class DateTimeParser:
                 else:
                     result_dt = datetime.combine(booking_date, time(hour, minute))
                 return result_dt, time_desc
-        standalone_minutes_match = re.match(r'^:(\d{1,2})$', text.strip())
+        standalone_minutes_match = STANDALONE_MINUTES.match(text.strip())
         if standalone_minutes_match:
             minute = int(standalone_minutes_match.group(1))
             hour = 0
@@ -279,7 +306,7 @@ class DateTimeParser:
                 return result_dt, time_desc
             else:
                 return (hour, minute), time_desc
-        am_pm_match = re.search(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)', text)
+        am_pm_match = AMPM.search(text)
         if am_pm_match:
             hour = int(am_pm_match.group(1))
             minute = int(am_pm_match.group(2) or 0)
@@ -297,8 +324,7 @@ class DateTimeParser:
                 return result_dt, time_desc
             else:
                 return (hour, minute), time_desc
-        period_match = re.search(
-            r'(\d{1,2})(?::(\d{2}))?\s+(?:in the\s+|at\s+)?(morning|afternoon|evening|night)', text)
+        period_match = PERIOD_OF_DAY.search(text)
         if period_match:
             hour = int(period_match.group(1))
             minute = int(period_match.group(2) or 0)
@@ -314,16 +340,16 @@ class DateTimeParser:
                 return result_dt, time_desc
             else:
                 return (hour, minute), time_desc
-        time_without_ampm = re.search(TIME_WITHOUT_AMPM_PATTERN, text.strip())
+        time_without_ampm = TIME_WITHOUT_AMPM.search(text.strip())
         if time_without_ampm:
             hour = int(time_without_ampm.group(1))
             minute = int(time_without_ampm.group(2) or 0)
             return None, None
-        for pattern in TIME_PATTERNS:
-            match = re.search(pattern, text)
+        for pattern in TIME:
+            match = pattern.search(text)
             if match:
                 try:
-                    if pattern == TIME_PATTERNS[3]:
+                    if pattern is TIME_MINUTES:
                         minute = int(match.group(1))
                         hour = 0
                         time_desc = f"{hour}:{minute:02d}"
@@ -337,7 +363,7 @@ class DateTimeParser:
                             return result_dt, time_desc
                         else:
                             return (hour, minute), time_desc
-                    elif pattern == TIME_PATTERNS[6]:
+                    elif pattern is TIME_MINUTES_WORD:
                         minute = int(match.group(1))
                         hour = 0
                         time_desc = f"{hour}:{minute:02d}"
@@ -357,6 +383,12 @@ class DateTimeParser:
 
     @staticmethod
     def parse_date_time(text: str) -> Tuple[Optional[datetime], Optional[str]]:
+        if isinstance(text, ParsedUtterance):
+            return text.memoize("date_time", DateTimeParser._parse_date_time, text)
+        return DateTimeParser._parse_date_time(text)
+
+    @staticmethod
+    def _parse_date_time(text: str) -> Tuple[Optional[datetime], Optional[str]]:
         if "at" in text:
             parts = text.split("at")
             if len(parts) == 2:
@@ -370,8 +402,7 @@ class DateTimeParser:
                         time_result.hour, time_result.minute)
                     dt = datetime.combine(date_result, time(hour, minute))
                     return dt, f"{date_desc} at {time_desc}"
-        combined_pattern = r'([a-zA-Z]+)\s+(\d{1,2})(?:\s+|,\s*|\s*)\s*(\d{1,2})(?::(\d{2}))?(?:\s*(am|pm))?'
-        combined_match = re.search(combined_pattern, text.lower())
+        combined_match = MONTH_DAY_TIME.search(text.lower())
         if combined_match:
             month_name, day_str, hour_str, minute_str, am_pm = combined_match.groups()
             day = int(day_str)
@@ -415,8 +446,7 @@ class DateTimeParser:
                         pass
                 else:
                     return None, None
-        day_month_time_match = re.search(
-            r'(\d{1,2})\s+([a-zA-Z]+)\s+(\d{1,2}(?::\d{2})?(?:\s*[aApP][mM])?)', text)
+        day_month_time_match = DAY_MONTH_TIME.search(text)
         if day_month_time_match:
             day_str, month_str, time_str = day_month_time_match.groups()
             day = int(day_str)
@@ -449,7 +479,7 @@ class DateTimeParser:
             return dt, f"{date_desc} at {time_desc}"
         for month_name in MONTH_NAMES:
             if month_name in text.lower():
-                month_day_match = re.search(MONTH_DAY_PATTERN, text.lower())
+                month_day_match = MONTH_DAY.search(text.lower())
                 if month_day_match:
                     month_str, day_str = month_day_match.groups()
                     day = int(day_str)
@@ -457,7 +487,7 @@ class DateTimeParser:
                     year = datetime.now().year
                     time_part = text[month_day_match.end():].strip()
                     if time_part:
-                        time_match = re.search(TIME_PATTERNS[0], time_part)
+                        time_match = TIME_AMPM.search(time_part)
                         if time_match:
                             hour = int(time_match.group(1))
                             minute = int(time_match.group(2) or 0)
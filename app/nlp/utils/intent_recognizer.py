@@ -1,78 +1,72 @@
-import re
-from app.nlp.constants import (
-    BOOKING_KEYWORDS,
-    INQUIRY_KEYWORDS,
-    ID_KEYWORDS,
-    CANCEL_KEYWORDS,
-    BOOKING_REFERENCE_KEYWORDS,
-    LIST_KEYWORDS,
-    BOOKING_PLURAL_KEYWORDS,
-    LIST_BOOKINGS_EXACT_MATCHES,
-    GREETING_KEYWORDS,
-    UPDATE_KEYWORDS,
-    UPDATE_COMMANDS,
-    UPDATE_BOOKING_PATTERN,
-    SIMPLE_DIGIT_PATTERN,
-    SPECIFIC_BOOKING_INQUIRY_PATTERNS
-)
+from functools import lru_cache
+from app.nlp.constants import INTENT_KEYWORD_CLASSES
+from app.nlp.utils.keyword_automaton import KeywordAutomaton
+from app.nlp.utils.parsed_utterance import ParsedUtterance
+from app.nlp.utils.patterns import SPECIFIC_BOOKING_INQUIRY
+
+INTENT_KEYWORDS = KeywordAutomaton(INTENT_KEYWORD_CLASSES)
+BOOKING = INTENT_KEYWORDS.bit("booking")
+INQUIRY = INTENT_KEYWORDS.bit("inquiry")
+ID = INTENT_KEYWORDS.bit("id")
+CANCEL = INTENT_KEYWORDS.bit("cancel")
+UPDATE = INTENT_KEYWORDS.bit("update")
+BOOKING_REFERENCE = INTENT_KEYWORDS.bit("booking_reference")
+LIST = INTENT_KEYWORDS.bit("list")
+BOOKING_PLURAL = INTENT_KEYWORDS.bit("booking_plural")
+LIST_BOOKINGS = INTENT_KEYWORDS.bit("list_bookings")
+GREETING = INTENT_KEYWORDS.bit("greeting")
+UPDATE_COMMAND = INTENT_KEYWORDS.bit("update_command")
+BOOKING_ID = INTENT_KEYWORDS.bit("booking_id")
+ID_TOKEN = INTENT_KEYWORDS.bit("id_token")
+DIGIT = INTENT_KEYWORDS.bit("digit")
+KEYWORD_CACHE_SIZE = 256
 
 
 class IntentRecognizer:
+    @staticmethod
+    @lru_cache(maxsize=KEYWORD_CACHE_SIZE)
+    def keyword_classes(text: str) -> int:
+        return INTENT_KEYWORDS.scan(text)
+
+    @staticmethod
+    def classes_of(text: str) -> int:
+        if isinstance(text, ParsedUtterance):
+            return text.keyword_classes
+        return IntentRecognizer.keyword_classes(text)
+
     @staticmethod
     def is_booking_request(text: str) -> bool:
-        text = text.lower()
-        return any(keyword in text for keyword in BOOKING_KEYWORDS)
+        return bool(IntentRecognizer.classes_of(text) & BOOKING)
 
     @staticmethod
     def is_booking_id_inquiry(text: str) -> bool:
-        text = text.lower()
-        has_inquiry = any(keyword in text for keyword in INQUIRY_KEYWORDS)
-        has_id = any(keyword in text for keyword in ID_KEYWORDS)
-        return (has_inquiry and has_id) or "booking id" in text
+        classes = IntentRecognizer.classes_of(text)
+        return classes & (INQUIRY | ID) == INQUIRY | ID or bool(classes & BOOKING_ID)
 
     @staticmethod
     def is_cancellation_request(text: str) -> bool:
-        text = text.lower()
-        has_cancel = any(keyword in text for keyword in CANCEL_KEYWORDS)
-        has_booking = any(
-            keyword in text for keyword in BOOKING_REFERENCE_KEYWORDS) or "id" in text
-        has_id = re.search(SIMPLE_DIGIT_PATTERN, text) is not None
-        return has_cancel and (has_booking or has_id)
+        classes = IntentRecognizer.classes_of(text)
+        return bool(classes & CANCEL) and bool(classes & (BOOKING_REFERENCE | ID_TOKEN | DIGIT))
 
     @staticmethod
     def is_list_bookings_request(text: str) -> bool:
-        text = text.lower()
-        for match in LIST_BOOKINGS_EXACT_MATCHES:
-            if match in text:
-                return True
-        has_list = any(keyword in text for keyword in LIST_KEYWORDS)
-        has_booking = any(keyword in text for keyword in BOOKING_PLURAL_KEYWORDS)
-        return has_list and has_booking
+        classes = IntentRecognizer.classes_of(text)
+        return bool(classes & LIST_BOOKINGS) or classes & (LIST | BOOKING_PLURAL) == LIST | BOOKING_PLURAL
 
     @staticmethod
     def is_greeting(text: str) -> bool:
-        text = text.lower()
-        return any(greeting in text for greeting in GREETING_KEYWORDS)
+        return bool(IntentRecognizer.classes_of(text) & GREETING)
 
     @staticmethod
     def is_update_request(text: str) -> bool:
-        text = text.lower()
-        if re.search(UPDATE_BOOKING_PATTERN, text):
+        classes = IntentRecognizer.classes_of(text)
+        if classes & (UPDATE | BOOKING_REFERENCE) == UPDATE | BOOKING_REFERENCE:
             return True
-        for keyword in UPDATE_KEYWORDS:
-            if keyword in text and any(
-                    ref in text for ref in BOOKING_REFERENCE_KEYWORDS + ["a booking", "an appointment"]):
-                return True
-        has_update = any(update_command in text for update_command in UPDATE_COMMANDS)
-        has_booking = any(
-            keyword in text for keyword in BOOKING_REFERENCE_KEYWORDS) or "id" in text
-        return has_update and (has_booking or re.search(SIMPLE_DIGIT_PATTERN, text))
+        return bool(classes & UPDATE_COMMAND) and bool(classes & (BOOKING_REFERENCE | ID_TOKEN | DIGIT))
 
     @staticmethod
     def is_specific_booking_inquiry(text: str) -> bool:
-        text = text.lower()
-        for pattern in SPECIFIC_BOOKING_INQUIRY_PATTERNS:
-            match = re.search(pattern, text)
-            if match:
-                return True
-        return False
+        if not IntentRecognizer.classes_of(text) & BOOKING_REFERENCE:
+            return False
+        text_lower = ParsedUtterance.of(text).lowered
+        return any(pattern.search(text_lower) for pattern in SPECIFIC_BOOKING_INQUIRY)
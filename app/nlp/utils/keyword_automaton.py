@@ -0,0 +1,50 @@
+from collections import deque
+from typing import Dict, Iterable, List
+
+
+class KeywordAutomaton:
+    def __init__(self, classes: Dict[str, Iterable[str]]):
+        self._bits = {name: 1 << position for position, name in enumerate(classes)}
+        goto: List[Dict[str, int]] = [{}]
+        outputs = [0]
+        for name, keywords in classes.items():
+            for keyword in keywords:
+                state = 0
+                for char in keyword.lower():
+                    if char not in goto[state]:
+                        goto.append({})
+                        outputs.append(0)
+                        goto[state][char] = len(goto) - 1
+                    state = goto[state][char]
+                outputs[state] |= self._bits[name]
+        self._transitions = self._build_transitions(goto, outputs)
+        self._outputs = outputs
+
+    @staticmethod
+    def _build_transitions(goto: List[Dict[str, int]], outputs: List[int]) -> List[Dict[str, int]]:
+        transitions: List[Dict[str, int]] = [dict(goto[0])]
+        transitions.extend({} for _ in range(len(goto) - 1))
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] |= outputs[fail[state]]
+            transitions[state] = dict(transitions[fail[state]])
+            for char, child in goto[state].items():
+                fail[child] = transitions[fail[state]].get(char, 0)
+                transitions[state][char] = child
+                queue.append(child)
+        return transitions
+
+    def bit(self, name: str) -> int:
+        return self._bits[name]
+
+    def scan(self, text: str) -> int:
+        transitions = self._transitions
+        outputs = self._outputs
+        state = 0
+        matched = 0
+        for char in text.lower():
+            state = transitions[state].get(char, 0)
+            matched |= outputs[state]
+        return matched
@@ -0,0 +1,64 @@
+from functools import cached_property
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+from app.nlp.constants import MONTH_NAMES, VALID_SPECIALTIES
+from app.nlp.utils.patterns import DATE_TEXT, DIGITS, TIME_TEXT, TOKEN
+
+Span = Tuple[int, int, str]
+
+
+class ParsedUtterance(str):
+    @classmethod
+    def of(cls, text: str) -> "ParsedUtterance":
+        if isinstance(text, cls):
+            return text
+        return cls(text)
+
+    @cached_property
+    def lowered(self) -> str:
+        return self.lower()
+
+    @cached_property
+    def normalized(self) -> str:
+        return self.lowered.strip()
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        return TOKEN.findall(self.lowered)
+
+    @cached_property
+    def numeric_spans(self) -> List[Span]:
+        return [(match.start(), match.end(), match.group()) for match in DIGITS.finditer(self)]
+
+    @property
+    def has_digits(self) -> bool:
+        return bool(self.numeric_spans)
+
+    @cached_property
+    def time_spans(self) -> List[Span]:
+        return [(match.start(), match.end(), match.group()) for match in TIME_TEXT.finditer(self.lowered)]
+
+    @cached_property
+    def date_spans(self) -> List[Span]:
+        return [(match.start(), match.end(), match.group()) for match in DATE_TEXT.finditer(self.lowered)]
+
+    @cached_property
+    def months(self) -> List[str]:
+        return [month for month in MONTH_NAMES if month in self.lowered]
+
+    @cached_property
+    def keyword_classes(self) -> int:
+        from app.nlp.utils.intent_recognizer import INTENT_KEYWORDS
+        return INTENT_KEYWORDS.scan(self.lowered)
+
+    @cached_property
+    def specialty_hits(self) -> List[str]:
+        return [specialty for specialty in VALID_SPECIALTIES if specialty.lower() in self.lowered]
+
+    @cached_property
+    def _memo(self) -> Dict[Hashable, Any]:
+        return {}
+
+    def memoize(self, key: Hashable, compute: Callable[..., Any], *args: Any) -> Any:
+        if key not in self._memo:
+            self._memo[key] = compute(*args)
+        return self._memo[key]
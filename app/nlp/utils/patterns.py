@@ -0,0 +1,125 @@
+import re
+from typing import Dict, List, Pattern
+from app.nlp.constants import (
+    AMPM_MARKER_PATTERN,
+    AMPM_PATTERN,
+    BOOKING_ID_EXTRACTION_PATTERN,
+    BOOKING_ID_PATTERN,
+    CLOCK_TIME_PATTERN,
+    DATE_PATTERNS,
+    DATE_TEXT_PATTERN,
+    DATE_PATTERNS_EXTENDED,
+    DAY_MONTH_TIME_PATTERN,
+    DAY_NUMBER_PATTERN,
+    DIGIT_PATTERN,
+    DURATION_PATTERN,
+    MONTH_DAY_LOOSE_PATTERNS,
+    MONTH_DAY_PATTERN,
+    MONTH_DAY_TIME_PATTERN,
+    MONTH_WORD_DAY_PATTERN,
+    NOT_A_SPECIALTY_PATTERN,
+    NUMERIC_TIME_PATTERN,
+    PERIOD_OF_DAY_PATTERN,
+    SIMPLE_DIGIT_PATTERN,
+    SINGLE_NUMBER_PATTERN,
+    SPECIFIC_BOOKING_INQUIRY_PATTERNS,
+    STANDALONE_MINUTES_PATTERN,
+    STANDALONE_NUMBER_PATTERN,
+    TECHNICIANS,
+    TIME_ONLY_PATTERN,
+    TIME_PATTERNS,
+    TIME_TEXT_PATTERN,
+    TIME_WITHOUT_AMPM_PATTERN,
+    TOKEN_PATTERN,
+    UPDATE_BOOKING_PATTERN,
+    UPDATE_BOOKING_WITH_TIME_PATTERN
+)
+
+
+class PatternRegistry:
+    _patterns: Dict[str, Pattern[str]] = {}
+
+    @classmethod
+    def register(cls, name: str, pattern: str, flags: int = 0) -> Pattern[str]:
+        if name in cls._patterns:
+            raise ValueError(f"Pattern '{name}' is already registered")
+        compiled = re.compile(pattern, flags)
+        cls._patterns[name] = compiled
+        return compiled
+
+    @classmethod
+    def get(cls, name: str) -> Pattern[str]:
+        return cls._patterns[name]
+
+    @classmethod
+    def names(cls) -> List[str]:
+        return list(cls._patterns)
+
+
+SIMPLE_DIGIT = PatternRegistry.register("simple_digit", SIMPLE_DIGIT_PATTERN)
+DIGITS = PatternRegistry.register("digits", DIGIT_PATTERN)
+SINGLE_NUMBER = PatternRegistry.register("single_number", SINGLE_NUMBER_PATTERN)
+DAY_NUMBER = PatternRegistry.register("day_number", DAY_NUMBER_PATTERN)
+STANDALONE_NUMBER = PatternRegistry.register("standalone_number", STANDALONE_NUMBER_PATTERN)
+TOKEN = PatternRegistry.register("token", TOKEN_PATTERN)
+
+MONTH_DAY = PatternRegistry.register("month_day", MONTH_DAY_PATTERN)
+MONTH_WORD_DAY = PatternRegistry.register("month_word_day", MONTH_WORD_DAY_PATTERN)
+MONTH_DAY_LOOSE = (
+    PatternRegistry.register("month_day_loose", MONTH_DAY_LOOSE_PATTERNS[0]),
+    PatternRegistry.register("month_abbreviation_day", MONTH_DAY_LOOSE_PATTERNS[1])
+)
+MONTH_DAY_TIME = PatternRegistry.register("month_day_time", MONTH_DAY_TIME_PATTERN)
+DAY_MONTH_TIME = PatternRegistry.register("day_month_time", DAY_MONTH_TIME_PATTERN)
+DATE_TEXT = PatternRegistry.register("date_text", DATE_TEXT_PATTERN)
+
+DATE_NUMERIC = PatternRegistry.register("date_numeric", DATE_PATTERNS[0])
+DATE_YEAR_FIRST = PatternRegistry.register("date_year_first", DATE_PATTERNS[1])
+DATE_WORD_DAY = PatternRegistry.register("date_word_day", DATE_PATTERNS[2])
+DATE_DAY_WORD = PatternRegistry.register("date_day_word", DATE_PATTERNS[3])
+DATE_DAY_OF_MONTH = PatternRegistry.register("date_day_of_month", DATE_PATTERNS[4])
+DATE_MONTH_DAY_YEAR = PatternRegistry.register("date_month_day_year", DATE_PATTERNS[5])
+DATE = (DATE_NUMERIC, DATE_YEAR_FIRST, DATE_WORD_DAY, DATE_DAY_WORD, DATE_DAY_OF_MONTH, DATE_MONTH_DAY_YEAR)
+
+DATE_EXTENDED_NUMERIC = PatternRegistry.register("date_extended_numeric", DATE_PATTERNS_EXTENDED[0])
+DATE_EXTENDED_DAY_OF_MONTH = PatternRegistry.register("date_extended_day_of_month", DATE_PATTERNS_EXTENDED[1])
+DATE_EXTENDED_ISO = PatternRegistry.register("date_extended_iso", DATE_PATTERNS_EXTENDED[2])
+DATE_EXTENDED_MONTH_DAY_YEAR = PatternRegistry.register("date_extended_month_day_year", DATE_PATTERNS_EXTENDED[3])
+DATE_EXTENDED = (DATE_EXTENDED_NUMERIC, DATE_EXTENDED_DAY_OF_MONTH, DATE_EXTENDED_ISO, DATE_EXTENDED_MONTH_DAY_YEAR)
+
+TIME_AMPM = PatternRegistry.register("time_ampm", TIME_PATTERNS[0])
+TIME_CLOCK = PatternRegistry.register("time_clock", TIME_PATTERNS[1])
+TIME_PERIOD = PatternRegistry.register("time_period", TIME_PATTERNS[2])
+TIME_MINUTES = PatternRegistry.register("time_minutes", TIME_PATTERNS[3])
+TIME_OCLOCK = PatternRegistry.register("time_oclock", TIME_PATTERNS[4])
+TIME_HOURS = PatternRegistry.register("time_hours", TIME_PATTERNS[5])
+TIME_MINUTES_WORD = PatternRegistry.register("time_minutes_word", TIME_PATTERNS[6])
+TIME = (TIME_AMPM, TIME_CLOCK, TIME_PERIOD, TIME_MINUTES, TIME_OCLOCK, TIME_HOURS, TIME_MINUTES_WORD)
+
+AMPM = PatternRegistry.register("ampm", AMPM_PATTERN)
+AMPM_MARKER = PatternRegistry.register("ampm_marker", AMPM_MARKER_PATTERN)
+PERIOD_OF_DAY = PatternRegistry.register("period_of_day", PERIOD_OF_DAY_PATTERN)
+CLOCK_TIME = PatternRegistry.register("clock_time", CLOCK_TIME_PATTERN)
+TIME_ONLY = PatternRegistry.register("time_only", TIME_ONLY_PATTERN)
+TIME_WITHOUT_AMPM = PatternRegistry.register("time_without_ampm", TIME_WITHOUT_AMPM_PATTERN)
+STANDALONE_MINUTES = PatternRegistry.register("standalone_minutes", STANDALONE_MINUTES_PATTERN)
+NUMERIC_TIME = PatternRegistry.register("numeric_time", NUMERIC_TIME_PATTERN)
+TIME_TEXT = PatternRegistry.register("time_text", TIME_TEXT_PATTERN)
+
+BOOKING_ID = PatternRegistry.register("booking_id", BOOKING_ID_PATTERN, re.IGNORECASE)
+BOOKING_ID_EXTRACTION = PatternRegistry.register("booking_id_extraction", BOOKING_ID_EXTRACTION_PATTERN)
+UPDATE_BOOKING = PatternRegistry.register("update_booking", UPDATE_BOOKING_PATTERN)
+UPDATE_BOOKING_WITH_TIME = PatternRegistry.register("update_booking_with_time", UPDATE_BOOKING_WITH_TIME_PATTERN)
+DURATION = PatternRegistry.register("duration", DURATION_PATTERN, re.IGNORECASE)
+
+INQUIRY_VERB_BOOKING = PatternRegistry.register("inquiry_verb_booking", SPECIFIC_BOOKING_INQUIRY_PATTERNS[0])
+INQUIRY_SHOW_BOOKING = PatternRegistry.register("inquiry_show_booking", SPECIFIC_BOOKING_INQUIRY_PATTERNS[1])
+INQUIRY_BOOKING_NUMBER = PatternRegistry.register("inquiry_booking_number", SPECIFIC_BOOKING_INQUIRY_PATTERNS[2])
+SPECIFIC_BOOKING_INQUIRY = (INQUIRY_VERB_BOOKING, INQUIRY_SHOW_BOOKING, INQUIRY_BOOKING_NUMBER)
+
+NOT_A_SPECIALTY = {
+    specialty.lower(): PatternRegistry.register(
+        f"not_a_{specialty.lower().replace(' ', '_')}",
+        NOT_A_SPECIALTY_PATTERN.format(specialty=re.escape(specialty.lower())))
+    for specialty in TECHNICIANS
+}
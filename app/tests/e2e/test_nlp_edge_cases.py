@@ -15,6 +15,7 @@ import json
 import pytest
 from datetime import datetime, timedelta
 from pathlib import Path
+from app.nlp.constants import TECHNICIANS
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 BASE_URL = 'http://localhost:8000/api/v1'
 HEADERS = {'Content-Type': 'application/json'}
@@ -88,8 +89,9 @@ def test_conflict_resolution():
     print_header("Testing Conflict Resolution")
     reset_database()
     session_id = str(uuid.uuid4())
-    print_step(1, "Creating first booking")
-    create_test_booking(session_id, "electrician", "tomorrow", "1 PM")
+    print_step(1, "Booking every electrician for the slot")
+    for technician_name in TECHNICIANS["Electrician"]:
+        create_test_booking(session_id, "electrician", "tomorrow", "1 PM", technician_name)
     print_step(2, "Attempting to create conflicting booking")
     reset_session(session_id)
     response = send_request(session_id, "I need an electrician")
@@ -2,6 +2,7 @@ from app.db.database import get_booking_by_id, reset_database
 from app.models.booking import Booking
 from app.nlp.utils.date_time_parser import DateTimeParser
 from app.nlp.processors.natural_language_processor import NaturalLanguageProcessor
+from app.nlp.managers.user_context_manager import UserContextManager
 import pytest
 import sys
 import os
@@ -19,10 +20,11 @@ class TestBookingFlowIntegration:
     def setup_method(self):
         reset_database()
         self.nlp = NaturalLanguageProcessor()
+        self.user_context = UserContextManager.create_default_context()
         self.responses = []
 
     def process_and_log(self, input_text):
-        response = self.nlp.process_input(input_text)
+        response = self.nlp.process_input(input_text, self.user_context)
         self.responses.append(f"User: {input_text}")
         self.responses.append(f"System: {response}")
         return response
@@ -76,6 +78,7 @@ class TestBookingFlowIntegration:
         for specialty in specialties:
             reset_database()
             self.nlp = NaturalLanguageProcessor()
+            self.user_context = UserContextManager.create_default_context()
             self.responses = []
             response = self.process_and_log(f"I need an {specialty}")
             assert "date" in response.lower(
@@ -2,6 +2,7 @@ from app.db.database import get_booking_by_id, reset_database
 from app.models.booking import Booking
 from app.nlp.utils.date_time_parser import DateTimeParser
 from app.nlp.processors.natural_language_processor import NaturalLanguageProcessor
+from app.nlp.managers.user_context_manager import UserContextManager
 import pytest
 import sys
 import os
@@ -16,21 +17,20 @@ sys.path.append(
 
 @pytest.fixture(autouse=True)
 def reset_database():
-    from app.db.database import bookings_db, next_id
-    bookings_db.clear()
-    globals()['next_id'] = 1
+    from app.db.database import reset_database as reset_store
+    reset_store()
     yield
-    bookings_db.clear()
-    globals()['next_id'] = 1
+    reset_store()
 
 
 class TestContextResetIssues:
     def setup_method(self):
         self.nlp = NaturalLanguageProcessor()
+        self.user_context = UserContextManager.create_default_context()
         self.responses = []
 
     def process_and_log(self, input_text):
-        response = self.nlp.process_input(input_text)
+        response = self.nlp.process_input(input_text, self.user_context)
         self.responses.append((input_text, response))
         return response
 
@@ -2,6 +2,7 @@ from app.db.database import get_booking_by_id, reset_database
 from app.models.booking import Booking
 from app.nlp.utils.date_time_parser import DateTimeParser
 from app.nlp.processors.natural_language_processor import NaturalLanguageProcessor
+from app.nlp.managers.user_context_manager import UserContextManager
 import pytest
 import sys
 import os
@@ -19,10 +20,11 @@ class TestTimeHandling:
     def setup_method(self):
         reset_database()
         self.nlp = NaturalLanguageProcessor()
+        self.user_context = UserContextManager.create_default_context()
         self.responses = []
 
     def process_and_log(self, input_text):
-        response = self.nlp.process_input(input_text)
+        response = self.nlp.process_input(input_text, self.user_context)
         self.responses.append(f"User: {input_text}")
         self.responses.append(f"System: {response}")
         return response
@@ -32,6 +34,7 @@ class TestTimeHandling:
         for time_str in ambiguous_times:
             reset_database()
             self.nlp = NaturalLanguageProcessor()
+            self.user_context = UserContextManager.create_default_context()
             self.responses = []
             self.process_and_log("Make an appointment for plumber")
             self.process_and_log("April 15")
@@ -55,6 +58,7 @@ class TestTimeHandling:
         for time_str in unambiguous_times:
             reset_database()
             self.nlp = NaturalLanguageProcessor()
+            self.user_context = UserContextManager.create_default_context()
             self.responses = []
             self.process_and_log("Make an appointment for plumber")
             self.process_and_log("April 15")
@@ -83,6 +87,7 @@ class TestTimeHandling:
         for time_str, expected_hour in time_formats.items():
             reset_database()
             self.nlp = NaturalLanguageProcessor()
+            self.user_context = UserContextManager.create_default_context()
             self.responses = []
             self.process_and_log("Make an appointment for plumber")
             self.process_and_log("April 15")
@@ -109,6 +114,7 @@ class TestTimeHandling:
         for response_str, expected_ampm in ampm_responses.items():
             reset_database()
             self.nlp = NaturalLanguageProcessor()
+            self.user_context = UserContextManager.create_default_context()
             self.responses = []
             self.process_and_log("Make an appointment for plumber")
             self.process_and_log("April 15")
@@ -121,6 +127,7 @@ class TestTimeHandling:
         for response_str in invalid_responses:
             reset_database()
             self.nlp = NaturalLanguageProcessor()
+            self.user_context = UserContextManager.create_default_context()
             self.responses = []
             self.process_and_log("Make an appointment for plumber")
             self.process_and_log("April 15")
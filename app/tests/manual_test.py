@@ -1,6 +1,7 @@
 from app.models.booking import BookingCreate
 from app.db.database import reset_database, create_booking
 from app.nlp.processor import NaturalLanguageProcessor
+from app.nlp.managers.user_context_manager import UserContextManager
 from app.nlp.utils.date_time_parser import DateTimeParser
 import sys
 import os
@@ -42,24 +43,26 @@ def test_specific_time_inputs():
 
 def test_booking_with_specific_times():
     nlp = NaturalLanguageProcessor()
+    user_context = UserContextManager.create_default_context()
     print("\n=== Testing Booking Flow with Specific Times ===")
-    response = nlp.process_input("Hello")
+    response = nlp.process_input("Hello", user_context)
     print(f"User: Hello")
     print(f"System: {response}")
-    response = nlp.process_input("I need to book an electrician")
+    response = nlp.process_input("I need to book an electrician", user_context)
     print(f"User: I need to book an electrician")
     print(f"System: {response}")
-    response = nlp.process_input("tomorrow")
+    response = nlp.process_input("tomorrow", user_context)
     print(f"User: tomorrow")
     print(f"System: {response}")
-    response = nlp.process_input("3:14 PM")
+    response = nlp.process_input("3:14 PM", user_context)
     print(f"User: 3:14 PM")
     print(f"System: {response}")
     nlp2 = NaturalLanguageProcessor()
-    response = nlp2.process_input("Hello")
-    response = nlp2.process_input("I need to book a plumber")
-    response = nlp2.process_input("tomorrow")
-    response = nlp2.process_input("3:15")
+    other_context = UserContextManager.create_default_context()
+    response = nlp2.process_input("Hello", other_context)
+    response = nlp2.process_input("I need to book a plumber", other_context)
+    response = nlp2.process_input("tomorrow", other_context)
+    response = nlp2.process_input("3:15", other_context)
     print(f"User: 3:15")
     print(f"System: {response}")
 
@@ -69,19 +72,20 @@ def test_technician_selection():
     print("TESTING TECHNICIAN SELECTION BY NUMBER")
     print("="*70)
     nlp = NaturalLanguageProcessor()
+    user_context = UserContextManager.create_default_context()
     print("\nStep 1: Request a plumber")
-    response = nlp.process_input("I need a plumber")
+    response = nlp.process_input("I need a plumber", user_context)
     print(f"Response: {response}")
     print("\nStep 2: Provide a date")
-    response = nlp.process_input("April 15")
+    response = nlp.process_input("April 15", user_context)
     print(f"Response: {response}")
     print("\nStep 3: Provide a time with specific minutes")
-    response = nlp.process_input("3:13 PM")
+    response = nlp.process_input("3:13 PM", user_context)
     print(f"Response: {response}")
     if "available" in response and "Please select a technician" in response:
         print("✅ Successfully entered technician selection mode")
         print("\nStep 4: Select a technician by number")
-        response = nlp.process_input("1")
+        response = nlp.process_input("1", user_context)
         print(f"Response: {response}")
         if "confirmed" in response:
             print("✅ Successfully selected technician by number")
@@ -96,19 +100,20 @@ def test_technician_selection_by_name():
     print("TESTING TECHNICIAN SELECTION BY NAME")
     print("="*70)
     nlp = NaturalLanguageProcessor()
+    user_context = UserContextManager.create_default_context()
     print("\nStep 1: Request a plumber")
-    response = nlp.process_input("I need a plumber")
+    response = nlp.process_input("I need a plumber", user_context)
     print(f"Response: {response}")
     print("\nStep 2: Provide a date")
-    response = nlp.process_input("April 16")
+    response = nlp.process_input("April 16", user_context)
     print(f"Response: {response}")
     print("\nStep 3: Provide a time with specific minutes")
-    response = nlp.process_input("4:13 PM")
+    response = nlp.process_input("4:13 PM", user_context)
     print(f"Response: {response}")
     if "available" in response and "Please select a technician" in response:
         print("✅ Successfully entered technician selection mode")
         print("\nStep 4: Select a technician by name")
-        response = nlp.process_input("Nicolas")
+        response = nlp.process_input("Nicolas", user_context)
         print(f"Response: {response}")
         if "confirmed" in response:
             print("✅ Successfully selected technician by name")
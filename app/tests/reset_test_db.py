@@ -1,4 +1,5 @@
-from app.db.database import bookings_db, next_id, initialize_db
+from app.db.database import store
+from app.models.booking import BookingCreate
 import os
 import sys
 from datetime import datetime, timedelta
@@ -7,9 +8,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
 def reset_database():
-    global bookings_db, next_id
-    bookings_db.clear()
-    next_id = 1
+    store.reset_database()
     now = datetime.now()
     base_date = datetime(
         now.year,
@@ -41,17 +40,11 @@ def reset_database():
         }
     ]
     for booking_data in test_bookings:
-        booking_id = next_id
-        next_id += 1
-        bookings_db[booking_id] = {
-            "technician_name": booking_data["technician_name"],
-            "specialty": booking_data["specialty"],
-            "booking_time": booking_data["booking_time"]
-        }
+        store.create_booking(BookingCreate(**booking_data))
     print(f"Database reset with {len(test_bookings)} test bookings:")
-    for booking_id, booking in bookings_db.items():
+    for booking in store.get_all_bookings():
         print(
-            f"  ID: {booking_id}, Time: {booking['booking_time']}, Technician: {booking['technician_name']}, Specialty: {booking['specialty']}")
+            f"  ID: {booking.id}, Time: {booking.booking_time}, Technician: {booking.technician_name}, Specialty: {booking.specialty}")
 
 
 if __name__ == "__main__":
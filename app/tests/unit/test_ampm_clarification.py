@@ -1,6 +1,7 @@
 import pytest
 from datetime import datetime
 from app.nlp.processors.natural_language_processor import NaturalLanguageProcessor
+from app.nlp.managers.user_context_manager import UserContextManager
 from app.nlp.utils.date_time_parser import DateTimeParser
 from app.nlp.constants import TIME_WITHOUT_AMPM_PATTERN
 
@@ -15,22 +16,23 @@ class TestAMPMClarification:
     ])
     def test_ampm_clarification_behavior(self, time_input):
         nlp = NaturalLanguageProcessor()
-        nlp.user_context["awaiting_time"] = True
-        nlp.user_context["temp_booking_date"] = datetime.now().replace(
+        user_context = UserContextManager.create_default_context()
+        user_context["awaiting_time"] = True
+        user_context["temp_booking_date"] = datetime.now().replace(
             hour=0, minute=0, second=0, microsecond=0)
-        nlp.user_context["temp_booking_specialty"] = "Plumber"
-        response = nlp.process_input(time_input)
+        user_context["temp_booking_specialty"] = "Plumber"
+        response = nlp.process_input(time_input, user_context)
         time_recognized = time_input in response or (
             time_input.split(':')[0] in response and ':00' in response)
         assert time_recognized, f"Time '{time_input}' was not recognized in the response: {response}"
-        assert nlp.user_context.get(
+        assert user_context.get(
             "awaiting_ampm", False), f"System should ask for AM/PM clarification for '{time_input}'"
         hour = int(time_input.split(':')[0])
         minute = int(time_input.split(':')[1])
-        assert nlp.user_context.get(
-            "temp_booking_hour") == hour, f"Expected hour {hour}, got {nlp.user_context.get('temp_booking_hour')}"
-        assert nlp.user_context.get(
-            "temp_booking_minute") == minute, f"Expected minute {minute}, got {nlp.user_context.get('temp_booking_minute')}"
+        assert user_context.get(
+            "temp_booking_hour") == hour, f"Expected hour {hour}, got {user_context.get('temp_booking_hour')}"
+        assert user_context.get(
+            "temp_booking_minute") == minute, f"Expected minute {minute}, got {user_context.get('temp_booking_minute')}"
 
     @pytest.mark.parametrize("time_input, expected_hour, expected_minute", [
         ("3:00 AM", 3, 0),
@@ -57,19 +59,20 @@ class TestAMPMClarification:
 
     def test_booking_with_ampm_response(self):
         nlp = NaturalLanguageProcessor()
-        response1 = nlp.process_input("I need to book a plumber")
+        user_context = UserContextManager.create_default_context()
+        response1 = nlp.process_input("I need to book a plumber", user_context)
         assert "What date" in response1 or "When" in response1, "System should ask for date"
-        response2 = nlp.process_input("Tomorrow")
+        response2 = nlp.process_input("Tomorrow", user_context)
         assert "What time" in response2 or "When" in response2, "System should ask for time"
-        response3 = nlp.process_input("5:00")
-        assert nlp.user_context.get(
+        response3 = nlp.process_input("5:00", user_context)
+        assert user_context.get(
             "awaiting_ampm", False), "System should ask for AM/PM clarification for '5:00'"
         assert "AM or PM" in response3, "Response should ask for AM or PM"
-        response4 = nlp.process_input("AM")
-        assert not nlp.user_context.get(
+        response4 = nlp.process_input("AM", user_context)
+        assert not user_context.get(
             "awaiting_ampm", False), "System should no longer be awaiting AM/PM"
-        if "temp_booking_time" in nlp.user_context and nlp.user_context["temp_booking_time"]:
-            time_dt = nlp.user_context["temp_booking_time"]
+        if "temp_booking_time" in user_context and user_context["temp_booking_time"]:
+            time_dt = user_context["temp_booking_time"]
             assert time_dt.hour == 5, f"Expected 05:00, got {time_dt.hour:02d}:{time_dt.minute:02d}"
 
     @pytest.mark.parametrize("time_input", ["5:00", "6:00", "7:00", "5:30", "6:45", "7:15"])
@@ -98,15 +101,16 @@ class TestAMPMClarification:
     ])
     def test_full_ampm_clarification_flow(self, time_input, am_pm, expected_hour):
         nlp = NaturalLanguageProcessor()
-        nlp.process_input("I need a plumber")
-        nlp.process_input("tomorrow")
-        response = nlp.process_input(time_input)
+        user_context = UserContextManager.create_default_context()
+        nlp.process_input("I need a plumber", user_context)
+        nlp.process_input("tomorrow", user_context)
+        response = nlp.process_input(time_input, user_context)
         assert "AM or PM" in response, f"Response should ask for AM or PM for time {time_input}"
-        assert nlp.user_context.get(
+        assert user_context.get(
             "awaiting_ampm", False), f"System should be awaiting AM/PM for {time_input}"
-        nlp.process_input(am_pm)
-        assert "temp_booking_time" in nlp.user_context, "temp_booking_time should be in user_context"
-        time_dt = nlp.user_context["temp_booking_time"]
+        nlp.process_input(am_pm, user_context)
+        assert "temp_booking_time" in user_context, "temp_booking_time should be in user_context"
+        time_dt = user_context["temp_booking_time"]
         assert time_dt.hour == expected_hour, f"Expected hour {expected_hour}, got {time_dt.hour}"
         minute = int(time_input.split(':')[1])
         assert time_dt.minute == minute, f"Expected minute {minute}, got {time_dt.minute}"
@@ -0,0 +1,99 @@
+from app.api.routes.availability import check_availability
+from app.db.database import create_booking, get_bookings_on_days, get_daily_availability, reset_database
+from app.models.availability import AvailabilityCheck
+from app.models.booking import BookingCreate
+from app.nlp.handlers.conflict_checker import BookingConflictChecker
+import unittest
+from fastapi import HTTPException
+import random
+import sys
+import os
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+TECHNICIANS = ["Alice", "Bob", "Carol"]
+
+
+class TestAvailabilityCheck(unittest.TestCase):
+    def setUp(self):
+        reset_database()
+        self.rng = random.Random(5)
+        self.base_date = datetime(2025, 3, 10)
+        for _ in range(200):
+            try:
+                create_booking(BookingCreate(
+                    technician_name=self.rng.choice(TECHNICIANS),
+                    specialty="Plumber",
+                    booking_time=self.random_time(),
+                    duration_minutes=self.rng.choice([30, 60, 90])
+                ))
+            except ValueError:
+                pass
+
+    def tearDown(self):
+        reset_database()
+
+    def random_time(self):
+        return self.base_date + timedelta(days=self.rng.randrange(6), minutes=15 * self.rng.randrange(96))
+
+    def test_days_are_loaded_as_contiguous_ranges(self):
+        days = [self.base_date.date() + timedelta(days=offset) for offset in (4, 0, 1, 1)]
+        bookings = get_bookings_on_days(days)
+        expected = {0, 1, 4}
+        self.assertTrue(bookings)
+        self.assertEqual(len({booking.id for booking in bookings}), len(bookings))
+        for booking in bookings:
+            self.assertIn((booking.booking_time.date() - self.base_date.date()).days, expected)
+        self.assertEqual(get_bookings_on_days([]), [])
+
+    def test_matches_per_technician_checks(self):
+        slots = []
+        for _ in range(300):
+            technicians = self.rng.choice([[name] for name in TECHNICIANS] + [TECHNICIANS, ["Nobody"]])
+            slots.append((technicians, self.random_time(), self.rng.choice([15, 45, 60, 120])))
+        verdicts = BookingConflictChecker.check_slots(slots)
+        self.assertEqual(len(verdicts), len(slots))
+        for (technicians, start, duration_minutes), verdict in zip(slots, verdicts):
+            conflicts = {
+                name: BookingConflictChecker.check_conflict(
+                    start, technician_name=name, duration_minutes=duration_minutes)
+                for name in technicians
+            }
+            free = [name for name in technicians if conflicts[name] is None]
+            self.assertEqual(verdict.free_technicians, free)
+            if free:
+                self.assertIsNone(verdict.booking_id)
+            else:
+                self.assertEqual(verdict.booking_id, min(conflict["booking_id"] for conflict in conflicts.values()))
+
+    def test_empty_batch(self):
+        self.assertEqual(BookingConflictChecker.check_slots([]), [])
+
+    def test_endpoint_agrees_with_daily_availability(self):
+        booking_time = datetime(2027, 1, 5, 10, 0)
+        booking_id = create_booking(BookingCreate(
+            technician_name="Nicolas Woollett", specialty="Plumber", booking_time=booking_time))
+        busy = get_daily_availability(booking_time.date(), ["Nicolas Woollett"])[0].busy
+        self.assertEqual(busy, ((booking_time, booking_time + timedelta(hours=1)),))
+        verdicts = check_availability([
+            AvailabilityCheck(technician="Nicolas Woollett", start=booking_time + timedelta(minutes=30)),
+            AvailabilityCheck(technician="Nicolas Woollett", start=booking_time + timedelta(hours=1))
+        ])
+        self.assertFalse(verdicts[0].available)
+        self.assertEqual(verdicts[0].conflicting_booking_id, booking_id)
+        self.assertTrue(verdicts[1].available)
+        self.assertEqual(verdicts[1].technicians, ["Nicolas Woollett"])
+        with self.assertRaises(ValueError):
+            create_booking(BookingCreate(technician_name="Nicolas Woollett", specialty="Plumber",
+                                         booking_time=booking_time + timedelta(minutes=30)))
+        create_booking(BookingCreate(technician_name="Nicolas Woollett", specialty="Plumber",
+                                     booking_time=booking_time + timedelta(hours=1)))
+
+    def test_unknown_technician_is_rejected(self):
+        with self.assertRaises(HTTPException) as raised:
+            check_availability([AvailabilityCheck(technician="Nobody", start=self.base_date)])
+        self.assertEqual(raised.exception.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+from app.db.availability_view import DailyAvailabilityView
+from app.db.columnar_store import ColumnarBookingStore
+from app.db.memory_store import InMemoryBookingStore
+from app.db.sqlite_store import SQLiteBookingStore
+from app.models.booking import BookingCreate, MAX_DURATION_MINUTES
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+
+class RangeOnlyStore(InMemoryBookingStore):
+    def get_all_bookings(self):
+        raise AssertionError("the availability view must not scan every booking")
+
+
+class TestDailyAvailabilityView(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+        self.day = self.base_date.date()
+        self.day_start = datetime(2025, 3, 10)
+        self.day_end = datetime(2025, 3, 11)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def stores(self):
+        return [
+            RangeOnlyStore(),
+            ColumnarBookingStore(),
+            SQLiteBookingStore(os.path.join(self.temp_dir.name, "bookings.db"))
+        ]
+
+    def attach(self, store):
+        loads = []
+
+        def load_day(start, end):
+            loads.append(start)
+            return store.get_bookings_in_range(start, end)
+
+        view = DailyAvailabilityView(load_day)
+        store.add_observer(view)
+        return view, loads
+
+    def book(self, store, booking_time, technician_name="Alice", duration_minutes=60):
+        return store.create_booking(BookingCreate(
+            technician_name=technician_name,
+            specialty="Plumber",
+            booking_time=booking_time,
+            duration_minutes=duration_minutes
+        ))
+
+    def test_busy_intervals_are_merged_and_free_gaps_fill_the_day(self):
+        view = DailyAvailabilityView(lambda start, end: [])
+        store = InMemoryBookingStore()
+        store.add_observer(view)
+        view.technician_day(self.day, "Alice")
+        view.technician_day(self.day + timedelta(days=1), "Alice")
+        self.book(store, self.base_date)
+        self.book(store, self.base_date + timedelta(hours=1), duration_minutes=30)
+        self.book(store, self.base_date + timedelta(hours=3))
+        self.book(store, datetime(2025, 3, 10, 23, 0), duration_minutes=120)
+        availability = view.technician_day(self.day, "Alice")
+        self.assertEqual(availability.busy, (
+            (self.base_date, self.base_date + timedelta(minutes=90)),
+            (self.base_date + timedelta(hours=3), self.base_date + timedelta(hours=4)),
+            (datetime(2025, 3, 10, 23, 0), self.day_end)
+        ))
+        self.assertEqual(availability.free, (
+            (self.day_start, self.base_date),
+            (self.base_date + timedelta(minutes=90), self.base_date + timedelta(hours=3)),
+            (self.base_date + timedelta(hours=4), datetime(2025, 3, 10, 23, 0))
+        ))
+        next_day = view.technician_day(self.day + timedelta(days=1), "Alice")
+        self.assertEqual(next_day.busy, ((self.day_end, self.day_end + timedelta(hours=1)),))
+
+    def test_unbooked_technician_is_free_all_day(self):
+        view = DailyAvailabilityView(lambda start, end: [])
+        availability = view.technician_day(self.day, "Bob")
+        self.assertEqual(availability.busy, ())
+        self.assertEqual(availability.free, ((self.day_start, self.day_end),))
+
+    def test_writes_update_loaded_days_incrementally(self):
+        for store in self.stores():
+            first = self.book(store, self.base_date)
+            view, loads = self.attach(store)
+            self.assertEqual(view.technician_day(self.day, "Alice").busy,
+                             ((self.base_date, self.base_date + timedelta(hours=1)),))
+
+            second = self.book(store, self.base_date + timedelta(hours=2), duration_minutes=90)
+            self.book(store, self.base_date, technician_name="Bob")
+            self.assertEqual(view.technician_day(self.day, "Alice").busy, (
+                (self.base_date, self.base_date + timedelta(hours=1)),
+                (self.base_date + timedelta(hours=2), self.base_date + timedelta(hours=3, minutes=30))
+            ))
+            self.assertEqual(len(view.technician_day(self.day, "Bob").busy), 1)
+
+            store.update_booking(first, {"booking_time": self.base_date + timedelta(days=1)})
+            self.assertEqual(view.technician_day(self.day, "Alice").busy,
+                             ((self.base_date + timedelta(hours=2), self.base_date + timedelta(hours=3, minutes=30)),))
+
+            store.delete_booking(second)
+            self.assertEqual(view.technician_day(self.day, "Alice").busy, ())
+            self.assertEqual(loads, [self.day_start - timedelta(minutes=MAX_DURATION_MINUTES)])
+
+            next_day = view.technician_day(self.day + timedelta(days=1), "Alice")
+            self.assertEqual(next_day.busy, ((self.base_date + timedelta(days=1),
+                                              self.base_date + timedelta(days=1, hours=1)),))
+            self.assertEqual(len(loads), 2)
+
+    def test_events_for_unloaded_days_are_ignored_until_read(self):
+        for store in self.stores():
+            view, loads = self.attach(store)
+            self.book(store, self.base_date)
+            self.assertFalse(view.is_loaded(self.day))
+            self.assertEqual(loads, [])
+            self.assertEqual(len(view.technician_day(self.day, "Alice").busy), 1)
+            self.assertTrue(view.is_loaded(self.day))
+
+    def test_reset_clears_the_view(self):
+        for store in self.stores():
+            view, loads = self.attach(store)
+            self.book(store, self.base_date)
+            view.technician_day(self.day, "Alice")
+            store.reset_database()
+            self.assertFalse(view.is_loaded(self.day))
+            self.assertEqual(view.technician_day(self.day, "Alice").busy, ())
+
+    def test_writes_from_another_worker_invalidate_the_view(self):
+        database_path = os.path.join(self.temp_dir.name, "shared.db")
+        store = SQLiteBookingStore(database_path)
+        view, loads = self.attach(store)
+        self.assertEqual(view.technician_day(self.day, "Alice").busy, ())
+        self.book(SQLiteBookingStore(database_path), self.base_date)
+        store.generation()
+        self.assertFalse(view.is_loaded(self.day))
+        self.assertEqual(view.technician_day(self.day, "Alice").busy,
+                         ((self.base_date, self.base_date + timedelta(hours=1)),))
+        self.assertEqual(len(loads), 2)
+
+    def test_repeated_added_event_is_idempotent(self):
+        store = InMemoryBookingStore()
+        view, loads = self.attach(store)
+        view.technician_day(self.day, "Alice")
+        booking_id = self.book(store, self.base_date)
+        view.booking_added(store.get_booking_by_id(booking_id))
+        self.assertEqual(len(view.technician_day(self.day, "Alice").busy), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+from app.db.conflict_batch import NO_CONFLICT, ScheduleArrays
+from app.db.database import create_booking, get_all_bookings, reset_database
+from app.models.booking import BookingCreate, BookingRecord
+from app.nlp.handlers.conflict_checker import BookingConflictChecker
+import unittest
+import random
+import sys
+import os
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+TECHNICIANS = ["Alice", "Bob", "Carol"]
+
+
+class TestScheduleArrays(unittest.TestCase):
+    def setUp(self):
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+
+    def test_lowest_overlapping_id_is_returned(self):
+        schedule = ScheduleArrays([
+            BookingRecord(7, "Alice", "Plumber", self.base_date + timedelta(minutes=30)),
+            BookingRecord(3, "Alice", "Plumber", self.base_date),
+            BookingRecord(5, "Bob", "Plumber", self.base_date)
+        ])
+        result = schedule.evaluate([
+            ("Alice", self.base_date + timedelta(minutes=15), None),
+            ("Alice", self.base_date + timedelta(hours=1, minutes=30), None),
+            (None, self.base_date - timedelta(minutes=30), None),
+            ("Dave", self.base_date, None)
+        ])
+        self.assertEqual(result.mask.tolist(), [True, False, True, False])
+        self.assertEqual(result.booking_ids.tolist(), [3, NO_CONFLICT, 3, NO_CONFLICT])
+
+    def test_duration_and_midnight_crossing(self):
+        schedule = ScheduleArrays([
+            BookingRecord(1, "Alice", "Plumber", self.base_date + timedelta(hours=2)),
+            BookingRecord(2, "Alice", "Plumber", self.base_date.replace(hour=0, minute=15) + timedelta(days=1))
+        ])
+        result = schedule.evaluate([
+            ("Alice", self.base_date, timedelta(hours=2)),
+            ("Alice", self.base_date, timedelta(hours=2, minutes=1)),
+            ("Alice", self.base_date.replace(hour=23, minute=45), None)
+        ])
+        self.assertEqual(result.booking_ids.tolist(), [NO_CONFLICT, 1, 2])
+
+    def test_sub_minute_times_are_exact(self):
+        schedule = ScheduleArrays([BookingRecord(1, "Alice", "Plumber", self.base_date)])
+        result = schedule.evaluate([
+            ("Alice", self.base_date - timedelta(minutes=59, seconds=59, microseconds=999999), None),
+            ("Alice", self.base_date - timedelta(hours=1), None),
+            ("Alice", self.base_date + timedelta(minutes=59, seconds=59), None)
+        ])
+        self.assertEqual(result.mask.tolist(), [True, False, True])
+
+    def test_excluded_booking_is_ignored(self):
+        bookings = [BookingRecord(1, "Alice", "Plumber", self.base_date)]
+        result = ScheduleArrays(bookings, exclude_booking_id=1).evaluate([("Alice", self.base_date, None)])
+        self.assertFalse(result.mask[0])
+
+
+class TestBatchMatchesCheckConflict(unittest.TestCase):
+    def setUp(self):
+        reset_database()
+        self.rng = random.Random(11)
+        self.base_date = datetime(2025, 3, 10)
+        for _ in range(300):
+            try:
+                create_booking(BookingCreate(
+                    technician_name=self.rng.choice(TECHNICIANS),
+                    specialty="Plumber",
+                    booking_time=self.random_time()
+                ))
+            except ValueError:
+                pass
+
+    def tearDown(self):
+        reset_database()
+
+    def random_time(self):
+        return self.base_date + timedelta(days=self.rng.randrange(5), minutes=self.rng.randrange(24 * 60))
+
+    def test_matches_per_candidate_loop(self):
+        candidates = [(self.rng.choice(TECHNICIANS + [None, "Nobody"]), self.random_time(), None)
+                      for _ in range(2000)]
+        exclude_booking_id = get_all_bookings()[0].id
+        for exclude in (None, exclude_booking_id):
+            result = BookingConflictChecker.check_conflicts(candidates, exclude_booking_id=exclude)
+            for position, (technician_name, booking_time, _) in enumerate(candidates):
+                conflict = BookingConflictChecker.check_conflict(
+                    booking_time, exclude_booking_id=exclude, technician_name=technician_name)
+                expected = NO_CONFLICT if conflict is None else conflict["booking_id"]
+                self.assertEqual(result.booking_ids[position], expected)
+                self.assertEqual(result.mask[position], conflict is not None)
+
+    def test_matches_check_conflict_in_later_years(self):
+        booking_time = datetime(2026, 10, 19, 10, 0)
+        booking_id = create_booking(BookingCreate(
+            technician_name="Alice", specialty="Plumber", booking_time=booking_time))
+        candidates = [("Alice", booking_time + timedelta(minutes=30), None), ("Bob", booking_time, None),
+                      (None, booking_time, None), ("Alice", booking_time + timedelta(hours=1), None)]
+        result = BookingConflictChecker.check_conflicts(candidates)
+        self.assertEqual(result.booking_ids.tolist(), [booking_id, NO_CONFLICT, booking_id, NO_CONFLICT])
+        for position, (technician_name, candidate_time, _) in enumerate(candidates):
+            conflict = BookingConflictChecker.check_conflict(candidate_time, technician_name=technician_name)
+            self.assertEqual(result.mask[position], conflict is not None)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+from app.db.columnar_store import ColumnarBookingStore
+from app.db.conflict_batch import ScheduleArrays
+from app.db.database import get_all_bookings, initialize_db, reset_database
+from app.db.journal import BookingJournal
+from app.db.memory_store import InMemoryBookingStore
+from app.db.sqlite_store import SQLiteBookingStore
+from app.models.booking import BookingCreate, BookingRecord
+from app.nlp.managers.user_context_manager import UserContextManager
+from app.nlp.utils.booking_data_extractor import BookingDataExtractor
+from pydantic import ValidationError
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+
+class TestBookingDurations(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def stores(self):
+        return [
+            InMemoryBookingStore(),
+            ColumnarBookingStore(),
+            SQLiteBookingStore(os.path.join(self.temp_dir.name, "bookings.db"))
+        ]
+
+    def book(self, store, booking_time, duration_minutes=None, specialty="Plumber", technician_name="Alice"):
+        return store.create_booking(BookingCreate(
+            technician_name=technician_name,
+            specialty=specialty,
+            booking_time=booking_time,
+            duration_minutes=duration_minutes
+        ))
+
+    def test_specialty_defaults_and_bounds(self):
+        self.assertEqual(BookingCreate(technician_name="A", specialty="Plumber",
+                                       booking_time=self.base_date).duration_minutes, 60)
+        self.assertEqual(BookingCreate(technician_name="A", specialty="Painter",
+                                       booking_time=self.base_date).duration_minutes, 180)
+        with self.assertRaises(ValidationError):
+            BookingCreate(technician_name="A", specialty="Plumber", booking_time=self.base_date, duration_minutes=5)
+        record = BookingRecord(1, "A", "Plumber", self.base_date, 1, 90)
+        self.assertEqual(record.end_time, self.base_date + timedelta(minutes=90))
+
+    def test_long_booking_blocks_later_starts(self):
+        for store in self.stores():
+            booking_id = self.book(store, self.base_date, duration_minutes=180)
+            self.assertEqual(store.get_booking_by_id(booking_id).duration_minutes, 180)
+            self.assertEqual(store.find_conflicting_booking(
+                self.base_date + timedelta(hours=2, minutes=59), "Alice").id, booking_id)
+            self.assertIsNone(store.find_conflicting_booking(self.base_date + timedelta(hours=3), "Alice"))
+            with self.assertRaises(ValueError):
+                self.book(store, self.base_date + timedelta(hours=2))
+            self.book(store, self.base_date + timedelta(hours=3))
+            self.assertTrue(store.day_mask(self.base_date.date(), "Alice") >> 40 & 1)
+
+    def test_requested_duration_reaches_later_bookings(self):
+        for store in self.stores():
+            later_id = self.book(store, self.base_date + timedelta(hours=2), duration_minutes=30)
+            self.assertIsNone(store.find_conflicting_booking(self.base_date, "Alice"))
+            self.assertEqual(store.find_conflicting_booking(
+                self.base_date, "Alice", duration_minutes=121).id, later_id)
+            with self.assertRaises(ValueError):
+                self.book(store, self.base_date, duration_minutes=150)
+
+    def test_extending_a_booking_checks_the_new_end(self):
+        for store in self.stores():
+            first_id = self.book(store, self.base_date)
+            self.book(store, self.base_date + timedelta(hours=2))
+            store.update_booking(first_id, {"duration_minutes": 120})
+            with self.assertRaises(ValueError):
+                store.update_booking(first_id, {"duration_minutes": 121})
+            self.assertEqual(store.get_booking_by_id(first_id).duration_minutes, 120)
+
+    def test_bulk_import_uses_row_durations(self):
+        for store in self.stores():
+            results = store.create_bookings([
+                BookingCreate(technician_name="Alice", specialty="Plumber", booking_time=self.base_date,
+                              duration_minutes=120),
+                BookingCreate(technician_name="Alice", specialty="Plumber",
+                              booking_time=self.base_date + timedelta(hours=1))
+            ], atomic=False)
+            self.assertIsNotNone(results[0].booking_id)
+            self.assertIsNone(results[1].booking_id)
+
+    def test_journal_replay_keeps_durations(self):
+        store = InMemoryBookingStore(BookingJournal(self.temp_dir.name, fsync=False))
+        booking_id = self.book(store, self.base_date, specialty="Welder")
+        store.journal.close()
+        reopened = InMemoryBookingStore(BookingJournal(self.temp_dir.name, fsync=False))
+        self.assertEqual(reopened.get_booking_by_id(booking_id).duration_minutes, 120)
+        self.assertIsNotNone(reopened.find_conflicting_booking(self.base_date + timedelta(minutes=90), "Alice"))
+        reopened.journal.close()
+
+    def test_batch_conflicts_respect_existing_durations(self):
+        schedule = ScheduleArrays([
+            BookingRecord(3, "Alice", "Painter", self.base_date, 1, 180),
+            BookingRecord(2, "Alice", "Plumber", self.base_date + timedelta(hours=2), 1, 60)
+        ])
+        result = schedule.evaluate([
+            ("Alice", self.base_date + timedelta(hours=2, minutes=30), None),
+            ("Alice", self.base_date + timedelta(hours=3), None),
+            ("Alice", self.base_date - timedelta(hours=1), timedelta(minutes=61))
+        ])
+        self.assertEqual(result.booking_ids.tolist(), [2, -1, 3])
+
+    def test_extract_duration_from_text(self):
+        self.assertEqual(BookingDataExtractor.extract_duration("Book a plumber tomorrow at 3pm for 2 hours"),
+                         (120, "Book a plumber tomorrow at 3pm"))
+        self.assertEqual(BookingDataExtractor.extract_duration("90 minutes")[0], 90)
+        self.assertEqual(BookingDataExtractor.extract_duration("for an hour and a half")[0], 90)
+        self.assertEqual(BookingDataExtractor.extract_duration("in 2 hours"), (None, "in 2 hours"))
+        self.assertEqual(BookingDataExtractor.extract_duration("for 12 hours")[0], None)
+
+    def test_abandoned_flows_forget_the_duration(self):
+        for clear in (UserContextManager.cancel_booking_process, UserContextManager.reset_booking_context):
+            user_context = UserContextManager.create_default_context()
+            UserContextManager.set_temp_duration(user_context, 120)
+            clear(user_context)
+            self.assertIsNone(user_context["temp_booking_duration"])
+
+    def test_seed_rows_keep_one_hour_slots(self):
+        reset_database()
+        initialize_db()
+        try:
+            durations = [booking.duration_minutes for booking in get_all_bookings()]
+        finally:
+            reset_database()
+        self.assertEqual(durations, [60, 60, 60])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,256 @@
+from app.db import database
+from app.db.booking_index import BookingIntervalIndex, DayPartitionedBookingIndex
+from app.db.database import (
+    create_booking,
+    get_bookings_in_range,
+    delete_booking,
+    update_booking,
+    find_conflicting_booking,
+    get_booking_by_id,
+    get_upcoming_bookings,
+    reset_database
+)
+from app.db.booking_store import VersionConflictError
+from app.core.config import settings
+from app.db.memory_store import InMemoryBookingStore
+from app.models.booking import Booking, BookingCreate, BookingRecord
+from app.api.routes.bookings import encode_cursor, decode_cursor
+from fastapi import HTTPException
+import unittest
+import sys
+import os
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+
+class TestBookingIntervalIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = BookingIntervalIndex()
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+
+    def test_find_overlaps_per_technician(self):
+        self.index.add(1, "Tech A", self.base_date)
+        self.index.add(2, "Tech B", self.base_date)
+        overlaps = list(self.index.find_overlaps(
+            self.base_date + timedelta(minutes=30), self.base_date + timedelta(minutes=90), "Tech A"))
+        self.assertEqual(overlaps, [(self.base_date, 1)])
+
+    def test_find_overlaps_any_technician(self):
+        self.index.add(1, "Tech A", self.base_date)
+        self.index.add(2, "Tech B", self.base_date + timedelta(minutes=15))
+        overlaps = list(self.index.find_overlaps(self.base_date, self.base_date + timedelta(hours=1)))
+        self.assertEqual([booking_id for _, booking_id in overlaps], [1, 2])
+
+    def test_adjacent_intervals_do_not_overlap(self):
+        self.index.add(1, "Tech A", self.base_date)
+        overlaps = list(self.index.find_overlaps(
+            self.base_date + timedelta(hours=1), self.base_date + timedelta(hours=2), "Tech A"))
+        self.assertEqual(overlaps, [])
+        overlaps = list(self.index.find_overlaps(
+            self.base_date - timedelta(hours=1), self.base_date, "Tech A"))
+        self.assertEqual(overlaps, [])
+
+    def test_remove(self):
+        self.index.add(1, "Tech A", self.base_date)
+        self.index.remove(1, "Tech A", self.base_date)
+        overlaps = list(self.index.find_overlaps(self.base_date, self.base_date + timedelta(hours=1)))
+        self.assertEqual(overlaps, [])
+
+
+class TestDatabaseIndexMaintenance(unittest.TestCase):
+    def setUp(self):
+        reset_database()
+        self.base_date = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        self.booking_id = create_booking(BookingCreate(
+            technician_name="Tech A",
+            specialty="Plumber",
+            booking_time=self.base_date
+        ))
+
+    def tearDown(self):
+        reset_database()
+
+    def test_create_rejects_overlap_for_same_technician(self):
+        with self.assertRaises(ValueError):
+            create_booking(BookingCreate(
+                technician_name="Tech A",
+                specialty="Plumber",
+                booking_time=self.base_date + timedelta(minutes=30)
+            ))
+
+    def test_update_moves_index_entry(self):
+        new_time = self.base_date + timedelta(hours=3)
+        update_booking(self.booking_id, {"booking_time": new_time})
+        self.assertIsNone(find_conflicting_booking(self.base_date, "Tech A"))
+        conflict = find_conflicting_booking(new_time, "Tech A")
+        self.assertEqual(conflict.id, self.booking_id)
+
+    def test_update_rejects_overlap_and_keeps_booking(self):
+        other_id = create_booking(BookingCreate(
+            technician_name="Tech A",
+            specialty="Plumber",
+            booking_time=self.base_date + timedelta(hours=2)
+        ))
+        with self.assertRaises(ValueError):
+            update_booking(other_id, {"booking_time": self.base_date + timedelta(minutes=30)})
+        self.assertEqual(get_booking_by_id(other_id).booking_time, self.base_date + timedelta(hours=2))
+        self.assertEqual(get_booking_by_id(other_id).version, 1)
+
+    def test_update_checks_expected_version(self):
+        updated = update_booking(self.booking_id, {"specialty": "Welder"}, expected_version=1)
+        self.assertEqual(updated.version, 2)
+        with self.assertRaises(VersionConflictError):
+            update_booking(self.booking_id, {"specialty": "Plumber"}, expected_version=1)
+        self.assertEqual(get_booking_by_id(self.booking_id).specialty, "Welder")
+
+    def test_delete_removes_index_entry(self):
+        delete_booking(self.booking_id)
+        self.assertIsNone(find_conflicting_booking(self.base_date))
+
+    def test_exclude_booking_id(self):
+        self.assertIsNone(find_conflicting_booking(self.base_date, exclude_booking_id=self.booking_id))
+
+    def test_bookings_crossing_midnight_conflict_with_the_next_morning(self):
+        late_booking = self.base_date.replace(hour=23, minute=30)
+        late_id = create_booking(BookingCreate(
+            technician_name="Tech A",
+            specialty="Plumber",
+            booking_time=late_booking
+        ))
+        self.assertEqual(find_conflicting_booking(late_booking + timedelta(minutes=45), "Tech A").id, late_id)
+        self.assertIsNone(find_conflicting_booking(late_booking + timedelta(hours=1), "Tech A"))
+
+    def test_long_overnight_booking_blocks_the_next_morning(self):
+        overnight = self.base_date.replace(hour=22)
+        overnight_id = create_booking(BookingCreate(
+            technician_name="Tech A",
+            specialty="Plumber",
+            booking_time=overnight,
+            duration_minutes=480
+        ))
+        next_morning = overnight + timedelta(hours=3)
+        self.assertEqual(find_conflicting_booking(next_morning, "Tech A").id, overnight_id)
+        with self.assertRaises(ValueError):
+            create_booking(BookingCreate(technician_name="Tech A", specialty="Plumber", booking_time=next_morning))
+        create_booking(BookingCreate(technician_name="Tech A", specialty="Plumber",
+                                     booking_time=overnight + timedelta(hours=8)))
+
+    def test_upcoming_bookings_skip_the_past_and_are_capped(self):
+        create_booking(BookingCreate(technician_name="Tech A", specialty="Plumber",
+                                     booking_time=self.base_date - timedelta(days=30)))
+        ids = [self.booking_id] + [create_booking(BookingCreate(
+            technician_name="Tech B", specialty="Plumber", booking_time=self.base_date + timedelta(days=day)))
+            for day in range(settings.BOOKING_LIST_LIMIT + 5)]
+        upcoming = get_upcoming_bookings()
+        self.assertEqual(len(upcoming), settings.BOOKING_LIST_LIMIT)
+        self.assertEqual(sorted(booking.id for booking in upcoming)[:2], sorted(ids)[:2])
+        self.assertTrue(all(booking.booking_time >= self.base_date for booking in upcoming))
+        self.assertEqual(len(get_upcoming_bookings(limit=3)), 3)
+
+    def test_bookings_db_is_only_exported_by_the_memory_store(self):
+        if isinstance(database.store, InMemoryBookingStore):
+            self.assertIs(database.bookings_db, database.store.bookings_db)
+            self.assertIn(self.booking_id, database.bookings_db)
+        else:
+            with self.assertRaises(AttributeError):
+                database.bookings_db
+
+
+class TestDayPartitionedBookingIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = DayPartitionedBookingIndex()
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+        for offset in range(5):
+            self.index.add(offset + 1, "Tech A", self.base_date + timedelta(days=offset))
+
+    def test_days_between_only_returns_matching_partitions(self):
+        days = self.index.days_between(self.base_date + timedelta(days=1), self.base_date + timedelta(days=3))
+        self.assertEqual(days, [(self.base_date + timedelta(days=offset)).date() for offset in range(1, 4)])
+
+    def test_empty_partition_is_dropped(self):
+        self.index.remove(1, "Tech A", self.base_date)
+        self.assertIsNone(self.index.partition(self.base_date.date()))
+        self.assertEqual(len(self.index.days_between(None, None)), 4)
+
+
+class TestBookingsInRange(unittest.TestCase):
+    def setUp(self):
+        reset_database()
+        self.base_date = datetime(2025, 3, 10, 9, 0)
+        self.ids = []
+        for day in range(7):
+            for technician, specialty in [("Tech A", "Plumber"), ("Tech B", "Electrician")]:
+                self.ids.append(create_booking(BookingCreate(
+                    technician_name=technician,
+                    specialty=specialty,
+                    booking_time=self.base_date + timedelta(days=day, hours=day)
+                )))
+
+    def tearDown(self):
+        reset_database()
+
+    def test_single_day(self):
+        start = datetime(2025, 3, 12)
+        bookings = get_bookings_in_range(start, start + timedelta(days=1))
+        self.assertEqual(len(bookings), 2)
+        self.assertTrue(all(booking.booking_time.date() == start.date() for booking in bookings))
+
+    def test_end_is_exclusive(self):
+        bookings = get_bookings_in_range(self.base_date, self.base_date + timedelta(days=1, hours=1))
+        self.assertEqual(len(bookings), 2)
+
+    def test_filters(self):
+        week_start = datetime(2025, 3, 10)
+        week_end = week_start + timedelta(days=7)
+        by_technician = get_bookings_in_range(week_start, week_end, technician="Tech A")
+        self.assertEqual(len(by_technician), 7)
+        self.assertTrue(all(booking.technician_name == "Tech A" for booking in by_technician))
+        by_specialty = get_bookings_in_range(week_start, week_end, specialty="electrician")
+        self.assertEqual(len(by_specialty), 7)
+        self.assertTrue(all(booking.specialty == "Electrician" for booking in by_specialty))
+
+    def test_results_are_time_ordered(self):
+        bookings = get_bookings_in_range()
+        times = [booking.booking_time for booking in bookings]
+        self.assertEqual(times, sorted(times))
+        self.assertEqual(sorted(booking.id for booking in bookings), sorted(self.ids))
+
+
+    def test_keyset_pagination_is_stable_under_inserts(self):
+        pages = []
+        after = None
+        while True:
+            page = get_bookings_in_range(after=after, limit=3)
+            if not page:
+                break
+            pages.extend(booking.id for booking in page)
+            after = (page[-1].booking_time, page[-1].id)
+            create_booking(BookingCreate(
+                technician_name="Tech C",
+                specialty="Welder",
+                booking_time=self.base_date - timedelta(days=len(pages))
+            ))
+        self.assertEqual(pages, self.ids)
+
+    def test_specialty_pagination(self):
+        first = get_bookings_in_range(specialty="plumber", limit=4)
+        rest = get_bookings_in_range(specialty="plumber", after=(first[-1].booking_time, first[-1].id))
+        self.assertEqual([booking.id for booking in first + rest], self.ids[::2])
+
+    def test_cursor_round_trip(self):
+        cursor = encode_cursor(self.base_date, 42)
+        self.assertEqual(decode_cursor(cursor), (self.base_date, 42))
+        with self.assertRaises(HTTPException):
+            decode_cursor("not-a-cursor")
+
+    def test_reads_return_frozen_records(self):
+        booking = get_booking_by_id(self.ids[0])
+        self.assertIsInstance(booking, BookingRecord)
+        with self.assertRaises(AttributeError):
+            booking.technician_name = "Someone Else"
+        validated = Booking.model_validate(booking, from_attributes=True)
+        self.assertEqual(validated.model_dump(), booking._asdict())
+
+
+if __name__ == "__main__":
+    unittest.main()
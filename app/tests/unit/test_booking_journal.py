@@ -0,0 +1,128 @@
+from app.db.journal import BookingJournal
+from app.db.memory_store import InMemoryBookingStore
+from app.models.booking import BookingCreate
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+
+class TestBookingJournal(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def open_store(self, snapshot_interval=10000):
+        journal = BookingJournal(self.temp_dir.name, snapshot_interval=snapshot_interval, fsync=False)
+        return InMemoryBookingStore(journal)
+
+    def create(self, store, technician, hours=0, days=0):
+        return store.create_booking(BookingCreate(
+            technician_name=technician,
+            specialty="Plumber",
+            booking_time=self.base_date + timedelta(days=days, hours=hours)
+        ))
+
+    def test_replay_restores_bookings_and_next_id(self):
+        store = self.open_store()
+        first_id = self.create(store, "Alice")
+        second_id = self.create(store, "Bob", hours=2)
+        store.update_booking(second_id, {"technician_name": "Carol"})
+        self.create(store, "Dave", days=1)
+        store.delete_booking(first_id)
+        store.journal.close()
+
+        recovered = self.open_store()
+        self.assertEqual(recovered.bookings_db, store.bookings_db)
+        self.assertEqual(recovered.next_id, store.next_id)
+        self.assertEqual(self.create(recovered, "Erin", days=2), 4)
+
+    def test_recovered_index_detects_conflicts(self):
+        store = self.open_store()
+        self.create(store, "Alice")
+        store.journal.close()
+
+        recovered = self.open_store()
+        conflict = recovered.find_conflicting_booking(self.base_date + timedelta(minutes=30), "Alice")
+        self.assertIsNotNone(conflict)
+        self.assertEqual(conflict.id, 1)
+        with self.assertRaises(ValueError):
+            self.create(recovered, "Alice")
+
+    def test_snapshot_truncates_journal(self):
+        store = self.open_store(snapshot_interval=3)
+        for day in range(5):
+            self.create(store, "Alice", days=day)
+        store.journal.close()
+
+        self.assertTrue(os.path.exists(store.journal.snapshot_path))
+        with open(store.journal.journal_path, encoding="utf-8") as journal_file:
+            self.assertEqual(len(journal_file.readlines()), 2)
+
+        recovered = self.open_store(snapshot_interval=3)
+        self.assertEqual(recovered.bookings_db, store.bookings_db)
+        self.assertEqual(recovered.next_id, 6)
+
+    def test_reset_is_replayed(self):
+        store = self.open_store()
+        self.create(store, "Alice")
+        store.reset_database()
+        self.create(store, "Bob")
+        store.journal.close()
+
+        recovered = self.open_store()
+        self.assertEqual(list(recovered.bookings_db), [1])
+        self.assertEqual(recovered.bookings_db[1]["technician_name"], "Bob")
+
+    def test_seed_skipped_after_recovery(self):
+        seed = [{"technician_name": "Alice", "specialty": "Plumber", "booking_time": self.base_date}]
+        store = self.open_store()
+        store.seed(seed)
+        store.journal.close()
+
+        recovered = self.open_store()
+        recovered.seed(seed)
+        self.assertEqual(len(recovered.bookings_db), 1)
+
+    def test_torn_tail_is_discarded(self):
+        store = self.open_store()
+        self.create(store, "Alice")
+        store.journal.close()
+        with open(store.journal.journal_path, "a", encoding="utf-8") as journal_file:
+            journal_file.write('{"op":"create","id":2,')
+
+        recovered = self.open_store()
+        self.assertEqual(list(recovered.bookings_db), [1])
+        self.create(recovered, "Bob")
+        recovered.journal.close()
+
+        reopened = self.open_store()
+        self.assertEqual(sorted(reopened.bookings_db), [1, 2])
+
+    def test_concurrent_appends_are_all_durable(self):
+        journal = BookingJournal(self.temp_dir.name, fsync=False)
+        journal.load()
+
+        def append_records(worker):
+            for index in range(50):
+                journal.append({"op": "delete", "id": worker * 100 + index})
+
+        threads = [threading.Thread(target=append_records, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        journal.close()
+
+        _, records = BookingJournal(self.temp_dir.name, fsync=False).load()
+        self.assertEqual([record["lsn"] for record in records], list(range(1, 401)))
+
+
+if __name__ == "__main__":
+    unittest.main()
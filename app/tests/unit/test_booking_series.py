@@ -0,0 +1,181 @@
+from app.db.availability import interval_mask
+from app.db.availability_view import DailyAvailabilityView
+from app.db.columnar_store import ColumnarBookingStore
+from app.db.journal import BookingJournal
+from app.db.memory_store import InMemoryBookingStore
+from app.db.sqlite_store import SQLiteBookingStore
+from app.models.booking import BookingCreate
+from app.models.series import BookingRequest, BookingSeriesCreate, SeriesRecord
+from pydantic import ValidationError
+import unittest
+import sys
+import os
+import tempfile
+from datetime import date, datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+
+def weekly(booking_time, **recurrence):
+    return BookingSeriesCreate(
+        technician_name="Alice",
+        specialty="Plumber",
+        booking_time=booking_time,
+        recurrence=dict({"frequency": "weekly"}, **recurrence)
+    )
+
+
+class TestSeriesExpansion(unittest.TestCase):
+    def setUp(self):
+        self.monday = datetime(2025, 1, 6, 9, 0)
+
+    def test_weekly_occurrences_are_expanded_inside_the_window_only(self):
+        series = SeriesRecord.from_create(7, weekly(self.monday, until=datetime(2025, 7, 6)))
+        self.assertEqual(series.occurrence_count, 26)
+        occurrences = list(series.occurrences(datetime(2025, 3, 1), datetime(2025, 4, 1)))
+        self.assertEqual([occurrence.booking_time.day for occurrence in occurrences], [3, 10, 17, 24, 31])
+        self.assertTrue(all(occurrence.id == 7 for occurrence in occurrences))
+        self.assertEqual(series.last_time, datetime(2025, 6, 30, 9, 0))
+
+    def test_monthly_occurrences_clamp_to_the_end_of_the_month(self):
+        series = SeriesRecord(1, "Alice", "Plumber", datetime(2025, 1, 31, 9, 0), 60, "monthly", count=4)
+        self.assertEqual([occurrence.booking_time.date() for occurrence in series.occurrences()],
+                         [date(2025, 1, 31), date(2025, 2, 28), date(2025, 3, 31), date(2025, 4, 30)])
+        self.assertEqual(series.occurrence_on(date(2025, 2, 28)).booking_time, datetime(2025, 2, 28, 9, 0))
+        self.assertIsNone(series.occurrence_on(date(2025, 2, 27)))
+        self.assertIsNone(series.occurrence_on(date(2025, 5, 31)))
+
+    def test_occurrence_on_respects_interval_and_bounds(self):
+        series = SeriesRecord.from_create(1, weekly(self.monday, interval=2, count=3))
+        self.assertIsNotNone(series.occurrence_on(date(2025, 1, 20)))
+        self.assertIsNone(series.occurrence_on(date(2025, 1, 13)))
+        self.assertIsNone(series.occurrence_on(date(2025, 2, 17)))
+        self.assertIsNone(series.occurrence_on(date(2024, 12, 23)))
+
+    def test_invalid_recurrences_are_rejected(self):
+        with self.assertRaises(ValidationError):
+            weekly(self.monday)
+        with self.assertRaises(ValidationError):
+            weekly(self.monday, until=self.monday - timedelta(days=1))
+        with self.assertRaises(ValidationError):
+            weekly(self.monday, until=self.monday + timedelta(weeks=600))
+        self.assertIsNone(BookingRequest(technician_name="Alice", specialty="Plumber",
+                                         booking_time=self.monday).recurrence)
+
+
+class TestSeriesStorage(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.monday = datetime(2025, 1, 6, 9, 0)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def stores(self):
+        return [
+            InMemoryBookingStore(),
+            ColumnarBookingStore(),
+            SQLiteBookingStore(os.path.join(self.temp_dir.name, "bookings.db"))
+        ]
+
+    def book(self, store, booking_time, technician_name="Alice"):
+        return store.create_booking(BookingCreate(
+            technician_name=technician_name,
+            specialty="Plumber",
+            booking_time=booking_time
+        ))
+
+    def test_series_is_stored_as_one_rule(self):
+        for store in self.stores():
+            series_id = store.create_series(weekly(self.monday, count=52))
+            self.assertEqual(len(store.get_all_bookings()), 0)
+            self.assertEqual(store.get_series(series_id).count, 52)
+            self.assertEqual(len(store.get_series_occurrences(series_id=series_id)), 52)
+            window = store.get_series_occurrences(datetime(2025, 2, 1), datetime(2025, 3, 1))
+            self.assertEqual([occurrence.booking_time.day for occurrence in window], [3, 10, 17, 24])
+            self.assertEqual(store.get_series_occurrences(technician="Bob"), [])
+
+    def test_ids_are_shared_with_bookings(self):
+        for store in self.stores():
+            booking_id = self.book(store, self.monday + timedelta(days=1))
+            series_id = store.create_series(weekly(self.monday, count=4))
+            next_id = self.book(store, self.monday + timedelta(days=2))
+            self.assertEqual(len({booking_id, series_id, next_id}), 3)
+            self.assertIsNone(store.get_booking_by_id(series_id))
+
+    def test_series_conflicting_with_an_existing_booking_is_rejected(self):
+        for store in self.stores():
+            self.book(store, datetime(2025, 3, 10, 9, 30))
+            with self.assertRaisesRegex(ValueError, "2025-03-10 09:00"):
+                store.create_series(weekly(self.monday, count=20))
+            self.assertEqual(store.get_series_occurrences(), [])
+            self.assertIsNotNone(store.create_series(weekly(self.monday, count=20, interval=4)))
+
+    def test_series_conflicting_with_another_series_is_rejected(self):
+        for store in self.stores():
+            store.create_series(weekly(self.monday, count=10))
+            with self.assertRaises(ValueError):
+                store.create_series(BookingSeriesCreate(
+                    technician_name="Alice",
+                    specialty="Plumber",
+                    booking_time=datetime(2025, 1, 6, 9, 30),
+                    recurrence={"frequency": "monthly", "count": 3}
+                ))
+            self.assertIsNotNone(store.create_series(weekly(self.monday + timedelta(hours=1), count=10)))
+
+    def test_bookings_cannot_overlap_occurrences(self):
+        for store in self.stores():
+            series_id = store.create_series(weekly(self.monday, count=8))
+            occurrence = self.monday + timedelta(weeks=5)
+            with self.assertRaises(ValueError):
+                self.book(store, occurrence + timedelta(minutes=30))
+            self.assertEqual(store.find_conflicting_booking(occurrence, "Alice").id, series_id)
+            self.assertIsNone(store.find_conflicting_booking(occurrence + timedelta(days=1), "Alice"))
+            self.assertIsNone(store.find_conflicting_booking(occurrence, "Bob"))
+            moved = self.book(store, occurrence + timedelta(days=1))
+            with self.assertRaises(ValueError):
+                store.update_booking(moved, {"booking_time": occurrence})
+            self.assertEqual(store.day_mask(occurrence.date(), "Alice"),
+                             interval_mask(occurrence, timedelta(hours=1)))
+
+    def test_delete_and_reset_remove_series(self):
+        for store in self.stores():
+            series_id = store.create_series(weekly(self.monday, count=8))
+            self.assertTrue(store.delete_series(series_id))
+            self.assertFalse(store.delete_series(series_id))
+            self.assertIsNone(store.get_series(series_id))
+            self.book(store, self.monday)
+            store.create_series(weekly(self.monday + timedelta(days=1), count=8))
+            store.reset_database()
+            self.assertEqual(store.get_series_occurrences(), [])
+
+    def test_availability_view_follows_series(self):
+        for store in self.stores():
+            view = DailyAvailabilityView(lambda start, end: list(store.get_bookings_in_range(start, end))
+                                         + store.get_series_occurrences(start, end))
+            store.add_observer(view)
+            day = date(2025, 1, 13)
+            self.assertEqual(view.technician_day(day, "Alice").busy, ())
+            series_id = store.create_series(weekly(self.monday, count=8))
+            self.assertEqual(view.technician_day(day, "Alice").busy,
+                             ((datetime(2025, 1, 13, 9, 0), datetime(2025, 1, 13, 10, 0)),))
+            self.assertEqual(len(view.technician_day(date(2025, 1, 20), "Alice").busy), 1)
+            store.delete_series(series_id)
+            self.assertEqual(view.technician_day(day, "Alice").busy, ())
+
+    def test_journal_recovers_series(self):
+        journal_dir = os.path.join(self.temp_dir.name, "journal")
+        store = InMemoryBookingStore(BookingJournal(journal_dir, fsync=False))
+        kept = store.create_series(weekly(self.monday, until=datetime(2025, 3, 1)))
+        dropped = store.create_series(weekly(self.monday + timedelta(days=1), count=4))
+        store.delete_series(dropped)
+        recovered = InMemoryBookingStore(BookingJournal(journal_dir, fsync=False))
+        self.assertEqual(recovered.get_series(kept), store.get_series(kept))
+        self.assertIsNone(recovered.get_series(dropped))
+        self.assertGreater(self.book(recovered, self.monday + timedelta(days=2)), dropped)
+        recovered.journal.write_snapshot(recovered.snapshot_state())
+        restored = InMemoryBookingStore(BookingJournal(journal_dir, fsync=False))
+        self.assertEqual(restored.get_series(kept), store.get_series(kept))
+
+
+if __name__ == "__main__":
+    unittest.main()
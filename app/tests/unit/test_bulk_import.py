@@ -0,0 +1,139 @@
+from app.api.routes import bookings_router
+from app.db.bulk import plan_bulk_insert
+from app.db.database import reset_database
+from app.db.columnar_store import ColumnarBookingStore
+from app.db.memory_store import InMemoryBookingStore
+from app.db.sqlite_store import SQLiteBookingStore
+from app.models.booking import BookingCreate
+import unittest
+import json
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+
+def booking(technician, booking_time, specialty="Plumber"):
+    return BookingCreate(technician_name=technician, specialty=specialty, booking_time=booking_time)
+
+
+class TestPlanBulkInsert(unittest.TestCase):
+    def setUp(self):
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+
+    def test_conflicts_within_batch_are_found_regardless_of_order(self):
+        bookings = [
+            booking("Alice", self.base_date + timedelta(minutes=30)),
+            booking("Bob", self.base_date),
+            booking("Alice", self.base_date)
+        ]
+        accepted, errors = plan_bulk_insert(bookings, lambda booking_time, technician, duration: False)
+        self.assertEqual(accepted, [1, 2])
+        self.assertIn("row 3", errors[0])
+
+    def test_adjacent_slots_and_other_days_are_accepted(self):
+        bookings = [
+            booking("Alice", self.base_date),
+            booking("Alice", self.base_date + timedelta(hours=1)),
+            booking("Alice", self.base_date.replace(hour=23, minute=30)),
+            booking("Alice", self.base_date.replace(hour=23, minute=30) + timedelta(hours=1))
+        ]
+        accepted, errors = plan_bulk_insert(bookings, lambda booking_time, technician, duration: False)
+        self.assertEqual(accepted, [0, 1, 2, 3])
+        self.assertEqual(errors, {})
+
+    def test_overlaps_across_midnight_are_rejected(self):
+        bookings = [
+            booking("Alice", self.base_date.replace(hour=23, minute=30)),
+            booking("Alice", self.base_date.replace(hour=23, minute=30) + timedelta(minutes=45))
+        ]
+        accepted, errors = plan_bulk_insert(bookings, lambda booking_time, technician, duration: False)
+        self.assertEqual(accepted, [0])
+        self.assertIn("row 1", errors[1])
+
+    def test_store_conflicts_are_reported(self):
+        bookings = [booking("Alice", self.base_date), booking("Bob", self.base_date)]
+        accepted, errors = plan_bulk_insert(bookings, lambda booking_time, technician, duration: technician == "Bob")
+        self.assertEqual(accepted, [0])
+        self.assertEqual(list(errors), [1])
+
+    def test_conflicts_name_the_given_row_numbers(self):
+        bookings = [booking("Alice", self.base_date), booking("Alice", self.base_date + timedelta(minutes=30))]
+        accepted, errors = plan_bulk_insert(bookings, lambda booking_time, technician, duration: False, [4, 7])
+        self.assertEqual(accepted, [0])
+        self.assertIn("row 4", errors[1])
+
+
+class TestStoreBulkInsert(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+        self.stores = [
+            InMemoryBookingStore(),
+            ColumnarBookingStore(),
+            SQLiteBookingStore(os.path.join(self.temp_dir.name, "bookings.db"))
+        ]
+        for store in self.stores:
+            store.create_booking(booking("Alice", self.base_date))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def batch(self):
+        return [
+            booking("Bob", self.base_date),
+            booking("Alice", self.base_date + timedelta(minutes=30)),
+            booking("Bob", self.base_date + timedelta(hours=2)),
+            booking("Bob", self.base_date + timedelta(hours=2, minutes=15))
+        ]
+
+    def test_atomic_batch_with_conflicts_commits_nothing(self):
+        for store in self.stores:
+            results = store.create_bookings(self.batch())
+            self.assertEqual([result.row for result in results if result.error], [2, 4])
+            self.assertTrue(all(result.booking_id is None for result in results))
+            self.assertEqual(len(store.get_all_bookings()), 1)
+
+    def test_partial_batch_commits_valid_rows(self):
+        for store in self.stores:
+            results = store.create_bookings(self.batch(), atomic=False)
+            self.assertEqual([result.booking_id for result in results], [2, None, 3, None])
+            self.assertEqual(len(store.get_all_bookings()), 3)
+            self.assertIsNotNone(store.find_conflicting_booking(self.base_date + timedelta(hours=2), "Bob"))
+
+
+class TestBulkImportRoute(unittest.TestCase):
+    def setUp(self):
+        reset_database()
+        app = FastAPI()
+        app.include_router(bookings_router, prefix="/bookings")
+        self.client = TestClient(app)
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+
+    def tearDown(self):
+        reset_database()
+
+    def line(self, technician, booking_time):
+        return json.dumps({"technician_name": technician, "specialty": "Plumber",
+                           "booking_time": booking_time.isoformat()})
+
+    def test_rows_are_ndjson_line_numbers(self):
+        body = "\n".join([
+            "not json",
+            "{}",
+            "",
+            self.line("Alice", self.base_date),
+            self.line("Alice", self.base_date + timedelta(minutes=30))
+        ])
+        response = self.client.post("/bookings/bulk?atomic=false", content=body)
+        result = response.json()
+        self.assertEqual([error["row"] for error in result["errors"]], [1, 2, 5])
+        self.assertIn("conflicts with row 4", result["errors"][2]["error"])
+        self.assertEqual([created["row"] for created in result["bookings"]], [4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+from app.db.columnar_store import ColumnarBookingStore, to_epoch_minutes, from_epoch_minutes
+from app.db.memory_store import InMemoryBookingStore
+from app.models.booking import BookingCreate
+import unittest
+import sys
+import os
+import random
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+
+class TestColumnarBookingStore(unittest.TestCase):
+    def setUp(self):
+        self.store = ColumnarBookingStore()
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+
+    def create(self, technician, specialty="Plumber", minutes=0, days=0):
+        return self.store.create_booking(BookingCreate(
+            technician_name=technician,
+            specialty=specialty,
+            booking_time=self.base_date + timedelta(days=days, minutes=minutes)
+        ))
+
+    def test_epoch_minutes_round_trip(self):
+        self.assertEqual(from_epoch_minutes(to_epoch_minutes(self.base_date)), self.base_date)
+        self.assertEqual(to_epoch_minutes(datetime(1970, 1, 1, 0, 1)), 1)
+
+    def test_names_are_interned(self):
+        self.create("Alice")
+        self.create("Alice", days=1)
+        self.create("Bob", specialty="Welder")
+        self.assertEqual(self.store.technician_names, ["Alice", "Bob"])
+        self.assertEqual(list(self.store.technician_column), [0, 0, 1])
+        self.assertEqual(list(self.store.specialty_column), [0, 0, 1])
+
+    def test_crud(self):
+        booking_id = self.create("Alice")
+        booking = self.store.get_booking_by_id(booking_id)
+        self.assertEqual(booking.technician_name, "Alice")
+        self.assertEqual(booking.booking_time, self.base_date)
+
+        updated = self.store.update_booking(booking_id, {"technician_name": "Bob"})
+        self.assertEqual(updated.technician_name, "Bob")
+        self.assertIsNone(self.store.find_conflicting_booking(self.base_date, "Alice"))
+        self.assertEqual(self.store.find_conflicting_booking(self.base_date, "Bob").id, booking_id)
+
+        self.assertTrue(self.store.delete_booking(booking_id))
+        self.assertFalse(self.store.delete_booking(booking_id))
+        self.assertIsNone(self.store.get_booking_by_id(booking_id))
+        self.assertEqual(len(self.store), 0)
+
+    def test_update_ignores_none_fields(self):
+        booking_id = self.create("Alice")
+        updated = self.store.update_booking(booking_id, {
+            "technician_name": None, "specialty": None, "booking_time": None, "duration_minutes": None})
+        self.assertEqual(updated.technician_name, "Alice")
+        self.assertEqual(updated.specialty, "Plumber")
+        self.assertEqual(updated.booking_time, self.base_date)
+        self.assertEqual(updated.version, 2)
+        self.assertEqual(self.store.technician_names, ["Alice"])
+
+    def test_tombstoned_ids_are_not_reused(self):
+        first_id = self.create("Alice")
+        self.store.delete_booking(first_id)
+        self.assertEqual(self.create("Bob"), first_id + 1)
+        self.assertEqual([booking.id for booking in self.store.get_all_bookings()], [first_id + 1])
+
+    def test_conflict_rejected(self):
+        self.create("Alice")
+        with self.assertRaises(ValueError):
+            self.create("Alice", minutes=59)
+        self.create("Alice", minutes=60)
+        self.create("Bob", minutes=30)
+
+    def test_range_filters(self):
+        self.create("Alice", days=0)
+        self.create("Bob", specialty="Welder", days=1)
+        self.create("Alice", days=2)
+        start = self.base_date + timedelta(days=1)
+        self.assertEqual([b.id for b in self.store.get_bookings_in_range(start=start)], [2, 3])
+        self.assertEqual([b.id for b in self.store.get_bookings_in_range(end=start)], [1])
+        self.assertEqual([b.id for b in self.store.get_bookings_in_range(technician="Alice")], [1, 3])
+        self.assertEqual([b.id for b in self.store.get_bookings_in_range(specialty="welder")], [2])
+        self.assertEqual(len(self.store.get_bookings_in_range(technician="Nobody")), 0)
+
+    def test_keyset_pagination(self):
+        for day in range(3):
+            self.create("Alice", days=day)
+            self.create("Bob", specialty="Welder", days=day)
+        first = self.store.get_bookings_in_range(limit=4)
+        rest = self.store.get_bookings_in_range(after=(first[-1].booking_time, first[-1].id))
+        self.assertEqual([b.id for b in list(first) + list(rest)], [1, 2, 3, 4, 5, 6])
+        welders = self.store.get_bookings_in_range(specialty="WELDER", after=(self.base_date, 2))
+        self.assertEqual([b.id for b in welders], [4, 6])
+
+    def test_seed_builds_sorted_index(self):
+        self.store.seed([
+            {"technician_name": "Alice", "specialty": "Plumber", "booking_time": self.base_date + timedelta(days=2)},
+            {"technician_name": "Bob", "specialty": "Welder", "booking_time": self.base_date},
+            {"technician_name": "Alice", "specialty": "Plumber", "booking_time": self.base_date + timedelta(days=1)}
+        ])
+        self.assertEqual([b.id for b in self.store.get_bookings_in_range()], [2, 3, 1])
+        self.assertEqual(self.store.find_conflicting_booking(self.base_date + timedelta(days=1), "Alice").id, 3)
+        self.assertEqual(self.create("Carol"), 4)
+
+    def test_matches_dict_store_conflicts(self):
+        reference = InMemoryBookingStore()
+        rng = random.Random(7)
+        technicians = ["Alice", "Bob", "Carol"]
+        for _ in range(300):
+            booking = BookingCreate(
+                technician_name=rng.choice(technicians),
+                specialty="Plumber",
+                booking_time=self.base_date + timedelta(minutes=rng.randrange(0, 4 * 24 * 60, 15))
+            )
+            try:
+                expected = reference.create_booking(booking)
+            except ValueError:
+                expected = None
+            try:
+                actual = self.store.create_booking(booking)
+            except ValueError:
+                actual = None
+            self.assertEqual(actual, expected)
+        for _ in range(300):
+            probe = self.base_date + timedelta(minutes=rng.randrange(0, 4 * 24 * 60, 5))
+            technician = rng.choice(technicians + [None])
+            expected = reference.find_conflicting_booking(probe, technician)
+            actual = self.store.find_conflicting_booking(probe, technician)
+            self.assertEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import pytest
 from datetime import datetime, timedelta
 from app.nlp.processors.natural_language_processor import NaturalLanguageProcessor
+from app.nlp.managers.user_context_manager import UserContextManager
 from app.nlp.utils.date_time_parser import DateTimeParser
 from app.db.database import reset_database
 
@@ -20,20 +21,21 @@ class TestCombinedInputs:
             self, date_input, time_input, expected_hour, expected_minute):
         reset_database()
         nlp = NaturalLanguageProcessor()
-        response1 = nlp.process_input("I need a plumber")
+        user_context = UserContextManager.create_default_context()
+        response1 = nlp.process_input("I need a plumber", user_context)
         assert "date" in response1.lower() or "when" in response1.lower(
         ), f"System should ask for date, got: {response1}"
-        response2 = nlp.process_input(date_input)
+        response2 = nlp.process_input(date_input, user_context)
         assert "time" in response2.lower() or "when" in response2.lower(
         ), f"System should ask for time, got: {response2}"
-        response3 = nlp.process_input(time_input)
+        response3 = nlp.process_input(time_input, user_context)
         assert ("technician" in response3.lower() or
                 "available" in response3.lower() or
                 "already a booking" in response3.lower()), f"System did not recognize time input or conflict: {response3}"
         if "already a booking" in response3.lower():
             return
-        assert "temp_booking_time" in nlp.user_context, "temp_booking_time should be in user_context"
-        time_dt = nlp.user_context["temp_booking_time"]
+        assert "temp_booking_time" in user_context, "temp_booking_time should be in user_context"
+        time_dt = user_context["temp_booking_time"]
         assert time_dt.hour == expected_hour, f"Expected hour {expected_hour}, got {time_dt.hour}"
         assert time_dt.minute == expected_minute, f"Expected minute {expected_minute}, got {time_dt.minute}"
 
@@ -46,45 +48,47 @@ class TestCombinedInputs:
     def test_specialty_with_date_time(self, specialty, date_input, time_input):
         reset_database()
         nlp = NaturalLanguageProcessor()
-        response1 = nlp.process_input(f"I need to book a {specialty}")
+        user_context = UserContextManager.create_default_context()
+        response1 = nlp.process_input(f"I need to book a {specialty}", user_context)
         assert "date" in response1.lower() or "when" in response1.lower(
         ), f"System should ask for date, got: {response1}"
-        response2 = nlp.process_input(date_input)
+        response2 = nlp.process_input(date_input, user_context)
         assert "time" in response2.lower() or "when" in response2.lower(
         ), f"System should ask for time, got: {response2}"
-        response3 = nlp.process_input(time_input)
+        response3 = nlp.process_input(time_input, user_context)
         assert ("technician" in response3.lower() or
                 "available" in response3.lower() or
                 "already a booking" in response3.lower()), f"System did not recognize time input or conflict: {response3}"
         if "already a booking" in response3.lower():
             return
-        assert "temp_booking_time" in nlp.user_context, "temp_booking_time should be in user_context"
-        assert not nlp.user_context.get(
+        assert "temp_booking_time" in user_context, "temp_booking_time should be in user_context"
+        assert not user_context.get(
             "awaiting_time", False), "System should not be awaiting time after time input"
 
     def test_complete_booking_flow(self):
         reset_database()
         nlp = NaturalLanguageProcessor()
-        response1 = nlp.process_input("I need a plumber")
+        user_context = UserContextManager.create_default_context()
+        response1 = nlp.process_input("I need a plumber", user_context)
         assert "date" in response1.lower() or "when" in response1.lower(
         ), f"System should ask for date, got: {response1}"
-        response2 = nlp.process_input("tomorrow")
+        response2 = nlp.process_input("tomorrow", user_context)
         assert "time" in response2.lower() or "when" in response2.lower(
         ), f"System should ask for time, got: {response2}"
-        response3 = nlp.process_input("3 PM")
+        response3 = nlp.process_input("3 PM", user_context)
         assert ("technician" in response3.lower() or
                 "available" in response3.lower() or
                 "already a booking" in response3.lower()), f"System did not recognize time input or conflict: {response3}"
         if "already a booking" in response3.lower():
             return
-        assert "temp_booking_time" in nlp.user_context, "temp_booking_time should be in user_context"
-        time_dt = nlp.user_context["temp_booking_time"]
+        assert "temp_booking_time" in user_context, "temp_booking_time should be in user_context"
+        time_dt = user_context["temp_booking_time"]
         assert time_dt.hour == 15, f"Expected hour 15, got {time_dt.hour}"
         assert time_dt.minute == 0, f"Expected minute 0, got {time_dt.minute}"
-        assert nlp.user_context.get(
+        assert user_context.get(
             "awaiting_technician", False), "System should be awaiting technician selection"
-        specialty = nlp.user_context.get(
-            "specialty") or nlp.user_context.get("temp_booking_specialty")
+        specialty = user_context.get(
+            "specialty") or user_context.get("temp_booking_specialty")
         assert specialty is not None, "Specialty should be set in user_context"
         assert specialty.lower(
         ) == "plumber", f"Expected specialty 'plumber', got '{specialty}'"
@@ -99,14 +103,15 @@ class TestCombinedInputs:
             self, combined_input, expected_month, expected_day, expected_hour, expected_minute):
         reset_database()
         nlp = NaturalLanguageProcessor()
-        response = nlp.process_input(combined_input)
+        user_context = UserContextManager.create_default_context()
+        response = nlp.process_input(combined_input, user_context)
         assert ("technician" in response.lower() or
                 "available" in response.lower() or
                 "already a booking" in response.lower()), f"System did not recognize combined input or conflict: {response}"
         if "already a booking" in response.lower():
             return
-        assert "temp_booking_time" in nlp.user_context, "temp_booking_time should be in user_context"
-        time_dt = nlp.user_context["temp_booking_time"]
+        assert "temp_booking_time" in user_context, "temp_booking_time should be in user_context"
+        time_dt = user_context["temp_booking_time"]
         assert time_dt.month == expected_month, f"Expected month {expected_month}, got {time_dt.month}"
         assert time_dt.day == expected_day, f"Expected day {expected_day}, got {time_dt.day}"
         assert time_dt.hour == expected_hour, f"Expected hour {expected_hour}, got {time_dt.hour}"
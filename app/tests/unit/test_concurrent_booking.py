@@ -0,0 +1,160 @@
+from app.db.booking_store import VersionConflictError
+from app.db.columnar_store import ColumnarBookingStore
+from app.db.journal import BookingJournal
+from app.db.locks import IdAllocator, LockStripes
+from app.db.memory_store import InMemoryBookingStore
+from app.models.booking import BookingCreate
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+THREADS = 32
+
+
+class TestConcurrentBooking(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_date = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+        self.temp_dir.cleanup()
+
+    def stores(self):
+        return [
+            InMemoryBookingStore(),
+            InMemoryBookingStore(BookingJournal(self.temp_dir.name, fsync=False)),
+            ColumnarBookingStore()
+        ]
+
+    def run_threads(self, target, count=THREADS):
+        barrier = threading.Barrier(count)
+
+        def worker(index):
+            barrier.wait()
+            target(index)
+
+        threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_one_slot_has_exactly_one_winner(self):
+        for store in self.stores():
+            for attempt in range(10):
+                winners = []
+                losers = []
+                booking_time = self.base_date + timedelta(days=attempt)
+
+                def book(index):
+                    try:
+                        winners.append(store.create_booking(BookingCreate(
+                            technician_name="Alice",
+                            specialty="Plumber",
+                            booking_time=booking_time + timedelta(minutes=index % 30)
+                        )))
+                    except ValueError:
+                        losers.append(index)
+
+                self.run_threads(book)
+                self.assertEqual(len(winners), 1)
+                self.assertEqual(len(losers), THREADS - 1)
+            self.assertEqual(len(store.get_all_bookings()), 10)
+
+    def test_mixed_durations_never_overlap(self):
+        for store in self.stores():
+            def book(index):
+                try:
+                    store.create_booking(BookingCreate(
+                        technician_name="Alice",
+                        specialty="Plumber",
+                        booking_time=self.base_date + timedelta(minutes=15 * (index % 16)),
+                        duration_minutes=15 * (1 + index % 5)
+                    ))
+                except ValueError:
+                    pass
+
+            self.run_threads(book)
+            bookings = sorted(store.get_bookings_in_range(technician="Alice"), key=lambda booking: booking.booking_time)
+            self.assertTrue(bookings)
+            for previous, booking in zip(bookings, bookings[1:]):
+                self.assertLessEqual(previous.end_time, booking.booking_time)
+
+    def test_unrelated_technicians_all_succeed_with_unique_ids(self):
+        for store in self.stores():
+            booking_ids = []
+
+            def book(index):
+                for hour in range(8):
+                    booking_ids.append(store.create_booking(BookingCreate(
+                        technician_name=f"Tech {index}",
+                        specialty="Plumber",
+                        booking_time=self.base_date + timedelta(hours=hour)
+                    )))
+
+            self.run_threads(book)
+            self.assertEqual(sorted(booking_ids), list(range(1, THREADS * 8 + 1)))
+            for index in range(THREADS):
+                self.assertEqual(len(store.get_bookings_in_range(technician=f"Tech {index}")), 8)
+
+    def test_concurrent_reschedules_into_one_slot(self):
+        store = InMemoryBookingStore()
+        booking_ids = [store.create_booking(BookingCreate(
+            technician_name="Alice",
+            specialty="Plumber",
+            booking_time=self.base_date + timedelta(days=index)
+        )) for index in range(THREADS)]
+
+        def move(index):
+            store.update_booking(booking_ids[index], {"technician_name": "Bob"})
+
+        self.run_threads(move)
+        self.assertEqual(len(store.get_bookings_in_range(technician="Bob")), THREADS)
+        self.assertEqual(store.get_bookings_in_range(technician="Alice"), [])
+
+    def test_compare_and_swap_reschedule_has_one_winner(self):
+        for store in self.stores():
+            booking_id = store.create_booking(BookingCreate(
+                technician_name="Alice",
+                specialty="Plumber",
+                booking_time=self.base_date
+            ))
+            winners = []
+            rejected = []
+
+            def reschedule(index):
+                try:
+                    winners.append(store.update_booking(
+                        booking_id, {"booking_time": self.base_date + timedelta(days=1, hours=index % 8)},
+                        expected_version=1))
+                except VersionConflictError:
+                    rejected.append(index)
+
+            self.run_threads(reschedule)
+            self.assertEqual(len(winners), 1)
+            self.assertEqual(len(rejected), THREADS - 1)
+            self.assertEqual(store.get_booking_by_id(booking_id).version, 2)
+
+    def test_id_allocator_is_atomic(self):
+        allocator = IdAllocator()
+        allocated = []
+        self.run_threads(lambda index: allocated.extend(allocator.allocate() for _ in range(100)))
+        self.assertEqual(sorted(allocated), list(range(1, THREADS * 100 + 1)))
+
+    def test_lock_stripes_deduplicate_keys(self):
+        stripes = LockStripes(stripes=4)
+        with stripes.hold("Alice", "Alice", "Bob"):
+            pass
+        with stripes.hold_all():
+            pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -97,6 +97,7 @@ class TestConflictChecker(unittest.TestCase):
     def test_conflict_across_hour_boundary(self):
         booking_time = self.base_date + timedelta(minutes=45)
         conflict_time = self.base_date + timedelta(minutes=90)
+        delete_booking(self.booking_id)
         booking_create = BookingCreate(
             technician_name=self.technician_name,
             specialty=self.specialty,
@@ -109,7 +110,7 @@ class TestConflictChecker(unittest.TestCase):
     def test_sequential_bookings(self):
         times = [
             self.base_date + timedelta(hours=i)
-            for i in range(3)
+            for i in range(1, 4)
         ]
         for i, time in enumerate(times):
             booking_create = BookingCreate(
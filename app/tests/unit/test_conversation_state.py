@@ -0,0 +1,54 @@
+import unittest
+from app.nlp.processors.conversation_state import ConversationState
+from app.nlp.processors.natural_language_processor import NaturalLanguageProcessor
+from app.nlp.managers.user_context_manager import UserContextManager
+from app.db.database import reset_database
+
+
+class TestConversationState(unittest.TestCase):
+    def setUp(self):
+        reset_database()
+        self.processor = NaturalLanguageProcessor()
+        self.user_context = UserContextManager.create_default_context()
+
+    def test_flags_map_to_states_in_priority_order(self):
+        self.assertEqual(ConversationState.of(self.user_context), ConversationState.IDLE)
+        self.user_context["awaiting_time"] = True
+        self.user_context["conflict_detected"] = True
+        self.assertEqual(ConversationState.active(self.user_context),
+                         [ConversationState.CONFLICT, ConversationState.AWAITING_TIME, ConversationState.IDLE])
+        self.user_context["awaiting_ampm"] = True
+        self.assertEqual(ConversationState.of(self.user_context), ConversationState.AWAITING_AMPM)
+
+    def test_every_state_has_a_transition_table(self):
+        self.assertEqual(set(self.processor.transitions), set(ConversationState))
+        for state, rows in self.processor.transitions.items():
+            self.assertTrue(rows, state)
+            for condition, handler in rows:
+                self.assertTrue(callable(condition))
+                self.assertTrue(callable(handler))
+
+    def test_booking_flow_walks_through_states(self):
+        states = []
+        for text in ["i need a plumber", "march 3 2030", "3pm", "1"]:
+            response = self.processor.process_input(text, self.user_context)
+            states.append(ConversationState.of(self.user_context))
+        self.assertEqual(states, [ConversationState.AWAITING_DATE, ConversationState.AWAITING_TIME,
+                                  ConversationState.AWAITING_TECHNICIAN, ConversationState.IDLE])
+        self.assertIn("is confirmed", response)
+
+    def test_in_flow_states_skip_free_form_intents(self):
+        self.processor.process_input("i need a plumber", self.user_context)
+        self.processor.process_input("march 3 2030", self.user_context)
+        self.processor.process_input("3pm", self.user_context)
+        response = self.processor.process_input("book a plumber on march 5 2030 at 4pm", self.user_context)
+        self.assertNotIn("we have the following", response)
+
+    def test_cancel_leaves_in_flow_state(self):
+        self.processor.process_input("i need a plumber", self.user_context)
+        self.processor.process_input("nevermind", self.user_context)
+        self.assertEqual(ConversationState.of(self.user_context), ConversationState.IDLE)
+
+
+if __name__ == "__main__":
+    unittest.main()
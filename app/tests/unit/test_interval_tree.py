@@ -0,0 +1,65 @@
+from app.db.interval_tree import IntervalTree
+import unittest
+import sys
+import os
+import random
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+
+class TestIntervalTree(unittest.TestCase):
+    def setUp(self):
+        self.base_date = datetime(2025, 3, 10, 8, 0)
+        self.rng = random.Random(11)
+
+    def random_intervals(self, count):
+        intervals = []
+        for key in range(1, count + 1):
+            start = self.base_date + timedelta(minutes=self.rng.randrange(0, 12 * 60, 5))
+            intervals.append((start, start + timedelta(minutes=self.rng.choice([15, 60, 90, 120, 480])), key))
+        return intervals
+
+    def brute_force(self, intervals, low, high):
+        return sorted((start, key) for start, end, key in intervals if start < high and end > low)
+
+    def test_overlaps_are_half_open(self):
+        tree = IntervalTree()
+        tree.insert(self.base_date, self.base_date + timedelta(hours=1), 1)
+        self.assertEqual(list(tree.overlaps(self.base_date + timedelta(hours=1), self.base_date + timedelta(hours=2))), [])
+        self.assertEqual(list(tree.overlaps(self.base_date - timedelta(hours=1), self.base_date)), [])
+        self.assertEqual(list(tree.stab(self.base_date + timedelta(minutes=59))), [(self.base_date, 1)])
+
+    def test_inserted_and_built_trees_match_brute_force(self):
+        intervals = self.random_intervals(400)
+        inserted = IntervalTree()
+        for start, end, key in intervals:
+            inserted.insert(start, end, key)
+        built = IntervalTree()
+        built.build(intervals)
+        self.assertEqual(len(inserted), 400)
+        self.assertEqual(len(built), 400)
+        for _ in range(200):
+            low = self.base_date + timedelta(minutes=self.rng.randrange(-60, 14 * 60))
+            high = low + timedelta(minutes=self.rng.randrange(1, 240))
+            expected = self.brute_force(intervals, low, high)
+            self.assertEqual(list(inserted.overlaps(low, high)), expected)
+            self.assertEqual(list(built.overlaps(low, high)), expected)
+
+    def test_remove_keeps_max_end_consistent(self):
+        intervals = self.random_intervals(200)
+        tree = IntervalTree()
+        tree.build(intervals)
+        self.rng.shuffle(intervals)
+        removed, kept = intervals[:120], intervals[120:]
+        for start, _, key in removed:
+            self.assertTrue(tree.remove(start, key))
+        self.assertFalse(tree.remove(removed[0][0], removed[0][2]))
+        self.assertEqual(len(tree), len(kept))
+        for _ in range(100):
+            point = self.base_date + timedelta(minutes=self.rng.randrange(0, 20 * 60))
+            self.assertEqual(list(tree.stab(point)),
+                             self.brute_force(kept, point, point + timedelta(microseconds=1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from app.nlp.utils.intent_recognizer import IntentRecognizer
+from app.nlp.utils.keyword_automaton import KeywordAutomaton
+
+
+class TestKeywordAutomaton(unittest.TestCase):
+    def setUp(self):
+        self.automaton = KeywordAutomaton({
+            "pronoun": ["he", "she", "his", "hers"],
+            "greeting": ["hi", "hello"],
+            "digit": list("0123456789")
+        })
+
+    def test_overlapping_and_nested_keywords_are_all_reported(self):
+        classes = self.automaton.scan("USHERS")
+        self.assertEqual(classes, self.automaton.bit("pronoun"))
+        self.assertEqual(self.automaton.scan("this"), self.automaton.bit("pronoun") | self.automaton.bit("greeting"))
+
+    def test_failure_links_recover_partial_matches(self):
+        self.assertEqual(self.automaton.scan("hhello"), self.automaton.bit("greeting") | self.automaton.bit("pronoun"))
+        self.assertEqual(self.automaton.scan("room 12"), self.automaton.bit("digit"))
+        self.assertEqual(self.automaton.scan("nothing to see"), self.automaton.bit("greeting"))
+        self.assertEqual(self.automaton.scan("xyz"), 0)
+
+    def test_intents_are_answered_from_one_scan(self):
+        IntentRecognizer.keyword_classes.cache_clear()
+        text = "Cancel booking 12"
+        self.assertTrue(IntentRecognizer.is_cancellation_request(text))
+        self.assertTrue(IntentRecognizer.is_specific_booking_inquiry(text))
+        self.assertFalse(IntentRecognizer.is_greeting(text))
+        self.assertFalse(IntentRecognizer.is_update_request(text))
+        self.assertEqual(IntentRecognizer.keyword_classes.cache_info().misses, 1)
+
+    def test_intent_predicates_return_booleans(self):
+        self.assertIs(IntentRecognizer.is_update_request("update my booking please 4"), True)
+        self.assertIs(IntentRecognizer.is_update_request("update my schedule"), False)
+        self.assertIs(IntentRecognizer.is_list_bookings_request("can i see my appointments"), True)
+        self.assertIs(IntentRecognizer.is_booking_id_inquiry("tell me the reference"), True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from app.nlp.utils.booking_data_extractor import BookingDataExtractor
+from app.nlp.utils.date_time_parser import DateTimeParser
+from app.nlp.utils.intent_recognizer import IntentRecognizer
+from app.nlp.utils.parsed_utterance import ParsedUtterance
+
+
+class TestParsedUtterance(unittest.TestCase):
+    def test_behaves_like_the_original_text(self):
+        utterance = ParsedUtterance("  Book a Plumber for March 3 at 3pm ")
+        self.assertEqual(utterance, "  Book a Plumber for March 3 at 3pm ")
+        self.assertIsInstance(utterance, str)
+        self.assertIs(ParsedUtterance.of(utterance), utterance)
+        self.assertEqual(utterance.normalized, "book a plumber for march 3 at 3pm")
+
+    def test_analyses(self):
+        utterance = ParsedUtterance("I'd like a plumber tomorrow at 3pm, booking 12")
+        self.assertEqual(utterance.tokens, ["i'd", "like", "a", "plumber", "tomorrow", "at", "3", "pm", "booking", "12"])
+        self.assertEqual([span[2] for span in utterance.numeric_spans], ["3", "12"])
+        self.assertTrue(utterance.has_digits)
+        self.assertIn("3pm", [span[2] for span in utterance.time_spans])
+        self.assertIn("tomorrow", [span[2] for span in utterance.date_spans])
+        self.assertEqual(utterance.specialty_hits, ["Plumber"])
+        self.assertEqual(ParsedUtterance("march 3").months, ["march"])
+        self.assertFalse(ParsedUtterance("hello").has_digits)
+
+    def test_analyses_are_computed_once(self):
+        utterance = ParsedUtterance("cancel booking 12")
+        self.assertIs(utterance.tokens, utterance.tokens)
+        self.assertEqual(utterance.keyword_classes, IntentRecognizer.keyword_classes("cancel booking 12"))
+        calls = []
+        for _ in range(3):
+            utterance.memoize("probe", lambda: calls.append(1) or len(calls))
+        self.assertEqual(calls, [1])
+
+    def test_memoized_results_match_plain_text(self):
+        for text in ["i need a plumber tomorrow at 3pm", "not a plumber, a welder", "update booking 7",
+                     "3rd of march 2025 at 10:30 am", "show booking 4"]:
+            utterance = ParsedUtterance(text)
+            for _ in range(2):
+                self.assertEqual(BookingDataExtractor.extract_specialty(utterance),
+                                 BookingDataExtractor.extract_specialty(text))
+                self.assertEqual(BookingDataExtractor.extract_booking_id(utterance),
+                                 BookingDataExtractor.extract_booking_id(text))
+                self.assertEqual(DateTimeParser.parse_date(utterance), DateTimeParser.parse_date(text))
+                self.assertEqual(DateTimeParser.parse_time(utterance), DateTimeParser.parse_time(text))
+                self.assertEqual(DateTimeParser.parse_date_time(utterance), DateTimeParser.parse_date_time(text))
+                self.assertEqual(IntentRecognizer.is_update_request(utterance), IntentRecognizer.is_update_request(text))
+                self.assertEqual(IntentRecognizer.is_specific_booking_inquiry(utterance),
+                                 IntentRecognizer.is_specific_booking_inquiry(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from app.nlp.constants import DATE_PATTERNS_EXTENDED, TECHNICIANS
+from app.nlp.utils.date_time_parser import DateTimeParser
+from app.nlp.utils.patterns import (
+    DATE_EXTENDED,
+    DATE_EXTENDED_NUMERIC,
+    DURATION,
+    NOT_A_SPECIALTY,
+    PatternRegistry
+)
+
+
+class TestPatternRegistry(unittest.TestCase):
+    def test_patterns_are_compiled_once_and_looked_up_by_name(self):
+        self.assertIs(PatternRegistry.get("date_extended_numeric"), DATE_EXTENDED_NUMERIC)
+        self.assertEqual(DATE_EXTENDED_NUMERIC.pattern, DATE_PATTERNS_EXTENDED[0])
+        self.assertEqual([pattern.pattern for pattern in DATE_EXTENDED], DATE_PATTERNS_EXTENDED)
+        self.assertEqual(len(PatternRegistry.names()), len(set(PatternRegistry.names())))
+
+    def test_duplicate_names_are_rejected(self):
+        with self.assertRaises(ValueError):
+            PatternRegistry.register("date_extended_numeric", r'\d+')
+        self.assertIs(PatternRegistry.get("date_extended_numeric"), DATE_EXTENDED_NUMERIC)
+
+    def test_flags_and_specialty_patterns_are_built_at_import(self):
+        self.assertIsNotNone(DURATION.search("For 2 HOURS"))
+        self.assertEqual(set(NOT_A_SPECIALTY), {specialty.lower() for specialty in TECHNICIANS})
+        self.assertIsNotNone(NOT_A_SPECIALTY["general repairs"].search("not a general repairs"))
+
+    def test_parser_branches_on_pattern_identity(self):
+        self.assertEqual(DateTimeParser.parse_date("12/04/2025")[1], "12/4/2025")
+        self.assertEqual(DateTimeParser.parse_date("3rd of march 2025")[1], "3 march 2025")
+
+
+if __name__ == "__main__":
+    unittest.main()
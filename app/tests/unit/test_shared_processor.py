@@ -0,0 +1,40 @@
+import unittest
+from app.nlp.processors.natural_language_processor import NaturalLanguageProcessor
+from app.nlp.managers.user_context_manager import UserContextManager
+from app.db.database import reset_database
+
+
+class TestSharedProcessor(unittest.TestCase):
+    def setUp(self):
+        reset_database()
+        self.processor = NaturalLanguageProcessor()
+
+    def test_interleaved_sessions_keep_their_own_state(self):
+        first = UserContextManager.create_default_context()
+        second = UserContextManager.create_default_context()
+        self.assertIn("date", self.processor.process_input("i need a plumber", first).lower())
+        self.assertIn("date", self.processor.process_input("book an electrician", second).lower())
+        self.assertIn("time", self.processor.process_input("march 3 2025", first).lower())
+        self.assertEqual(first["temp_booking_specialty"], "Plumber")
+        self.assertTrue(first["awaiting_time"])
+        self.assertEqual(second["temp_booking_specialty"], "Electrician")
+        self.assertTrue(second["awaiting_date"])
+        self.assertFalse(second["awaiting_time"])
+
+    def test_processor_keeps_no_conversation_state(self):
+        user_context = UserContextManager.create_default_context()
+        self.processor.process_input("i need a plumber", user_context)
+        self.assertTrue(user_context["awaiting_date"])
+        self.assertFalse(hasattr(self.processor, "user_context"))
+        with self.assertRaises(TypeError):
+            self.processor.process_input("i need a plumber")
+
+    def test_ensure_defaults_fills_missing_keys_in_place(self):
+        session = {"last_booking_id": 4}
+        self.assertIs(UserContextManager.ensure_defaults(session), session)
+        self.assertEqual(session["last_booking_id"], 4)
+        self.assertFalse(session["awaiting_date"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+from app.db.availability import SlotAvailability, interval_mask, slot_range
+from app.db.columnar_store import ColumnarBookingStore
+from app.db.memory_store import InMemoryBookingStore
+from app.db.sqlite_store import SQLiteBookingStore
+from app.models.booking import BookingCreate
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+
+class TestSlotAvailability(unittest.TestCase):
+    def setUp(self):
+        self.availability = SlotAvailability(slot_minutes=15)
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+
+    def test_slot_range_rounds_outwards(self):
+        self.assertEqual(slot_range(self.base_date, slot_minutes=15), (40, 44))
+        self.assertEqual(slot_range(self.base_date + timedelta(minutes=7), slot_minutes=15), (40, 45))
+        self.assertEqual(slot_range(datetime(2025, 3, 10, 23, 30), slot_minutes=15), (94, 96))
+
+    def test_overlapping_intervals_share_a_slot(self):
+        booked = interval_mask(self.base_date, slot_minutes=15)
+        self.assertTrue(booked & interval_mask(self.base_date + timedelta(minutes=59), slot_minutes=15))
+        self.assertFalse(booked & interval_mask(self.base_date + timedelta(hours=1), slot_minutes=15))
+        self.assertFalse(booked & interval_mask(self.base_date - timedelta(hours=1), slot_minutes=15))
+
+    def test_masks_are_per_technician_and_combine_with_or(self):
+        self.availability.add("Alice", self.base_date)
+        self.availability.add("Bob", self.base_date + timedelta(hours=2))
+        day = self.base_date.date()
+        alice = self.availability.mask(day, "Alice")
+        bob = self.availability.mask(day, "Bob")
+        self.assertEqual(self.availability.mask(day), alice | bob)
+        self.assertEqual(self.availability.mask(day, "Carol"), 0)
+        self.assertEqual(self.availability.mask(day + timedelta(days=1)), 0)
+
+    def test_free_mask_reports_any_free_technician(self):
+        self.availability.add("Alice", self.base_date)
+        self.availability.add("Bob", self.base_date)
+        day = self.base_date.date()
+        slot = interval_mask(self.base_date, slot_minutes=15)
+        self.assertNotEqual(self.availability.free_mask(day, ["Alice", "Bob"]) & slot, slot)
+        self.assertEqual(self.availability.free_mask(day, ["Alice", "Carol"]) & slot, slot)
+
+    def test_rebuild_drops_empty_days(self):
+        self.availability.add("Alice", self.base_date)
+        self.availability.rebuild("Alice", self.base_date.date(), [])
+        self.assertEqual(self.availability.mask(self.base_date.date()), 0)
+        self.assertEqual(self.availability._masks, {})
+
+
+class TestStoreDayMask(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+        self.stores = [
+            InMemoryBookingStore(),
+            ColumnarBookingStore(),
+            SQLiteBookingStore(os.path.join(self.temp_dir.name, "bookings.db"))
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def create(self, store, technician_name, booking_time):
+        return store.create_booking(BookingCreate(
+            technician_name=technician_name, specialty="Plumber", booking_time=booking_time))
+
+    def test_day_mask_tracks_create_update_and_delete(self):
+        day = self.base_date.date()
+        for store in self.stores:
+            first = self.create(store, "Alice", self.base_date)
+            second = self.create(store, "Alice", self.base_date + timedelta(hours=3))
+            self.create(store, "Bob", self.base_date + timedelta(hours=1))
+            expected = interval_mask(self.base_date) | interval_mask(self.base_date + timedelta(hours=3))
+            self.assertEqual(store.day_mask(day, "Alice"), expected)
+            self.assertEqual(store.day_mask(day), expected | interval_mask(self.base_date + timedelta(hours=1)))
+
+            store.update_booking(first, {"booking_time": self.base_date + timedelta(hours=5)})
+            self.assertEqual(store.day_mask(day, "Alice"),
+                             interval_mask(self.base_date + timedelta(hours=3))
+                             | interval_mask(self.base_date + timedelta(hours=5)))
+
+            store.delete_booking(second)
+            store.update_booking(first, {"booking_time": self.base_date + timedelta(days=1)})
+            self.assertEqual(store.day_mask(day, "Alice"), 0)
+            self.assertEqual(store.day_mask(day + timedelta(days=1), "Alice"), interval_mask(self.base_date))
+
+            store.reset_database()
+            self.assertEqual(store.day_mask(day), 0)
+
+    def test_free_mask_never_hides_a_conflict(self):
+        for store in self.stores:
+            self.create(store, "Alice", self.base_date)
+            for minutes in range(-90, 91, 5):
+                booking_time = self.base_date + timedelta(minutes=minutes)
+                busy = store.day_mask(booking_time.date(), "Alice") & interval_mask(booking_time)
+                if store.find_conflicting_booking(booking_time, "Alice") is not None:
+                    self.assertTrue(busy)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+from app.db.availability import SlotAvailability, covered_mask, interval_mask
+from app.db.columnar_store import ColumnarBookingStore
+from app.db.database import create_booking, delete_booking, reset_database
+from app.db.memory_store import InMemoryBookingStore
+from app.db.sqlite_store import SQLiteBookingStore
+from app.models.booking import BookingCreate
+from app.nlp.constants import TECHNICIANS
+from app.nlp.handlers.conflict_checker import BookingConflictChecker
+from app.nlp.processors.technician_service import TechnicianService
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+GROUPS = {"Plumber": ["Alice", "Bob"], "Welder": ["Bob", "Carol"]}
+
+
+class TestSlotCapacity(unittest.TestCase):
+    def setUp(self):
+        self.availability = SlotAvailability(slot_minutes=15)
+        self.availability.set_groups(GROUPS)
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+        self.day = self.base_date.date()
+
+    def test_slot_is_full_only_when_every_member_is_busy(self):
+        self.availability.add("Alice", self.base_date)
+        self.assertEqual(self.availability.full_mask(self.day, "Plumber"), 0)
+        self.assertEqual(self.availability.busy_count(self.day, "Plumber", 40), 1)
+        self.availability.add("Bob", self.base_date + timedelta(minutes=30))
+        self.assertEqual(self.availability.full_mask(self.day, "Plumber"),
+                         interval_mask(self.base_date + timedelta(minutes=30), timedelta(minutes=30), 15))
+        self.assertEqual(self.availability.full_mask(self.day, "Welder"), 0)
+        self.assertEqual(self.availability.busy_count(self.day, "Welder", 42), 1)
+
+    def test_counters_follow_rebuilds_and_regrouping(self):
+        self.availability.add("Alice", self.base_date)
+        self.availability.add("Bob", self.base_date)
+        self.assertTrue(self.availability.full_mask(self.day, "Plumber"))
+        self.availability.rebuild("Bob", self.day, [])
+        self.assertEqual(self.availability.full_mask(self.day, "Plumber"), 0)
+        self.assertEqual(self.availability.busy_count(self.day, "Welder", 40), 0)
+        self.availability.set_groups({"Plumber": ["Alice"]})
+        self.assertEqual(self.availability.full_mask(self.day, "Plumber"), interval_mask(self.base_date, slot_minutes=15))
+        self.availability.clear()
+        self.assertEqual(self.availability.full_mask(self.day, "Plumber"), 0)
+
+    def test_covered_mask_keeps_only_whole_slots(self):
+        self.assertEqual(covered_mask(self.base_date, timedelta(hours=1), 15), 0b1111 << 40)
+        self.assertEqual(covered_mask(self.base_date + timedelta(minutes=5), timedelta(minutes=30), 15), 1 << 41)
+        self.assertEqual(covered_mask(self.base_date + timedelta(minutes=5), timedelta(minutes=15), 15), 0)
+
+    def test_stores_report_the_same_full_mask(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            stores = [
+                InMemoryBookingStore(),
+                ColumnarBookingStore(),
+                SQLiteBookingStore(os.path.join(temp_dir, "bookings.db"))
+            ]
+            for store in stores:
+                store.set_capacity_groups(GROUPS)
+                for technician_name in ("Alice", "Bob"):
+                    store.create_booking(BookingCreate(
+                        technician_name=technician_name, specialty="Plumber", booking_time=self.base_date))
+                self.assertEqual(store.full_mask(self.day, "Plumber"), interval_mask(self.base_date))
+                self.assertEqual(store.full_mask(self.day, "Welder"), 0)
+
+
+class TestSpecialtyConflicts(unittest.TestCase):
+    def setUp(self):
+        reset_database()
+        self.base_date = datetime(2025, 3, 10, 15, 0)
+        self.plumbers = TECHNICIANS["Plumber"]
+
+    def tearDown(self):
+        reset_database()
+
+    def book(self, technician_name, booking_time=None):
+        return create_booking(BookingCreate(
+            technician_name=technician_name, specialty="Plumber", booking_time=booking_time or self.base_date))
+
+    def test_one_booking_does_not_block_other_technicians(self):
+        self.book(self.plumbers[0])
+        self.assertFalse(BookingConflictChecker.is_slot_full(self.base_date, "Plumber"))
+        self.assertIsNone(TechnicianService.check_and_handle_conflict(
+            {"temp_booking_specialty": "Plumber"}, self.base_date, "3:00 PM"))
+        self.assertFalse(BookingConflictChecker.is_slot_full(self.base_date, "Electrician"))
+
+    def test_slot_is_full_when_every_plumber_is_booked(self):
+        booking_ids = [self.book(technician_name) for technician_name in self.plumbers]
+        self.assertTrue(BookingConflictChecker.is_slot_full(self.base_date + timedelta(minutes=30), "Plumber"))
+        self.assertTrue(BookingConflictChecker.is_slot_full(self.base_date + timedelta(minutes=10), "Technician"))
+        self.assertFalse(BookingConflictChecker.is_slot_full(self.base_date, "Electrician"))
+        user_context = {"temp_booking_specialty": "Plumber"}
+        message = TechnicianService.check_and_handle_conflict(user_context, self.base_date, "3:00 PM")
+        self.assertIn("4:00 PM", message)
+        self.assertTrue(user_context["conflict_detected"])
+        delete_booking(booking_ids[1])
+        self.assertFalse(BookingConflictChecker.is_slot_full(self.base_date, "Plumber"))
+
+    def test_staggered_bookings_fill_the_slot_without_a_full_counter(self):
+        self.book(self.plumbers[0], self.base_date - timedelta(minutes=50))
+        self.book(self.plumbers[1], self.base_date + timedelta(minutes=50))
+        self.book(self.plumbers[2], self.base_date + timedelta(minutes=20))
+        self.assertTrue(BookingConflictChecker.is_slot_full(self.base_date, "Plumber"))
+        self.assertFalse(BookingConflictChecker.is_slot_full(self.base_date, "Plumber", duration_minutes=10))
+
+    def test_reschedule_next_to_another_technicians_booking(self):
+        self.book(self.plumbers[0])
+        booking_id = self.book(self.plumbers[1], self.base_date + timedelta(hours=2))
+        self.assertIsNone(TechnicianService.check_and_handle_conflict(
+            {"temp_booking_specialty": "Plumber"}, self.base_date + timedelta(minutes=30), "3:30 PM",
+            exclude_booking_id=booking_id))
+        self.book(self.plumbers[1], self.base_date + timedelta(hours=4))
+        user_context = {"temp_booking_specialty": "Plumber"}
+        message = TechnicianService.check_and_handle_conflict(
+            user_context, self.base_date + timedelta(hours=4), "7:00 PM", exclude_booking_id=booking_id)
+        self.assertIsNotNone(message)
+        self.assertTrue(user_context["conflict_detected"])
+
+
+if __name__ == "__main__":
+    unittest.main()
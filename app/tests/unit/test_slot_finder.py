@@ -0,0 +1,108 @@
+from app.db.availability import SlotAvailability
+from app.db.database import create_booking, reset_database
+from app.db.slot_finder import FreeSlotFinder
+from app.models.booking import BookingCreate
+from app.nlp.constants import TECHNICIANS
+from app.nlp.handlers.conflict_checker import BookingConflictChecker
+from app.nlp.processors.technician_service import TechnicianService
+import unittest
+import sys
+import os
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+PLUMBERS = ["Nicolas Woollett", "John Pipe", "Sarah Waters"]
+
+
+class TestFreeSlotFinder(unittest.TestCase):
+    def setUp(self):
+        self.availability = SlotAvailability(slot_minutes=15)
+        self.finder = FreeSlotFinder(self.availability.mask, slot_minutes=15, horizon_days=2)
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+
+    def book(self, technician_name, booking_time):
+        self.availability.add(technician_name, booking_time)
+
+    def test_next_free_skips_blocked_starts(self):
+        self.book("Alice", self.base_date)
+        slots = self.finder.next_free(self.base_date - timedelta(minutes=30), ["Alice"], count=2)
+        self.assertEqual([slot.start for slot in slots],
+                         [self.base_date + timedelta(hours=1), self.base_date + timedelta(hours=1, minutes=15)])
+        self.assertEqual(slots[0].technicians, ["Alice"])
+
+    def test_slot_is_free_when_any_technician_is_free(self):
+        self.book("Alice", self.base_date)
+        slots = self.finder.next_free(self.base_date, ["Alice", "Bob"], count=1)
+        self.assertEqual(slots[0].start, self.base_date)
+        self.assertEqual(slots[0].technicians, ["Bob"])
+
+    def test_next_free_rolls_over_to_the_next_day(self):
+        self.book("Alice", self.base_date.replace(hour=23))
+        slots = self.finder.next_free(self.base_date.replace(hour=22, minute=30), ["Alice"], count=1)
+        self.assertEqual(slots[0].start, self.base_date.replace(hour=0) + timedelta(days=1))
+
+    def test_late_starts_respect_the_next_mornings_bookings(self):
+        next_morning = self.base_date.replace(hour=0, minute=30) + timedelta(days=1)
+        self.book("Alice", next_morning)
+        slots = self.finder.next_free(self.base_date.replace(hour=23, minute=15), ["Alice"], count=2)
+        self.assertEqual([slot.start for slot in slots],
+                         [self.base_date.replace(hour=23, minute=15), self.base_date.replace(hour=23, minute=30)])
+        slots = self.finder.next_free(self.base_date.replace(hour=23, minute=45), ["Alice"], count=1)
+        self.assertEqual(slots[0].start, next_morning + timedelta(hours=1))
+
+    def test_nearest_free_searches_both_directions(self):
+        self.book("Alice", self.base_date)
+        self.book("Alice", self.base_date + timedelta(hours=1, minutes=30))
+        slots = self.finder.nearest_free(self.base_date + timedelta(minutes=45), ["Alice"], count=2)
+        self.assertEqual([slot.start for slot in slots],
+                         [self.base_date - timedelta(hours=1), self.base_date + timedelta(hours=2, minutes=30)])
+
+    def test_nearest_free_respects_earliest(self):
+        self.book("Alice", self.base_date)
+        slots = self.finder.nearest_free(self.base_date, ["Alice"], count=1, earliest=self.base_date)
+        self.assertEqual(slots[0].start, self.base_date + timedelta(hours=1))
+
+    def test_suggestions_do_not_conflict(self):
+        for hour in range(6, 20, 2):
+            self.book("Alice", self.base_date.replace(hour=hour, minute=10))
+        for slot in self.finder.next_free(self.base_date.replace(hour=6), ["Alice"], count=20):
+            for hour in range(6, 20, 2):
+                booked = self.base_date.replace(hour=hour, minute=10)
+                self.assertFalse(booked - timedelta(hours=1) < slot.start < booked + timedelta(hours=1))
+
+
+class TestConflictAlternatives(unittest.TestCase):
+    def setUp(self):
+        reset_database()
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+        for technician_name in PLUMBERS:
+            create_booking(BookingCreate(
+                technician_name=technician_name, specialty="Plumber", booking_time=self.base_date))
+
+    def tearDown(self):
+        reset_database()
+
+    def test_conflict_message_lists_free_alternatives(self):
+        user_context = {}
+        message = TechnicianService.check_and_handle_conflict(
+            user_context, self.base_date + timedelta(minutes=20), "10:20 AM")
+        self.assertIn("already a booking", message)
+        self.assertIn("11:00 AM, 11:15 AM or 11:30 AM", message)
+        self.assertTrue(user_context.get("conflict_detected"))
+        alternative = self.base_date + timedelta(hours=1)
+        self.assertIsNone(BookingConflictChecker.check_conflict(alternative))
+
+    def test_alternatives_fit_the_specialty_default_duration(self):
+        painters = TECHNICIANS["Painter"]
+        for hour in (10, 14):
+            for technician_name in painters:
+                create_booking(BookingCreate(technician_name=technician_name, specialty="Painter",
+                                             booking_time=self.base_date.replace(hour=hour)))
+        message = TechnicianService.check_and_handle_conflict(
+            {"temp_booking_specialty": "Painter"}, self.base_date + timedelta(minutes=20), "10:20 AM")
+        self.assertNotIn("1:00 PM", message)
+        self.assertIn("5:00 PM", message)
+
+
+if __name__ == "__main__":
+    unittest.main()
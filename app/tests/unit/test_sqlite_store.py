@@ -0,0 +1,191 @@
+from app.db.booking_store import VersionConflictError
+from app.db.observers import BookingObserver
+from app.db.sqlite_store import SQLiteBookingStore
+from app.models.booking import BookingCreate
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+
+class RecordingObserver(BookingObserver):
+    def __init__(self):
+        self.events = []
+
+    def booking_added(self, booking):
+        self.events.append(("added", booking.id))
+
+    def booking_removed(self, booking):
+        self.events.append(("removed", booking.id))
+
+    def series_added(self, series):
+        self.events.append(("series_added", series.id))
+
+    def series_removed(self, series):
+        self.events.append(("series_removed", series.id))
+
+    def bookings_reset(self):
+        self.events.append(("reset", None))
+
+
+class TestSQLiteBookingStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.temp_dir.name, "bookings.db")
+        self.store = SQLiteBookingStore(self.database_path)
+        self.base_date = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _create(self, technician_name="Tech A", booking_time=None, store=None):
+        return (store or self.store).create_booking(BookingCreate(
+            technician_name=technician_name,
+            specialty="Plumber",
+            booking_time=booking_time or self.base_date
+        ))
+
+    def test_uses_wal_journal_mode(self):
+        mode = self.store._connection().execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_composite_index_exists(self):
+        columns = [row[2] for row in self.store._connection().execute(
+            "PRAGMA index_info(idx_bookings_technician_time)")]
+        self.assertEqual(columns, ["technician_name", "booking_time"])
+
+    def test_crud_round_trip(self):
+        booking_id = self._create()
+        booking = self.store.get_booking_by_id(booking_id)
+        self.assertEqual(booking.technician_name, "Tech A")
+        self.assertEqual(booking.booking_time, self.base_date)
+        new_time = self.base_date + timedelta(hours=2)
+        updated = self.store.update_booking(booking_id, {"booking_time": new_time})
+        self.assertEqual(updated.booking_time, new_time)
+        self.assertEqual(self.store.get_booking_by_id(booking_id).booking_time, new_time)
+        self.assertTrue(self.store.delete_booking(booking_id))
+        self.assertFalse(self.store.delete_booking(booking_id))
+        self.assertIsNone(self.store.get_booking_by_id(booking_id))
+
+    def test_overlap_rejected_inside_insert(self):
+        self._create()
+        with self.assertRaises(ValueError):
+            self._create(booking_time=self.base_date + timedelta(minutes=30))
+        self._create(technician_name="Tech B", booking_time=self.base_date + timedelta(minutes=30))
+        self._create(booking_time=self.base_date + timedelta(hours=1))
+
+    def test_find_conflicting_booking_looks_past_midnight(self):
+        late_id = self._create(booking_time=datetime(2025, 3, 10, 23, 30))
+        self.assertEqual(self.store.find_conflicting_booking(datetime(2025, 3, 11, 0, 0)).id, late_id)
+        self.assertIsNone(self.store.find_conflicting_booking(datetime(2025, 3, 11, 0, 30)))
+        conflict = self.store.find_conflicting_booking(datetime(2025, 3, 10, 23, 0))
+        self.assertEqual(conflict.id, late_id)
+        self.assertIsNone(self.store.find_conflicting_booking(
+            datetime(2025, 3, 10, 23, 0), exclude_booking_id=late_id))
+
+    def test_range_query_filters(self):
+        for day in range(3):
+            self._create(booking_time=self.base_date + timedelta(days=day))
+            self._create(technician_name="Tech B", booking_time=self.base_date + timedelta(days=day))
+        start = datetime.combine(self.base_date.date() + timedelta(days=1), datetime.min.time())
+        bookings = self.store.get_bookings_in_range(start, start + timedelta(days=1))
+        self.assertEqual(len(bookings), 2)
+        bookings = self.store.get_bookings_in_range(technician="Tech B", specialty="plumber")
+        self.assertEqual(len(bookings), 3)
+
+    def test_keyset_pagination(self):
+        ids = []
+        for day in range(3):
+            ids.append(self._create(booking_time=self.base_date + timedelta(days=day)))
+            ids.append(self._create(technician_name="Tech B", booking_time=self.base_date + timedelta(days=day)))
+        first = self.store.get_bookings_in_range(limit=4)
+        rest = self.store.get_bookings_in_range(after=(first[-1].booking_time, first[-1].id), limit=4)
+        self.assertEqual([booking.id for booking in first + rest], ids)
+
+    def test_update_is_version_checked(self):
+        booking_id = self._create()
+        other_id = self._create(booking_time=self.base_date + timedelta(hours=2))
+        with self.assertRaises(ValueError):
+            self.store.update_booking(other_id, {"booking_time": self.base_date + timedelta(minutes=30)})
+        self.assertEqual(self.store.update_booking(booking_id, {"specialty": "Welder"}, expected_version=1).version, 2)
+        with self.assertRaises(VersionConflictError):
+            self.store.update_booking(booking_id, {"specialty": "Plumber"}, expected_version=1)
+        self.assertEqual(self.store.get_booking_by_id(booking_id).version, 2)
+
+    def test_version_column_added_to_existing_database(self):
+        legacy_path = os.path.join(self.temp_dir.name, "legacy.db")
+        connection = sqlite3.connect(legacy_path)
+        connection.execute("CREATE TABLE bookings (id INTEGER PRIMARY KEY AUTOINCREMENT, technician_name TEXT, "
+                           "specialty TEXT, booking_time TEXT)")
+        connection.execute("INSERT INTO bookings (technician_name, specialty, booking_time) "
+                           "VALUES ('Tech A', 'Plumber', '2025-03-10 10:00:00.000000')")
+        connection.commit()
+        connection.close()
+        self.assertEqual(SQLiteBookingStore(legacy_path).get_booking_by_id(1).version, 1)
+
+    def test_data_survives_reopen(self):
+        booking_id = self._create()
+        reopened = SQLiteBookingStore(self.database_path)
+        self.assertEqual(reopened.get_booking_by_id(booking_id).technician_name, "Tech A")
+
+    def test_seed_only_populates_empty_database(self):
+        sample = [{"technician_name": "Tech A", "specialty": "Plumber", "booking_time": self.base_date}]
+        self.store.seed(sample)
+        self.store.seed(sample)
+        self.assertEqual(len(self.store.get_all_bookings()), 1)
+
+    def test_reset_restarts_ids(self):
+        self._create()
+        self.store.reset_database()
+        self.assertEqual(self.store.get_all_bookings(), [])
+        self.assertEqual(self._create(), 1)
+
+    def test_concurrent_writers_cannot_double_book(self):
+        stores = [SQLiteBookingStore(self.database_path) for _ in range(8)]
+        results = []
+        barrier = threading.Barrier(len(stores))
+
+        def attempt(store):
+            barrier.wait()
+            try:
+                results.append(self._create(store=store))
+            except ValueError:
+                results.append(None)
+        threads = [threading.Thread(target=attempt, args=(store,)) for store in stores]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len([result for result in results if result is not None]), 1)
+        self.assertEqual(len(self.store.get_all_bookings()), 1)
+
+    def test_generation_is_shared_between_stores(self):
+        other = SQLiteBookingStore(self.database_path)
+        observer = RecordingObserver()
+        self.store.add_observer(observer)
+        before = self.store.generation()
+        booking_id = self._create()
+        self.assertEqual(other.generation(), before + 1)
+        self.assertEqual(observer.events, [("added", booking_id)])
+        other.delete_booking(booking_id)
+        self.assertEqual(self.store.generation(), before + 2)
+        self.assertEqual(observer.events, [("added", booking_id), ("reset", None)])
+        self.assertEqual(self.store.generation(), before + 2)
+        self.assertEqual(len(observer.events), 2)
+
+    def test_foreign_write_marks_observers_stale_on_next_local_write(self):
+        other = SQLiteBookingStore(self.database_path)
+        observer = RecordingObserver()
+        self.store.add_observer(observer)
+        self._create(store=other)
+        booking_id = self._create(booking_time=self.base_date + timedelta(hours=2))
+        self.assertEqual(observer.events, [("reset", None), ("added", booking_id)])
+        self.assertEqual(SQLiteBookingStore(self.database_path).generation(), self.store.generation())
+
+
+if __name__ == "__main__":
+    unittest.main()
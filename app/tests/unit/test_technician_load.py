@@ -0,0 +1,142 @@
+from app.core.config import settings
+from app.db.database import create_booking, reset_database
+from app.db.memory_store import InMemoryBookingStore
+from app.db.sqlite_store import SQLiteBookingStore
+from app.db.technician_load import TechnicianLoad
+from app.models.booking import BookingCreate
+from app.nlp.constants import TECHNICIANS
+from app.nlp.managers.technician_manager import TechnicianManager
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+GROUPS = {"Plumber": ["Alice", "Bob", "Carol"], "Welder": ["Carol", "Dave"]}
+
+
+class TestTechnicianLoad(unittest.TestCase):
+    def setUp(self):
+        self.store = InMemoryBookingStore()
+        self.load = TechnicianLoad(lambda start, end: self.store.get_bookings_in_range(start, end))
+        self.load.set_groups(GROUPS)
+        self.store.add_observer(self.load)
+        self.base_date = datetime(2025, 3, 10, 8, 0)
+        self.day = self.base_date.date()
+
+    def book(self, technician_name, hour, day_offset=0, store=None):
+        return (store or self.store).create_booking(BookingCreate(
+            technician_name=technician_name,
+            specialty="Plumber",
+            booking_time=self.base_date + timedelta(days=day_offset, hours=hour)
+        ))
+
+    def test_least_loaded_follows_writes(self):
+        self.book("Alice", 0)
+        self.book("Alice", 1)
+        self.book("Bob", 0)
+        self.assertEqual(self.load.least_loaded(self.day, "Plumber", lambda name: True), "Carol")
+        self.book("Carol", 2)
+        self.book("Carol", 3)
+        self.assertEqual(self.load.least_loaded(self.day, "Plumber", lambda name: True), "Bob")
+        self.assertEqual(self.load.least_loaded(self.day, "Welder", lambda name: True), "Dave")
+        booking_id = self.book("Bob", 4)
+        self.book("Bob", 5)
+        self.store.delete_booking(booking_id)
+        self.assertEqual(self.load.count(self.day, "Bob"), 2)
+        self.assertEqual(self.load.least_loaded(self.day, "Plumber", lambda name: True), "Alice")
+
+    def test_rejected_technicians_are_skipped_and_kept(self):
+        self.book("Bob", 0)
+        self.assertEqual(self.load.least_loaded(self.day, "Plumber", lambda name: name != "Alice"), "Carol")
+        self.assertEqual(self.load.least_loaded(self.day, "Plumber", lambda name: True), "Alice")
+        self.assertIsNone(self.load.least_loaded(self.day, "Plumber", lambda name: False))
+        self.assertIsNone(self.load.least_loaded(self.day, "Nobody", lambda name: True))
+
+    def test_updates_move_load_between_days(self):
+        booking_id = self.book("Alice", 0)
+        self.assertEqual(self.load.count(self.day, "Alice"), 1)
+        self.assertEqual(self.load.count(self.day + timedelta(days=1), "Alice"), 0)
+        self.store.update_booking(booking_id, {"booking_time": self.base_date + timedelta(days=1)})
+        self.assertEqual(self.load.count(self.day, "Alice"), 0)
+        self.assertEqual(self.load.count(self.day + timedelta(days=1), "Alice"), 1)
+        self.store.reset_database()
+        self.assertEqual(self.load.count(self.day + timedelta(days=1), "Alice"), 0)
+
+    def test_heap_stays_bounded_under_churn(self):
+        self.load.least_loaded(self.day, "Plumber", lambda name: True)
+        for hour in range(12):
+            self.store.delete_booking(self.book("Alice", hour))
+        self.assertEqual(self.load.least_loaded(self.day, "Plumber", lambda name: True), "Alice")
+        self.assertLessEqual(len(self.load._heaps.get((self.day, "Plumber"), [])), 12)
+
+    def test_rotation_cycles_through_free_technicians(self):
+        picks = [self.load.rotate("Plumber", lambda name: name != "Bob") for _ in range(4)]
+        self.assertEqual(picks, ["Alice", "Carol", "Alice", "Carol"])
+        self.assertIsNone(self.load.rotate("Plumber", lambda name: False))
+
+    def test_writes_from_another_worker_reload_counts_and_keep_the_rotation(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_path = os.path.join(temp_dir, "bookings.db")
+            store = SQLiteBookingStore(database_path)
+            load = TechnicianLoad(lambda start, end: store.get_bookings_in_range(start, end))
+            load.set_groups(GROUPS)
+            store.add_observer(load)
+            self.assertEqual(load.least_loaded(self.day, "Plumber", lambda name: True), "Alice")
+            self.assertEqual(load.rotate("Plumber", lambda name: True), "Alice")
+            self.book("Alice", 0, store=SQLiteBookingStore(database_path))
+            store.generation()
+            self.assertEqual(load.count(self.day, "Alice"), 1)
+            self.assertEqual(load.least_loaded(self.day, "Plumber", lambda name: True), "Bob")
+            self.assertEqual(load.rotate("Plumber", lambda name: True), "Bob")
+
+
+class TestAssignmentStrategies(unittest.TestCase):
+    def setUp(self):
+        reset_database()
+        self.strategy = settings.TECHNICIAN_ASSIGNMENT_STRATEGY
+        self.booking_time = datetime(2025, 3, 10, 10, 0)
+
+    def tearDown(self):
+        settings.TECHNICIAN_ASSIGNMENT_STRATEGY = self.strategy
+        reset_database()
+
+    def fill_specialty(self, strategy):
+        settings.TECHNICIAN_ASSIGNMENT_STRATEGY = strategy
+        assigned = []
+        for _ in TECHNICIANS["Plumber"]:
+            technician_name = TechnicianManager.assign_technician("Plumber", self.booking_time)
+            create_booking(BookingCreate(
+                technician_name=technician_name,
+                specialty="Plumber",
+                booking_time=self.booking_time
+            ))
+            assigned.append(technician_name)
+        return assigned
+
+    def test_least_loaded_fills_every_technician_without_conflicts(self):
+        self.assertEqual(sorted(self.fill_specialty("least_loaded")), sorted(TECHNICIANS["Plumber"]))
+
+    def test_round_robin_fills_every_technician_without_conflicts(self):
+        self.assertEqual(sorted(self.fill_specialty("round_robin")), sorted(TECHNICIANS["Plumber"]))
+
+    def test_least_loaded_prefers_the_idle_technician(self):
+        settings.TECHNICIAN_ASSIGNMENT_STRATEGY = "least_loaded"
+        busy, idle = TECHNICIANS["Plumber"][0], TECHNICIANS["Plumber"][1:]
+        for hour in range(3):
+            create_booking(BookingCreate(
+                technician_name=busy,
+                specialty="Plumber",
+                booking_time=self.booking_time + timedelta(hours=hour + 1)
+            ))
+        self.assertIn(TechnicianManager.assign_technician("Plumber", self.booking_time), idle)
+
+    def test_unknown_strategy_is_rejected(self):
+        settings.TECHNICIAN_ASSIGNMENT_STRATEGY = "fastest"
+        with self.assertRaises(ValueError):
+            TechnicianManager.assign_technician("Plumber", self.booking_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
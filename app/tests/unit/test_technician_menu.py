@@ -0,0 +1,112 @@
+from app.db import database
+from app.db.database import create_booking, delete_booking, get_generation, reset_database
+from app.db.sqlite_store import SQLiteBookingStore
+from app.models.booking import BookingCreate
+from app.nlp.managers.technician_manager import TechnicianManager
+from app.nlp.processors.technician_service import TechnicianService
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+
+class TestTechnicianMenu(unittest.TestCase):
+    def setUp(self):
+        reset_database()
+        self.base_date = datetime(2025, 3, 10, 10, 0)
+        self.plumbers = TechnicianManager.get_available_technicians("Plumber")
+
+    def tearDown(self):
+        reset_database()
+
+    def use_store(self, store):
+        self.addCleanup(self.reset_menu_cache)
+        self.addCleanup(setattr, database, "store", database.store)
+        database.store = store
+        self.reset_menu_cache()
+
+    @staticmethod
+    def reset_menu_cache():
+        TechnicianManager._menu_cache = {}
+        TechnicianManager._menu_generation = None
+
+    def book(self, technician_name, booking_time):
+        return create_booking(BookingCreate(
+            technician_name=technician_name, specialty="Plumber", booking_time=booking_time))
+
+    def test_busy_technicians_are_left_out(self):
+        self.book(self.plumbers[0], self.base_date)
+        menu = TechnicianManager.get_free_technicians("Plumber", self.base_date + timedelta(minutes=30))
+        self.assertNotIn(self.plumbers[0], menu)
+        self.assertEqual(len(menu), len(self.plumbers) - 1)
+
+    def test_menu_is_ordered_by_free_capacity(self):
+        self.book(self.plumbers[0], self.base_date.replace(hour=8))
+        self.book(self.plumbers[0], self.base_date.replace(hour=12))
+        self.book(self.plumbers[1], self.base_date.replace(hour=8))
+        menu = TechnicianManager.get_free_technicians("Plumber", self.base_date.replace(hour=15))
+        self.assertEqual(menu, [self.plumbers[2], self.plumbers[1], self.plumbers[0]])
+
+    def test_longer_duration_excludes_technicians_booked_later(self):
+        self.book(self.plumbers[0], self.base_date + timedelta(hours=2))
+        self.assertIn(self.plumbers[0], TechnicianManager.get_free_technicians("Plumber", self.base_date))
+        self.assertNotIn(self.plumbers[0], TechnicianManager.get_free_technicians(
+            "Plumber", self.base_date, duration_minutes=180))
+
+    def test_cached_menu_is_invalidated_by_writes(self):
+        booking_time = self.base_date + timedelta(hours=3)
+        first = TechnicianManager.get_free_technicians("Plumber", booking_time)
+        self.assertEqual(TechnicianManager._menu_cache[("Plumber", booking_time, 60)][0], get_generation())
+        self.assertEqual(TechnicianManager.get_free_technicians("Plumber", booking_time), first)
+        booking_id = self.book(self.plumbers[1], booking_time)
+        self.assertNotIn(self.plumbers[1], TechnicianManager.get_free_technicians("Plumber", booking_time))
+        delete_booking(booking_id)
+        self.assertEqual(TechnicianManager.get_free_technicians("Plumber", booking_time), first)
+
+    def test_cached_menu_is_invalidated_by_other_workers(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        database_path = os.path.join(temp_dir.name, "bookings.db")
+        self.use_store(SQLiteBookingStore(database_path))
+        booking_time = self.base_date + timedelta(hours=3)
+        self.assertIn(self.plumbers[1], TechnicianManager.get_free_technicians("Plumber", booking_time))
+        self.assertIn(("Plumber", booking_time, 60), TechnicianManager._menu_cache)
+        other_worker = SQLiteBookingStore(database_path)
+        other_worker.create_booking(BookingCreate(
+            technician_name=self.plumbers[1], specialty="Plumber", booking_time=booking_time))
+        self.assertNotIn(self.plumbers[1], TechnicianManager.get_free_technicians("Plumber", booking_time))
+
+    def test_concurrent_lookups_share_one_menu(self):
+        booking_time = self.base_date + timedelta(hours=4)
+        self.book(self.plumbers[0], booking_time)
+        menus = []
+        threads = [threading.Thread(target=lambda: menus.append(
+            TechnicianManager.get_free_technicians("Plumber", booking_time))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(menus), 8)
+        self.assertTrue(all(menu == menus[0] and self.plumbers[0] not in menu for menu in menus))
+
+    def test_selection_menu_lists_only_free_technicians(self):
+        self.book(self.plumbers[0], self.base_date)
+        user_context = {}
+        response = TechnicianService.setup_technician_selection(user_context, self.base_date, "Plumber")
+        self.assertNotIn(self.plumbers[0], response)
+        self.assertNotIn(self.plumbers[0], user_context["available_technicians"])
+        for technician_name in user_context["available_technicians"]:
+            self.book(technician_name, self.base_date)
+
+    def test_no_free_technicians(self):
+        for technician_name in self.plumbers:
+            self.book(technician_name, self.base_date)
+        response = TechnicianService.setup_technician_selection({}, self.base_date, "Plumber")
+        self.assertIn("no available technicians", response)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -23,19 +23,17 @@ def generate_session_id(prefix="test"):
 def send_request(session_id, text):
     if session_id not in user_contexts:
         user_contexts[session_id] = UserContextManager.create_default_context()
-    nlp_processor.user_context = user_contexts[session_id].copy()
-    response = nlp_processor.process_input(text)
-    user_contexts[session_id] = nlp_processor.user_context.copy()
-    return response
+    return nlp_processor.process_input(text, user_contexts[session_id])
 
 
 def reset_session(session_id):
     if session_id in user_contexts:
-        user_contexts[session_id] = nlp_processor._create_default_context()
+        user_contexts[session_id] = UserContextManager.create_default_context()
     return {"status": "success", "message": "Context reset"}
 
 
-def create_test_booking(session_id, specialty="plumber", date="tomorrow", time="3 pm"):
+def create_test_booking(session_id, specialty="plumber", date="tomorrow", time="3 pm",
+                        technician_name="Test Technician"):
     reset_session(session_id)
     try:
         today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
@@ -73,7 +71,7 @@ def create_test_booking(session_id, specialty="plumber", date="tomorrow", time="
         booking_time = booking_date.replace(hour=hour, minute=minute)
         from app.models.booking import BookingCreate
         booking_create = BookingCreate(
-            technician_name="Test Technician",
+            technician_name=technician_name,
             specialty=specialty.capitalize(),
             booking_time=booking_time
         )
@@ -81,7 +79,7 @@ def create_test_booking(session_id, specialty="plumber", date="tomorrow", time="
         day_of_week = booking_time.strftime("%A")
         date_str = booking_time.strftime("%B %d")
         time_str = booking_time.strftime("%I:%M %p")
-        return f"Your booking with Test Technician ({specialty.capitalize()}) is confirmed for {day_of_week}, {date_str} at {time_str}. Your booking ID is {booking_id}."
+        return f"Your booking with {technician_name} ({specialty.capitalize()}) is confirmed for {day_of_week}, {date_str} at {time_str}. Your booking ID is {booking_id}."
     except Exception as e:
         print(f"Error creating test booking: {e}")
         response = send_request(session_id, f"I need a {specialty}")
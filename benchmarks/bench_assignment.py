@@ -0,0 +1,71 @@
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.config import settings  # noqa: E402
+from app.db.database import create_booking, reset_database  # noqa: E402
+from app.models.booking import BookingCreate  # noqa: E402
+from app.nlp.constants import TECHNICIANS  # noqa: E402
+from app.nlp.handlers.conflict_checker import BookingConflictChecker  # noqa: E402
+from app.nlp.managers.technician_manager import TechnicianManager  # noqa: E402
+
+STRATEGIES = ["random", "round_robin", "least_loaded"]
+
+
+def simulate(strategy, requests, days, seed):
+    settings.TECHNICIAN_ASSIGNMENT_STRATEGY = strategy
+    reset_database()
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 6)
+    specialties = [name for name in TECHNICIANS if name != "Technician"]
+    booked = conflicts = full = 0
+    loads = Counter()
+    elapsed = 0.0
+    for _ in range(requests):
+        specialty = rng.choice(specialties)
+        booking_time = base + timedelta(days=rng.randrange(days), hours=rng.randrange(8, 18))
+        if BookingConflictChecker.is_slot_full(booking_time, specialty, 60):
+            full += 1
+            continue
+        started = time.perf_counter()
+        technician_name = TechnicianManager.assign_technician(specialty, booking_time, 60)
+        elapsed += time.perf_counter() - started
+        try:
+            create_booking(BookingCreate(technician_name=technician_name, specialty=specialty,
+                                         booking_time=booking_time, duration_minutes=60))
+        except ValueError:
+            conflicts += 1
+            continue
+        booked += 1
+        loads[(booking_time.date(), technician_name)] += 1
+    attempts = booked + conflicts
+    spread = max(loads.values()) - min(loads.values()) if loads else 0
+    return booked, conflicts, full, conflicts / attempts if attempts else 0.0, spread, elapsed * 1e6 / max(attempts, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate booking demand under each technician assignment strategy")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--days", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    original = settings.TECHNICIAN_ASSIGNMENT_STRATEGY
+    print(f"{args.requests} requests over {args.days} days")
+    print(f"{'strategy':<14} {'booked':>7} {'conflicts':>9} {'full':>6} {'conflict %':>10} {'spread':>6} {'us/assign':>9}")
+    try:
+        for strategy in STRATEGIES:
+            booked, conflicts, full, rate, spread, per_assign = simulate(strategy, args.requests, args.days, args.seed)
+            print(f"{strategy:<14} {booked:>7} {conflicts:>9} {full:>6} {rate * 100:>9.1f}% {spread:>6} {per_assign:>9.1f}")
+    finally:
+        settings.TECHNICIAN_ASSIGNMENT_STRATEGY = original
+        reset_database()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import argparse
+import os
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.db.conflict_batch import ScheduleArrays  # noqa: E402
+from app.db.memory_store import InMemoryBookingStore  # noqa: E402
+from app.nlp.constants import TECHNICIANS  # noqa: E402
+
+
+def build_store(count, seed):
+    rng = random.Random(seed)
+    base = datetime(2030, 1, 1, 8, 0)
+    roster = [(name, specialty) for specialty, names in TECHNICIANS.items() for name in names]
+    rows = []
+    for _ in range(count):
+        technician_name, specialty = rng.choice(roster)
+        rows.append({
+            "technician_name": technician_name,
+            "specialty": specialty,
+            "booking_time": base + timedelta(minutes=15 * rng.randrange(0, 90 * 24 * 4))
+        })
+    store = InMemoryBookingStore()
+    store.seed(rows)
+    return store, base, [name for name, _ in roster]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare batch conflict evaluation with the per-candidate loop")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--candidates", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    store, base, roster = build_store(args.rows, 42)
+    rng = random.Random(7)
+    candidates = [(rng.choice(roster), base + timedelta(minutes=5 * rng.randrange(0, 90 * 24 * 12)), None)
+                  for _ in range(args.candidates)]
+
+    def loop():
+        for technician_name, booking_time, _ in candidates:
+            store.find_conflicting_booking(booking_time, technician_name)
+
+    def batch_with_load():
+        ScheduleArrays(store.get_all_bookings()).evaluate(candidates)
+
+    schedule = ScheduleArrays(store.get_all_bookings())
+
+    def batch_only():
+        schedule.evaluate(candidates)
+
+    print(f"{args.rows} bookings, {args.candidates} candidates")
+    print(f"{'case':<20} {'total ms':>9} {'candidates/s':>13}")
+    for name, case in [("per-candidate loop", loop), ("batch incl. load", batch_with_load),
+                       ("batch evaluate", batch_only)]:
+        total = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        print(f"{name:<20} {total * 1000:>9.2f} {args.candidates / total:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.nlp.constants import TECHNICIANS  # noqa: E402
+from app.db.columnar_store import ColumnarBookingStore  # noqa: E402
+from app.db.memory_store import InMemoryBookingStore  # noqa: E402
+
+
+def generate_rows(count, seed):
+    rng = random.Random(seed)
+    base = datetime(2030, 1, 1, 8, 0)
+    roster = [(name, specialty) for specialty, names in TECHNICIANS.items() for name in names]
+    rows = []
+    for _ in range(count):
+        technician_name, specialty = rng.choice(roster)
+        rows.append({
+            "technician_name": technician_name,
+            "specialty": specialty,
+            "booking_time": base + timedelta(minutes=15 * rng.randrange(0, 365 * 24 * 4))
+        })
+    return rows
+
+
+def measure(store_factory, rows):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    store = store_factory()
+    store.seed(rows)
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    started = time.perf_counter()
+    for booking in store.get_all_bookings()[:1000]:
+        booking.id
+    read_elapsed = time.perf_counter() - started
+    return current, peak, elapsed, read_elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare memory use of the dict and columnar booking stores")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rows = generate_rows(args.rows, args.seed)
+    print(f"{'store':<10} {'retained MiB':>13} {'peak MiB':>10} {'bytes/row':>10} {'load s':>8} {'1k reads s':>11}")
+    for name, factory in (("dict", InMemoryBookingStore), ("columnar", ColumnarBookingStore)):
+        current, peak, elapsed, read_elapsed = measure(factory, rows)
+        print(f"{name:<10} {current / 2 ** 20:>13.1f} {peak / 2 ** 20:>10.1f} "
+              f"{current / args.rows:>10.1f} {elapsed:>8.2f} {read_elapsed:>11.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import os
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.db.memory_store import InMemoryBookingStore  # noqa: E402
+from app.db.slot_finder import FreeSlotFinder  # noqa: E402
+from app.nlp.constants import TECHNICIANS  # noqa: E402
+
+
+def build_store(days, fill, seed):
+    rng = random.Random(seed)
+    base = datetime(2030, 1, 1)
+    rows = []
+    for specialty, names in TECHNICIANS.items():
+        for name in names:
+            for day in range(days):
+                for hour in range(7, 20):
+                    if rng.random() < fill:
+                        rows.append({
+                            "technician_name": name,
+                            "specialty": specialty,
+                            "booking_time": base + timedelta(days=day, hours=hour)
+                        })
+    store = InMemoryBookingStore()
+    store.seed(rows)
+    return store, base
+
+
+def probe_forward(store, after, technicians, count):
+    found = []
+    candidate = after
+    while len(found) < count:
+        if any(store.find_conflicting_booking(candidate, name) is None for name in technicians):
+            found.append(candidate)
+        candidate += timedelta(minutes=15)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure nearest-free-slot search on a dense schedule")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--fill", type=float, default=0.95)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    store, base = build_store(args.days, args.fill, 42)
+    finder = FreeSlotFinder(store.day_mask)
+    technicians = TECHNICIANS["Plumber"]
+    rng = random.Random(7)
+    probes = [base + timedelta(days=rng.randrange(args.days), hours=rng.randrange(7, 20))
+              for _ in range(args.queries)]
+
+    def bitmap_next():
+        for probe in probes:
+            finder.next_free(probe, technicians, 3)
+
+    def bitmap_nearest():
+        for probe in probes:
+            finder.nearest_free(probe, technicians, 3)
+
+    def probing():
+        for probe in probes:
+            probe_forward(store, probe, technicians, 3)
+
+    print(f"{len(store.bookings_db)} bookings, {args.queries} queries")
+    print(f"{'case':<16} {'total ms':>9} {'us/query':>9}")
+    for name, case in [("bitmap next", bitmap_next), ("bitmap nearest", bitmap_nearest),
+                       ("probe forward", probing)]:
+        total = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        print(f"{name:<16} {total * 1000:>9.2f} {total * 1e6 / args.queries:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
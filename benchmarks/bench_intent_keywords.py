@@ -0,0 +1,146 @@
+import argparse
+import os
+import random
+import re
+import sys
+import timeit
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.nlp.constants import (  # noqa: E402
+    BOOKING_KEYWORDS,
+    BOOKING_PLURAL_KEYWORDS,
+    BOOKING_REFERENCE_KEYWORDS,
+    CANCEL_KEYWORDS,
+    GREETING_KEYWORDS,
+    ID_KEYWORDS,
+    INQUIRY_KEYWORDS,
+    LIST_BOOKINGS_EXACT_MATCHES,
+    LIST_KEYWORDS,
+    SIMPLE_DIGIT_PATTERN,
+    SPECIFIC_BOOKING_INQUIRY_PATTERNS,
+    UPDATE_BOOKING_PATTERN,
+    UPDATE_COMMANDS,
+    UPDATE_KEYWORDS
+)
+from app.nlp.utils.intent_recognizer import IntentRecognizer  # noqa: E402
+
+UTTERANCES = [
+    "hello", "hi there", "good morning, i need a plumber", "I want a electrician tomorrow at 3pm",
+    "book a gardener for next monday", "can you schedule an appointment with a welder",
+    "i need a plumber on march 3 at 10am for 2 hours", "tomorrow", "3pm", "10:30", "the first one", "2",
+    "show my bookings", "what are my bookings", "list bookings please", "can i see my appointments",
+    "cancel booking 12", "please delete my appointment", "remove reservation 4", "cancel",
+    "update booking 3", "change my appointment to friday at 4pm", "reschedule booking 7 to tomorrow",
+    "modify my booking", "what is my booking id", "tell me my reference number", "show booking 5",
+    "check appointment #8", "booking 9 details", "morning", "evening please", "nevermind", "yes", "no",
+    "actually i need an electrician instead", "not a plumber, a carpenter", "I'd like a painter next week",
+]
+INTENTS = ["is_greeting", "is_booking_id_inquiry", "is_specific_booking_inquiry", "is_list_bookings_request",
+           "is_cancellation_request", "is_update_request", "is_booking_request"]
+
+
+class LegacyIntentRecognizer:
+    @staticmethod
+    def is_booking_request(text):
+        text = text.lower()
+        return any(keyword in text for keyword in BOOKING_KEYWORDS)
+
+    @staticmethod
+    def is_booking_id_inquiry(text):
+        text = text.lower()
+        has_inquiry = any(keyword in text for keyword in INQUIRY_KEYWORDS)
+        has_id = any(keyword in text for keyword in ID_KEYWORDS)
+        return (has_inquiry and has_id) or "booking id" in text
+
+    @staticmethod
+    def is_cancellation_request(text):
+        text = text.lower()
+        has_cancel = any(keyword in text for keyword in CANCEL_KEYWORDS)
+        has_booking = any(keyword in text for keyword in BOOKING_REFERENCE_KEYWORDS) or "id" in text
+        has_id = re.search(SIMPLE_DIGIT_PATTERN, text) is not None
+        return has_cancel and (has_booking or has_id)
+
+    @staticmethod
+    def is_list_bookings_request(text):
+        text = text.lower()
+        for match in LIST_BOOKINGS_EXACT_MATCHES:
+            if match in text:
+                return True
+        has_list = any(keyword in text for keyword in LIST_KEYWORDS)
+        has_booking = any(keyword in text for keyword in BOOKING_PLURAL_KEYWORDS)
+        return has_list and has_booking
+
+    @staticmethod
+    def is_greeting(text):
+        text = text.lower()
+        return any(greeting in text for greeting in GREETING_KEYWORDS)
+
+    @staticmethod
+    def is_update_request(text):
+        text = text.lower()
+        if re.search(UPDATE_BOOKING_PATTERN, text):
+            return True
+        for keyword in UPDATE_KEYWORDS:
+            if keyword in text and any(
+                    ref in text for ref in BOOKING_REFERENCE_KEYWORDS + ["a booking", "an appointment"]):
+                return True
+        has_update = any(update_command in text for update_command in UPDATE_COMMANDS)
+        has_booking = any(keyword in text for keyword in BOOKING_REFERENCE_KEYWORDS) or "id" in text
+        return has_update and (has_booking or re.search(SIMPLE_DIGIT_PATTERN, text))
+
+    @staticmethod
+    def is_specific_booking_inquiry(text):
+        text = text.lower()
+        for pattern in SPECIFIC_BOOKING_INQUIRY_PATTERNS:
+            if re.search(pattern, text):
+                return True
+        return False
+
+
+def build_corpus(size, seed):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        text = rng.choice(UTTERANCES)
+        if rng.random() < 0.3:
+            text = f"{text} {rng.choice(UTTERANCES)}"
+        corpus.append(text)
+    return corpus
+
+
+def classify_all(recognizer, corpus, before_utterance=None):
+    predicates = [getattr(recognizer, name) for name in INTENTS]
+    for text in corpus:
+        if before_utterance is not None:
+            before_utterance()
+        for predicate in predicates:
+            predicate(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-method keyword scans with the intent keyword automaton")
+    parser.add_argument("--utterances", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.utterances, args.seed)
+    for text in corpus:
+        for name in INTENTS:
+            if bool(getattr(LegacyIntentRecognizer, name)(text)) != bool(getattr(IntentRecognizer, name)(text)):
+                raise AssertionError(f"{name} disagrees on {text!r}")
+
+    print(f"{args.utterances} utterances, {len(INTENTS)} intent predicates each")
+    print(f"{'recognizer':<22} {'us/utterance':>13}")
+    rows = [
+        ("per-method scans", lambda: classify_all(LegacyIntentRecognizer, corpus)),
+        ("automaton, cold", lambda: classify_all(IntentRecognizer, corpus, IntentRecognizer.keyword_classes.cache_clear)),
+        ("automaton, cached", lambda: classify_all(IntentRecognizer, corpus)),
+    ]
+    for name, run in rows:
+        elapsed = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        print(f"{name:<22} {elapsed * 1e6 / len(corpus):>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
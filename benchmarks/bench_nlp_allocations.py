@@ -0,0 +1,89 @@
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.db.database import reset_database  # noqa: E402
+from app.nlp.managers.user_context_manager import UserContextManager  # noqa: E402
+from app.nlp.processors.natural_language_processor import NaturalLanguageProcessor  # noqa: E402
+from app.nlp.utils.intent_recognizer import IntentRecognizer  # noqa: E402
+
+CONVERSATION = [
+    "hello",
+    "show my bookings",
+    "i need a plumber",
+    "march 3 2025",
+    "cancel",
+    "book an electrician",
+    "what is my booking id",
+    "nevermind",
+]
+
+
+def per_request_turn(session, text):
+    processor = NaturalLanguageProcessor()
+    for key, value in session.items():
+        processor.user_context[key] = value
+    response = processor.process_input(text)
+    IntentRecognizer().is_list_bookings_request(text)
+    session.clear()
+    session.update(processor.user_context.copy())
+    return response
+
+
+def shared_turn_factory():
+    processor = NaturalLanguageProcessor()
+
+    def shared_turn(session, text):
+        return processor.process_input(text, UserContextManager.ensure_defaults(session))
+    return shared_turn
+
+
+def run(turn, rounds):
+    sessions = [{} for _ in range(8)]
+    for _ in range(rounds):
+        for session in sessions:
+            for text in CONVERSATION:
+                turn(session, text)
+
+
+def measure(turn, rounds):
+    turns = rounds * 8 * len(CONVERSATION)
+    reset_database()
+    run(turn, 1)
+    gc.collect()
+    started = time.perf_counter()
+    run(turn, rounds)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    peaks = 0
+    sessions = [{} for _ in range(8)]
+    for _ in range(rounds):
+        for session in sessions:
+            for text in CONVERSATION:
+                before = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                turn(session, text)
+                peaks += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return peaks / turns, elapsed * 1e6 / turns
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-turn allocations of per-request and shared NLP processors")
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{args.rounds * 8 * len(CONVERSATION)} turns across 8 sessions")
+    print(f"{'processor':<12} {'peak B/turn':>12} {'us/turn':>9}")
+    for name, turn in (("per_request", per_request_turn), ("shared", shared_turn_factory())):
+        peak, per_turn = measure(turn, args.rounds)
+        print(f"{name:<12} {peak:>12.0f} {per_turn:>9.1f}")
+    reset_database()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import argparse
+import os
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.db.memory_store import InMemoryBookingStore  # noqa: E402
+from app.models.booking import Booking  # noqa: E402
+from app.nlp.constants import TECHNICIANS  # noqa: E402
+
+
+def build_store(count, seed):
+    rng = random.Random(seed)
+    base = datetime(2030, 1, 1, 8, 0)
+    roster = [(name, specialty) for specialty, names in TECHNICIANS.items() for name in names]
+    rows = []
+    for _ in range(count):
+        technician_name, specialty = rng.choice(roster)
+        rows.append({
+            "technician_name": technician_name,
+            "specialty": specialty,
+            "booking_time": base + timedelta(minutes=15 * rng.randrange(0, 30 * 24 * 4))
+        })
+    store = InMemoryBookingStore()
+    store.seed(rows)
+    return store, base
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare validated models with store records on the read path")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    store, base = build_store(args.rows, 42)
+    probes = [base + timedelta(minutes=15 * i) for i in range(1000)]
+    technician_name = TECHNICIANS["Plumber"][0]
+
+    def list_records():
+        store.get_all_bookings()
+
+    def list_validated():
+        [Booking(**record._asdict()) for record in store.get_all_bookings()]
+
+    def conflicts_records():
+        for probe in probes:
+            store.find_conflicting_booking(probe, technician_name)
+
+    def conflicts_validated():
+        for probe in probes:
+            record = store.find_conflicting_booking(probe, technician_name)
+            if record is not None:
+                Booking(**record._asdict())
+
+    cases = [
+        (f"list {args.rows} rows", list_validated, list_records),
+        ("1000 conflict checks", conflicts_validated, conflicts_records)
+    ]
+    print(f"{'case':<22} {'validated ms':>13} {'records ms':>11} {'speedup':>8}")
+    for name, validated, records in cases:
+        validated_ms = min(timeit.repeat(validated, number=1, repeat=args.repeat)) * 1000
+        records_ms = min(timeit.repeat(records, number=1, repeat=args.repeat)) * 1000
+        print(f"{name:<22} {validated_ms:>13.2f} {records_ms:>11.2f} {validated_ms / records_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import copy
+import os
+import sys
+import time
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.db.database import reset_database  # noqa: E402
+from app.nlp.constants import PROCESSOR_MESSAGES  # noqa: E402
+from app.nlp.managers.user_context_manager import UserContextManager  # noqa: E402
+from app.nlp.processors.conversation_state import ConversationState  # noqa: E402
+from app.nlp.processors.natural_language_processor import NaturalLanguageProcessor  # noqa: E402
+from app.nlp.processors.processor_condition_factory import ProcessorConditionFactory  # noqa: E402
+from app.nlp.utils.booking_data_extractor import BookingDataExtractor  # noqa: E402
+from app.nlp.utils.parsed_utterance import ParsedUtterance  # noqa: E402
+
+SCENARIOS = [
+    ("idle", [], "show my bookings"),
+    ("awaiting_date", ["i need a plumber"], "march 5 2030"),
+    ("awaiting_time", ["i need a plumber", "march 5 2030"], "4pm"),
+    ("awaiting_ampm", ["i need a plumber", "march 5 2030", "4"], "pm"),
+    ("awaiting_technician", ["i need a plumber", "march 5 2030", "4pm"], "not sure yet"),
+    ("awaiting_booking_id_for_cancel", ["cancel"], "booking 99"),
+    ("awaiting_specialty", ["book a technician"], "someone good"),
+]
+LEGACY_FLAGS = ["awaiting_date", "awaiting_time", "awaiting_technician", "awaiting_booking_id_for_update",
+                "awaiting_booking_id_for_cancel", "awaiting_specialty", "updating_booking"]
+
+
+class LinearProcessor(NaturalLanguageProcessor):
+    def __init__(self):
+        super().__init__()
+        tables = self.transitions
+        factory = ProcessorConditionFactory
+        idle = tables[ConversationState.IDLE]
+        self.flagged = [(flag, tables[ConversationState(flag)][-1][1]) for flag in LEGACY_FLAGS]
+        self.prefix = idle[:2] + [(factory.is_cancelling_in_progress, self.handle_cancel_in_progress)] + idle[2:4]
+        self.intents = idle[4:]
+
+    def process_input(self, text, user_context=None):
+        duration_minutes, text = BookingDataExtractor.extract_duration(text)
+        if duration_minutes:
+            UserContextManager.set_temp_duration(user_context, duration_minutes)
+        text = ParsedUtterance.of(text)
+        if user_context.get("awaiting_ampm", False):
+            return self.handle_ampm_response(user_context, text)
+        if user_context.get("conflict_detected", False):
+            for condition, handler in self.transitions[ConversationState.CONFLICT]:
+                if condition(user_context, text):
+                    return handler(user_context, text)
+        for condition, handler in self.prefix:
+            if condition(user_context, text):
+                return handler(user_context, text)
+        for flag, handler in self.flagged:
+            if user_context.get(flag, False):
+                return handler(user_context, text)
+        for condition, handler in self.intents:
+            if condition(user_context, text):
+                return handler(user_context, text)
+        return PROCESSOR_MESSAGES["UNCLEAR_HELP"]
+
+
+def prepare(processor, prefix, count):
+    context = UserContextManager.create_default_context()
+    for text in prefix:
+        processor.process_input(text, context)
+    return [copy.deepcopy(context) for _ in range(count)]
+
+
+def measure(processor, prefix, probe, turns, repeat):
+    best = None
+    for _ in range(repeat):
+        reset_database()
+        contexts = prepare(processor, prefix, turns)
+        started = time.perf_counter()
+        for context in contexts:
+            processor.process_input(probe, context)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e6 / turns
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-state latency of linear and state-indexed NLP dispatch")
+    parser.add_argument("--turns", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    linear = LinearProcessor()
+    indexed = NaturalLanguageProcessor()
+    print(f"{args.turns} turns per state, best of {args.repeat}")
+    print(f"{'state':<32} {'linear us':>10} {'indexed us':>11} {'speedup':>8}")
+    for name, prefix, probe in SCENARIOS:
+        linear_us = measure(linear, prefix, probe, args.turns, args.repeat)
+        indexed_us = measure(indexed, prefix, probe, args.turns, args.repeat)
+        print(f"{name:<32} {linear_us:>10.1f} {indexed_us:>11.1f} {linear_us / indexed_us:>7.2f}x")
+    reset_database()
+
+
+if __name__ == "__main__":
+    main()